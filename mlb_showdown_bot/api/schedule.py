@@ -6,7 +6,7 @@ from ..core.database.postgres_db import PostgresDB
 
 schedule_bp = Blueprint('schedule', __name__)
 
-_mlb_stats_api = MLBStatsAPI(cache_ttl=10)
+_mlb_stats_api = MLBStatsAPI()  # Games use game state aware cache TTLs
 
 @schedule_bp.route('/schedule', methods=["GET"])
 def fetch_schedule():
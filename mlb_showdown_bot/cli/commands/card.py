@@ -2,7 +2,7 @@ import typer
 from typing import Optional
 
 # Import business logic
-from ...core.card.card_generation import generate_card, generate_cards
+from ...core.card.card_generation import generate_card, generate_cards, enable_career_trends_pool
 
 app = typer.Typer()
 
@@ -83,6 +83,10 @@ def card_main(
     
     # Get all CLI parameters
     params = ctx.params
+
+    # CLI RUNS OFFLINE, SO HISTORICAL POINTS CAN BUILD SEASONS IN A PROCESS POOL
+    if params['show_historical_points']:
+        enable_career_trends_pool()
     
     # Run multiple card generation if player_ids is provided, otherwise generate a single card
     if params['player_ids']:
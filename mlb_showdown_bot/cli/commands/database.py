@@ -11,11 +11,14 @@ from ...core.mlb_stats_api.models.leagues.league import LeagueListEnum, LeagueEn
 
 # Scripts
 from ...scripts.season.rosters import snapshot_rosters as _snapshot_rosters
+from ...scripts.season.in_season_trends import precompute_in_season_trends as _precompute_in_season_trends
 
 # Import business logic
 from ...core.archive.player_stats_archive import PlayerStatsArchive, PostgresDB
+from ...core.archive.scrape_job_queue import scrape_job_statuses
 from ...core.database.classes import WbcShowdownCardRecord, FangraphsLeaderboardRecord
 from ...core.card.utils.shared_functions import convert_year_string_to_list
+from ...core.shared.rate_limiter import host_rate_limiter
 from ...core.card.showdown_player_card import Edition, SpecialEdition, StatsPeriod, WBCTeam, Position, ShowdownPlayerCard, PlayerType, StatsPeriodType, Hand, StatHighlightsType
 from ...core.data.replacement_season_averages import get_replacement_hitting_avgs, get_replacement_pitching_avgs, build_replacement_level_stats_for_card
 from ...core.card.stats.normalized_player_stats import NormalizedPlayerStats, PlayerStatsNormalizer
@@ -44,7 +47,13 @@ def database_update(
     modified_end_date: Optional[str] = typer.Option(None, "--modified_end_date", "-mod_e", help="Only include records modified before this date"),
     player_id_list: Optional[str] = typer.Option(None, "--player_id_list", "-pil", help="Comma-separated list of player IDs (e.g., 'abreuwi02,bailepa01,crowape01')"),
     limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Limit how many players are processed"),
-    ignore_minimums: bool = typer.Option(False, "--ignore_minimums", "-im", help="Ignore minimum PA/IP when archiving stats")
+    ignore_minimums: bool = typer.Option(False, "--ignore_minimums", "-im", help="Ignore minimum PA/IP when archiving stats"),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Number of worker processes used to generate Showdown Player Cards"),
+    chunk_size: int = typer.Option(100, "--chunk_size", "-cs", help="Number of cards built together (and sent to a worker at a time when --jobs > 1)"),
+    resume: bool = typer.Option(False, "--resume", "-r", help="Resume Showdown Player Card generation after the last batch committed by a previous run"),
+    workers: int = typer.Option(4, "--workers", "-w", help="Number of players scraped at the same time when running player stats"),
+    bref_requests_per_minute: Optional[float] = typer.Option(None, "--bref_requests_per_minute", "-rpm", help="Requests per minute budget for baseball reference, shared by all workers"),
+    job_key: Optional[str] = typer.Option(None, "--job_key", "-jk", help="Persistent scrape job for player stats. Re-running with the same key resumes the job (requires -pg). Defaults to one job per day for daily mid-season updates."),
 ):
     """Archive player stats to Postgres"""
 
@@ -66,6 +75,10 @@ def database_update(
         if daily_mid_season_update and year_list == [datetime.now().year]:
             # CHANGE MODIFIED END DATE TO 16 HOURS AGO
             modified_end_date:str = (datetime.now(timezone.utc) - timedelta(hours=16)).strftime("%Y-%m-%d %H:%M:%S")
+
+            # ONE SCRAPE JOB PER DAY SO A RESTARTED OR TIMED OUT RUN PICKS UP WHERE IT LEFT OFF
+            if job_key is None and publish_to_postgres:
+                job_key = f"player_stats_daily_{datetime.now(timezone.utc).strftime('%Y-%m-%d')}"
             
         # UPDATE PLAYER LIST
         if run_player_list:
@@ -74,14 +87,18 @@ def database_update(
             print(f"Total players found: {len(player_stats_archive.player_list)}")
 
         if run_player_stats:
+            if bref_requests_per_minute:
+                host_rate_limiter.configure(host='www.baseball-reference.com', requests_per_minute=bref_requests_per_minute)
             player_stats_archive = PlayerStatsArchive(years=year_list, is_snapshot=False)
             player_stats_archive.scrape_stats_for_player_list(
+                workers=workers,
                 publish_to_postgres=publish_to_postgres, 
                 exclude_records_with_stats=exclude_records_with_stats,
                 modified_start_date=modified_start_date,
                 modified_end_date=modified_end_date,
                 limit=limit,
-                player_id_list=parsed_player_id_list
+                player_id_list=parsed_player_id_list,
+                job_key=job_key,
             )
 
         if run_player_cards:
@@ -91,7 +108,10 @@ def database_update(
                 refresh_explore=refresh_explore, 
                 sets=showdown_set_list,
                 ignore_minimums=ignore_minimums,
-                player_id_list=parsed_player_id_list
+                player_id_list=parsed_player_id_list,
+                jobs=jobs,
+                chunk_size=chunk_size,
+                resume=resume,
             )
 
         if run_auto_image_suggestions:
@@ -133,6 +153,61 @@ def database_update(
         print(f"\n✅ Database operation completed in {time_str}")
 
 
+@app.command("in_season_trends")
+def database_in_season_trends(
+    env: str = typer.Option("dev", "--env", "-e", help="Environment to run the command in"),
+    seasons: str = typer.Option(str(datetime.now().year), "--seasons", "-s", help="Which season(s) to precompute trends for, comma-separated."),
+    showdown_sets: str = typer.Option("CLASSIC,EXPANDED,2000,2001,2002,2003,2004,2005", "--showdown_sets", "-sets", help="Showdown Set(s) to use, comma-separated."),
+    player_id_list: Optional[str] = typer.Option(None, "--player_id_list", "-pil", help="Comma-separated list of MLB player IDs. Defaults to all players on 40-man rosters."),
+    chunk_size: int = typer.Option(10, "--chunk_size", "-cs", help="Number of players whose stats are fetched together"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Limit how many players are processed"),
+):
+    """Precompute weekly in-season trend datapoints for active players. Run nightly after `database run`."""
+    start_time = time.time()
+    _precompute_in_season_trends(
+        seasons=seasons,
+        env=env,
+        showdown_sets=[s.strip() for s in showdown_sets.split(',') if s.strip()],
+        player_ids=[int(pid.strip()) for pid in player_id_list.split(',') if pid.strip()] if player_id_list else None,
+        chunk_size=chunk_size,
+        limit=limit,
+    )
+    print(f"\n✅ In-season trends completed in {time.time() - start_time:.2f} seconds")
+
+@app.command("scrape_job_status")
+def database_scrape_job_status(
+    env: str = typer.Option("dev", "--env", "-e", help="Environment to run the command in"),
+    job_key: Optional[str] = typer.Option(None, "--job_key", "-jk", help="Scrape job to show. Defaults to the most recent jobs."),
+    throughput_minutes: int = typer.Option(15, "--throughput_minutes", "-tm", help="Window used to calculate throughput and ETA"),
+    limit: int = typer.Option(10, "--limit", "-l", help="Number of jobs to show when no job key is provided"),
+):
+    """Show progress, throughput and ETA of persistent scrape jobs"""
+    is_production = env.lower() == "prod"
+    db = PostgresDB(is_archive=is_production)
+    statuses = scrape_job_statuses(db=db, job_key=job_key, throughput_minutes=throughput_minutes, limit=limit)
+    if len(statuses) == 0:
+        print("No scrape jobs found.")
+        return
+
+    status_table = PrettyTable()
+    status_table.field_names = ["Job", "Total", "Done", "Pending", "In Flight", "Retrying", "Failed", "Items/Min", "ETA (Mins)", "Last Completed"]
+    for status in statuses:
+        last_completed_date = status.get('last_completed_date', None)
+        status_table.add_row([
+            status['job_key'],
+            status['total'],
+            status['done'],
+            status['pending'],
+            status['in_flight'],
+            status['retrying'],
+            status['failed'],
+            status['items_per_min'],
+            status['eta_mins'] if status['eta_mins'] is not None else '-',
+            last_completed_date.strftime("%Y-%m-%d %H:%M:%S") if last_completed_date else '-',
+        ])
+    print(status_table)
+    db.close_connection()
+
 @app.command("feature_status")
 def database_feature_status(
     feature_name: str = typer.Option(None, "--feature_name", "-f", help="Name of the feature to check status."),
@@ -0,0 +1,150 @@
+import hashlib
+from queue import Queue, Full
+from threading import Thread
+from typing import Optional
+
+from ..database.postgres_db import PostgresDB
+from ..card.showdown_player_card import ShowdownPlayerCard
+
+# ------------------------------------------------------------------------
+# CARD UPLOAD PIPELINE
+# ------------------------------------------------------------------------
+
+class CardUploadPipeline:
+    """Bounded producer/consumer pipeline that streams generated cards into internal.dim_card.
+
+    The producer (card generation) hands over cards in work unit order with `add`. Each card
+    is serialized with `as_json` right away, so the full pydantic object can be dropped,
+    and rows are flushed in fixed-size batches by a background uploader thread.
+
+    The queue between the two holds at most `max_pending_batches`, so generation blocks
+    (backpressure) whenever uploads fall behind. Every committed batch also commits a
+    checkpoint of the next work unit index in the same transaction, which `resume_index`
+    reads back to restart a run after the last committed batch. The checkpoint is deleted
+    once a run completes, so it only ever resumes interrupted runs.
+    """
+
+    _STOP = None
+
+    def __init__(self, db: PostgresDB, run_key: str, batch_size: int = 1000, max_pending_batches: int = 2, start_unit_index: int = 0, cards_uploaded: int = 0) -> None:
+        self.db = db
+        self.run_key = run_key
+        self.batch_size = batch_size
+        self.next_unit_index = start_unit_index
+        self.cards_queued = cards_uploaded
+        self.cards_uploaded = cards_uploaded
+        self.batches_uploaded = 0
+        self.error: Optional[Exception] = None
+
+        self._rows: list[tuple] = []
+        self._queue: Queue = Queue(maxsize=max_pending_batches)
+        self._uploader = Thread(target=self._upload_batches, name='dim_card_uploader', daemon=True)
+        self._uploader.start()
+
+    @staticmethod
+    def run_key_for_units(unit_ids: list[str]) -> str:
+        """Key for an ordered list of work unit ids. Resuming only applies to the exact same list.
+
+        Args:
+            unit_ids: Identifier for each (player, set) work unit, in order.
+
+        Returns:
+            SHA1 hex digest.
+        """
+        return hashlib.sha1('\n'.join(unit_ids).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def resume_index(cls, db: PostgresDB, run_key: str) -> tuple[int, int]:
+        """Work unit index to restart a run from, based on the last committed batch.
+
+        Args:
+            db: Database connection.
+            run_key: Key for the run (see `run_key_for_units`).
+
+        Returns:
+            Tuple of next work unit index and number of cards already uploaded. (0, 0) if no checkpoint.
+        """
+        checkpoint = db.fetch_dim_card_upload_checkpoint(run_key=run_key)
+        if checkpoint is None:
+            return 0, 0
+        return checkpoint['next_unit_index'], checkpoint['cards_uploaded']
+
+    # ------------------------------------------------------------------------
+    # PRODUCER
+    # ------------------------------------------------------------------------
+
+    def add(self, unit_index: int, card: Optional[ShowdownPlayerCard]) -> None:
+        """Add the result of a work unit. Units must be added in order.
+
+        Args:
+            unit_index: Index of the work unit.
+            card: Generated card. None if the unit was skipped or failed, which only advances the checkpoint.
+        """
+        self._raise_if_failed()
+        if card is not None:
+            self._rows.append(self.db.dim_card_row(card))
+            self.cards_queued += 1
+        self.next_unit_index = unit_index + 1
+        if len(self._rows) >= self.batch_size:
+            self._flush()
+
+    def close(self, is_complete: bool = False) -> None:
+        """Flush the final batch, wait for every upload to finish, then raise any upload error.
+
+        Args:
+            is_complete: Every work unit was added. Deletes the run's checkpoint after the final upload.
+        """
+        if self.error is None:
+            self._flush(force=True)
+        self._put(self._STOP)
+        self._uploader.join()
+        self._raise_if_failed()
+        if is_complete:
+            self.db.delete_dim_card_upload_checkpoint(run_key=self.run_key)
+
+    def _flush(self, force: bool = False) -> None:
+        """Queue the current rows as a batch. Blocks while the queue is full."""
+        if len(self._rows) == 0 and not force:
+            return
+        checkpoint = {
+            'run_key': self.run_key,
+            'next_unit_index': self.next_unit_index,
+            'cards_uploaded': self.cards_queued,
+        }
+        self._put( (self._rows, checkpoint) )
+        self._rows = []
+
+    def _put(self, item: Optional[tuple[list[tuple], dict]]) -> None:
+        """Put on the queue, waiting for room unless the uploader has stopped"""
+        while True:
+            try:
+                self._queue.put(item, timeout=1.0)
+                return
+            except Full:
+                if not self._uploader.is_alive():
+                    self._raise_if_failed()
+                    return
+
+    def _raise_if_failed(self) -> None:
+        if self.error is not None:
+            raise RuntimeError(f"dim_card upload failed after {self.cards_uploaded} cards") from self.error
+
+    # ------------------------------------------------------------------------
+    # CONSUMER
+    # ------------------------------------------------------------------------
+
+    def _upload_batches(self) -> None:
+        """Background thread. Uploads batches in order until the stop signal or an error."""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            rows, checkpoint = item
+            try:
+                self.db.upload_dim_card_rows(rows=rows, batch_size=self.batch_size, checkpoint=checkpoint)
+            except Exception as e:
+                self.error = e
+                return
+            self.cards_uploaded = checkpoint['cards_uploaded']
+            self.batches_uploaded += 1
+            print(f"  ✓ Uploaded batch {self.batches_uploaded} ({len(rows)} cards, {self.cards_uploaded} total)")
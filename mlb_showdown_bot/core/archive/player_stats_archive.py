@@ -1,16 +1,27 @@
 import urllib
 import cloudscraper
+import pickle
+import tempfile
 import traceback
 from bs4 import BeautifulSoup
 from pprint import pprint
-from time import sleep
+from time import sleep, monotonic
 from datetime import date, datetime
 from requests import exceptions as req_exc
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import IO, Iterator, Optional
 
 from ..database.postgres_db import PostgresDB, PlayerArchive
+from ..shared.rate_limiter import host_rate_limiter
+from ..shared.fetch_scheduler import FetchScheduler
+from ..shared.html_cache import default_html_cache
+from .scrape_job_queue import ScrapeJobQueue
 from .player_stats import PlayerStats, PlayerType
 from ..card.utils.shared_functions import convert_to_numeric
 from ..card.showdown_player_card import ShowdownPlayerCard, StatsPeriod, StatsPeriodType, ShowdownImage, StatHighlightsType, PlayerType, Set as ShowdownSet
+from .card_upload_pipeline import CardUploadPipeline
 
 
 class PlayerStatsArchive:
@@ -222,22 +233,24 @@ class PlayerStatsArchive:
     def is_player_list_empty(self) -> bool:
         return len(self.player_list) == 0
 
-    def scrape_stats_for_player_list(self, delay:float = 10.0, publish_to_postgres:bool=True, env: str = "dev", limit:int=None, exclude_records_with_stats:bool=True, modified_start_date:str = None, modified_end_date:str = None, player_id_list:list[str] = None) -> None:
-        """Using the class player_list array, iterrate through players and scrape bref data.
+    def scrape_stats_for_player_list(self, workers:int = 4, publish_to_postgres:bool=True, env: str = "dev", limit:int=None, exclude_records_with_stats:bool=True, modified_start_date:str = None, modified_end_date:str = None, player_id_list:list[str] = None, job_key:str = None) -> None:
+        """Using the class player_list array, scrape bref data for players concurrently.
+        Requests are paced by each host's requests per minute budget (see `host_rate_limiter`) instead of a fixed delay.
 
         Args:
-            delay: Delay between each player's scrape.
+            workers: Number of players scraped at the same time.
             publish_to_postgres: Flag to publish data to postgres.
             env: Environment to run in (dev, prod).
             limit: Limit for how many players can be run.
             exclude_records_with_stats: Flag to exclude records with stats.
             modified_start_date: Limit to only records modified after this date.
             modified_end_date: Limit to only records modified before this date.
+            job_key: Persistent scrape job (requires publish_to_postgres). Re-running with the same key 
+                     continues where the job left off, and multiple workers can share a key.
 
         Returns:
           None
         """
-
         if publish_to_postgres:
             # CREATE DATABASE TABLE
             is_prod = env.lower() == 'prod'
@@ -263,36 +276,76 @@ class PlayerStatsArchive:
         self.player_list.sort(key=lambda x: (x.war or 0, x.g or 0), reverse=True) # WILL PRIORITIZE PLAYERS WITH MOST WINS ABOVE REPLACEMENT
 
         # SCRAPE STATS AND INSERT/UPDATE DB RECORDS
-        total_players = min(len(self.player_list), limit) if limit else len(self.player_list)
-        for index, player in enumerate(self.player_list, start=1):
+        # UPSERTS STAY ON THIS THREAD, WORKERS ONLY SCRAPE
+        players_to_scrape = self.player_list[:limit] if limit else self.player_list
+        total_players = len(players_to_scrape)
+        job_queue: ScrapeJobQueue = None
+        if job_key and publish_to_postgres:
+            # PERSISTENT WORK QUEUE. PLAYERS ARE CLAIMED FROM THE JOB INSTEAD OF THE LIST
+            job_queue = ScrapeJobQueue(db=db, job_key=job_key)
+            num_new_items = job_queue.enqueue(item_ids=[player.id for player in players_to_scrape], description=f"Player stats for {','.join(str(y) for y in self.years)}")
+            job_status = job_queue.status() or {}
+            total_players = job_status.get('pending', 0) + job_status.get('retrying', 0) + job_status.get('in_flight', 0)
+            print(f"SCRAPE JOB {job_key}: {num_new_items} NEW PLAYERS, {job_status.get('done', 0)} DONE, {job_status.get('failed', 0)} FAILED, {total_players} REMAINING")
+            players_to_scrape = self.__players_for_job_items(job_queue=job_queue)
+
+        # LEASES ARE RENEWED WHILE PLAYERS ARE IN FLIGHT, A SCRAPE CAN WAIT ON HOST BACKOFFS LONGER THAN THE LEASE
+        scheduler = FetchScheduler(max_in_flight=workers)
+        start_time = monotonic()
+        scraped_players = scheduler.run(
+            jobs=players_to_scrape, 
+            fetch=lambda player: player.scrape_stats_data(),
+            heartbeat=job_queue.renew_leases if job_queue else None,
+            heartbeat_interval_seconds=job_queue.lease_seconds / 3 if job_queue else 60.0,
+        )
+        for index, (player, _, error) in enumerate(scraped_players, start=1):
 
-            try:
+            if error is not None:
+                print(f"ERROR PROCESSING PLAYER {player.name} {player.year} - {error}")
+                if job_queue:
+                    job_queue.fail(item_id=player.id, error=error)
+                continue
 
-                # SETUP TIME ESTIMATE
-                est_time_remaining_seconds = (total_players - index) * (delay + 2.0) # 2.0 IS FOR SLEEP MECHANISMS WITHIN BREF CLASS
+            try:
+                # TIME ESTIMATE FROM OBSERVED THROUGHPUT
+                est_time_remaining_seconds = max(total_players - index, 0) * (monotonic() - start_time) / index
                 est_time_remaining_mins = round(est_time_remaining_seconds / 60.0, 2)
                 est_time_remaining_hours = round(est_time_remaining_mins / 60.0, 2)
                 time_unit = "HOURS" if est_time_remaining_mins > 120 else "MINS"
                 time_value = est_time_remaining_hours if time_unit == 'HOURS' else est_time_remaining_mins
 
                 print(f"  {index}/{total_players}: {player.name: <20} ({time_value} {time_unit} LEFT)")
-                player.scrape_stats_data()
                 if publish_to_postgres:
                     db.upsert_player_season_stats_row(cursor=db_cursor, data=player.as_dict(convert_stats_to_json=True), conflict_strategy="update_stats_only")
-                if limit:
-                    if index >= limit:
-                        break
-                
-                sleep(delay)
+                if job_queue:
+                    job_queue.complete(item_id=player.id)
 
             except Exception as e:
                 print(f"ERROR PROCESSING PLAYER {player.name} {player.year} - {e}")
-                sleep(delay)
+                if job_queue:
+                    job_queue.fail(item_id=player.id, error=e)
+
+        if job_queue:
+            job_status = job_queue.status() or {}
+            if job_status.get('retrying', 0) > 0 or job_status.get('in_flight', 0) > 0:
+                print(f"SCRAPE JOB {job_key}: {job_status['retrying']} PLAYERS WAITING TO RETRY, {job_status['in_flight']} IN FLIGHT ON OTHER WORKERS. RE-RUN WITH THE SAME JOB KEY TO FINISH.")
 
         if publish_to_postgres:
             # CLOSE CONNECTION
             db.close_connection()
 
+    def __players_for_job_items(self, job_queue:ScrapeJobQueue) -> Iterator[PlayerStats]:
+        """Players for items claimed from the scrape job, one at a time as workers free up, so no item waits on its lease before it starts.
+        Items for players no longer in the player list (ex: filtered out since the job started) are marked done."""
+        players_by_id = { player.id: player for player in self.player_list }
+        for item_id in job_queue.claimed_items(batch_size=1):
+            player = players_by_id.get(item_id, None)
+            if player is None:
+                print(f"  SKIPPING {item_id}, NOT IN PLAYER LIST")
+                job_queue.complete(item_id=item_id)
+                continue
+            yield player
+
     def fill_player_stats_from_archive(self, db: PostgresDB, exclude_records_with_stats:bool=False, modified_start_date: str = None, modified_end_date: str = None, player_id_list: list[str] = None, ignore_minimums: bool = False) -> None:
         """Fill player stats list from archive database.
         
@@ -336,8 +389,9 @@ class PlayerStatsArchive:
 # CONVERTING TO SHOWDOWN CARDS
 # ------------------------------------------------------------------------
 
-    def generate_showdown_player_cards(self, publish_to_postgres:bool=True, env: str = "dev", refresh_explore: bool=True, sets: list[ShowdownSet] = None, ignore_minimums: bool = False, player_id_list: list[str] = None) -> None:
-        """Using the class player_list
+    def generate_showdown_player_cards(self, publish_to_postgres:bool=True, env: str = "dev", refresh_explore: bool=True, sets: list[ShowdownSet] = None, ignore_minimums: bool = False, player_id_list: list[str] = None, jobs: int = 1, chunk_size: int = 100, upload_batch_size: int = 1000, resume: bool = False) -> None:
+        """Using the class player_list, generate cards for every (player, set) and stream them into internal.dim_card.
+        Cards are uploaded in batches while generation continues, so only a few batches are held in memory.
         
         Args:
             publish_to_postgres: Flag to publish data to postgres.
@@ -345,6 +399,10 @@ class PlayerStatsArchive:
             sets: List of Showdown Sets to generate cards for. If None, generates for all sets.
             ignore_minimums: Flag to ignore minimum PA/IP when generating cards.
             player_id_list: List of player IDs to generate cards for. If None, generates for all players.
+            jobs: Number of worker processes. 1 builds every card in this process.
+            chunk_size: Number of (player, set) cards built together, rounded to whole players (and sent to a worker when jobs > 1).
+            upload_batch_size: Number of cards in each dim_card upload batch.
+            resume: Skip cards already committed by a previous run over the same players and sets.
         Returns:
             None
         """
@@ -364,51 +422,203 @@ class PlayerStatsArchive:
                 self.fill_player_stats_from_archive(db=db, ignore_minimums=ignore_minimums, player_id_list=player_id_list)
 
         print("CONVERTING TO SHOWDOWN CARDS...")
-        showdown_cards: list[ShowdownPlayerCard] = []
+
+        # WORK UNITS IN OUTPUT ORDER (SET, THEN PLAYER)
+        # CHUNKS ARE BUILT PER PLAYER SO A PLAYER'S SETS SHARE THEIR SET AGNOSTIC STAGES (SEE `_generate_showdown_cards_in_order`)
+        units: list[dict] = []
+        unit_ids: list[str] = []
         for set in sets:
-            print(f'\nSET: {set}')
-            total_players = len(self.player_list)
-            for index, player in enumerate(self.player_list, 1):
-                type_override_raw = player.player_type_override
-                type_override = PlayerType.PITCHER if type_override_raw else None
-                name = player.name
-                year = str(player.year)
-                stats = player.stats
-                set = set
-
-                stats_period = StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=year)
-                image = ShowdownImage(stat_highlights_type=StatHighlightsType.ALL)
-
-                if player.bref_id in ['howelha01', 'dunnja01','sudhowi01','mercewi01'] and type_override_raw == '(pitcher)':
-                    continue
-                
-                # SKIP PLAYERS WITH 0 PA
-                if stats.get('PA', 0) == 0:
+            for player in self.player_list:
+                card_kwargs = self._showdown_card_kwargs(player=player, set=set)
+                if card_kwargs is None:
                     continue
+                units.append(card_kwargs)
+                unit_ids.append(f"{ShowdownSet(set).value}|{player.bref_id}|{player.year}|{player.player_type_override}")
 
-                print(f"  {index}/{total_players}: {name: <30}", end="\r")
-                try:
-                    showdown = ShowdownPlayerCard(
-                        name=name, year=year, stats=stats, stats_period=stats_period,
-                        set=set, player_type_override=type_override, print_to_cli=False,
-                        image=image
-                    )
-                except Exception as e:
-                    print(f"\nERROR CREATING SHOWDOWN CARD FOR {name} ({year}) - {e}")
-                    continue
-                
-                showdown_cards.append(showdown)
-            
-        if len(showdown_cards) == 0:
+        if len(units) == 0:
             print("NO SHOWDOWN CARDS GENERATED.")
             return
-        
-        db.upload_to_card_data(showdown_cards=showdown_cards, batch_size=1000)
 
-        if refresh_explore:
+        # STREAM CARDS INTO DIM_CARD AS THEY ARE GENERATED
+        pipeline: Optional[CardUploadPipeline] = None
+        start_index = 0
+        if publish_to_postgres:
+            db.create_dim_card_table()
+            db.create_dim_card_upload_checkpoint_table()
+            run_key = CardUploadPipeline.run_key_for_units(unit_ids=unit_ids)
+            cards_uploaded = 0
+            if resume:
+                start_index, cards_uploaded = CardUploadPipeline.resume_index(db=db, run_key=run_key)
+                if start_index > 0:
+                    print(f"RESUMING AFTER {start_index}/{len(units)} CARDS ({cards_uploaded} ALREADY UPLOADED)")
+            pipeline = CardUploadPipeline(db=db, run_key=run_key, batch_size=upload_batch_size, start_unit_index=start_index, cards_uploaded=cards_uploaded)
+
+        num_cards = 0
+        current_set = None
+        try:
+            for unit_index, showdown, error in self._generate_showdown_cards_in_order(units=units, start_index=start_index, jobs=jobs, chunk_size=chunk_size):
+                unit = units[unit_index]
+                if unit['set'] != current_set:
+                    current_set = unit['set']
+                    print(f'\nSET: {current_set}')
+                print(f"  {unit_index + 1}/{len(units)}: {unit['name']: <30}", end="\r")
+                if error:
+                    print(f"\nERROR CREATING SHOWDOWN CARD FOR {error}")
+                if showdown is not None:
+                    num_cards += 1
+                if pipeline:
+                    pipeline.add(unit_index=unit_index, card=showdown)
+        except BaseException:
+            # COMMIT WHATEVER WAS GENERATED AND KEEP THE CHECKPOINT TO RESUME FROM
+            # A CLOSE ERROR IS ONLY PRINTED, SO IT DOESN'T REPLACE THE ERROR THAT STOPPED GENERATION
+            if pipeline:
+                try:
+                    pipeline.close(is_complete=False)
+                except Exception as close_error:
+                    print(f"\nERROR CLOSING CARD UPLOAD PIPELINE AFTER GENERATION STOPPED: {close_error}")
+                    traceback.print_exc()
+            raise
+
+        # CLEAN RUN, CLEAR THE CHECKPOINT
+        if pipeline:
+            pipeline.close(is_complete=True)
+
+        print(f"\n✓ Generated {num_cards} showdown cards" + (f", {pipeline.cards_uploaded} uploaded to database" if pipeline else ""))
+        if num_cards == 0:
+            return
+
+        if publish_to_postgres and refresh_explore:
             db.refresh_explore_views()
 
 
+    def _showdown_card_kwargs(self, player: PlayerStats, set: ShowdownSet) -> Optional[dict]:
+        """Inputs for an unbuilt ShowdownPlayerCard for a (player, set) work unit.
+
+        Args:
+            player: Archived player stats.
+            set: Showdown Set to generate the card for.
+
+        Returns:
+            Keyword arguments for ShowdownPlayerCard, None if the player should be skipped.
+        """
+        type_override_raw = player.player_type_override
+        year = str(player.year)
+
+        if player.bref_id in ['howelha01', 'dunnja01','sudhowi01','mercewi01'] and type_override_raw == '(pitcher)':
+            return None
+        
+        # SKIP PLAYERS WITH 0 PA
+        if player.stats.get('PA', 0) == 0:
+            return None
+
+        return dict(
+            name=player.name, year=year, stats=player.stats, 
+            stats_period=StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=year),
+            set=set, player_type_override=PlayerType.PITCHER if type_override_raw else None, print_to_cli=False,
+            image=ShowdownImage(stat_highlights_type=StatHighlightsType.ALL), build_on_init=False
+        )
+
+    def _generate_showdown_cards_in_order(self, units: list[dict], start_index: int, jobs: int, chunk_size: int) -> Iterator[tuple[int, Optional[ShowdownPlayerCard], Optional[str]]]:
+        """Generate cards for work units in chunks of whole players, yielding results in unit order.
+
+        Each chunk holds every remaining set of its players, so `_build_showdown_cards_chunk` builds a
+        player's set agnostic stages once. Units are in set, then player order, so results for the first
+        set are yielded as they are built, and results for later sets are spilled to a temp file per set
+        until their turn. Only a few chunks of cards are held in memory.
+
+        With jobs > 1 chunks run in a process pool. Workers are reused for the whole run so their
+        chart caches stay warm, and only `jobs * 2` chunks are in flight at a time so finished
+        cards don't pile up in memory while the consumer is busy uploading.
+
+        Args:
+            units: ShowdownPlayerCard keyword arguments, one per (player, set).
+            start_index: First unit to generate.
+            jobs: Number of worker processes.
+            chunk_size: Number of work units built together, rounded to whole players.
+
+        Yields:
+            Tuple of unit index, card (None if it failed), and error message (None if it succeeded).
+        """
+        if start_index >= len(units):
+            return
+
+        # UNITS FOR THE SAME ARCHIVED PLAYER SHARE THE STATS OBJECT
+        # PLAYERS ARE ORDERED BY THEIR LAST UNIT SO EVERY SET'S UNITS ARE BUILT IN ORDER, EVEN WHEN RESUMING MID SET
+        player_unit_indexes: dict[int, list[int]] = {}
+        for unit_index in range(start_index, len(units)):
+            player_unit_indexes.setdefault(id(units[unit_index]['stats']), []).append(unit_index)
+        chunks: list[list[int]] = [[]]
+        for unit_indexes in sorted(player_unit_indexes.values(), key=lambda unit_indexes: unit_indexes[-1]):
+            if len(chunks[-1]) > 0 and len(chunks[-1]) + len(unit_indexes) > chunk_size:
+                chunks.append([])
+            chunks[-1].extend(unit_indexes)
+
+        # CONSECUTIVE UNITS FOR ONE SET. THE FIRST IS YIELDED AS IT'S BUILT, THE REST ARE SPILLED UNTIL THEIR TURN
+        set_starts = [start_index] + [unit_index for unit_index in range(start_index + 1, len(units)) if units[unit_index]['set'] != units[unit_index - 1]['set']]
+        spill_files: dict[int, IO[bytes]] = {}
+        try:
+            for unit_index, card, error in self._build_showdown_card_chunks(units=units, chunks=chunks, jobs=jobs):
+                set_index = bisect_right(set_starts, unit_index) - 1
+                if set_index == 0:
+                    yield unit_index, card, error
+                    continue
+                if set_index not in spill_files:
+                    spill_files[set_index] = tempfile.TemporaryFile()
+                pickle.dump((unit_index, card, error), spill_files[set_index], protocol=pickle.HIGHEST_PROTOCOL)
+
+            for set_index in sorted(spill_files.keys()):
+                spill_file = spill_files[set_index]
+                spill_file.seek(0)
+                while True:
+                    try:
+                        yield pickle.load(spill_file)
+                    except EOFError:
+                        break
+        finally:
+            for spill_file in spill_files.values():
+                spill_file.close()
+
+    def _build_showdown_card_chunks(self, units: list[dict], chunks: list[list[int]], jobs: int) -> Iterator[tuple[int, Optional[ShowdownPlayerCard], Optional[str]]]:
+        """Build chunks of work units, yielding results in chunk order.
+
+        Args:
+            units: ShowdownPlayerCard keyword arguments, one per (player, set).
+            chunks: Unit indexes built together.
+            jobs: Number of worker processes.
+
+        Yields:
+            Tuple of unit index, card (None if it failed), and error message (None if it succeeded).
+        """
+        if jobs <= 1:
+            for chunk in chunks:
+                results = _build_showdown_cards_chunk([units[unit_index] for unit_index in chunk])
+                for unit_index, (card, error) in zip(chunk, results):
+                    yield unit_index, card, error
+            return
+
+        print(f"  {sum(len(chunk) for chunk in chunks)} CARDS IN {len(chunks)} CHUNKS ACROSS {jobs} WORKERS")
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending: deque[tuple[list[int], Future]] = deque()
+            next_chunks = iter(chunks)
+            def submit_next_chunk() -> None:
+                chunk = next(next_chunks, None)
+                if chunk is not None:
+                    pending.append( (chunk, executor.submit(_build_showdown_cards_chunk, [units[unit_index] for unit_index in chunk])) )
+
+            for _ in range(jobs * 2):
+                submit_next_chunk()
+            while len(pending) > 0:
+                chunk, future = pending.popleft()
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # WHOLE CHUNK FAILED (EX: WORKER DIED), RECORD AN ERROR FOR EACH PLAYER IN IT
+                    results = [(None, _showdown_card_error_message(units[unit_index]['name'], units[unit_index]['year'], units[unit_index]['set'], e)) for unit_index in chunk]
+                submit_next_chunk()
+                for unit_index, (card, error) in zip(chunk, results):
+                    yield unit_index, card, error
+
+
 # ------------------------------------------------------------------------
 # PARSE DATA
 # ------------------------------------------------------------------------
@@ -447,6 +657,13 @@ class PlayerStatsArchive:
           HTML string for URL request.
         """
 
+        # RAW HTML CACHE. LEAGUE PAGES HAVE THE SEASON IN THE URL
+        html_cache = default_html_cache()
+        if html_cache:
+            cached_html = html_cache.get(url)
+            if cached_html is not None:
+                return cached_html
+
         scraper = cloudscraper.create_scraper()
         
         # TIMEOUTS
@@ -454,7 +671,9 @@ class PlayerStatsArchive:
         READ_TO = 22
 
         try:
+            host_rate_limiter.acquire(url)
             html = scraper.get(url, timeout=(CONNECT_TO, READ_TO))
+            host_rate_limiter.report(url, status_code=html.status_code, headers=html.headers)
             html.raise_for_status()
         except req_exc.Timeout:
             # Bubble up a clear timeout error
@@ -469,5 +688,56 @@ class PlayerStatsArchive:
         if html.status_code == 429:
             print("429 - TOO MANY REQUESTS")
 
+        if html_cache and html.status_code == 200:
+            html_cache.put(url, html.text)
+
         return html.text
-    
\ No newline at end of file
+    
+
+
+# ------------------------------------------------------------------------
+# PROCESS POOL WORKERS
+# ------------------------------------------------------------------------
+# MODULE LEVEL SO THEY CAN BE PICKLED BY ProcessPoolExecutor
+
+def _showdown_card_error_message(name: str, year: str, set: ShowdownSet, error: Exception) -> str:
+    return f"{name} ({year}) [{ShowdownSet(set).value}] - {error}"
+
+def _build_showdown_cards_chunk(units: list[dict]) -> list[tuple[Optional[ShowdownPlayerCard], Optional[str]]]:
+    """Build a chunk of cards. Runs in a worker process when using a pool.
+
+    Args:
+        units: ShowdownPlayerCard keyword arguments, one per (player, set).
+
+    Returns:
+        One (card, error message) tuple per unit, in unit order. Card is None when it failed.
+    """
+    results: list[tuple[Optional[ShowdownPlayerCard], Optional[str]]] = [(None, None)] * len(units)
+    cards: list[ShowdownPlayerCard] = []
+
+    # UNITS FOR THE SAME ARCHIVED PLAYER (SAME STATS OBJECT) ONLY DIFFER BY SET
+    # GROUP THEM ACROSS THE CHUNK SO THE PLAYER'S SET AGNOSTIC STAGES ARE BUILT ONCE, RESULTS STAY IN UNIT ORDER
+    player_unit_indexes: dict[int, list[int]] = {}
+    for index, card_kwargs in enumerate(units):
+        player_unit_indexes.setdefault(id(card_kwargs['stats']), []).append(index)
+
+    for unit_indexes in player_unit_indexes.values():
+        group = [units[index] for index in unit_indexes]
+        shared_kwargs = {k: v for k, v in group[0].items() if k != 'set'}
+        try:
+            # ARCHIVE STATS ARE ALREADY CLEAN, SKIP VALIDATION
+            group_cards = ShowdownPlayerCard.cards_for_sets(sets=[card_kwargs['set'] for card_kwargs in group], trusted=True, **shared_kwargs)
+            cards.extend(group_cards)
+            for index, card in zip(unit_indexes, group_cards):
+                results[index] = (card, None)
+        except Exception as e:
+            for index, card_kwargs in zip(unit_indexes, group):
+                results[index] = (None, _showdown_card_error_message(card_kwargs['name'], card_kwargs['year'], card_kwargs['set'], e))
+
+    build_errors: list[tuple[ShowdownPlayerCard, Exception]] = []
+    ShowdownPlayerCard.build_cards(cards=cards, errors=build_errors)
+    failed = { id(card): e for card, e in build_errors }
+    return [
+        (None, _showdown_card_error_message(card.name, card.year, card.set, failed[id(card)])) if card is not None and id(card) in failed else (card, error)
+            for card, error in results
+    ]
@@ -0,0 +1,87 @@
+import os
+import socket
+from typing import Iterator, Optional
+
+from ..database.postgres_db import PostgresDB
+
+
+class ScrapeJobQueue:
+    """Persistent work queue for an archive scrape job, stored in internal.scrape_job / internal.scrape_job_item.
+
+    Items move from PENDING to IN_FLIGHT when a worker claims them with a lease, then to DONE or FAILED.
+    Failed items are retried after a backoff (PENDING with retry_at) until `max_attempts` is reached.
+    Items whose lease expired (crashed or timed out worker) are claimed again, so restarts and
+    multiple workers using the same job key continue exactly where the job left off.
+    Workers call `renew_leases` while items are in flight, since fetches can wait on rate limiter backoffs longer than the lease.
+
+    Uses the caller's connection, from the thread that created the queue.
+    """
+
+    def __init__(self, db: PostgresDB, job_key: str, lease_seconds: float = 300.0, max_attempts: int = 3, retry_delay_seconds: float = 120.0) -> None:
+        self.db = db
+        self.job_key = job_key
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.db.create_scrape_job_tables()
+
+    def enqueue(self, item_ids: list[str], description: str = None) -> int:
+        """Add items in priority order. Items already in the job keep their state.
+
+        Returns:
+            Number of new items.
+        """
+        return self.db.enqueue_scrape_job_items(job_key=self.job_key, item_ids=item_ids, description=description)
+
+    def claim(self, limit: int) -> list[str]:
+        """Lease up to `limit` items"""
+        return self.db.claim_scrape_job_items(job_key=self.job_key, worker_id=self.worker_id, limit=limit, lease_seconds=self.lease_seconds)
+
+    def claimed_items(self, batch_size: int = 1) -> Iterator[str]:
+        """Claim items `batch_size` at a time until none are left to claim. Items are claimed as they're pulled,
+        so a batch size of 1 only leases items a worker is ready to start."""
+        while True:
+            item_ids = self.claim(limit=batch_size)
+            if len(item_ids) == 0:
+                return
+            yield from item_ids
+
+    def renew_leases(self) -> None:
+        """Extend the lease of every item this worker has in flight by `lease_seconds`"""
+        self.db.renew_scrape_job_leases(job_key=self.job_key, worker_id=self.worker_id, lease_seconds=self.lease_seconds)
+
+    def complete(self, item_id: str) -> None:
+        self.db.complete_scrape_job_item(job_key=self.job_key, item_id=item_id)
+
+    def fail(self, item_id: str, error: Exception | str, is_retryable: bool = True) -> None:
+        """Schedule a retry with exponential backoff, or mark the item FAILED once out of attempts"""
+        self.db.fail_scrape_job_item(
+            job_key=self.job_key, item_id=item_id, error=str(error)[:1000], max_attempts=self.max_attempts, 
+            retry_delay_seconds=self.retry_delay_seconds if is_retryable else None
+        )
+
+    def status(self) -> Optional[dict]:
+        statuses = scrape_job_statuses(db=self.db, job_key=self.job_key)
+        return statuses[0] if statuses else None
+
+
+def scrape_job_statuses(db: PostgresDB, job_key: str = None, throughput_minutes: int = 15, limit: int = 10) -> list[dict]:
+    """Item counts by state, throughput (items per minute over the last `throughput_minutes`) and ETA for scrape jobs.
+
+    Args:
+        db: PostgresDB object.
+        job_key: Optional job. Defaults to the most recent jobs.
+        throughput_minutes: Window for throughput.
+        limit: Max number of jobs when job_key isn't provided.
+
+    Returns:
+        List of job status dicts, newest first. Adds total, items_per_min and eta_mins (None when idle).
+    """
+    statuses = db.fetch_scrape_job_status(job_key=job_key, throughput_minutes=throughput_minutes, limit=limit)
+    for status in statuses:
+        remaining = status['pending'] + status['retrying'] + status['in_flight']
+        status['total'] = remaining + status['done'] + status['failed']
+        status['items_per_min'] = round(status['recent_done'] / throughput_minutes, 2)
+        status['eta_mins'] = round(remaining / status['items_per_min'], 1) if status['items_per_min'] > 0 else None
+    return statuses
@@ -0,0 +1,471 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from .showdown_player_card import ShowdownPlayerCard
+from .chart import ChartAccuracyBreakdown
+from .utils.stage_profiler import StageProfile, NO_STAGE
+from .stats.metrics import Stat
+from .trends.trends import TrendDatapoint
+from ..database.postgres_db import PostgresDB, PlayerArchive
+from ..version import __version__
+
+# ------------------------------------------------------------------------
+# CACHE KEY
+# ------------------------------------------------------------------------
+
+# CARD FIELDS THAT DESCRIBE THE REQUEST/ENVIRONMENT, NOT THE CARD. LEFT OUT OF THE KEY AND TAKEN FROM THE REQUEST ON A HIT.
+REQUEST_FIELDS = [
+    'build_on_init', 'load_time', 'profile_stages', 'stage_profile', 'show_image', 'print_to_cli',
+    'ignore_cache', 'disable_cache_cleaning', 'user_id',
+]
+REQUEST_IMAGE_FIELDS = [
+    'output_folder_path', 'output_file_name', 'upload_to_supabase', 'storage_path', 'thumbnail_storage_path', 'error',
+]
+# DERIVED FROM STATS DURING THE BUILD. UNBUILT CARDS HOLD THE PROPERTY OBJECT AS THE DEFAULT, WHICH CAN'T BE SERIALIZED.
+DERIVED_FIELDS = ['positions_list']
+
+
+def card_cache_key(card: ShowdownPlayerCard) -> str:
+    """Stable hash of every input that affects an unbuilt card.
+
+    Covers the (normalized) stats, set, era, chart version, overrides, card affecting image options
+    and the bot version, so any change in stats or code produces a new key.
+
+    Args:
+        card: Card that has not been built yet (`build_on_init=False`).
+
+    Returns:
+        SHA256 hex digest.
+    """
+    inputs = card.model_dump(mode='json', exclude={field: True for field in REQUEST_FIELDS + DERIVED_FIELDS} | {'image': {field: True for field in REQUEST_IMAGE_FIELDS}})
+    inputs['version'] = __version__
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+# ------------------------------------------------------------------------
+# BACKENDS
+# ------------------------------------------------------------------------
+
+class CardCacheBackendType(str, Enum):
+    LOCAL = 'LOCAL'
+    POSTGRES = 'POSTGRES'
+
+
+class LocalCardCacheBackend:
+    """Built cards stored as JSON files, one folder per bot version.
+
+    Each version folder holds a marker file. On init, other version folders with the marker
+    are removed (only their cache files), anything else under `folder_path` is left alone.
+    Least recently used files are evicted once there are more than `max_entries`
+    (reads bump the file's modified time).
+    """
+
+    MARKER_FILE_NAME = '.showdown_card_cache'
+
+    def __init__(self, folder_path: str, max_entries: int = 5000, namespace: Optional[str] = None) -> None:
+        """
+        Args:
+            folder_path: Root folder of the cache.
+            max_entries: Max number of files kept for the current version.
+            namespace: Optional subfolder of `folder_path` for data stored separately from built cards (ex: career trends).
+        """
+        root_path = os.path.join(folder_path, namespace) if namespace else folder_path
+        self.folder_path = os.path.join(root_path, __version__)
+        self.max_entries = max_entries
+        self._lock = Lock()
+        os.makedirs(self.folder_path, exist_ok=True)
+        Path(self.folder_path, self.MARKER_FILE_NAME).touch(exist_ok=True)
+
+        # REMOVE CARDS FROM OLD VERSIONS. ONLY FOLDERS CREATED BY THE CACHE (MARKER FILE) ARE TOUCHED.
+        for version_folder in Path(root_path).iterdir():
+            if not version_folder.is_dir() or version_folder.name == __version__ or not (version_folder / self.MARKER_FILE_NAME).is_file():
+                continue
+            # INCLUDES TEMP FILES LEFT BY CRASHED WRITES
+            for file in version_folder.iterdir():
+                if file.is_file() and (file.suffix in ['.json', '.tmp'] or file.name == self.MARKER_FILE_NAME):
+                    file.unlink(missing_ok=True)
+            try:
+                version_folder.rmdir()
+            except OSError:
+                # OTHER FILES IN THE FOLDER, LEAVE IT
+                continue
+
+        # LRU ORDER FROM FILE MODIFIED TIMES (OLDEST FIRST)
+        files = sorted(Path(self.folder_path).glob('*.json'), key=lambda file: file.stat().st_mtime)
+        self._lru: OrderedDict[str, None] = OrderedDict((file.stem, None) for file in files)
+
+    def get_many(self, cache_keys: list[str]) -> dict[str, dict]:
+        cards: dict[str, dict] = {}
+        for cache_key in cache_keys:
+            path = self._path(cache_key)
+            try:
+                with open(path, 'r') as file:
+                    cards[cache_key] = json.load(file)
+                os.utime(path)
+            except (FileNotFoundError, json.JSONDecodeError):
+                continue
+            with self._lock:
+                self._lru[cache_key] = None
+                self._lru.move_to_end(cache_key)
+        return cards
+
+    def put_many(self, cards: dict[str, dict]) -> None:
+        for cache_key, card_data in cards.items():
+            # WRITE TO A TEMP FILE FIRST SO READERS NEVER SEE A PARTIAL FILE
+            path = self._path(cache_key)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w') as file:
+                json.dump(card_data, file)
+            os.replace(temp_path, path)
+            with self._lock:
+                self._lru[cache_key] = None
+                self._lru.move_to_end(cache_key)
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            while len(self._lru) > self.max_entries:
+                cache_key, _ = self._lru.popitem(last=False)
+                Path(self._path(cache_key)).unlink(missing_ok=True)
+
+    def _path(self, cache_key: str) -> str:
+        return os.path.join(self.folder_path, f"{cache_key}.json")
+
+
+class PostgresCardCacheBackend:
+    """Built cards stored in internal.card_cache (or another `table_name` in the internal schema).
+
+    Rows from other versions and least recently used rows over `max_entries` are pruned on init
+    and after every `prune_every` writes. Holds one connection for the life of the backend, 
+    shared by threads one query at a time, and reconnects when it's closed.
+    """
+
+    def __init__(self, max_entries: int = 250000, prune_every: int = 1000, table_name: str = 'card_cache') -> None:
+        self.max_entries = max_entries
+        self.prune_every = prune_every
+        self.table_name = table_name
+        self._writes_since_prune = 0
+        self._lock = Lock()
+        self._db = PostgresDB()
+        self._db.create_card_cache_table(table_name=self.table_name)
+        self._db.prune_card_cache(version=__version__, max_entries=self.max_entries, table_name=self.table_name)
+
+    def get_many(self, cache_keys: list[str]) -> dict[str, dict]:
+        with self._lock:
+            return self._connected_db().fetch_cached_cards(cache_keys=cache_keys, table_name=self.table_name)
+
+    def put_many(self, cards: dict[str, dict]) -> None:
+        with self._lock:
+            db = self._connected_db()
+            db.upload_cached_cards(cards=cards, version=__version__, table_name=self.table_name)
+            self._writes_since_prune += len(cards)
+            if self._writes_since_prune >= self.prune_every:
+                db.prune_card_cache(version=__version__, max_entries=self.max_entries, table_name=self.table_name)
+                self._writes_since_prune = 0
+
+    def _connected_db(self) -> PostgresDB:
+        """The backend's database, reconnected if the connection was closed (ex: dropped by the server)"""
+        if self._db.connection is None or self._db.connection.closed:
+            self._db.close_connection()
+            self._db.connect()
+        return self._db
+
+
+# ------------------------------------------------------------------------
+# CARD CACHE
+# ------------------------------------------------------------------------
+
+class CardCache:
+    """Cache of built cards keyed by `card_cache_key`.
+
+    A hit skips the whole build (stats cleaning, chart search, points, etc) and only reloads
+    the stored card. Image generation still runs when the request asks for an image.
+    """
+
+    def __init__(self, backend: LocalCardCacheBackend | PostgresCardCacheBackend) -> None:
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def build(self, card: ShowdownPlayerCard) -> ShowdownPlayerCard:
+        """Build an unbuilt card, or load it from the cache.
+
+        Args:
+            card: Card created with `build_on_init=False`.
+
+        Returns:
+            Built card. Either `card` itself or a new card loaded from the cache.
+        """
+        built_cards = self.build_cards(cards=[card], errors=None, raise_errors=True)
+        return built_cards[0]
+
+    def build_cards(self, cards: list[ShowdownPlayerCard], batch_size: int = 250, errors: list[tuple[ShowdownPlayerCard, Exception]] = None, raise_errors: bool = False) -> list[ShowdownPlayerCard]:
+        """Cache aware `ShowdownPlayerCard.build_cards`. Cached cards are loaded in one lookup,
+        the rest are built together and stored.
+
+        Args:
+            cards: Cards created with `build_on_init=False`.
+            batch_size: Max number of players scored in one chart batch.
+            errors: Optional list to collect (card, exception) for failed cards. If None, errors are printed.
+            raise_errors: Raise the first build error instead of collecting it.
+
+        Returns:
+            Built cards in input order. Failed cards are skipped.
+        """
+        keys = [card_cache_key(card) for card in cards]
+        lookup_keys = [key for card, key in zip(cards, keys) if not card.ignore_cache]
+        cached = self.backend.get_many(list(dict.fromkeys(lookup_keys))) if len(lookup_keys) > 0 else {}
+
+        # BUILD MISSES TOGETHER
+        misses = [card for card, key in zip(cards, keys) if key not in cached or card.ignore_cache]
+        build_errors: list[tuple[ShowdownPlayerCard, Exception]] = []
+        if len(misses) == 1 and raise_errors:
+            misses[0].build_card(show_image=misses[0].show_image, print_to_cli=misses[0].print_to_cli)
+        elif len(misses) > 0:
+            ShowdownPlayerCard.build_cards(cards=misses, batch_size=batch_size, errors=build_errors)
+        failed = { id(card) for card, _ in build_errors }
+        if errors is not None:
+            errors.extend(build_errors)
+        elif raise_errors and len(build_errors) > 0:
+            raise build_errors[0][1]
+        else:
+            for card, e in build_errors:
+                print(f"\nERROR CREATING SHOWDOWN CARD FOR {card.name} ({card.year}) - {e}")
+
+        # STORE NEW CARDS
+        new_cards = { key: self._card_data(card) for card, key in zip(cards, keys) if id(card) not in failed and (key not in cached or card.ignore_cache) }
+        if len(new_cards) > 0:
+            self.backend.put_many(new_cards)
+
+        built_cards: list[ShowdownPlayerCard] = []
+        for card, key in zip(cards, keys):
+            if id(card) in failed:
+                continue
+            if key in cached and not card.ignore_cache:
+                self.hits += 1
+                built_cards.append(self._load_card(request_card=card, card_data=cached[key]))
+            else:
+                self.misses += 1
+                built_cards.append(card)
+        return built_cards
+
+    def _card_data(self, card: ShowdownPlayerCard) -> dict:
+        """Card JSON to store. Accuracy breakdowns are stored as is so they aren't recalculated when loaded."""
+        card_data = card.as_json()
+        for breakdowns in (card_data.get('command_out_accuracy_breakdowns', None) or {}).values():
+            for breakdown in breakdowns.values():
+                breakdown['disable_calcs'] = True
+        for breakdown in ((card_data.get('chart', None) or {}).get('accuracy_breakdown', None) or {}).values():
+            breakdown['disable_calcs'] = True
+        return card_data
+
+    def _load_card(self, request_card: ShowdownPlayerCard, card_data: dict) -> ShowdownPlayerCard:
+        """Cached card with the request's environment fields, generating an image if requested.
+        When the request profiles stages, the profile has a 'cache_hit' stage in place of the build stages."""
+        start_time = datetime.now()
+        stage_profile = StageProfile() if request_card.profile_stages else None
+        with (stage_profile.stage('cache_hit') if stage_profile is not None else NO_STAGE):
+            card = ShowdownPlayerCard(**(card_data | {field: getattr(request_card, field) for field in REQUEST_FIELDS}))
+            for field in REQUEST_IMAGE_FIELDS:
+                setattr(card.image, field, getattr(request_card.image, field))
+
+            # CHART RECALCULATES ITS ACCURACY ON INIT, STARTING FROM THE STORED VALUE. RESTORE WHAT WAS BUILT.
+            chart_data = card_data.get('chart', None)
+            if card.chart and chart_data:
+                for field in ['accuracy', 'command_accuracy_weight', 'command_out_accuracy_weight']:
+                    setattr(card.chart, field, chart_data.get(field, getattr(card.chart, field)))
+                card.chart.accuracy_breakdown = { Stat(stat): ChartAccuracyBreakdown(**breakdown) for stat, breakdown in (chart_data.get('accuracy_breakdown', None) or {}).items() }
+        card.stage_profile = stage_profile
+
+        if card.show_image or card.image.output_folder_path or card.image.upload_to_supabase:
+            with card._stage('generate_card_image'):
+                card.generate_card_image(show=card.show_image)
+            if card.image.upload_to_supabase:
+                with card._stage('upload_to_supabase'):
+                    card.upload_image_to_supabase()
+        else:
+            card.load_time = round((datetime.now() - start_time).total_seconds(), 2)
+
+        if card.print_to_cli:
+            card.print_player()
+
+        return card
+
+
+# ------------------------------------------------------------------------
+# DEFAULT CACHE
+# ------------------------------------------------------------------------
+
+_default_card_cache: Optional[CardCache] = None
+_default_card_cache_lock = Lock()
+
+def default_card_cache() -> Optional[CardCache]:
+    """Process wide card cache configured with environment variables. None when caching is disabled.
+
+    CARD_CACHE_BACKEND: LOCAL or POSTGRES. Caching is disabled when not set.
+    CARD_CACHE_MAX_ENTRIES: Max number of cached cards (LRU eviction).
+    CARD_CACHE_PATH: Folder for the LOCAL backend. Defaults to `cache/cards` in the repo.
+
+    Returns:
+        CardCache or None.
+    """
+    global _default_card_cache
+    backend_type_str = os.getenv('CARD_CACHE_BACKEND', None)
+    if not backend_type_str:
+        return None
+
+    with _default_card_cache_lock:
+        if _default_card_cache is None:
+            max_entries = os.getenv('CARD_CACHE_MAX_ENTRIES', None)
+            backend = _card_cache_backend(backend_type=CardCacheBackendType(backend_type_str.upper()), max_entries=int(max_entries) if max_entries else None)
+            _default_card_cache = CardCache(backend=backend)
+
+    return _default_card_cache
+
+
+def _card_cache_backend(backend_type: CardCacheBackendType, max_entries: Optional[int] = None, namespace: Optional[str] = None) -> LocalCardCacheBackend | PostgresCardCacheBackend:
+    """Cache backend of the given type. A namespace stores entries apart from built cards, in a subfolder (LOCAL) or a `<namespace>_cache` table (POSTGRES)."""
+    max_entries_kwargs = {'max_entries': max_entries} if max_entries else {}
+    match backend_type:
+        case CardCacheBackendType.LOCAL:
+            folder_path = os.getenv('CARD_CACHE_PATH', None) or os.path.join(Path(os.path.dirname(__file__)).parent.parent.parent, 'cache', 'cards')
+            return LocalCardCacheBackend(folder_path=folder_path, namespace=namespace, **max_entries_kwargs)
+        case CardCacheBackendType.POSTGRES:
+            return PostgresCardCacheBackend(table_name=f'{namespace}_cache' if namespace else 'card_cache', **max_entries_kwargs)
+
+
+def build_cached_card(**kwargs) -> ShowdownPlayerCard:
+    """`ShowdownPlayerCard(**kwargs)` served from the default card cache when one is configured.
+
+    Args:
+        **kwargs: ShowdownPlayerCard inputs.
+
+    Returns:
+        Built ShowdownPlayerCard (unbuilt if `build_on_init=False` is passed).
+    """
+    card_cache = default_card_cache()
+    if card_cache is None or not kwargs.get('build_on_init', True):
+        return ShowdownPlayerCard(**kwargs)
+    card = card_cache.build(ShowdownPlayerCard(**(kwargs | {'build_on_init': False})))
+    card.build_on_init = True
+    return card
+
+
+# ------------------------------------------------------------------------
+# CAREER TREND CACHE
+# ------------------------------------------------------------------------
+
+def career_trend_cache_key(archive: PlayerArchive, set: str, options: dict) -> str:
+    """Hash for one archived season's career trend datapoint.
+
+    Changes whenever the archive row is modified or the bot version changes.
+
+    Args:
+        archive: Archived season.
+        set: Showdown Set value.
+        options: Other card inputs shared by every season (era, chart options, etc). Request fields are ignored.
+
+    Returns:
+        SHA256 hex digest.
+    """
+    inputs = {
+        'type': 'career_trend',
+        'bref_id': archive.bref_id,
+        'year': archive.year,
+        'set': set,
+        'type_override': archive.player_type_override,
+        'modified_date': archive.modified_date,
+        'stats_modified_date': archive.stats_modified_date,
+        'options': {k: v for k, v in options.items() if k not in REQUEST_FIELDS},
+        'version': __version__,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class CareerTrendCache:
+    """Career trend datapoints (one per archived season) kept in process, backed by a cache backend when one is configured.
+    The backend should be separate from the card cache's (see `default_career_trend_cache`) so trends don't share its eviction budget.
+
+    Entries are dicts with the season card's `player_type` and its `trend` datapoint.
+    """
+
+    def __init__(self, backend: Optional[LocalCardCacheBackend | PostgresCardCacheBackend] = None, max_entries: int = 50000) -> None:
+        self.backend = backend
+        self.max_entries = max_entries
+        self._lru: OrderedDict[str, dict] = OrderedDict()
+        self._lock = Lock()
+
+    def get_many(self, cache_keys: list[str]) -> dict[str, tuple[str, TrendDatapoint]]:
+        """Cached datapoints for the keys that were found.
+
+        Args:
+            cache_keys: Keys from `career_trend_cache_key`.
+
+        Returns:
+            Dict of cache key to (player type, trend datapoint).
+        """
+        entries: dict[str, dict] = {}
+        with self._lock:
+            for cache_key in cache_keys:
+                entry = self._lru.get(cache_key, None)
+                if entry is not None:
+                    self._lru.move_to_end(cache_key)
+                    entries[cache_key] = entry
+
+        # FALL BACK TO THE BACKEND, KEEPING HITS IN PROCESS
+        missing_keys = [cache_key for cache_key in cache_keys if cache_key not in entries]
+        if self.backend is not None and len(missing_keys) > 0:
+            backend_entries = self.backend.get_many(missing_keys)
+            self._remember(backend_entries)
+            entries.update(backend_entries)
+
+        return { cache_key: (entry['player_type'], TrendDatapoint(**entry['trend'])) for cache_key, entry in entries.items() }
+
+    def put_many(self, datapoints: dict[str, tuple[str, TrendDatapoint]]) -> None:
+        """Store datapoints.
+
+        Args:
+            datapoints: Dict of cache key to (player type, trend datapoint).
+        """
+        entries = { cache_key: {'player_type': player_type, 'trend': trend.model_dump(mode='json')} for cache_key, (player_type, trend) in datapoints.items() }
+        self._remember(entries)
+        if self.backend is not None and len(entries) > 0:
+            self.backend.put_many(entries)
+
+    def _remember(self, entries: dict[str, dict]) -> None:
+        with self._lock:
+            for cache_key, entry in entries.items():
+                self._lru[cache_key] = entry
+                self._lru.move_to_end(cache_key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+
+_default_career_trend_cache: Optional[CareerTrendCache] = None
+
+def default_career_trend_cache() -> CareerTrendCache:
+    """Process wide career trend cache. Always kept in process, and stored with the CARD_CACHE_BACKEND type when it's set.
+    Trends get their own folder (`career_trends` under CARD_CACHE_PATH) or table (internal.career_trends_cache),
+    never mixed with built cards.
+
+    CAREER_TREND_CACHE_MAX_ENTRIES: Max number of datapoints kept in process and in the backend.
+
+    Returns:
+        CareerTrendCache.
+    """
+    global _default_career_trend_cache
+    backend_type_str = os.getenv('CARD_CACHE_BACKEND', None)
+    with _default_card_cache_lock:
+        if _default_career_trend_cache is None:
+            max_entries = os.getenv('CAREER_TREND_CACHE_MAX_ENTRIES', None)
+            max_entries_kwargs = {'max_entries': int(max_entries)} if max_entries else {}
+            backend = _card_cache_backend(backend_type=CardCacheBackendType(backend_type_str.upper()), namespace='career_trends', **max_entries_kwargs) if backend_type_str else None
+            _default_career_trend_cache = CareerTrendCache(backend=backend, **max_entries_kwargs)
+    return _default_career_trend_cache
@@ -1,8 +1,13 @@
 from pprint import pprint
-from typing import Any
+from typing import Any, Optional
 from prettytable import PrettyTable
 from datetime import date, datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+import multiprocessing
+import atexit
 import traceback
+import os
 import json
 import ast
 
@@ -13,7 +18,9 @@ from .stats.baseball_ref_scraper import BaseballReferenceScraper
 from .stats.stats_period import StatsPeriod, StatsPeriodType, StatsPeriodDateAggregation, StatsPeriodLeague
 from .utils.shared_functions import convert_to_date, convert_year_string_to_list
 from .trends.trends import CareerTrends, InSeasonTrends, TrendDatapoint
+from .trends.in_season_trend_store import InSeasonTrendStore, StoredTrendDatapoint, default_in_season_trend_store, in_season_trend_key, trend_game_summaries
 from ..database.postgres_db import PostgresDB, PlayerArchive
+from .card_cache import default_card_cache, build_cached_card, default_career_trend_cache, career_trend_cache_key
 
 # STATS
 from .stats.mlb_stats_api import MLBStatsAPI
@@ -336,7 +343,7 @@ def generate_card(**kwargs) -> dict[str, Any]:
         # PROCESS CARD
         image_source = ImageSource(**kwargs)
         image = ShowdownImage(source=image_source, **kwargs)
-        card = ShowdownPlayerCard(
+        card = build_cached_card(
             stats_period=stats_period, 
             stats=stats, 
             realtime_game_logs=[game_boxscore] if game_boxscore else None, 
@@ -375,6 +382,7 @@ def generate_card(**kwargs) -> dict[str, Any]:
 
         # ADD ANY OTHER CONTEXTUAL LOGGING
         additional_logs['scraper_load_time'] = scraper_load_time
+        additional_logs['card_stage_profile'] = card.stage_profile.model_dump(mode='json') if card.stage_profile else None # ONLY WHEN `profile_stages` IS ENABLED
 
         # ADD CODE TO LOG CARD TO DB
         if db_for_logs:
@@ -488,31 +496,56 @@ def generate_all_historical_yearly_cards_for_player(actual_card:ShowdownPlayerCa
     kwargs.pop('print_to_cli', None) # Remove print_to_cli from kwargs to avoid confusion
     kwargs.pop('show_image', None) # Remove show_image from kwargs to avoid confusion
     kwargs.pop('chart_version', None) # Remove year from kwargs to avoid confusion
-    
-    for year_archive in yearly_archive_data:
 
-        # BUILD SHOWDOWN CARD
-        try:
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k not in [
-                "name", "year", "stats", "stats_period", "player_type_override",
-            ]}
-            yearly_card = ShowdownPlayerCard(
-                name=year_archive.name, 
-                year=str(year_archive.year), 
-                stats=year_archive.stats,
-                stats_period=StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=str(year_archive.year)),
-                player_type_override=year_archive.player_type_override,
-                print_to_cli=False,
-                show_image=False,
-                chart_version=1,
-                **filtered_kwargs
-            )
-            if yearly_card.player_type != actual_card.player_type:
-                continue
-            yearly_trends_data[int(year_archive.year)] = yearly_card.trend_line_data()
-        except Exception as e:
-            print(e)
+    # INPUTS SHARED BY EVERY YEAR WERE ALREADY VALIDATED ON THE ACTUAL CARD, REUSE THEM SO EACH YEAR SKIPS VALIDATION
+    # ERA IS LEFT AS INPUTTED SINCE 'DYNAMIC' RESOLVES DIFFERENTLY FOR EACH YEAR, FIELDS DERIVED FROM STATS ARE RESOLVED PER YEAR
+    trusted_kwargs = {
+        k: getattr(actual_card, k) for k in kwargs.keys() 
+            if k in ShowdownPlayerCard.model_fields and k not in [
+                "name", "year", "stats", "stats_period", "player_type_override", "era",
+                "player_type", "bref_id", "bref_url", "mlb_id", "is_stats_estimate", "league", "team", "nationality",
+                "build_on_init",
+            ]
+    }
+
+    # CACHED DATAPOINTS ARE KEYED BY THE ARCHIVE ROW'S MODIFIED DATES AND THE BOT VERSION, SO EDITS TO EITHER REBUILD THE SEASON
+    trend_cache = default_career_trend_cache()
+    trend_options = trusted_kwargs | {'era': kwargs.get('era', None)}
+    cache_keys = [career_trend_cache_key(archive=year_archive, set=actual_card.set.value, options=trend_options) for year_archive in yearly_archive_data]
+    datapoints = trend_cache.get_many(cache_keys) if not actual_card.ignore_cache else {}
+
+    # BUILD SEASONS THAT AREN'T CACHED
+    missing = [(cache_key, year_archive) for cache_key, year_archive in zip(cache_keys, yearly_archive_data) if cache_key not in datapoints]
+    units = [
+        dict(
+            name=year_archive.name, 
+            year=str(year_archive.year), 
+            stats=year_archive.stats,
+            stats_period=StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=str(year_archive.year)),
+            era=kwargs.get('era', None),
+            player_type_override=year_archive.player_type_override,
+            print_to_cli=False,
+            show_image=False,
+            chart_version=1,
+            **trusted_kwargs
+        ) for _, year_archive in missing
+    ]
+    new_datapoints: dict[str, tuple[str, TrendDatapoint]] = {}
+    for (cache_key, _), (player_type, datapoint, error) in zip(missing, _build_career_trend_datapoints_in_pool(units=units)):
+        if error:
+            print(error)
             continue # SKIP YEAR
+        new_datapoints[cache_key] = (player_type, datapoint)
+    trend_cache.put_many(new_datapoints)
+    datapoints.update(new_datapoints)
+
+    for cache_key, year_archive in zip(cache_keys, yearly_archive_data):
+        if cache_key not in datapoints:
+            continue
+        player_type, datapoint = datapoints[cache_key]
+        if player_type != actual_card.player_type.value:
+            continue
+        yearly_trends_data[int(year_archive.year)] = datapoint
     
     # ADD CURRENT YEAR
     if len(yearly_trends_data) > 0 and actual_card.stats_period.year_int is not None:
@@ -531,13 +564,129 @@ def generate_all_historical_yearly_cards_for_player(actual_card:ShowdownPlayerCa
     # GET ALL HISTORICAL CARDS
     return CareerTrends(yearly_trends=yearly_trends_data)
 
-def generate_in_season_trends_for_player(actual_card: ShowdownPlayerCard, date_aggregation:str, team_override:Team | str = None, include_day_over_day: bool = False, points_change_cutoff_date: date = None, **kwargs) -> InSeasonTrends:
+# ------------------------------------------------------------------------
+# CAREER TRENDS WORKERS
+# ------------------------------------------------------------------------
+# MODULE LEVEL SO THEY CAN BE PICKLED BY ProcessPoolExecutor
+
+# SEASONS PER WORKER BEFORE THE POOL IS WORTH THE OVERHEAD OF SENDING STATS TO WORKERS
+CAREER_TRENDS_MIN_SEASONS_PER_WORKER = 4
+
+_career_trends_executor: Optional[ProcessPoolExecutor] = None
+_career_trends_executor_lock = Lock()
+
+# POOL IS OFF UNLESS ENABLED BY AN OFFLINE CALLER (EX: CLI) OR CAREER_TRENDS_WORKERS.
+# WEB WORKERS BUILD IN PROCESS SO EACH GUNICORN WORKER DOESN'T HOLD ITS OWN SET OF SPAWNED PROCESSES.
+_career_trends_pool_workers: Optional[int] = None
+
+def enable_career_trends_pool(workers: int = None) -> None:
+    """Allow career trends to build archived seasons in a process pool. Meant for CLI and offline scripts, not the web app.
+    The pool is created on first use and shut down when the process exits.
+
+    Args:
+        workers: Number of worker processes. Defaults to CAREER_TRENDS_WORKERS, otherwise CPU count (max 4).
+    """
+    global _career_trends_pool_workers
+    env_workers = os.getenv('CAREER_TRENDS_WORKERS', None)
+    _career_trends_pool_workers = workers or (int(env_workers) if env_workers else min(4, os.cpu_count() or 1))
+
+def shutdown_career_trends_pool() -> None:
+    """Shut down the career trends process pool if one was started. Registered with atexit when the pool is created."""
+    global _career_trends_executor
+    with _career_trends_executor_lock:
+        executor, _career_trends_executor = _career_trends_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def _career_trends_workers() -> int:
+    """Number of worker processes for career trends. 0 means build in process.
+    Set with `enable_career_trends_pool` or the CAREER_TRENDS_WORKERS env variable (off by default)."""
+    if _career_trends_pool_workers is not None:
+        return _career_trends_pool_workers
+    workers = os.getenv('CAREER_TRENDS_WORKERS', None)
+    return int(workers) if workers else 0
+
+def _build_career_trend_datapoints(units: list[dict]) -> list[tuple[Optional[str], Optional[TrendDatapoint], Optional[str]]]:
+    """Build archived season cards together and return their trend datapoints. Runs in a worker process when using the pool.
+
+    Args:
+        units: `ShowdownPlayerCard.from_trusted_inputs` keyword arguments, one per season.
+
+    Returns:
+        One (player type, trend datapoint, error message) tuple per unit, in unit order. Error is None when it succeeded.
+    """
+    results: list[ShowdownPlayerCard | Exception] = []
+    for unit in units:
+        try:
+            results.append(ShowdownPlayerCard.from_trusted_inputs(**(unit | {'build_on_init': False})))
+        except Exception as e:
+            results.append(e)
+
+    # BUILD TOGETHER SO CHARTS ARE SOLVED IN ONE BATCH
+    cards = [result for result in results if isinstance(result, ShowdownPlayerCard)]
+    build_errors: list[tuple[ShowdownPlayerCard, Exception]] = []
+    card_cache = default_card_cache()
+    built_cards = iter(card_cache.build_cards(cards=cards, errors=build_errors) if card_cache else ShowdownPlayerCard.build_cards(cards=cards, errors=build_errors))
+    failed = { id(card): e for card, e in build_errors }
+
+    datapoints: list[tuple[Optional[str], Optional[TrendDatapoint], Optional[str]]] = []
+    for result in results:
+        error = result if isinstance(result, Exception) else failed.get(id(result), None)
+        if error is not None:
+            datapoints.append( (None, None, str(error)) )
+            continue
+        card = next(built_cards)
+        try:
+            datapoints.append( (card.player_type.value, card.trend_line_data(), None) )
+        except Exception as e:
+            datapoints.append( (None, None, str(e)) )
+    return datapoints
+
+def _build_career_trend_datapoints_in_pool(units: list[dict]) -> list[tuple[Optional[str], Optional[TrendDatapoint], Optional[str]]]:
+    """Build career trend datapoints, split across a small process pool when the pool is enabled and there are enough seasons.
+    The pool is created on first use, reused by later calls, and shut down at exit.
+
+    Args:
+        units: `ShowdownPlayerCard.from_trusted_inputs` keyword arguments, one per season.
+
+    Returns:
+        One (player type, trend datapoint, error message) tuple per unit, in unit order.
+    """
+    global _career_trends_executor
+    workers = min(_career_trends_workers(), len(units) // CAREER_TRENDS_MIN_SEASONS_PER_WORKER)
+    if workers <= 1:
+        return _build_career_trend_datapoints(units)
+
+    with _career_trends_executor_lock:
+        if _career_trends_executor is None:
+            # SPAWN SO WORKERS AREN'T FORKED FROM A MULTI-THREADED WEB SERVER
+            _career_trends_executor = ProcessPoolExecutor(max_workers=_career_trends_workers(), mp_context=multiprocessing.get_context('spawn'))
+            atexit.register(shutdown_career_trends_pool)
+        executor = _career_trends_executor
+
+    chunk_size = -(-len(units) // workers)
+    chunks = [units[i:i + chunk_size] for i in range(0, len(units), chunk_size)]
+    try:
+        return [datapoint for chunk_datapoints in executor.map(_build_career_trend_datapoints, chunks) for datapoint in chunk_datapoints]
+    except Exception as e:
+        # POOL IS BROKEN (EX: WORKER DIED), BUILD IN THIS PROCESS AND START A NEW POOL NEXT TIME
+        print(f"Career trends worker pool failed, building in process: {e}")
+        with _career_trends_executor_lock:
+            if _career_trends_executor is executor:
+                _career_trends_executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        return _build_career_trend_datapoints(units)
+
+def generate_in_season_trends_for_player(actual_card: ShowdownPlayerCard, date_aggregation:str, team_override:Team | str = None, include_day_over_day: bool = False, points_change_cutoff_date: date = None, trend_store: InSeasonTrendStore = None, update_trend_store: bool = False, **kwargs) -> InSeasonTrends:
     """Generate in-season trends for a player. Done on a weekly or monthly basis, showing points per week.
 
     Args:
         points_change_cutoff_date: If provided, the weekly `points_change` value is only populated when the
             player's most recent game log date is on or after this date. Used to avoid showing a stale weekly
             trend for players who haven't played recently (e.g. injured, traded, offseason).
+        trend_store: Precomputed datapoints to read from. Defaults to `default_in_season_trend_store()`.
+            Datapoints are only built for date ranges that aren't stored or have new games since they were stored.
+        update_trend_store: Store datapoints that were built in `trend_store`. Used by the nightly `database in_season_trends` command.
     """
 
     # REMOVE PRINT TO CLI
@@ -551,6 +700,7 @@ def generate_in_season_trends_for_player(actual_card: ShowdownPlayerCard, date_a
         return None
     
     # FILTER TO SINGLE TEAM IF OVERRIDE IS PROVIDED
+    team_filter_value: str = None
     if team_override:
         team_filter_value = team_override.value if isinstance(team_override, Team) else team_override
         game_logs = [gl for gl in game_logs if gl.get('team_ID', 'n/a') == team_filter_value]
@@ -579,24 +729,76 @@ def generate_in_season_trends_for_player(actual_card: ShowdownPlayerCard, date_a
             # APPEND AT SECOND TO LAST POSITION
             date_ranges.insert(-1, (player_first_date, yesterday))
 
+    # ONE CARD PER DATE RANGE. EVERY RANGE STARTS ON THE PLAYER'S FIRST GAME, SO GAME LOGS ARE SUMMED ONCE AND SHARED
+    end_date_minimum = min(datetime(year=int(year), month=3, day=28), datetime.now()).date()
+    date_ranges = [dr for dr in date_ranges if dr[1] >= end_date_minimum] # SKIP EARLY SEASON
     in_season_trends_data: dict[str, TrendDatapoint] = {}
-    for dr in date_ranges:
-        start_date, end_date = dr
-        end_date_str = end_date.strftime('%Y-%m-%d')
-        end_date_minimum = min(datetime(year=int(year), month=3, day=28), datetime.now()).date()
-        if end_date < end_date_minimum: continue # SKIP EARLY SEASON
+    try:
+        weekly_cards = ShowdownPlayerCard.cards_for_date_ranges(
+            stats_periods=[StatsPeriod(type=StatsPeriodType.DATE_RANGE, year=str(year), start_date=start_date, end_date=end_date) for start_date, end_date in date_ranges],
+            stats=actual_card.stats,
+            chart_version=1,
+            **kwargs,
+        ) if len(date_ranges) > 0 else []
+    except Exception as e:
+        print(e)
+        weekly_cards = []
+
+    # PRECOMPUTED DATAPOINTS
+    # A STORED DATAPOINT IS USED WHILE ITS DATE RANGE HAS THE SAME GAMES, SO ONLY RANGES WITH NEW GAMES ARE BUILT
+    trend_store = trend_store or default_in_season_trend_store()
+    trend_key: str = None
+    game_summaries = {}
+    stored_datapoints: dict[str, StoredTrendDatapoint] = {}
+    if trend_store and len(weekly_cards) > 0:
         try:
-            weekly_card = ShowdownPlayerCard(
-                stats_period=StatsPeriod(type=StatsPeriodType.DATE_RANGE, year=str(year), start_date=start_date, end_date=end_date),
-                stats=actual_card.stats,
-                chart_version=1,
-                **kwargs,
-            )
-            in_season_trends_data[end_date_str] = weekly_card.trend_line_data()
+            trend_key = in_season_trend_key(actual_card=actual_card, trend_card=weekly_cards[0], date_aggregation=date_aggregation, team_filter=team_filter_value)
+            game_summaries = trend_game_summaries(game_logs=game_logs, year=int(year), date_ranges=date_ranges)
+            if not kwargs.get('ignore_cache', False):
+                stored_datapoints = trend_store.get_many(trend_keys=[trend_key]).get(trend_key, {})
+        except Exception as e:
+            print(f"Error reading precomputed in-season trends: {e}")
+    date_ranges_and_cards_to_build = [
+        (dr, card) for dr, card in zip(date_ranges, weekly_cards)
+        if (stored := stored_datapoints.get(dr[1].strftime('%Y-%m-%d'), None)) is None or stored.game_summary != game_summaries.get(dr[1].strftime('%Y-%m-%d'), None)
+    ]
+
+    # BUILD TOGETHER SO CHARTS ARE SOLVED IN ONE BATCH
+    build_errors: list[tuple[ShowdownPlayerCard, Exception]] = []
+    card_cache = default_card_cache()
+    weekly_cards_to_build = [card for _, card in date_ranges_and_cards_to_build]
+    built_weekly_cards = card_cache.build_cards(cards=weekly_cards_to_build, errors=build_errors) if card_cache else ShowdownPlayerCard.build_cards(cards=weekly_cards_to_build, errors=build_errors)
+    failed_card_ids = { id(card) for card, _ in build_errors }
+    for _, e in build_errors:
+        print(e)
+    built_date_ranges = [dr for dr, card in date_ranges_and_cards_to_build if id(card) not in failed_card_ids]
+    built_trends_data: dict[str, TrendDatapoint] = {}
+    for (_, end_date), weekly_card in zip(built_date_ranges, built_weekly_cards):
+        try:
+            built_trends_data[end_date.strftime('%Y-%m-%d')] = weekly_card.trend_line_data()
         except Exception as e:
             print(e)
             continue
 
+    # COMBINE IN DATE ORDER
+    for _, end_date in date_ranges:
+        end_date_str = end_date.strftime('%Y-%m-%d')
+        trend_datapoint = built_trends_data.get(end_date_str, None) or (stored_datapoints[end_date_str].trend if end_date_str in stored_datapoints else None)
+        if trend_datapoint:
+            in_season_trends_data[end_date_str] = trend_datapoint
+
+    # STORE NEW DATAPOINTS
+    if update_trend_store and trend_key and len(built_trends_data) > 0:
+        try:
+            trend_store.put(
+                trend_key=trend_key, 
+                actual_card=actual_card, 
+                date_aggregation=date_aggregation,
+                datapoints=[StoredTrendDatapoint(end_date=end_date_str, game_summary=game_summaries[end_date_str], trend=trend_datapoint) for end_date_str, trend_datapoint in built_trends_data.items()],
+            )
+        except Exception as e:
+            print(f"Error storing precomputed in-season trends: {e}")
+
     # RETURN NONE IF NO TRENDS FOUND
     trends_data_count = len(in_season_trends_data)
     if trends_data_count == 0:
@@ -677,7 +879,7 @@ def generate_random_player(**kwargs) -> PlayerArchive:
     if random_player:
         return random_player
 
-def generate_cards(player_ids: list[str], years: list[int], keep_as_py_objects:bool=False, sets: list[str] = None, inject_bref_ids: bool = False, points_change_cutoff_date: date = None, two_way_ids: list[str] = None, **kwargs) -> list[dict[str, Any]]:
+def generate_cards(player_ids: list[str], years: list[int], keep_as_py_objects:bool=False, sets: list[str] = None, inject_bref_ids: bool = False, points_change_cutoff_date: date = None, two_way_ids: list[str] = None, in_season_trend_store: InSeasonTrendStore = None, update_in_season_trend_store: bool = False, **kwargs) -> list[dict[str, Any]]:
     """Generate multiple cards for a list of player ids and a year. Only works with MLB API datasource.
 
     Args:
@@ -687,6 +889,8 @@ def generate_cards(player_ids: list[str], years: list[int], keep_as_py_objects:b
         sets: Optional list of sets to generate cards for. If provided, will generate a card for each set specified for each player and year combination. Ex: ["2000", "EXPANDED"]
         inject_bref_ids: When True, does a single batch lookup against dim_player_id_map to enrich each NormalizedPlayerStats with its bref_id before building the stats row.
         points_change_cutoff_date: If provided, passed through to weekly trend generation so `points_change['week']` is only populated for players who have played a game on or after this date.
+        in_season_trend_store: Precomputed weekly trend datapoints to read from. Defaults to `default_in_season_trend_store()`.
+        update_in_season_trend_store: Store weekly trend datapoints that had to be built in `in_season_trend_store`.
         **kwargs: Keyword arguments to pass to card generation function
 
     Returns:
@@ -756,59 +960,77 @@ def generate_cards(player_ids: list[str], years: list[int], keep_as_py_objects:b
             if is_two_way
             else [None]
         )
-        skip_player = False
-        for set in (sets or [None]):
-            if skip_player:
-                break
-            for player_type_override in player_type_overrides:
-                card_kwargs = kwargs.copy()
-
-                # Remove potentially conflicting attributes from kwargs
-                card_kwargs.pop('name', None)
-                card_kwargs.pop('player_type_override', None)
-                
-                if set:
-                    card_kwargs['set'] = set
-                try:
-                    stats_period_type = card_kwargs.get('stats_period_type', 'REGULAR')
-                    stats_period = StatsPeriod(
-                        type=stats_period_type,
-                        player_type_override=player_type_override.value if player_type_override else None,
-                        **card_kwargs
-                    )
-                    normalized_player_stats = PlayerStatsNormalizer.from_mlb_api(
-                        player=player_data,
-                        stats_period=stats_period,
-                    )
-
-                    # Inject sprint speed if available
-                    if sprint_speed_data and normalized_player_stats.type == PlayerType.HITTER:
-                        player_sprint_speed_data = next((s for s in sprint_speed_data if s.player_id == player_data.id), None)
-                        if player_sprint_speed_data:
-                            normalized_player_stats.sprint_speed = player_sprint_speed_data.sprint_speed
-
-                    # Inject defensive stats if available
-                    position_stats = [PositionStats.from_fangraphs_fielding_stats(FieldingStats(**pos_stats)) for pos_stats in fielding_stats_list if pos_stats.get('xMLBAMID', None) == player_data.id]
-                    if position_stats and normalized_player_stats.type == PlayerType.HITTER:
-                        normalized_player_stats.inject_defensive_stats_list(position_stats_list=position_stats, source=Datasource.FANGRAPHS)
-
-                    # Inject bref_id from pre-fetched lookup if enabled
-                    if inject_bref_ids and not normalized_player_stats.bref_id:
-                        normalized_player_stats.add_bref_id(mlb_id_to_bref.get(player_data.id))
+        # (set index, card data) for every override, so cards are added in set then override order
+        player_final_cards: list[tuple[int, dict]] = []
+        for player_type_override in player_type_overrides:
+            card_kwargs = kwargs.copy()
 
-                    if normalized_player_stats.is_missing_stats:
-                        print(f"Skipping card generation for {player_data.full_name} ({normalized_player_stats.type.value}) in {years[0]} due to missing stats.")
-                        skip_player = True
-                        break
+            # Remove potentially conflicting attributes from kwargs
+            card_kwargs.pop('name', None)
+            card_kwargs.pop('player_type_override', None)
 
-                    card = ShowdownPlayerCard(
-                        name=player_data.full_name,
-                        stats_period=stats_period,
-                        stats=normalized_player_stats.as_dict(),
-                        image=ShowdownImage(**card_kwargs),
-                        **card_kwargs
-                    )
+            # Stats are the same for every set, so they are pulled and normalized once
+            try:
+                stats_period_type = card_kwargs.get('stats_period_type', 'REGULAR')
+                stats_period = StatsPeriod(
+                    type=stats_period_type,
+                    player_type_override=player_type_override.value if player_type_override else None,
+                    **card_kwargs
+                )
+                normalized_player_stats = PlayerStatsNormalizer.from_mlb_api(
+                    player=player_data,
+                    stats_period=stats_period,
+                )
+
+                # Inject sprint speed if available
+                if sprint_speed_data and normalized_player_stats.type == PlayerType.HITTER:
+                    player_sprint_speed_data = next((s for s in sprint_speed_data if s.player_id == player_data.id), None)
+                    if player_sprint_speed_data:
+                        normalized_player_stats.sprint_speed = player_sprint_speed_data.sprint_speed
+
+                # Inject defensive stats if available
+                position_stats = [PositionStats.from_fangraphs_fielding_stats(FieldingStats(**pos_stats)) for pos_stats in fielding_stats_list if pos_stats.get('xMLBAMID', None) == player_data.id]
+                if position_stats and normalized_player_stats.type == PlayerType.HITTER:
+                    normalized_player_stats.inject_defensive_stats_list(position_stats_list=position_stats, source=Datasource.FANGRAPHS)
+
+                # Inject bref_id from pre-fetched lookup if enabled
+                if inject_bref_ids and not normalized_player_stats.bref_id:
+                    normalized_player_stats.add_bref_id(mlb_id_to_bref.get(player_data.id))
+
+                if normalized_player_stats.is_missing_stats:
+                    print(f"Skipping card generation for {player_data.full_name} ({normalized_player_stats.type.value}) in {years[0]} due to missing stats.")
+                    break
+
+                # One card per set, sharing set agnostic build stages (stat cleaning, game logs, etc)
+                card_kwargs.pop('set', None)
+                player_cards = ShowdownPlayerCard.cards_for_sets(
+                    sets=sets or [kwargs.get('set', None)],
+                    name=player_data.full_name,
+                    stats_period=stats_period,
+                    stats=normalized_player_stats.as_dict(),
+                    image=ShowdownImage(**card_kwargs),
+                    **card_kwargs
+                )
+                build_errors: list[tuple[ShowdownPlayerCard, Exception]] = []
+                card_cache = default_card_cache()
+                unbuilt_cards = player_cards
+                if card_cache:
+                    player_cards = card_cache.build_cards(cards=unbuilt_cards, errors=build_errors)
+                else:
+                    player_cards = ShowdownPlayerCard.build_cards(cards=unbuilt_cards, errors=build_errors)
+                # Built cards are in set order with failed cards left out
+                failed_card_ids = { id(card) for card, _ in build_errors }
+                set_indexes = [set_index for set_index, card in enumerate(unbuilt_cards) if id(card) not in failed_card_ids]
+                for _, e in build_errors:
+                    traceback.print_exception(e)
+                    errors.append((player_data.full_name, str(e)))
+            except Exception as e:
+                traceback.print_exc()
+                errors.append((player_data.full_name, str(e)))
+                continue
 
+            for set_index, card in zip(set_indexes, player_cards):
+                try:
                     # Remove player type override for the hitter side if this is a two-way player
                     # This will allow proper joining to the player_season_stats table via ID
                     if is_two_way and card.player_type == PlayerType.HITTER:
@@ -828,6 +1050,9 @@ def generate_cards(player_ids: list[str], years: list[int], keep_as_py_objects:b
                         include_day_over_day=True,
                         name=player_data.full_name,
                         points_change_cutoff_date=points_change_cutoff_date,
+                        trend_store=in_season_trend_store,
+                        update_trend_store=update_in_season_trend_store,
+                        set=card.set,
                         **card_kwargs
                     )
                     if in_season_trends_data:
@@ -840,13 +1065,15 @@ def generate_cards(player_ids: list[str], years: list[int], keep_as_py_objects:b
                     else:
                         print(f"No in-season trends data for {player_data.full_name} in {years[0]}.")
 
-                    final_cards.append(final_data)
+                    player_final_cards.append( (set_index, final_data) )
                 except Exception as e:
                     import traceback
                     traceback.print_exc()
                     errors.append((player_data.full_name, str(e)))
                     continue
 
+        final_cards.extend(final_data for _, final_data in sorted(player_final_cards, key=lambda entry: entry[0]))
+
 
     for error in errors:
         print(f"Error generating card for {error[0]}: {error[1]}")
@@ -11,7 +11,7 @@ import math
 # INTERNAL
 from .utils.value_range import ValueRange
 from .stats.metrics import Stat
-from ..data.mlb_season_averages import MLB_SEASON_AVGS
+from ..data.season_averages_table import MLB_SEASON_AVGS_TABLE
 
 # ---------------------------------------
 # CHART CATEGORY
@@ -37,12 +37,13 @@ class ChartCategory(str, Enum):
 
     @property
     def is_out(self) -> bool:
-        return self.value in ['PU', 'SO', 'GB', 'FB']
+        # SET LOOKUP, CALLED FOR EVERY CATEGORY OF EVERY CHART SCORED
+        return self in _OUT_CATEGORIES
     
     @property
     def is_filled_in_desc_order(self) -> bool:
         """Check if category is filled in descending order. Outs and BB are filled in ascending order."""
-        return not self.is_out and self != ChartCategory.BB
+        return self not in _ASC_ORDER_CATEGORIES
 
     def is_valid_for_type(self, is_pitcher:bool) -> bool:
         """Check if category is valid for player type"""
@@ -192,6 +193,9 @@ class ChartCategory(str, Enum):
         return 1.0
 
 
+_OUT_CATEGORIES = frozenset([ChartCategory.PU, ChartCategory.SO, ChartCategory.GB, ChartCategory.FB])
+_ASC_ORDER_CATEGORIES = _OUT_CATEGORIES | {ChartCategory.BB}
+
 # ---------------------------------------
 # CHART ACCURACY
 # ---------------------------------------
@@ -234,6 +238,157 @@ class ChartAccuracyBreakdown(BaseModel):
         self.weighted_accuracy = round(self.accuracy * self.weight, 4)
 
 
+# ---------------------------------------
+# CHART KERNEL
+# ---------------------------------------
+
+def _py_round(values: np.ndarray, digits: int = 4) -> np.ndarray:
+    """Element-wise Python `round`, which is correctly rounded unlike `np.round`.
+
+    Rounding the scaled value is exact unless the scaling lands within an ulp of a halfway
+    point, so only those (rare) elements fall back to `round`.
+    """
+    scale = 10.0 ** digits
+    scaled = values * scale
+    result = np.rint(scaled) / scale
+    with np.errstate(invalid='ignore'):
+        distance_to_half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+        is_ambiguous = ~(distance_to_half > np.abs(scaled) * 4.5e-16) & (np.abs(scaled) < 2.0 ** 52)
+    for index in np.flatnonzero(is_ambiguous).tolist():
+        result.flat[index] = round(float(values.flat[index]), digits)
+    return result
+
+
+class ChartKernel:
+    """Numeric core of one or many charts, used for projections.
+
+    Values are stored as one column per `ChartCategory`. `ChartSolver` builds one kernel over
+    every command/outs candidate it scores, with NumPy arrays as columns. `Chart` and card
+    projections use `from_chart`, which reads the chart's values dicts directly, so a single
+    chart skips array overhead and keeps its int/float types.
+    Either way the kernel skips pydantic attribute access and the per category property
+    calls of `Chart`.
+
+    Values and results on `Chart` stay dicts, their insertion order and int/float types
+    carry through to range strings and serialized output.
+    """
+
+    __slots__ = ('values', 'opponent_values', 'my_advantages', 'opponent_advantages', 'stats_per_400_pa')
+
+    def __init__(self, values: dict[ChartCategory, Union[np.ndarray, int, float]], opponent_values: dict[ChartCategory, Union[np.ndarray, int, float]], my_advantages: Union[np.ndarray, int, float], opponent_advantages: Union[np.ndarray, int, float], stats_per_400_pa: dict) -> None:
+        """
+        Args:
+          values: Chart values for each category (single values or columns).
+          opponent_values: Opponent chart values for each category (single values or columns).
+          my_advantages: Number of advantages out of 20 for the chart.
+          opponent_advantages: Number of advantages out of 20 for the opponent.
+          stats_per_400_pa: Real stats per 400 PA (single values or columns).
+        """
+        self.values = values
+        self.opponent_values = opponent_values
+        self.my_advantages = my_advantages
+        self.opponent_advantages = opponent_advantages
+        self.stats_per_400_pa = stats_per_400_pa
+
+    @classmethod
+    def from_chart(cls, chart: 'Chart', opponent: Optional['Chart'] = None) -> 'ChartKernel':
+        """Kernel for a single chart.
+
+        Args:
+          chart: Chart to read values and real stats from.
+          opponent: Optional opponent to use instead of `chart.opponent` (ex: points baseline).
+
+        Returns:
+          ChartKernel with one chart.
+        """
+        opponent = opponent or chart.opponent
+        hitter_advantages = (opponent.command - chart.command) * (1 if chart.is_pitcher else -1)
+        my_advantages = (20 - hitter_advantages) if chart.is_pitcher else hitter_advantages
+        return cls(
+            values=chart.values,
+            opponent_values=opponent.values,
+            my_advantages=my_advantages,
+            opponent_advantages=20 - my_advantages,
+            stats_per_400_pa=chart.stats_per_400_pa,
+        )
+
+    def projected_stats_for_category(self, category: ChartCategory, pa: int = 400) -> Union[np.ndarray, float]:
+        my_results = self.values.get(category, 0)
+        opponent_results = self.opponent_values.get(category, 0)
+        pa_multiplier = pa / 400
+        return ( (my_results * self.my_advantages) + (opponent_results * self.opponent_advantages) ) * pa_multiplier
+
+    def projected_stats_per_400_pa(self) -> dict:
+        """Predict real stats given Showdown in game chart(s).
+
+        Returns:
+          Dict with stats per 400 Plate Appearances (arrays when the kernel holds many charts).
+        """
+
+        # ----- COUNTING STATS -----
+
+        strikeouts_per_400_pa = self.projected_stats_for_category(ChartCategory.SO)
+        walks_per_400_pa = self.projected_stats_for_category(ChartCategory.BB)
+        singles_per_400_pa = self.projected_stats_for_category(ChartCategory._1B) + self.projected_stats_for_category(ChartCategory._1B_PLUS)
+        doubles_per_400_pa = self.projected_stats_for_category(ChartCategory._2B)
+        triples_per_400_pa = self.projected_stats_for_category(ChartCategory._3B)
+        home_runs_per_400_pa = self.projected_stats_for_category(ChartCategory.HR)
+        popups_per_400_pa = self.projected_stats_for_category(ChartCategory.PU)
+        groundouts_per_400_pa = self.projected_stats_for_category(ChartCategory.GB)
+        fly_ball_outs_per_400_pa = self.projected_stats_for_category(ChartCategory.FB)
+        hits_per_400_pa = singles_per_400_pa \
+                            + doubles_per_400_pa \
+                            + triples_per_400_pa \
+                            + home_runs_per_400_pa
+
+        # ----- SLASH LINE -----
+
+        # DEFINE AT BATS
+        # REMOVE REAL LIFE SACRIFICE FLIES FROM FLY BALL OUTS
+        sacrifice_hits_per_400_pa = self.stats_per_400_pa.get('sh_per_400_pa', 0)
+        sacrifice_flies_per_400_pa = self.stats_per_400_pa.get('sf_per_400_pa', 0)
+        ibb_per_400_pa = self.stats_per_400_pa.get('ibb_per_400_pa', 0)
+        at_bats = (400.0 - walks_per_400_pa - sacrifice_hits_per_400_pa - sacrifice_flies_per_400_pa)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+
+            # BA
+            batting_avg = hits_per_400_pa / at_bats
+
+            # OBP
+            obp = self._round( (hits_per_400_pa + walks_per_400_pa) / (at_bats + walks_per_400_pa + sacrifice_flies_per_400_pa) )
+
+            # SLG
+            slugging_pct = self._round( (singles_per_400_pa + (2 * doubles_per_400_pa) + (3 * triples_per_400_pa) + (4 * home_runs_per_400_pa)) / at_bats )
+
+        # GROUP ESTIMATIONS IN DICTIONARY
+        return {
+            'so_per_400_pa': strikeouts_per_400_pa,
+            'pu_per_400_pa': popups_per_400_pa,
+            'gb_per_400_pa': groundouts_per_400_pa,
+            'fb_per_400_pa': fly_ball_outs_per_400_pa,
+            'bb_per_400_pa': walks_per_400_pa,
+            '1b_per_400_pa': singles_per_400_pa,
+            '2b_per_400_pa': doubles_per_400_pa,
+            '3b_per_400_pa': triples_per_400_pa,
+            'hr_per_400_pa': home_runs_per_400_pa,
+            'h_per_400_pa': hits_per_400_pa,
+            'sh_per_400_pa': sacrifice_hits_per_400_pa,
+            'sf_per_400_pa': sacrifice_flies_per_400_pa,
+            'ibb_per_400_pa': ibb_per_400_pa,
+            'ab_per_400_pa': at_bats,
+            'batting_avg': batting_avg,
+            'onbase_perc': obp,
+            'slugging_perc': slugging_pct,
+            'onbase_plus_slugging': self._round( obp + slugging_pct ),
+            'g': self.stats_per_400_pa.get('G', 0),
+        }
+
+    def _round(self, value: Union[np.ndarray, float]) -> Union[np.ndarray, float]:
+        """Round to 4 decimals the same way for columns and single values"""
+        return _py_round(value) if isinstance(value, np.ndarray) else round(value, 4)
+
+
 # ---------------------------------------
 # CHART
 # ---------------------------------------
@@ -297,7 +452,7 @@ class Chart(BaseModel):
 
         # CONVERT FROM WOTC DATA
         if self.is_wotc_conversion:
-            self.slot_values = self.__generate_slot_values()
+            self.slot_values = self.generate_slot_values()
             self.generate_values_and_results_from_wotc_data(results_list=wotc_chart_results)
 
         # POPULATE ESTIMATED COMMAND
@@ -310,7 +465,7 @@ class Chart(BaseModel):
 
         # POPULATE VALUES DICT
         if len(self.values) == 0:
-            self.slot_values = self.__generate_slot_values()
+            self.slot_values = self.generate_slot_values()
             self.generate_values_and_results()
 
         # MAKE SURE BOTH OUTS AND OUTS_FULL ARE POPULATED
@@ -376,7 +531,7 @@ class Chart(BaseModel):
     def onbase_results(self) -> float | int:
         return sum([v for k,v in self.values.items() if not k.is_out])
 
-    def __generate_slot_values(self) -> dict[int, float]:
+    def generate_slot_values(self) -> dict[int, float]:
         
         # EACH SLOT IS WORTH 1 FOR CLASSIC
         if not self.has_over_21_slot_values:
@@ -1472,68 +1627,7 @@ class Chart(BaseModel):
         Returns:
           Dict with stats per 400 Plate Appearances.
         """
-
-        # ----- COUNTING STATS -----
-
-        strikeouts_per_400_pa = self.projected_stats_for_category(ChartCategory.SO)
-        walks_per_400_pa = self.projected_stats_for_category(ChartCategory.BB)
-        singles_per_400_pa = self.projected_stats_for_category(ChartCategory._1B) + self.projected_stats_for_category(ChartCategory._1B_PLUS)
-        doubles_per_400_pa = self.projected_stats_for_category(ChartCategory._2B)
-        triples_per_400_pa = self.projected_stats_for_category(ChartCategory._3B)
-        home_runs_per_400_pa = self.projected_stats_for_category(ChartCategory.HR)
-        popups_per_400_pa = self.projected_stats_for_category(ChartCategory.PU)
-        groundouts_per_400_pa = self.projected_stats_for_category(ChartCategory.GB)
-        fly_ball_outs_per_400_pa = self.projected_stats_for_category(ChartCategory.FB)
-        hits_per_400_pa = singles_per_400_pa \
-                            + doubles_per_400_pa \
-                            + triples_per_400_pa \
-                            + home_runs_per_400_pa
-        
-        # ----- SLASH LINE -----
-
-        # DEFINE AT BATS
-        # REMOVE REAL LIFE SACRIFICE FLIES FROM FLY BALL OUTS
-        sacrifice_hits_per_400_pa = self.stats_per_400_pa.get('sh_per_400_pa', 0)
-        sacrifice_flies_per_400_pa = self.stats_per_400_pa.get('sf_per_400_pa', 0)
-        ibb_per_400_pa = self.stats_per_400_pa.get('ibb_per_400_pa', 0)
-        at_bats = (400.0 - walks_per_400_pa - sacrifice_hits_per_400_pa - sacrifice_flies_per_400_pa)
-
-        # BA
-        batting_avg = hits_per_400_pa / at_bats
-
-        # OBP
-        obp = round( (hits_per_400_pa + walks_per_400_pa) / (at_bats + walks_per_400_pa + sacrifice_flies_per_400_pa), 4)
-
-        # SLG
-        slugging_pct = self.__slugging_pct(ab=at_bats,
-                                           singles=singles_per_400_pa,
-                                           doubles=doubles_per_400_pa,
-                                           triples=triples_per_400_pa,
-                                           homers=home_runs_per_400_pa)
-        # GROUP ESTIMATIONS IN DICTIONARY
-        results_per_400_pa = {
-            'so_per_400_pa': strikeouts_per_400_pa,
-            'pu_per_400_pa': popups_per_400_pa,
-            'gb_per_400_pa': groundouts_per_400_pa,
-            'fb_per_400_pa': fly_ball_outs_per_400_pa,
-            'bb_per_400_pa': walks_per_400_pa,
-            '1b_per_400_pa': singles_per_400_pa,
-            '2b_per_400_pa': doubles_per_400_pa,
-            '3b_per_400_pa': triples_per_400_pa,
-            'hr_per_400_pa': home_runs_per_400_pa,
-            'h_per_400_pa': hits_per_400_pa,
-            'sh_per_400_pa': sacrifice_hits_per_400_pa,
-            'sf_per_400_pa': sacrifice_flies_per_400_pa,
-            'ibb_per_400_pa': ibb_per_400_pa,
-            'ab_per_400_pa': at_bats,
-            'batting_avg': batting_avg,
-            'onbase_perc': obp,
-            'slugging_perc': slugging_pct,
-            'onbase_plus_slugging': round( obp + slugging_pct, 4 ),
-            'g': self.stats_per_400_pa.get('G', 0),
-        }
-
-        return results_per_400_pa
+        return ChartKernel.from_chart(self).projected_stats_per_400_pa()
 
     def projected_stats_for_category(self, category:ChartCategory, pa: int = 400) -> int | float:
 
@@ -1544,10 +1638,6 @@ class Chart(BaseModel):
 
         return total_projected
 
-    def __slugging_pct(self, ab:float, singles:float, doubles:float, triples:float, homers:float)  -> float:
-        """ Calculate Slugging Pct"""
-        return round( (singles + (2 * doubles) + (3 * triples) + (4 * homers)) / ab, 4 )
-    
     @property
     def is_overestimating_obp(self) -> bool:
         """Check if chart is overestimating OBP"""
@@ -1677,7 +1767,7 @@ class Chart(BaseModel):
         """Get average MLB stats for a list of years"""
 
         # HELPERS
-        max_year_mlb_avgs = max(MLB_SEASON_AVGS.keys())
+        max_year_mlb_avgs = MLB_SEASON_AVGS_TABLE.max_year
         num_years_card = len(year_list)
         max_year_card = max(year_list) if len(year_list) > 0 else 0
 
@@ -1689,30 +1779,10 @@ class Chart(BaseModel):
         # IF SINGLE YEAR, TAKE ACTUALS FOR THAT YEAR OR THE PREVIOUS YEAR
         if num_years_card == 1:
             year = min(max_year_card, max_year_mlb_avgs)
-            return MLB_SEASON_AVGS.get(year, {})
-        
-        # IF MULTIPLE YEARS, TAKE AVERAGE OF THE YEARS
-        # FILTER MLB AVERAGES FOR THE YEARS
-        all_years: dict[int, dict[str, float | int]] = {k: v for k, v in MLB_SEASON_AVGS.items() if k in year_list}
-        if len(all_years) == 0:
-            return {}
-        
-        # AVERAGE THE VALUES
-        mlb_avgs:dict[str, list[float | int]] = {}
-        for year_data in all_years.values():
-            for key, value in year_data.items():
-                if isinstance(value, (int, float)):  # Ensure the value is numeric
-                    if value is None: continue
-                    existing_value = mlb_avgs.get(key, [])
-                    existing_value.append(value)
-                    mlb_avgs[key] = existing_value
-        for key, values in mlb_avgs.items():
-            if isinstance(values, list) and len(values) > 0:
-                mlb_avgs[key] = round(sum(values) / len(values), 4)
-            else:
-                mlb_avgs[key] = None
+            return MLB_SEASON_AVGS_TABLE.season(year)
         
-        return mlb_avgs
+        # IF MULTIPLE YEARS, TAKE AVERAGE OF THE YEARS FROM THE PREFIX SUM TABLE
+        return MLB_SEASON_AVGS_TABLE.average(year_list)
 
     def wotc_set_adjustment_factor(self, for_hitter_chart:bool) -> float:
         """Get adjustment factor for WOTC set"""
@@ -0,0 +1,1095 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Optional, Union
+from pydantic import BaseModel
+import numpy as np
+
+# INTERNAL
+from .chart import Chart, ChartCategory, ChartCategoryFillMethod, ChartAccuracyBreakdown, ChartKernel, _py_round
+from .sets import Set, Era
+from ..shared.player_position import PlayerSubType
+from .stats.metrics import Stat
+from .utils.value_range import ValueRange
+
+# ---------------------------------------
+# CONSTANTS
+# ---------------------------------------
+
+CATEGORIES: list[ChartCategory] = list(ChartCategory)
+CATEGORY_INDEX: dict[ChartCategory, int] = { category: index for index, category in enumerate(CATEGORIES) }
+OUT_CATEGORY_INDEXES: list[int] = [CATEGORY_INDEX[c] for c in CATEGORIES if c.is_out]
+
+# RESULTS ARE STORED AS A MATRIX OF CATEGORY INDEXES, ONE ROW PER CHART
+# FILLS CAN WALK PAST SLOT 1 OR SLOT 30, SO SLOT INDEXES ARE SHIFTED BY AN OFFSET
+EMPTY_SLOT = -1
+RESULTS_SLOT_OFFSET = 32
+RESULTS_WIDTH = 96
+SLOT_VALUES_WIDTH = 32
+
+# SLOT WORTH AND SLOT VALUES ONLY DEPEND ON SET, PLAYER TYPE, AND COMMAND
+_SLOT_ATTRIBUTES_CACHE: dict[tuple[str, bool, bool, Union[int, float]], tuple[Union[int, float], np.ndarray]] = {}
+
+
+# ---------------------------------------
+# HELPERS
+# ---------------------------------------
+# THE SCALAR CHART CODE USES PYTHON BUILTINS (round, sum, min, max). THESE HELPERS
+# REPLICATE THEIR EXACT FLOAT SEMANTICS SO BATCHED RESULTS MATCH `Chart` BIT FOR BIT.
+# `_py_round` LIVES WITH `ChartKernel` IN chart.py, WHICH SHARES THE PROJECTION MATH.
+
+# BUILTIN sum OF FLOATS IS COMPENSATED (NEUMAIER) ON 3.12+
+_IS_SUM_COMPENSATED = sys.version_info >= (3, 12)
+
+def _py_sum(columns: list[np.ndarray], n: int, masks: list[np.ndarray] = None) -> np.ndarray:
+    """Row-wise equivalent of Python's builtin `sum` over columns, including its compensation.
+
+    Args:
+        columns: Columns to sum, in the same order as the scalar code.
+        n: Number of rows.
+        masks: Optional list of boolean columns. Values with a False mask are skipped.
+
+    Returns:
+        Array of row sums.
+    """
+    total = np.zeros(n)
+    compensation = np.zeros(n)
+    with np.errstate(invalid='ignore', over='ignore'):
+        for index, column in enumerate(columns):
+            is_included = masks[index] if masks is not None else True
+            new_total = total + column
+            if _IS_SUM_COMPENSATED:
+                column_compensation = np.where(np.abs(total) >= np.abs(column), (total - new_total) + column, (column - new_total) + total)
+                compensation = np.where(is_included, compensation + column_compensation, compensation)
+            total = np.where(is_included, new_total, total)
+        if not _IS_SUM_COMPENSATED:
+            return total
+        return np.where((compensation != 0) & np.isfinite(compensation), total + compensation, total)
+
+def _py_max(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Element-wise equivalent of Python's `max(a, b)`"""
+    return np.where(b > a, b, a)
+
+def _py_min(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Element-wise equivalent of Python's `min(a, b)`"""
+    return np.where(b < a, b, a)
+
+def _custom_round(number: np.ndarray, multiple: np.ndarray, cutoff: float = 0.5) -> np.ndarray:
+    """Element-wise version of `Chart.__custom_round`"""
+    scaled_number = number / multiple
+    whole_number = np.trunc(scaled_number) + 0.0 # NORMALIZE -0.0 TO MATCH int()
+    decimal_part = scaled_number - whole_number
+    return np.where(decimal_part >= cutoff, (whole_number + 1) * multiple, whole_number * multiple)
+
+def _pct_diff(value_1: np.ndarray, value_2: np.ndarray) -> np.ndarray:
+    """Element-wise version of `Chart.__pct_diff`"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (value_1 - value_2) / ((value_1 + value_2) / 2)
+
+
+# ---------------------------------------
+# SEARCH RESULT
+# ---------------------------------------
+
+@dataclass
+class ChartCandidate:
+    """Scored command/outs combination. Holds everything needed to rank it and rebuild the full `Chart`."""
+    command: int
+    outs: Union[int, float]
+    outs_input: Union[int, float]
+    sub_21_per_slot_worth: Union[int, float]
+    command_accuracy_weight: float
+    accuracy: float
+    accuracy_breakdown: dict[Stat, ChartAccuracyBreakdown] = field(default_factory=dict)
+    command_out_accuracy_weight: float = 1.0
+    is_command_out_anomaly: bool = False
+    command_estimated: Optional[float] = None
+
+    @property
+    def command_outs_concat(self) -> str:
+        return f'{self.command}-{(self.outs / self.sub_21_per_slot_worth):.0f}'
+
+
+@dataclass
+class ChartSolution:
+    """All scored candidates for one player, in evaluation order"""
+    candidates: list[ChartCandidate] = field(default_factory=list)
+
+    @property
+    def ranked(self) -> list[ChartCandidate]:
+        """Candidates sorted by accuracy, ties keep evaluation order"""
+        return sorted(self.candidates, key=lambda x: x.accuracy, reverse=True)
+
+    @property
+    def best(self) -> Optional[ChartCandidate]:
+        ranked = self.ranked
+        return ranked[0] if len(ranked) > 0 else None
+
+
+# ---------------------------------------
+# SOLVER
+# ---------------------------------------
+
+class ChartSolver:
+    """Score many command/outs combinations at once.
+
+    Mirrors the value generation and accuracy logic in `Chart` with NumPy arrays,
+    one row per candidate chart. Only the winning combination needs to be
+    built as a full `Chart` object.
+    """
+
+    def __init__(self, set: str, is_pitcher: bool, is_expanded: bool) -> None:
+        self.set = set
+        self.is_pitcher = is_pitcher
+        self.is_hitter = not is_pitcher
+        self.is_expanded = is_expanded
+
+        # PROTOTYPE CHART FOR SET/TYPE LEVEL ATTRIBUTES
+        self.prototype = Chart.model_construct(command=0, set=set, is_pitcher=is_pitcher, is_expanded=is_expanded)
+        self.is_classic = self.prototype.is_classic
+        self.categories = self.prototype.categories_list
+        self.accuracy_stat_weights = self.prototype.accuracy_stat_weights
+        self.does_set_ignore_outlier_adjustments = self.prototype.does_set_ignore_outlier_adjustments
+
+
+    # ---------------------------------------
+    # SEARCH
+    # ---------------------------------------
+
+    def search(self, commands: list[int], command_accuracy_weights: list[float], stats_per_400_pa: dict, opponent: Chart, era_year_list: list[int], player_subtype: str, year: Optional[int] = None) -> list[ChartCandidate]:
+        """Score every command option with calculated outs and with outs one slot below/above.
+        The alternate closer to the real OBP is kept, matching the combinations tested in
+        `ShowdownPlayerCard._most_accurate_chart`. Everything is scored in a single batch.
+
+        Args:
+            commands: Command options to test.
+            command_accuracy_weights: Accuracy weight for each command option.
+            stats_per_400_pa: Real stats per 400 PA.
+            opponent: Opponent chart.
+            era_year_list: Years used for era adjustments.
+            player_subtype: Player subtype value (ex: 'starting_pitcher').
+            year: Last year of the stats period.
+
+        Returns:
+            List of unique candidates in the order they were evaluated.
+        """
+        return self.search_many(
+            commands=[commands],
+            command_accuracy_weights=[command_accuracy_weights],
+            stats_per_400_pa=[stats_per_400_pa],
+            opponents=[opponent],
+            era_year_lists=[era_year_list],
+            player_subtypes=[player_subtype],
+            years=[year],
+        )[0]
+
+    def search_many(self, commands: list[list[int]], command_accuracy_weights: list[list[float]], stats_per_400_pa: list[dict], opponents: list[Chart], era_year_lists: list[list[int]], player_subtypes: list[str], years: list[Optional[int]]) -> list[list[ChartCandidate]]:
+        """Batched version of `search` for many players of the same set and player type.
+        Every player's command/outs combinations are stacked into one matrix and scored together.
+
+        Args:
+            commands: Command options to test for each player.
+            command_accuracy_weights: Accuracy weight for each command option, for each player.
+            stats_per_400_pa: Real stats per 400 PA for each player.
+            opponents: Opponent chart for each player.
+            era_year_lists: Years used for era adjustments for each player.
+            player_subtypes: Player subtype value for each player.
+            years: Last year of the stats period for each player.
+
+        Returns:
+            List of unique candidates for each player, in the order they were evaluated.
+        """
+
+        # ESTIMATED COMMAND IS THE SAME FOR EVERY COMBINATION OF A PLAYER
+        commands_estimated: list[Optional[float]] = [
+            Chart.model_construct(
+                command=0,
+                set=self.set,
+                is_pitcher=self.is_pitcher,
+                is_expanded=self.is_expanded,
+                era_year_list=era_year_list,
+                player_subtype=player_subtype,
+                stats_per_400_pa=player_stats,
+            ).calculate_estimated_command(year=year)
+            for player_stats, era_year_list, player_subtype, year in zip(stats_per_400_pa, era_year_lists, player_subtypes, years)
+        ]
+
+        # ONE ROW PER PLAYER/COMMAND, PLAYERS ARE STORED IN CONSECUTIVE BLOCKS
+        # ROWS POINT BACK TO THEIR PLAYER, SO PLAYER LEVEL INPUTS ARE ONLY CONVERTED TO ARRAYS ONCE
+        player_row_starts = np.cumsum([0] + [len(player_commands) for player_commands in commands[:-1]]).tolist()
+        row_players = np.repeat(np.arange(len(commands)), [len(player_commands) for player_commands in commands])
+        row_commands = [command for player_commands in commands for command in player_commands]
+        row_command_accuracy_weights = [weight for player_weights in command_accuracy_weights for weight in player_weights]
+
+        # CALCULATED OUTS FOR EACH COMMAND
+        n = len(row_commands)
+        rows, _, _ = self._rows(commands=row_commands, outs=[0] * n, players=row_players, stats_per_400_pa=stats_per_400_pa, opponents=opponents)
+        calculated_outs = [self._python_number(outs) for outs in rows['outs'].tolist()]
+
+        # ALTERNATE OUTS ARE ONE SLOT BELOW/ABOVE THE CALCULATED OUTS
+        # BOTH ARE SCORED IN THE SAME BATCH, THE ONE MOVING TOWARDS THE REAL OBP IS KEPT
+        alternate_outs: dict[int, list[Optional[Union[int, float]]]] = {}
+        for direction in [-1, 1]:
+            alternates = np.maximum(rows['outs'] + (rows['slot_worth'] * direction), 0)
+            # IF OUTS DIDN'T CHANGE OR ARE 21+, NO NEED TO RECALCULATE
+            # 0 OUTS WOULD BE RECALCULATED TO THE SAME CHART
+            is_valid = ~((alternates == rows['outs']) | (alternates > 20) | (alternates == 0))
+            alternate_outs[direction] = [self._python_number(outs) if valid else None for outs, valid in zip(alternates.tolist(), is_valid.tolist())]
+
+        scores = self.score(
+            commands=row_commands * 3,
+            outs=[0] * n + [o or 0 for o in alternate_outs[-1]] + [o or 0 for o in alternate_outs[1]],
+            command_accuracy_weights=row_command_accuracy_weights * 3,
+            players=np.tile(row_players, 3),
+            stats_per_400_pa=stats_per_400_pa,
+            opponents=opponents,
+            commands_estimated=commands_estimated,
+            years=years,
+        )
+
+        def candidate(row: int, command: int, outs: Union[int, float], outs_input: Union[int, float], command_accuracy_weight: float, command_estimated: Optional[float]) -> ChartCandidate:
+            return ChartCandidate(
+                command=command,
+                outs=outs,
+                outs_input=outs_input,
+                sub_21_per_slot_worth=self.sub_21_per_slot_worth(command),
+                command_accuracy_weight=command_accuracy_weight,
+                accuracy=float(scores['accuracy'][row]),
+                accuracy_breakdown=self.accuracy_breakdown(scores, row),
+                command_out_accuracy_weight=float(scores['command_out_accuracy_weight'][row]),
+                is_command_out_anomaly=bool(scores['is_command_out_anomaly'][row]),
+                command_estimated=command_estimated,
+            )
+
+        # DEDUPE IN EVALUATION ORDER, SEPARATELY FOR EACH PLAYER
+        projected_obps = scores['onbase_perc'].tolist()
+        candidates_per_player: list[list[ChartCandidate]] = []
+        for player, player_commands in enumerate(commands):
+            real_obp = stats_per_400_pa[player].get('onbase_perc', 0)
+            command_estimated = commands_estimated[player]
+            unique_candidates: list[ChartCandidate] = []
+            command_outs_tested: set[str] = set()
+            for offset, (command, command_accuracy_weight) in enumerate(zip(player_commands, command_accuracy_weights[player])):
+                i = player_row_starts[player] + offset
+                candidates_for_command = [candidate(row=i, command=command, outs=calculated_outs[i], outs_input=0, command_accuracy_weight=command_accuracy_weight, command_estimated=command_estimated)]
+
+                # SEE ACCURACY WHEN OVERESTIMATING OBP VS UNDERESTIMATING OBP WHEN ROUNDING # OF OUTS
+                is_overestimating_obp = real_obp > projected_obps[i]
+                direction = -1 if is_overestimating_obp else 1
+                outs = alternate_outs[direction][i]
+                if outs is not None:
+                    row = (n if direction == -1 else 2 * n) + i
+                    candidates_for_command.append(candidate(row=row, command=command, outs=outs, outs_input=outs, command_accuracy_weight=command_accuracy_weight, command_estimated=command_estimated))
+
+                for c in candidates_for_command:
+                    if c.command_outs_concat in command_outs_tested:
+                        continue
+                    command_outs_tested.add(c.command_outs_concat)
+                    unique_candidates.append(c)
+            candidates_per_player.append(unique_candidates)
+
+        return candidates_per_player
+
+    def to_chart(self, candidate: ChartCandidate, **chart_kwargs) -> Chart:
+        """Build the full `Chart` for a scored candidate. Used at the API boundary, once per card.
+
+        Fields are validated the same way as `Chart(...)`, then values and results are
+        generated by the chart itself. Estimated command and accuracy come from the candidate
+        instead of being recalculated.
+
+        Args:
+            candidate: Candidate returned by `search`.
+            chart_kwargs: Remaining Chart fields (opponent, set, era, stats_per_400_pa, ...).
+
+        Returns:
+            Chart matching `Chart(command=..., outs=..., **chart_kwargs)`.
+        """
+
+        # VALIDATE FIELDS WITHOUT RUNNING Chart.__init__ GENERATION
+        chart = Chart.__new__(Chart)
+        BaseModel.__init__(chart, command=candidate.command, outs=candidate.outs_input, command_accuracy_weight=candidate.command_accuracy_weight, **chart_kwargs)
+
+        # MIRRORS Chart.__init__ FOR A NON-BASELINE, NON-WOTC CHART
+        chart.command_estimated = candidate.command_estimated
+        if chart.outs > 0 and chart.outs_full == 0:
+            chart.update_outs_full()
+        chart.slot_values = chart.generate_slot_values()
+        chart.generate_values_and_results()
+        if chart.outs > 0 and chart.outs_full == 0:
+            chart.update_outs_full()
+
+        # ACCURACY WAS ALREADY SCORED IN THE BATCH
+        chart.accuracy = candidate.accuracy
+        chart.accuracy_breakdown = candidate.accuracy_breakdown
+        chart.command_out_accuracy_weight = candidate.command_out_accuracy_weight
+        chart.is_command_out_anomaly = candidate.is_command_out_anomaly
+        chart.generate_range_strings()
+        return chart
+
+    def sub_21_per_slot_worth(self, command: Union[int, float]) -> Union[int, float]:
+        """Slot worth for a command, matching the type returned by `Chart.sub_21_per_slot_worth`"""
+        return self._slot_attributes(command)[0]
+
+    def _slot_attributes(self, command: Union[int, float]) -> tuple[Union[int, float], np.ndarray]:
+        """Cached slot worth and slot values array (index = slot) for a command"""
+        cache_key = (self.set, self.is_pitcher, self.is_expanded, command)
+        attributes = _SLOT_ATTRIBUTES_CACHE.get(cache_key, None)
+        if attributes is None:
+            chart = self.prototype.model_copy(update={'command': command})
+            slot_values = np.zeros(SLOT_VALUES_WIDTH)
+            for index, value in chart.generate_slot_values().items():
+                slot_values[index] = value
+            slot_values.setflags(write=False)
+            attributes = (chart.sub_21_per_slot_worth, slot_values)
+            _SLOT_ATTRIBUTES_CACHE[cache_key] = attributes
+        return attributes
+
+    def _python_number(self, value: float) -> Union[int, float]:
+        """Classic charts use whole numbers (slot worth of 1), expanded charts use floats"""
+        return float(value) if self.is_expanded else int(value)
+
+    # ---------------------------------------
+    # SCORE
+    # ---------------------------------------
+
+    def score(self, commands: list[Union[int, float]], outs: list[Union[int, float]], command_accuracy_weights: list[float], players: np.ndarray, stats_per_400_pa: list[dict], opponents: list[Chart], commands_estimated: list[Optional[float]], years: list[Optional[int]]) -> dict[str, np.ndarray]:
+        """Generate chart values and accuracy for every row.
+
+        Args:
+            commands: Command for each row.
+            outs: Outs for each row. 0 means calculate from the real OBP.
+            command_accuracy_weights: Command accuracy weight for each row.
+            players: Index of the row's player in the player level lists below.
+            stats_per_400_pa: Real stats per 400 PA for each player.
+            opponents: Opponent chart for each player.
+            commands_estimated: Estimated command for each player (2003+ sets).
+            years: Year for each player.
+
+        Returns:
+            Dictionary of arrays (outs, outs_full, values, accuracy, projected slash line, breakdowns)
+        """
+
+        rows, stats, actuals = self._rows(commands=commands, outs=outs, players=players, stats_per_400_pa=stats_per_400_pa, opponents=opponents)
+        n = len(commands)
+
+        # GENERATE VALUES
+        # CHARTS WITH 20 OUTS FILL BB IN DESC ORDER, SO THEY ARE PROCESSED AS A SEPARATE GROUP
+        values = np.zeros((n, len(CATEGORIES)))
+        is_twenty_outs = rows['outs_full'] == 20
+        for is_group_twenty_outs in [False, True]:
+            group_indexes = np.nonzero(is_twenty_outs == is_group_twenty_outs)[0]
+            if len(group_indexes) == 0:
+                continue
+            group_rows = { k: v[group_indexes] for k, v in rows.items() }
+            group_stats = { k: v[group_indexes] for k, v in stats.items() }
+            values[group_indexes] = self._generate_values(rows=group_rows, stats=group_stats, is_twenty_outs=is_group_twenty_outs)
+
+        # ACCURACY
+        scores = self._accuracy(
+            values=values,
+            rows=rows,
+            stats=stats,
+            actuals=actuals,
+            command_accuracy_weights=np.array(command_accuracy_weights, dtype=float),
+            commands_estimated=np.array([np.nan if c is None else c for c in commands_estimated], dtype=float)[players],
+            years=np.array([np.nan if y is None else y for y in years], dtype=float)[players],
+        )
+        scores['outs'] = rows['outs']
+        scores['outs_full'] = rows['outs_full']
+        scores['values'] = values
+        return scores
+
+    def _rows(self, commands: list[Union[int, float]], outs: list[Union[int, float]], players: np.ndarray, stats_per_400_pa: list[dict], opponents: list[Chart]) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray], dict[str, np.ndarray]]:
+        """Convert row inputs to arrays and calculate outs.
+
+        Player and command level attributes are built once per player/unique command,
+        then broadcast to every row by indexing.
+
+        Returns:
+            Tuple of row attributes, stats per 400 PA columns, and actual stats used for accuracy.
+        """
+        n = len(commands)
+        rows: dict[str, np.ndarray] = {}
+        rows['command'] = np.array(commands, dtype=float)
+
+        # STATS
+        stat_keys = [self._stat_key(c) for c in CATEGORIES] + ['sb_per_400_pa', 'sh_per_400_pa', 'sf_per_400_pa', 'ibb_per_400_pa', 'onbase_perc', 'slugging_perc', 'onbase_plus_slugging']
+        actual_keys = [stat.value for stat in self.accuracy_stat_weights.keys() if stat != Stat.COMMAND]
+        player_stats = np.array([[s.get(key, 0) for key in stat_keys] for s in stats_per_400_pa], dtype=float).reshape(len(stats_per_400_pa), len(stat_keys))[players]
+        player_actuals = np.array([[s.get(key, None) for key in actual_keys] for s in stats_per_400_pa], dtype=float).reshape(len(stats_per_400_pa), len(actual_keys))[players]
+        stats = { key: player_stats[:, index] for index, key in enumerate(stat_keys) }
+        actuals = { key: player_actuals[:, index] for index, key in enumerate(actual_keys) }
+
+        # SLOTS
+        unique_commands, first_rows, command_indexes = np.unique(rows['command'], return_index=True, return_inverse=True)
+        slot_attributes = [self._slot_attributes(commands[row]) for row in first_rows.tolist()]
+        rows['slot_worth'] = np.array([worth for worth, _ in slot_attributes], dtype=float)[command_indexes]
+        rows['slot_values'] = np.vstack([slot_values for _, slot_values in slot_attributes])[command_indexes] if n > 0 else np.zeros((0, SLOT_VALUES_WIDTH))
+        rows['total_slots'] = np.where((rows['slot_worth'] < 1) & (self.set != '2002'), 30, 20)
+
+        # 1B+ SCALES WITH ONBASE
+        onbase_range = ValueRange(min=7 if self.is_expanded else 4, max=16 if self.is_expanded else 12)
+        rows['onbase_pctile'] = np.array([onbase_range.percentile(value=command) for command in unique_commands.tolist()], dtype=float)[command_indexes]
+
+        # OPPONENT AND ADVANTAGES
+        opponent_attributes = np.array([[opponent.command, opponent.outs] + [opponent.num_values(c) for c in CATEGORIES] for opponent in opponents], dtype=float).reshape(len(opponents), 2 + len(CATEGORIES))[players]
+        rows['opponent_values'] = opponent_attributes[:, 2:]
+        opponent_command = opponent_attributes[:, 0]
+        opponent_outs = opponent_attributes[:, 1]
+        hitter_advantages = (opponent_command - rows['command']) * (1 if self.is_pitcher else -1)
+        rows['my_advantages'] = (20 - hitter_advantages) if self.is_pitcher else hitter_advantages
+        rows['opponent_advantages'] = 20 - rows['my_advantages']
+
+        # CALCULATE OUTS BASED ON COMMAND
+        results_per_400_pa = 400 * stats['onbase_perc']
+        opponent_onbase_values = 20 - opponent_outs
+        with np.errstate(divide='ignore', invalid='ignore'):
+            my_onbase_values = (results_per_400_pa - (rows['opponent_advantages'] * opponent_onbase_values)) / rows['my_advantages']
+        my_out_values = _py_min( _py_max(20 - my_onbase_values, self.prototype.minimum_allowed_outs), self.prototype.maximum_allowed_outs )
+        calculated_outs = _py_round(_py_max(_custom_round(my_out_values, rows['slot_worth']), 0))
+        outs_input = np.array(outs, dtype=float)
+        rows['outs'] = np.where(outs_input == 0, calculated_outs, outs_input)
+        rows['outs_full'] = np.rint(rows['outs'] / rows['slot_worth']).astype(int)
+
+        return rows, stats, actuals
+
+    def _stat_key(self, category: ChartCategory) -> str:
+        return f'{category.value.lower()}_per_400_pa'
+
+    # ---------------------------------------
+    # VALUES
+    # ---------------------------------------
+
+    def _generate_values(self, rows: dict[str, np.ndarray], stats: dict[str, np.ndarray], is_twenty_outs: bool) -> np.ndarray:
+        """Batched version of `Chart.generate_values_and_results` for rows that share the same fill order.
+
+        Args:
+            rows: Row attributes (command, outs, slot values, advantages, ...).
+            stats: Real stats per 400 PA as columns.
+            is_twenty_outs: True if every row in the group has 20 outs.
+
+        Returns:
+            Matrix of chart values, one column per ChartCategory.
+        """
+
+        n = len(rows['command'])
+        values = np.zeros((n, len(CATEGORIES)))
+        results = np.full((n, RESULTS_WIDTH), EMPTY_SLOT, dtype=np.int8)
+        categories_filled: list[ChartCategory] = []
+        outs = rows['outs']
+        slot_worth = rows['slot_worth']
+
+        # ASC: SO, GB, FB, BB
+        # DESC: HR, 3B, 2B, 1B
+        # IF OUTS FILL 20 SLOTS, ADD BB TO DESC ORDER
+        categories_filled_asc = [c for c in self.categories if not c.is_filled_in_desc_order and not (is_twenty_outs and c == ChartCategory.BB)]
+        categories_filled_desc = [c for c in self.categories if c.is_filled_in_desc_order][::-1] + ([ChartCategory.BB] if is_twenty_outs else [])
+        final_onbase_category_to_fill = ChartCategory.BB if is_twenty_outs else ChartCategory._1B
+
+        for categories, is_reversed in [(categories_filled_asc, False), (categories_filled_desc, True)]:
+            categories_total_real_results_per_400 = _py_sum([stats[self._stat_key(c)] for c in categories], n)
+            current_chart_index = rows['total_slots'].copy() if is_reversed else np.ones(n, dtype=int)
+            for chart_category in categories:
+
+                # SKIP 1B+, THAT IS FILLED LATER
+                if chart_category == ChartCategory._1B_PLUS: continue
+
+                # DEFINE LIMIT FOR CATEGORY
+                category_limit = chart_category.slot_limit * slot_worth
+                if chart_category.is_out and chart_category != ChartCategory.SO:
+                    category_limit = np.where(outs > 4, outs * (3/4), outs)
+                    if self.is_classic:
+                        category_limit = np.rint(category_limit)
+
+                is_out_max = outs if chart_category.is_out else 20 - outs
+                category_remaining = is_out_max - _py_sum([values[:, CATEGORY_INDEX[c]] for c in categories_filled if c.is_out == chart_category.is_out], n)
+
+                # DEFINE MIN/MAX VALUES
+                is_final_category_in_section = chart_category in [final_onbase_category_to_fill, ChartCategory.FB]
+                min_values = category_remaining if is_final_category_in_section else None
+                max_values = category_remaining if is_final_category_in_section else _py_min(category_remaining, category_limit)
+
+                match chart_category.fill_method(set=self.set, is_pitcher=self.is_pitcher):
+
+                    case ChartCategoryFillMethod.PCT:
+                        category_results_per_400_pa = stats[self._stat_key(chart_category)]
+                        category_multiplier = chart_category.category_multiplier(set=self.set, is_pitcher=self.is_pitcher)
+                        with np.errstate(divide='ignore', invalid='ignore'):
+                            category_pct = np.where(categories_total_real_results_per_400 > 0, (category_results_per_400_pa / categories_total_real_results_per_400) * category_multiplier, 0)
+                        raw_values = category_pct * outs
+                        category_values = _py_min( _py_max( _custom_round(raw_values, slot_worth), category_remaining if chart_category == ChartCategory.FB else 0 ), max_values )
+                        category_results = np.rint(category_values / slot_worth).astype(int)
+
+                    case ChartCategoryFillMethod.RATE:
+                        category_values, category_results, was_limited = self._values_from_rate_stats(category=chart_category, rows=rows, stats=stats, current_chart_index=current_chart_index, max_values=max_values, min_values=min_values)
+
+                        # IF SINGLE, SPLIT INTO 1B AND 1B+
+                        if chart_category == ChartCategory._1B and self.is_hitter:
+                            single_plus_values, single_plus_results = self._single_plus_values_and_results(total_1B_values=category_values, rows=rows, stats=stats, current_chart_index=current_chart_index)
+                            values[:, CATEGORY_INDEX[ChartCategory._1B_PLUS]] = single_plus_values
+                            if ChartCategory._1B_PLUS not in categories_filled:
+                                categories_filled.append(ChartCategory._1B_PLUS)
+                            self._add_results(results, ChartCategory._1B_PLUS, single_plus_results, current_chart_index)
+                            current_chart_index = current_chart_index - single_plus_results
+                            category_values = category_values - single_plus_values
+                            category_results = category_results - single_plus_results
+
+                        # CHECK FOR REMAINING VALUES IF FB WAS LIMITED AND THERE ARE REMAINING VALUES
+                        if chart_category == ChartCategory.FB and was_limited.any():
+                            outs_values_pre_fb = _py_sum([values[:, CATEGORY_INDEX[c]] for c in categories_filled if c.is_out], n)
+                            total_outs_remaining = outs - outs_values_pre_fb - category_values
+                            is_gb_refill = was_limited & (total_outs_remaining >= slot_worth)
+                            gb_index = CATEGORY_INDEX[ChartCategory.GB]
+                            gb_results = np.where(is_gb_refill, np.rint(total_outs_remaining / slot_worth), 0).astype(int)
+                            values[:, gb_index] = np.where(is_gb_refill, values[:, gb_index] + category_values, values[:, gb_index])
+                            self._add_results(results, ChartCategory.GB, gb_results, current_chart_index)
+                            current_chart_index = current_chart_index + gb_results
+
+                values[:, CATEGORY_INDEX[chart_category]] = _py_round(category_values)
+                if chart_category not in categories_filled:
+                    categories_filled.append(chart_category)
+                self._add_results(results, chart_category, category_results, current_chart_index)
+                current_chart_index = current_chart_index + (category_results * -1 if chart_category.is_filled_in_desc_order else category_results)
+
+        # MAKE ADJUSTMENTS IF NECESSARY
+        projected = self._projected_stats(values=values, rows=rows, stats=stats)
+        obp_pct_diff = _pct_diff(projected['onbase_perc'], stats['onbase_perc'])
+        slg_pct_diff = _pct_diff(projected['slugging_perc'], stats['slugging_perc'])
+        ops_pct_diff = _pct_diff(projected['onbase_plus_slugging'], stats['onbase_plus_slugging'])
+
+        # ADJUST CHARTS THAT ARE OFF IN SLG AND OPS BUT CLOSE IN OBP
+        has_1b_values = values[:, CATEGORY_INDEX[ChartCategory._1B]] >= slot_worth
+        if self.is_hitter:
+            is_adjustment = (slg_pct_diff < 0) & (ops_pct_diff < 0) & (np.abs(obp_pct_diff) < 0.03) & (np.abs(slg_pct_diff) > 0.01) & has_1b_values
+        else:
+            is_adjustment = (slg_pct_diff > 0) & (ops_pct_diff > 0) & (np.abs(obp_pct_diff) < 0.04) & (np.abs(slg_pct_diff) > 0.05) & has_1b_values
+        if is_adjustment.any():
+            self._adjust_slg(values=values, results=results, rows=rows, stats=stats, projected=projected, is_adjustment=is_adjustment, slg_pct_diff=slg_pct_diff)
+
+        # 2002 POST 20 ADJUSTMENTS
+        if self.set == '2002':
+            self._apply_2002_post_20_adjustments(values=values, results=results, rows=rows, stats=stats)
+
+        # ROUND VALUES TO 4 DECIMALS
+        return _py_round(values.ravel()).reshape(values.shape)
+
+    def _values_from_rate_stats(self, category: ChartCategory, rows: dict[str, np.ndarray], stats: dict[str, np.ndarray], current_chart_index: np.ndarray, max_values: np.ndarray, min_values: Optional[np.ndarray]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Batched version of `Chart.calc_chart_category_values_from_rate_stats`"""
+
+        real_results_per_400_pa = stats[self._stat_key(category)]
+        opponent_values = rows['opponent_values'][:, CATEGORY_INDEX[category]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            chart_values = (real_results_per_400_pa - (rows['opponent_advantages'] * opponent_values)) / rows['my_advantages']
+
+        # LIMIT RESULTS TO CHART CATEGORY SLOT LIMIT
+        was_limited = chart_values > max_values
+        limited_values = _py_min(chart_values, max_values)
+        chart_values = _py_max( limited_values, limited_values if min_values is None else np.where(min_values != 0, min_values, limited_values) )
+
+        # IF ITS A BOOKEND CATEGORY (EX: FB) FILL WITH REMAINING VALUES
+        if category == ChartCategory.FB:
+            chart_values = _py_max(max_values, chart_values)
+
+        chart_values_rounded, results = self._values_and_results(value=chart_values, category=category, rows=rows, current_chart_index=current_chart_index)
+        return chart_values_rounded, results, was_limited
+
+    def _single_plus_values_and_results(self, total_1B_values: np.ndarray, rows: dict[str, np.ndarray], stats: dict[str, np.ndarray], current_chart_index: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Batched version of `Chart.__single_plus_values_and_results`"""
+
+        # DIVIDE STOLEN BASES PER 400 PA BY A SCALER BASED ON ONBASE #
+        onbase_pctile = rows['onbase_pctile']
+        min_denominator = self.prototype.hitter_single_plus_denominator_minimum
+        max_denominator = self.prototype.hitter_single_plus_denominator_maximum
+
+        # POPULATE 1B+ RESULTS
+        single_plus_denominator = min_denominator + ( (max_denominator - min_denominator) * onbase_pctile )
+        single_plus_values_raw = _py_min(np.trunc(stats['sb_per_400_pa'] / single_plus_denominator) + 0.0, total_1B_values)
+        single_plus_values_raw = self._apply_linear_decay(value=single_plus_values_raw, category=ChartCategory._1B_PLUS)
+
+        return self._values_and_results(value=single_plus_values_raw, category=ChartCategory._1B_PLUS, rows=rows, current_chart_index=current_chart_index)
+
+    def _values_and_results(self, value: np.ndarray, category: ChartCategory, rows: dict[str, np.ndarray], current_chart_index: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Batched version of `Chart.values_and_results`.
+
+        The expanded chart slot walk is done as a matrix of candidate slots per row,
+        stopping each row at the first slot that moves it further from the original value.
+        """
+
+        slot_worth = rows['slot_worth']
+
+        # APPLY DECAY RATE IF APPLICABLE
+        value = value * category.value_multiplier(set=self.set)
+        value = self._apply_linear_decay(value=value, category=category)
+
+        # ROUND TO NEAREST SLOT WORTH
+        raw_value = _py_max( _custom_round(value, slot_worth, category.rounding_cutoff(is_pitcher=self.is_pitcher, set=self.set)), 0 )
+        raw_results = np.rint(raw_value / slot_worth).astype(int)
+        if not self.is_expanded or category.is_out:
+            return _py_round(raw_value), raw_results
+
+        # ITERATE THROUGH EACH SLOT WORTH RESULT AND ROUND
+        n = len(value)
+        iterator = -1 if category.is_filled_in_desc_order else 1
+        end = np.ones(n, dtype=int) if category.is_filled_in_desc_order else rows['total_slots']
+        num_steps = np.maximum((end - current_chart_index) * iterator, 0)
+        max_steps = int(num_steps.max()) if n > 0 else 0
+        if max_steps == 0:
+            return np.zeros(n), np.zeros(n, dtype=int)
+
+        step = np.arange(max_steps)
+        slot_indexes = current_chart_index[:, None] + (step[None, :] * iterator)
+        is_valid_step = step[None, :] < num_steps[:, None]
+        is_slot_in_bounds = (slot_indexes >= 0) & (slot_indexes < SLOT_VALUES_WIDTH)
+        slot_values = np.where(
+            is_valid_step & is_slot_in_bounds,
+            np.take_along_axis(rows['slot_values'], np.clip(slot_indexes, 0, SLOT_VALUES_WIDTH - 1), axis=1),
+            0.0
+        )
+        new_potential_total_values = np.cumsum(slot_values, axis=1)
+        new_potential_values_vs_original = np.abs(new_potential_total_values - value[:, None])
+        diff_last_index = np.hstack([_py_max(value, 0)[:, None], new_potential_values_vs_original[:, :-1]])
+        is_out_of_bounds = (slot_indexes >= 27) if category == ChartCategory.HR else np.zeros_like(is_valid_step)
+
+        is_break = ~is_valid_step | ((new_potential_values_vs_original > diff_last_index) & ~is_out_of_bounds)
+
+        # BREAK IF CATEGORY IS 2B AND VALUE IS CLOSE. CREATES MORE VARIETY IN EXPANDED PITCHER CHARTS
+        if self.is_pitcher and category == ChartCategory._2B:
+            is_break |= (slot_indexes > 20) & (new_potential_total_values < value[:, None]) & (new_potential_values_vs_original < 0.15)
+
+        # NUMBER OF RESULTS IS THE FIRST BREAK
+        is_break = np.hstack([is_break, np.ones((n, 1), dtype=bool)])
+        num_results = np.argmax(is_break, axis=1)
+        values_total = np.where(num_results > 0, new_potential_total_values[np.arange(n), np.maximum(num_results - 1, 0)], 0.0)
+
+        return _py_round(values_total), num_results
+
+    def _apply_linear_decay(self, value: np.ndarray, category: ChartCategory) -> np.ndarray:
+        """Batched version of `Chart.__apply_linear_decay`"""
+        decay_rate_and_start = category.decay_rate_and_start(set=self.set, is_pitcher=self.is_pitcher)
+        if decay_rate_and_start is None:
+            return value
+
+        decay_rate, decay_start = decay_rate_and_start
+        return np.where(value > decay_start, decay_start + ((value - decay_start) * decay_rate), value)
+
+    def _add_results(self, results: np.ndarray, category: ChartCategory, num_results: np.ndarray, current_chart_index: np.ndarray) -> None:
+        """Write category to the results matrix, starting at the current index for each row"""
+        max_results = int(num_results.max()) if len(num_results) > 0 else 0
+        if max_results <= 0:
+            return
+
+        iterator = -1 if category.is_filled_in_desc_order else 1
+        step = np.arange(max_results)
+        columns = current_chart_index[:, None] + (step[None, :] * iterator) + RESULTS_SLOT_OFFSET
+        is_result = step[None, :] < num_results[:, None]
+        row_indexes = np.broadcast_to(np.arange(len(num_results))[:, None], columns.shape)
+        columns_to_fill = columns[is_result]
+        if len(columns_to_fill) > 0 and (columns_to_fill.min() < 0 or columns_to_fill.max() >= RESULTS_WIDTH):
+            raise ValueError(f'Chart results for {category.value} fall outside of the supported slot range')
+        results[row_indexes[is_result], columns_to_fill] = CATEGORY_INDEX[category]
+
+    def _slot_indexes_for_category(self, results: np.ndarray, category: ChartCategory, max_index: np.ndarray, is_min: bool = True) -> tuple[np.ndarray, np.ndarray]:
+        """Get the min (or max) slot index per row for a category, ignoring slots after max_index.
+
+        Returns:
+            Tuple of slot indexes and boolean array for whether the category was found.
+        """
+        slots = np.arange(RESULTS_WIDTH) - RESULTS_SLOT_OFFSET
+        is_match = (results == CATEGORY_INDEX[category]) & (slots[None, :] <= max_index[:, None])
+        is_found = is_match.any(axis=1)
+        if is_min:
+            indexes = np.argmax(is_match, axis=1) - RESULTS_SLOT_OFFSET
+        else:
+            indexes = (RESULTS_WIDTH - 1 - np.argmax(is_match[:, ::-1], axis=1)) - RESULTS_SLOT_OFFSET
+        return indexes, is_found
+
+    def _adjust_slg(self, values: np.ndarray, results: np.ndarray, rows: dict[str, np.ndarray], stats: dict[str, np.ndarray], projected: dict[str, np.ndarray], is_adjustment: np.ndarray, slg_pct_diff: np.ndarray) -> None:
+        """Batched version of `Chart.__adjust_slg`. Hitters increase SLG, pitchers decrease it. Updates values and results in place."""
+
+        is_increase = self.is_hitter
+        slg_categories = [ChartCategory._2B, ChartCategory._3B, ChartCategory.HR] if is_increase else [ChartCategory._2B, ChartCategory.HR]
+        n = len(is_adjustment)
+
+        # PCT DIFFS FOR CATEGORIES ELIGIBLE TO ADJUST
+        category_pct_diffs = np.zeros((n, len(slg_categories)))
+        is_category_included = np.zeros((n, len(slg_categories)), dtype=bool)
+        for i, slg_cat in enumerate(slg_categories):
+            small_sample_cutoff = 4.0 if slg_cat == ChartCategory._3B else 5
+            real_stat = stats[self._stat_key(slg_cat)]
+            pct_diff = _pct_diff(projected[self._stat_key(slg_cat)], real_stat)
+            decrease_multipler = 1 if is_increase else -1
+            category_pct_diffs[:, i] = pct_diff
+            is_category_included[:, i] = ~(real_stat < small_sample_cutoff) & ((pct_diff * decrease_multipler) <= -0.01)
+        is_adjustment = is_adjustment & is_category_included.any(axis=1)
+
+        # IF SLUGGING PERCENT IS WAY UNDER, WEIGHT 3B AND HR MORE THAN 2B
+        if self.is_hitter:
+            category_pct_diffs[:, 0] = np.where(slg_pct_diff < -0.08, category_pct_diffs[:, 0] * 0.5, category_pct_diffs[:, 0])
+
+        # GET CATEGORY WITH BIGGEST DIFFERENCE
+        if is_increase:
+            category_biggest_diff = np.argmin(np.where(is_category_included, category_pct_diffs, np.inf), axis=1)
+        else:
+            category_biggest_diff = np.argmax(np.where(is_category_included, category_pct_diffs, -np.inf), axis=1)
+        max_index = np.where(
+            (rows['total_slots'] > 20) & np.isin(results[:, 21 + RESULTS_SLOT_OFFSET], [CATEGORY_INDEX[ChartCategory.HR], CATEGORY_INDEX[ChartCategory._2B]]),
+            21, 20
+        )
+
+        # MIN SLOT FOR BIGGEST DIFF CATEGORY.
+        # HANDLE CASES WHERE PLAYER HAS 0 SLOTS FOR CATEGORY BY CHECKING THE NEXT CATEGORIES
+        min_slot_index = np.zeros(n, dtype=int)
+        has_min_slot = np.zeros(n, dtype=bool)
+        for i, slg_cat in enumerate(slg_categories):
+            slot_indexes, is_found = self._slot_indexes_for_category(results=results, category=slg_cat, max_index=max_index)
+            is_selected = (category_biggest_diff <= i) & ~has_min_slot & is_found
+            min_slot_index = np.where(is_selected, slot_indexes, min_slot_index)
+            has_min_slot |= is_selected
+        is_adjustment = is_adjustment & has_min_slot & (min_slot_index != 0)
+        if not is_adjustment.any():
+            return
+
+        # CHANGE VALUES FOR 1B AND ADJUST CATEGORY
+        slot_worth_change = rows['slot_worth'] * (1 if is_increase else -1)
+        single_index = CATEGORY_INDEX[ChartCategory._1B]
+        values[:, single_index] = np.where(is_adjustment, values[:, single_index] - slot_worth_change, values[:, single_index])
+        for i, slg_cat in enumerate(slg_categories):
+            category_index = CATEGORY_INDEX[slg_cat]
+            is_category_adjusted = is_adjustment & (category_biggest_diff == i)
+            values[:, category_index] = np.where(is_category_adjusted, values[:, category_index] + slot_worth_change, values[:, category_index])
+
+        # UPDATE RESULTS
+        # EX: {.. 15: '1B', 16: '2B', ..} -> {.. 15: '2B', 16: '2B', ..}
+        max_slot_index_1b, is_1b_found = self._slot_indexes_for_category(results=results, category=ChartCategory._1B, max_index=np.full(n, 20), is_min=False)
+        is_results_update = is_adjustment & is_1b_found & (max_slot_index_1b != 0)
+        if not is_results_update.any():
+            return
+
+        slots = (np.arange(RESULTS_WIDTH) - RESULTS_SLOT_OFFSET)[None, :]
+        biggest_diff_codes = np.array([CATEGORY_INDEX[c] for c in slg_categories])[category_biggest_diff]
+        is_filled = results != EMPTY_SLOT
+        if is_increase:
+            shifted_results = np.hstack([results[:, 1:], np.full((n, 1), EMPTY_SLOT, dtype=results.dtype)])
+            is_slot_updated = is_filled & (slots >= max_slot_index_1b[:, None]) & (slots < min_slot_index[:, None])
+            new_results = np.where(slots == (min_slot_index[:, None] - 1), biggest_diff_codes[:, None], shifted_results)
+        else:
+            shifted_results = np.hstack([np.full((n, 1), EMPTY_SLOT, dtype=results.dtype), results[:, :-1]])
+            is_slot_updated = is_filled & (slots > max_slot_index_1b[:, None]) & (slots <= min_slot_index[:, None])
+            new_results = np.where(slots == (max_slot_index_1b[:, None] + 1), single_index, shifted_results)
+        is_slot_updated &= is_results_update[:, None]
+        results[is_slot_updated] = new_results[is_slot_updated]
+
+    def _apply_2002_post_20_adjustments(self, values: np.ndarray, results: np.ndarray, rows: dict[str, np.ndarray], stats: dict[str, np.ndarray]) -> None:
+        """Batched version of `Chart.__apply_2002_post_20_adjustments`. Updates values and results in place."""
+
+        n = len(values)
+        last_value = results[:, 20 + RESULTS_SLOT_OFFSET].astype(int)
+        is_last_value_out = np.isin(last_value, OUT_CATEGORY_INDEXES)
+        if is_last_value_out.any():
+            possible_fill_results = [ChartCategory.BB, ChartCategory._1B, ChartCategory._2B]
+            projected = self._projected_stats(values=values, rows=rows, stats=stats)
+            diff_vs_real = np.column_stack([_pct_diff(projected[self._stat_key(c)], stats[self._stat_key(c)]) for c in possible_fill_results])
+            fill_codes = np.array([CATEGORY_INDEX[c] for c in possible_fill_results])[np.argmin(diff_vs_real, axis=1)]
+            last_value = np.where(is_last_value_out, fill_codes, last_value)
+
+        # FILL 21+ SLOTS, STARTING WITH HR
+        # IF LAST VALUE IS HR, FILL 21-30 WITH HR
+        hr_index = CATEGORY_INDEX[ChartCategory.HR]
+        starting_point = 32.45 if self.is_pitcher else 27.67
+        decay_rate = 0.8415 if self.is_pitcher else 0.7835
+        hr_start = _py_min( np.rint(starting_point - (decay_rate * stats['hr_per_400_pa'])), 27 )
+        row_indexes = np.arange(n)
+        for i in range(21, 31):
+            fill_category = np.where((last_value == hr_index) | (i >= hr_start), hr_index, last_value)
+            results[:, i + RESULTS_SLOT_OFFSET] = fill_category
+            values[row_indexes, fill_category] = values[row_indexes, fill_category] + rows['slot_values'][:, i]
+
+    # ---------------------------------------
+    # PROJECTIONS
+    # ---------------------------------------
+
+    def _projected_stats(self, values: np.ndarray, rows: dict[str, np.ndarray], stats: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Batched version of `Chart.projected_stats_per_400_pa`, one `ChartKernel` row per candidate"""
+        return ChartKernel(
+            values={ category: values[:, index] for index, category in enumerate(CATEGORIES) },
+            opponent_values={ category: rows['opponent_values'][:, index] for index, category in enumerate(CATEGORIES) },
+            my_advantages=rows['my_advantages'],
+            opponent_advantages=rows['opponent_advantages'],
+            stats_per_400_pa=stats,
+        ).projected_stats_per_400_pa()
+
+    # ---------------------------------------
+    # ACCURACY
+    # ---------------------------------------
+
+    def _outlier_cutoffs(self, command: np.ndarray) -> tuple[np.ndarray, np.ndarray, int, int]:
+        """Batched version of `Chart.outlier_cutoffs`"""
+
+        n = len(command)
+        if self.is_pitcher:
+            match self.set:
+                case '2000' | '2001': out_min, out_max = 15, 18
+                case '2002': out_min, out_max = 14, 19
+                case '2003' | '2004' | '2005' | 'EXPANDED': out_min, out_max = 15, 17
+                case 'CLASSIC': out_min, out_max = 14, 18
+            out_min, out_max = np.full(n, out_min, dtype=float), np.full(n, out_max, dtype=float)
+            command_outlier_upper_bound, command_outlier_lower_bound = 6, 1
+
+            # UPDATE FOR SPECIAL CASES
+            if self.is_classic:
+                out_min = np.where(command >= 6, 15, out_min)
+                out_max = np.where(command >= 6, 18, out_max)
+                out_min = np.where(command == 0, 15, out_min)
+                out_max = np.where(command == 0, 17.5, out_max)
+        else:
+            out_min = np.full(n, 5 if self.is_expanded else 3, dtype=float)
+            out_max = np.full(n, 7 if self.is_expanded else 5, dtype=float)
+
+            # UPDATE FOR SPECIAL CASES
+            if self.is_classic:
+                out_min = np.where(command > 10, 2, out_min)
+                out_max = np.where(command > 10, 3, out_max)
+                out_min = np.where(command < 8, 3, out_min)
+                out_max = np.where(command < 8, 6, out_max)
+
+            command_outlier_upper_bound = 14 if self.is_expanded else 11
+            command_outlier_lower_bound = 9 if self.is_expanded else 5
+
+        return out_min, out_max, command_outlier_lower_bound, command_outlier_upper_bound
+
+    def _breakdown_accuracy(self, stat: Stat, actual: np.ndarray, comparison: np.ndarray, adjustment_pct: np.ndarray) -> np.ndarray:
+        """Batched version of `ChartAccuracyBreakdown.calculate_accuracy_attributes`, excluding weighting"""
+        difference_multiplier = ChartAccuracyBreakdown.model_construct(stat=stat, is_pitcher=self.is_pitcher).difference_multiplier
+        diff = np.abs(actual - comparison) * difference_multiplier
+        with np.errstate(divide='ignore', invalid='ignore'):
+            accuracy = np.where(actual == comparison, 1.0, _py_max(1 - ( diff / ((actual + comparison) / 2) ), 0))
+        return accuracy * adjustment_pct
+
+    def _accuracy(self, values: np.ndarray, rows: dict[str, np.ndarray], stats: dict[str, np.ndarray], actuals: dict[str, np.ndarray], command_accuracy_weights: np.ndarray, commands_estimated: np.ndarray, years: np.ndarray) -> dict[str, np.ndarray]:
+        """Batched version of `Chart.generate_accuracy_rating`"""
+
+        n = len(values)
+        command = rows['command']
+        outs = rows['outs_full']
+        projected = self._projected_stats(values=values, rows=rows, stats=stats)
+
+        # POPULATE ACCURACY BREAKDOWN
+        breakdowns: dict[Stat, dict[str, np.ndarray]] = {}
+        for stat, weight in self.accuracy_stat_weights.items():
+            actual = commands_estimated if stat == Stat.COMMAND else actuals[stat.value]
+            comparison = command if stat == Stat.COMMAND else projected.get(stat.value, np.full(n, np.nan))
+            adjustment_pct = np.ones(n)
+            accuracy = self._breakdown_accuracy(stat=stat, actual=actual, comparison=comparison, adjustment_pct=adjustment_pct)
+            breakdowns[stat] = {
+                'is_included': ~np.isnan(actual) & ~np.isnan(comparison),
+                'actual': actual,
+                'comparison': comparison,
+                'weight': np.full(n, weight),
+                'accuracy': accuracy,
+                'weighted_accuracy': _py_round(accuracy * weight),
+                'adjustment_pct': adjustment_pct,
+            }
+
+        # OUTLIERS
+        out_min, out_max, command_outlier_lower_bound, command_outlier_upper_bound = self._outlier_cutoffs(command)
+        is_outside_out_bounds = (outs < out_min) | (outs > out_max)
+        is_elite_command_out_chart = (command >= command_outlier_upper_bound) & ((outs < out_min) if self.is_hitter else (outs > out_max))
+        is_super_low_rated_command_out_chart = (command <= command_outlier_lower_bound) & ((outs < out_min) if self.is_pitcher else (outs > out_max))
+        if self.is_classic:
+            is_high_command_high_outs = (command > 10) & (outs > 4) & (outs < 6)
+        else:
+            is_high_command_high_outs = self.is_expanded & (command > 11) & (outs > out_max) & (outs < 9)
+        is_chart_an_outlier = is_elite_command_out_chart | is_outside_out_bounds
+        command_out_accuracy_weight = np.ones(n)
+
+        command_breakdown = breakdowns.get(Stat.COMMAND, None)
+        if self.does_set_ignore_outlier_adjustments and command_breakdown:
+            is_outlier_adjusted = command_breakdown['is_included'] & is_chart_an_outlier
+
+            # DEFINE ACCURACY FOR NON-COMMAND CATEGORIES
+            accuracy_command = command_breakdown['accuracy']
+            non_command_breakdowns = [breakdown for stat, breakdown in breakdowns.items() if stat != Stat.COMMAND]
+            non_command_masks = [b['is_included'] for b in non_command_breakdowns]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                accuracy_non_command = _py_sum([b['weighted_accuracy'] for b in non_command_breakdowns], n, non_command_masks) / _py_sum([b['weight'] for b in non_command_breakdowns], n, non_command_masks)
+            accuracy_non_command = np.where(np.any(non_command_masks, axis=0) if non_command_masks else np.zeros(n, dtype=bool), accuracy_non_command, 0)
+
+            # 2003+ BOOST COMMAND ACCURACY FOR OUTLIERS THAT ARE ACCURATE
+            accuracy_cutoff = np.full(n, 0.99)
+            accuracy_command_minimum = np.full(n, 0.90 if self.is_hitter else 0.35)
+
+            # POST 2026, INCREASE PROBABILITY OF PITCHER COMMAND ACCURACY BOOSTS TO ADD MORE VARIETY TO PITCHER CHARTS
+            if self.is_pitcher:
+                is_post_2026 = years >= 2026
+                accuracy_cutoff = np.where(is_post_2026, 0.98, accuracy_cutoff)
+                accuracy_command_minimum = np.where(is_post_2026, 0.25, accuracy_command_minimum)
+
+            is_boosted_command_accuracy = is_outlier_adjusted & (accuracy_non_command > accuracy_cutoff) & (accuracy_command < accuracy_cutoff) & (accuracy_command > accuracy_command_minimum)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                boosted_adjustment_pct = _py_round(accuracy_cutoff / accuracy_command)
+            command_out_accuracy_weight = np.where(is_boosted_command_accuracy, boosted_adjustment_pct, command_out_accuracy_weight)
+
+            # 2003+ REDUCE ALL ACCURACY FOR HITTER OUTLIERS WITH STRANGE OUTS THAT ARE INACCURATE
+            out_low_bound = 4 if self.is_expanded else 2
+            out_high_bound = 8 if self.is_expanded else 5
+            onbase_upper_bound = 14 if self.is_expanded else 11
+            onbase_lower_bound = 10 if self.is_expanded else 6
+            is_out_of_bounds = ((outs < out_low_bound) & (command < onbase_upper_bound)) | ((outs > out_high_bound) & (command > onbase_lower_bound))
+            is_reduction = is_outlier_adjusted & self.is_hitter & is_out_of_bounds & ~is_boosted_command_accuracy & (accuracy_non_command < 0.99)
+            command_out_accuracy_weight = np.where(is_reduction, 0.925, command_out_accuracy_weight)
+
+            # RECALCULATE COMMAND ACCURACY WITH ADJUSTMENT
+            is_command_adjusted = is_boosted_command_accuracy | is_reduction
+            if is_command_adjusted.any():
+                adjustment_pct = np.where(is_command_adjusted, command_out_accuracy_weight, 1.0)
+                accuracy = self._breakdown_accuracy(stat=Stat.COMMAND, actual=command_breakdown['actual'], comparison=command_breakdown['comparison'], adjustment_pct=adjustment_pct)
+                command_breakdown['adjustment_pct'] = adjustment_pct
+                command_breakdown['accuracy'] = accuracy
+                command_breakdown['weighted_accuracy'] = _py_round(accuracy * command_breakdown['weight'])
+
+        # CALCULATE OVERALL ACCURACY
+        accuracy = _py_sum([b['weighted_accuracy'] for b in breakdowns.values()], n, [b['is_included'] for b in breakdowns.values()])
+
+        if not self.does_set_ignore_outlier_adjustments:
+
+            # ADJUST HIGH COMMAND HIGH OUTS
+            command_out_accuracy_weight = np.where(is_high_command_high_outs, 0.925, command_out_accuracy_weight)
+
+            # USE LINEAR DECAY TO REDUCE ACCURACY FOR OUTLIERS
+            is_decay = is_outside_out_bounds & ~is_elite_command_out_chart & ~is_super_low_rated_command_out_chart & ~is_high_command_high_outs
+            decay_rate = np.where(
+                (command <= (command_outlier_upper_bound - 2)) & (outs < out_min), 0.0275 * 1.60,
+                np.where(
+                    (command >= (command_outlier_lower_bound - 2)) & (outs > out_max), 0.0275 * 1.25,
+                    np.where(self.is_classic & (outs > out_max), 0.0275 * 1.25, 0.0275)
+                )
+            )
+            out_comp = np.where(outs > out_max, out_max, out_min)
+            command_out_accuracy_weight = np.where(is_decay, _py_min( 1.020 - (decay_rate * np.abs(outs - out_comp)), 1.0 ), command_out_accuracy_weight)
+
+            # APPLY WEIGHTS
+            accuracy = accuracy * command_out_accuracy_weight
+            accuracy = accuracy * command_accuracy_weights
+
+        return {
+            'accuracy': accuracy,
+            'is_command_out_anomaly': is_chart_an_outlier,
+            'command_out_accuracy_weight': command_out_accuracy_weight,
+            'breakdowns': breakdowns,
+            'onbase_perc': projected['onbase_perc'],
+        }
+
+    def accuracy_breakdown(self, scores: dict[str, np.ndarray], row: int) -> dict[Stat, ChartAccuracyBreakdown]:
+        """Build accuracy breakdown objects for a scored row. Matches `Chart.accuracy_breakdown`.
+
+        Args:
+            scores: Output of `score`.
+            row: Row index.
+
+        Returns:
+            Dictionary of accuracy breakdowns by stat, including OVERALL.
+        """
+
+        # NOTES
+        notes: list[str] = []
+        if scores['is_command_out_anomaly'][row]:
+            notes.append('OUTLIER')
+        command_out_accuracy_weight = float(scores['command_out_accuracy_weight'][row])
+        if command_out_accuracy_weight != 1.0:
+            notes.append(f'C/O ADJ: {command_out_accuracy_weight - 1.0:+.1%}')
+        notes_str = ', '.join(notes)
+
+        accuracy_breakdown: dict[Stat, ChartAccuracyBreakdown] = {}
+        for stat, breakdown in scores['breakdowns'].items():
+            if not breakdown['is_included'][row]:
+                continue
+            accuracy_breakdown[stat] = ChartAccuracyBreakdown.model_construct(
+                stat=stat,
+                actual=float(breakdown['actual'][row]),
+                comparison=float(breakdown['comparison'][row]),
+                is_pitcher=self.is_pitcher,
+                weight=float(breakdown['weight'][row]),
+                accuracy=float(breakdown['accuracy'][row]),
+                weighted_accuracy=float(breakdown['weighted_accuracy'][row]),
+                adjustment_pct=float(breakdown['adjustment_pct'][row]),
+                notes=notes_str,
+            )
+
+        # USE OPS BREAKDOWN FOR ACTUAL AND COMPARISON FOR OVERALL
+        ops_breakdown = accuracy_breakdown.get(Stat.OPS, None)
+        accuracy_breakdown[Stat.OVERALL] = ChartAccuracyBreakdown.model_construct(
+            stat=Stat.OVERALL,
+            actual=ops_breakdown.actual if ops_breakdown else 0.0,
+            comparison=round(ops_breakdown.comparison, 4) if ops_breakdown else 0.0,
+            is_pitcher=self.is_pitcher,
+            weight=0.0,
+            accuracy=float(scores['accuracy'][row]),
+            weighted_accuracy=1.0,
+            adjustment_pct=1.0,
+            notes=notes_str,
+        )
+        return accuracy_breakdown
+
+
+# ---------------------------------------
+# BATCH
+# ---------------------------------------
+
+def solve_charts(stats_matrix: list[dict], set: Set, era: Union[Era, list[Era]], sub_types: list[PlayerSubType], year_lists: list[list[int]], years: list[Optional[int]] = None, commands_excluded: list[list[int]] = None, batch_size: int = 250) -> list[ChartSolution]:
+    """Find the most accurate command/outs combination for many players at once.
+
+    Rows are grouped by player type and scored with `ChartSolver.search_many`,
+    `batch_size` players at a time. Each row matches what
+    `ShowdownPlayerCard._most_accurate_chart` would test for that player.
+
+    Args:
+        stats_matrix: Real stats per 400 PA, one row per player.
+        set: Showdown set shared by all players.
+        era: Era for all players, or one per player.
+        sub_types: Player subtype for each player.
+        year_lists: Years used for era adjustments for each player.
+        years: Last year of the stats period for each player.
+        commands_excluded: Commands to skip for each player.
+        batch_size: Max number of players scored in one batch.
+
+    Returns:
+        List of solutions, one per row of `stats_matrix`.
+    """
+
+    n = len(stats_matrix)
+    eras = era if isinstance(era, list) else [era] * n
+    years = years or [None] * n
+    commands_excluded = commands_excluded or [[]] * n
+
+    # OPPONENTS ONLY DEPEND ON SUBTYPE, ERA, AND YEARS, SO ROWS SHARE THEM WHEN THEY CAN
+    opponents: dict[tuple, Chart] = {}
+    def opponent_for_row(row: int) -> Chart:
+        key = (sub_types[row], eras[row], tuple(year_lists[row]))
+        if key not in opponents:
+            opponents[key] = set.opponent_chart(player_sub_type=sub_types[row], era=eras[row], year_list=year_lists[row], adjust_for_simulation_accuracy=True)
+        return opponents[key]
+
+    solutions: list[Optional[ChartSolution]] = [None] * n
+    for is_pitcher in [False, True]:
+        type_rows = [row for row in range(n) if sub_types[row].is_pitcher == is_pitcher]
+        if len(type_rows) == 0:
+            continue
+        solver = ChartSolver(set=set.value, is_pitcher=is_pitcher, is_expanded=set.has_expanded_chart)
+        for batch_start in range(0, len(type_rows), batch_size):
+            batch_rows = type_rows[batch_start:batch_start + batch_size]
+            commands: list[list[int]] = []
+            for row in batch_rows:
+                excluded = commands_excluded[row] or []
+                commands.append(list({ c for c in set.command_options(player_type=sub_types[row].parent_type) if c not in excluded }))
+            candidates = solver.search_many(
+                commands=commands,
+                command_accuracy_weights=[[set.command_accuracy_weighting(command=c, player_sub_type=sub_types[row]) for c in row_commands] for row, row_commands in zip(batch_rows, commands)],
+                stats_per_400_pa=[stats_matrix[row] for row in batch_rows],
+                opponents=[opponent_for_row(row) for row in batch_rows],
+                era_year_lists=[year_lists[row] for row in batch_rows],
+                player_subtypes=[sub_types[row].value for row in batch_rows],
+                years=[years[row] for row in batch_rows],
+            )
+            for row, row_candidates in zip(batch_rows, candidates):
+                solutions[row] = ChartSolution(candidates=row_candidates)
+
+    return solutions
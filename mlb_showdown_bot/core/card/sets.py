@@ -1,5 +1,6 @@
 from enum import Enum
 from datetime import datetime
+from threading import Lock
 import numpy as np
 
 # INTERNAL
@@ -8,6 +9,7 @@ from ..shared.player_position import PlayerType, PlayerSubType, Position
 from .points import PointsMetric, ValueRange
 from .images import PlayerImageComponent, TemplateImageComponent, ImageParallel, Expansion, SpecialEdition
 from .chart import Chart, ChartCategory
+from ..data.season_averages_table import MLB_SEASON_AVGS_TABLE
 
 
 class Era(Enum):
@@ -58,6 +60,37 @@ class Era(Enum):
 
 
 
+# ------------------------------------------------------------------------------
+# OPPONENT CHART CACHE
+# ------------------------------------------------------------------------------
+
+# ERA ADJUSTED OPPONENT CHARTS ONLY DEPEND ON THE SET, SUB TYPE, ERA, YEARS AND
+# SIMULATION FLAG, SO THEY ARE BUILT ONCE PER PROCESS AND COPIED OUT ON EACH READ.
+_OPPONENT_CHART_CACHE: dict[tuple, Chart] = {}
+_OPPONENT_CHART_CACHE_STATS: dict[str, int] = { 'hits': 0, 'misses': 0 }
+_OPPONENT_CHART_CACHE_LOCK = Lock()
+
+def opponent_chart_cache_stats() -> dict[str, int]:
+    """ Hit/miss counters and current size of the opponent chart cache.
+
+    Returns:
+        Dict with 'hits', 'misses' and 'size' keys.
+    """
+    with _OPPONENT_CHART_CACHE_LOCK:
+        return { **_OPPONENT_CHART_CACHE_STATS, 'size': len(_OPPONENT_CHART_CACHE) }
+
+def clear_opponent_chart_cache() -> None:
+    """ Rebuild the season averages table, then drop all cached opponent charts and reset counters.
+
+    Call after MLB_SEASON_AVGS is updated in-process (ex: mid-season refresh),
+    otherwise cached charts keep the old era adjustment.
+    """
+    MLB_SEASON_AVGS_TABLE.rebuild()
+    with _OPPONENT_CHART_CACHE_LOCK:
+        _OPPONENT_CHART_CACHE.clear()
+        _OPPONENT_CHART_CACHE_STATS.update({ 'hits': 0, 'misses': 0 })
+
+
 # ------------------------------------------------------------------------------
 # SET
 # ------------------------------------------------------------------------------
@@ -1568,12 +1601,35 @@ class Set(str, Enum):
     # ---------------------------------------
 
     def opponent_chart(self, player_sub_type:PlayerSubType, era:Era, year_list: list[int], adjust_for_simulation_accuracy:bool = True) -> Chart:
+        """ Baseline opponent chart adjusted to the given era and years.
+
+        Results are memoized process-wide (see clear_opponent_chart_cache). Each call
+        returns its own deep copy, so callers are free to mutate the chart.
+
+        Args:
+          player_sub_type: Sub type of the player the opponent is facing.
+          era: Era to adjust the opponent to.
+          year_list: Years used for era averages.
+          adjust_for_simulation_accuracy: Apply simulation accuracy adjustments to the baseline.
+
+        Returns:
+          Era adjusted opponent Chart.
+        """
+        key = (self.value, player_sub_type, era, tuple(year_list), adjust_for_simulation_accuracy)
+        with _OPPONENT_CHART_CACHE_LOCK:
+            cached_chart = _OPPONENT_CHART_CACHE.get(key, None)
+            _OPPONENT_CHART_CACHE_STATS['hits' if cached_chart is not None else 'misses'] += 1
+        if cached_chart is not None:
+            return cached_chart.model_copy(deep=True)
+
         chart = self.wotc_baseline_chart(
             player_type=player_sub_type.parent_type.opponent_type, 
             my_type=player_sub_type, 
             adjust_for_simulation_accuracy=adjust_for_simulation_accuracy
         )
         chart.adjust_for_era(era.value, year_list=year_list)
+        with _OPPONENT_CHART_CACHE_LOCK:
+            _OPPONENT_CHART_CACHE.setdefault(key, chart.model_copy(deep=True))
         return chart
 
     def wotc_baseline_chart(self, player_type: PlayerType, my_type: PlayerSubType, adjust_for_simulation_accuracy:bool = True) -> Chart:
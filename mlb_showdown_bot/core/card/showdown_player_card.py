@@ -14,14 +14,17 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 from oauth2client.service_account import ServiceAccountCredentials
 from collections import Counter
+from contextlib import AbstractContextManager
+from enum import Enum
+from functools import cache, partial
 from pathlib import Path
 from io import BytesIO
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageChops
 from prettytable import PrettyTable
 from pprint import pprint
-from pydantic import BaseModel, ValidationInfo, field_validator, model_validator
-from typing import Any, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator, model_validator
+from typing import Any, Callable, Optional, Union
 
 # INTERNAL
 from ..shared.team import Team
@@ -33,15 +36,17 @@ from ..shared.hand import Hand
 
 from .utils import showdown_constants as sc, colors
 from .utils.shared_functions import convert_to_date, convert_number_to_ordinal, total_ip_for_calculations
+from .utils.stage_profiler import StageProfile, NO_STAGE
 
 from .stats.accolade import Accolade
 from .stats.metrics import DefenseMetric
-from .stats.stats_period import StatsPeriod, StatsPeriodType, TeamSelection
+from .stats.stats_period import StatsPeriod, StatsPeriodType, TeamSelection, CumulativeGameLogStats
 from .stats.real_vs_projected_stat import RealVsProjectedStat
 from .stats.datasource import Datasource
 
 from .sets import Set, Era, SpeedMetric, PlayerType, PlayerSubType, Position, PlayerImageComponent, TemplateImageComponent, ValueRange, Chart, ImageParallel
-from .chart import ChartCategory, Stat, ChartAccuracyBreakdown
+from .chart import ChartCategory, ChartKernel, Stat, ChartAccuracyBreakdown
+from .chart_solver import ChartSolver, ChartCandidate, ChartSolution, solve_charts
 from .images import ImageSource, ImageSourceType, SpecialEdition, Edition, Expansion, ShowdownImage, StatHighlightsType, StatHighlightsCategory
 from .points import Points, PointsMetric, PointsBreakdown
 
@@ -101,6 +106,8 @@ class ShowdownPlayerCard(BaseModel):
     build_on_init: bool = True
     is_running_on_website: bool = False
     load_time: float = 0.0
+    profile_stages: bool = Field(default=False, exclude=True) # NOT SERIALIZED, THE PROFILE IS ONLY RETURNED IN `generate_card` LOGS
+    stage_profile: Optional[StageProfile] = Field(default=None, exclude=True)
     warnings: list[str] = []
 
     # RANKS
@@ -147,6 +154,12 @@ class ShowdownPlayerCard(BaseModel):
     # ONLINE STORAGE
     user_id: Optional[str] = None
 
+    # CARD FOR THE SAME PLAYER IN ANOTHER SET TO COPY SET AGNOSTIC STAGES FROM (SEE `cards_for_sets`)
+    _stats_source: Optional['ShowdownPlayerCard'] = PrivateAttr(default=None)
+
+    # RUNNING TOTALS OF GAME LOGS SHARED BY CARDS FOR CUMULATIVE DATE RANGES (SEE `cards_for_date_ranges`)
+    _cumulative_game_logs: Optional[CumulativeGameLogStats] = PrivateAttr(default=None)
+
 # ------------------------------------------------------------------------
 # POST INIT
 # ------------------------------------------------------------------------
@@ -173,9 +186,165 @@ class ShowdownPlayerCard(BaseModel):
         Returns:
             None
         """
+        self._start_stage_profile()
+        with self._stage('total'):
+            stats_for_400_pa = self._build_card_attributes()
+            self._build_card_chart(stats_per_400_pa=stats_for_400_pa, show_image=show_image, print_to_cli=print_to_cli)
+
+    @classmethod
+    def build_cards(cls, cards: list['ShowdownPlayerCard'], batch_size: int = 250, errors: list[tuple['ShowdownPlayerCard', Exception]] = None) -> list['ShowdownPlayerCard']:
+        """Build many unbuilt cards (`build_on_init=False`), solving all of their charts in batches.
+        Card attributes are built one at a time, then every chart search for a set runs
+        through `solve_charts` before the remaining card attributes are built.
+
+        Args:
+            cards: Cards created with `build_on_init=False`.
+            batch_size: Max number of players scored in one chart batch.
+            errors: Optional list to collect (card, exception) for failed cards. If None, errors are printed.
+
+        Returns:
+            Cards that built successfully, in input order. Failed cards are skipped.
+        """
+
+        def handle_error(card: 'ShowdownPlayerCard', e: Exception) -> None:
+            if errors is not None:
+                errors.append( (card, e) )
+                return
+            print(f"\nERROR CREATING SHOWDOWN CARD FOR {card.name} ({card.year}) - {e}")
+
+        # STATS, POSITIONS, SUBTYPE, ETC
+        # CARDS FROM `cards_for_sets` COPY THE SET AGNOSTIC STAGES FROM THE PLAYER'S FIRST CARD
+        prepared: list[tuple['ShowdownPlayerCard', dict]] = []
+        stats_built: set[int] = set()
+        stats_errors: dict[int, Exception] = {}
+        for card in cards:
+            card._start_stage_profile()
+            source, card._stats_source = card._stats_source, None
+            try:
+                if source is not None and id(source) in stats_errors:
+                    raise stats_errors[id(source)]
+                if source is not None and id(source) in stats_built:
+                    with card._stage('copy_stats_attributes'):
+                        card._copy_stats_attributes(source)
+                else:
+                    try:
+                        card._build_stats_attributes()
+                    except Exception as e:
+                        stats_errors[id(card)] = e
+                        raise
+                    stats_built.add(id(card))
+                prepared.append( (card, card._build_set_attributes()) )
+            except Exception as e:
+                handle_error(card, e)
+
+        # SOLVE CHARTS FOR EACH SET IN BATCHES
+        solutions: dict[int, ChartSolution] = {}
+        for showdown_set in list(dict.fromkeys([card.set for card, _ in prepared])):
+            set_cards = [(card, stats) for card, stats in prepared if card.set == showdown_set]
+            set_solutions = solve_charts(
+                stats_matrix=[stats for _, stats in set_cards],
+                set=showdown_set,
+                era=[card.era for card, _ in set_cards],
+                sub_types=[card.player_sub_type for card, _ in set_cards],
+                year_lists=[card._chart_year_list() for card, _ in set_cards],
+                years=[card.stats_period.last_year for card, _ in set_cards],
+                commands_excluded=[card.commands_excluded for card, _ in set_cards],
+                batch_size=batch_size,
+            )
+            for (card, _), solution in zip(set_cards, set_solutions):
+                solutions[id(card)] = solution
+
+        # FINISH BUILDING EACH CARD WITH ITS SOLVED CHART
+        built_cards: list[ShowdownPlayerCard] = []
+        for card, stats_for_400_pa in prepared:
+            try:
+                card._build_card_chart(stats_per_400_pa=stats_for_400_pa, chart_candidates=solutions[id(card)].candidates, show_image=card.show_image, print_to_cli=card.print_to_cli)
+                built_cards.append(card)
+            except Exception as e:
+                handle_error(card, e)
+
+        return built_cards
+
+    @classmethod
+    def cards_for_sets(cls, sets: list[Set | str], trusted: bool = False, **kwargs) -> list['ShowdownPlayerCard']:
+        """Unbuilt cards for one player in many sets. When built together with `build_cards`, the set agnostic
+        stages (stat cleaning, nicknames, game logs, stats period) run once for the first card and are copied
+        to the rest, so only positions and defense, speed, accolades, chart and points run per set.
+
+        Args:
+            sets: Showdown Sets to create a card for.
+            trusted: Create cards with `from_trusted_inputs` (ex: archived stats) instead of validating inputs.
+            **kwargs: ShowdownPlayerCard inputs shared by every set, excluding `set`.
+
+        Returns:
+            One unbuilt card per set, in the same order as `sets`.
+        """
+        constructor = cls.from_trusted_inputs if trusted else cls
+        stats_period: StatsPeriod = kwargs.pop('stats_period')
+        image: Optional[ShowdownImage] = kwargs.pop('image', None)
+        cards: list[ShowdownPlayerCard] = []
+        for showdown_set in sets:
+            # BUILDING MUTATES THE STATS PERIOD AND IMAGE, SO EACH CARD GETS ITS OWN
+            card_kwargs = kwargs | {'set': showdown_set, 'stats_period': stats_period.model_copy(deep=True), 'build_on_init': False}
+            if image is not None:
+                card_kwargs['image'] = image.model_copy(deep=True)
+            card = constructor(**card_kwargs)
+            card._stats_source = cards[0] if len(cards) > 0 else None
+            cards.append(card)
+        return cards
+
+    @classmethod
+    def cards_for_date_ranges(cls, stats_periods: list[StatsPeriod], **kwargs) -> list['ShowdownPlayerCard']:
+        """Unbuilt cards for one player over cumulative date ranges that start on the same date (ex: in-season trends).
+        Game logs are cleaned and summed once, and each card reads its period stats from the running totals,
+        so building a card doesn't re-aggregate every game before its end date.
+
+        Args:
+            stats_periods: Date range stats period for each card. Ranges that don't start on the first range's
+                           start date aggregate their game logs as usual.
+            **kwargs: ShowdownPlayerCard inputs shared by every card, excluding `stats_period`.
+
+        Returns:
+            One unbuilt card per stats period, in the same order as `stats_periods`.
+        """
+        end_dates = [stats_period.end_date for stats_period in stats_periods if stats_period.end_date]
+        cumulative_game_logs = CumulativeGameLogStats(start_date=stats_periods[0].start_date, end_date=max(end_dates)) if len(end_dates) > 0 else None
+        cards: list[ShowdownPlayerCard] = []
+        for stats_period in stats_periods:
+            card = cls(**(kwargs | {'stats_period': stats_period, 'build_on_init': False}))
+            card._cumulative_game_logs = cumulative_game_logs
+            cards.append(card)
+        return cards
+
+    def _start_stage_profile(self) -> None:
+        """Reset stage timings when `profile_stages` is enabled"""
+        self.stage_profile = StageProfile() if self.profile_stages else None
+
+    def _stage(self, name: str) -> AbstractContextManager:
+        """Context manager timing a build stage. No-op unless `profile_stages` is enabled.
+
+        Args:
+            name: Stage name stored in `stage_profile`.
+        """
+        return self.stage_profile.stage(name) if self.stage_profile is not None else NO_STAGE
+
+    def _build_card_attributes(self) -> dict:
+        """First half of `build_card`. Cleans stats and builds every attribute the chart depends on.
+
+        Returns:
+            Stats per 400 PA used to generate the chart.
+        """
+        self._build_stats_attributes()
+        return self._build_set_attributes()
+
+    def _build_stats_attributes(self) -> None:
+        """Set agnostic part of building the card: stat cleaning, nicknames, game logs and the stats period.
+        When building one player for many sets, this runs once and is copied with `_copy_stats_attributes`.
+        """
 
         # CLEAN UP AND CALCULATE MISSING/ALTERED STATS
-        self.stats = self.clean_stats(stats=self.stats)
+        with self._stage('clean_stats'):
+            self.stats = self.clean_stats(stats=self.stats)
 
         # ADD NICKNAMES
         # ONLY RUN ON WEBSITE FOR OPTIMIZATION PURPOSES
@@ -207,7 +376,13 @@ class ShowdownPlayerCard(BaseModel):
                     game_logs += added_game_logs
         
         # ADD LOGS AS STATS IN PERIOD
-        self.stats_period.add_stats_from_game_logs(game_logs=game_logs, is_pitcher=self.is_pitcher, team_override=self.team_override)
+        # CARDS FROM `cards_for_date_ranges` READ FROM RUNNING TOTALS INSTEAD OF RE-AGGREGATING EVERY GAME
+        with self._stage('add_stats_from_game_logs'):
+            is_added_from_cumulative_game_logs = self._cumulative_game_logs is not None and not self.realtime_game_logs \
+                and self.stats_period.add_stats_from_cumulative_game_logs(cumulative_game_logs=self._cumulative_game_logs, game_logs=game_logs, is_pitcher=self.is_pitcher, team_override=self.team_override)
+            if not is_added_from_cumulative_game_logs:
+                shared_game_log_columns = self._cumulative_game_logs.game_log_columns if self._cumulative_game_logs is not None else None
+                self.stats_period.add_stats_from_game_logs(game_logs=game_logs, is_pitcher=self.is_pitcher, team_override=self.team_override, game_log_columns=shared_game_log_columns)
 
         # WHEN EMPTY, CHECK FOR WARNINGS
         if not self.stats_period.stats and self.stats_period.type.uses_game_logs:
@@ -217,7 +392,8 @@ class ShowdownPlayerCard(BaseModel):
 
             # TRY AGAIN
             game_logs: list[dict] = self.stats.get(self.stats_period.type.stats_dict_key or 'n/a', [])
-            self.stats_period.add_stats_from_game_logs(game_logs=game_logs, is_pitcher=self.is_pitcher, team_override=self.team_override)
+            with self._stage('add_stats_from_game_logs'):
+                self.stats_period.add_stats_from_game_logs(game_logs=game_logs, is_pitcher=self.is_pitcher, team_override=self.team_override)
 
         if self.stats_period.stats:
             full_season_stats_used_for_stats_period = {k: v for k, v in self.stats.items() if k in ['IF/FB', 'GO/AO',]}
@@ -230,7 +406,8 @@ class ShowdownPlayerCard(BaseModel):
             if self.stats_period.type != StatsPeriodType.POSTSEASON:
                 self.stats_period.stats.update(full_season_stats_used_for_stats_period)
 
-            self.stats_period.stats = self.clean_stats(stats=self.stats_period.stats)
+            with self._stage('clean_stats'):
+                self.stats_period.stats = self.clean_stats(stats=self.stats_period.stats)
 
             # USE OVERWRITTEN FULL SEASON STATS AS PARTIALS
             full_stats_copy = self.stats.copy()
@@ -250,12 +427,35 @@ class ShowdownPlayerCard(BaseModel):
             self.is_stats_estimate = True
             self.warnings.append(f"Stats have been nerfed by a run value of {self.nerf_by_run_value}. The purpose is to normalize stats for players coming from different leagues (e.g. KBO, NPB, MINORS) to create a more accurate card against MLB pitching/hitting.")
 
+    def _copy_stats_attributes(self, source: 'ShowdownPlayerCard') -> None:
+        """Copy the output of `_build_stats_attributes` from a card for the same player in another set.
+        Containers the set specific stages read from are copied so cards don't share state.
+
+        Args:
+            source: Card with the same inputs (except set) that already ran `_build_stats_attributes`.
+        """
+        self.stats = dict(source.stats)
+        self.stats_period = source.stats_period.model_copy(update={'stats': dict(source.stats_period.stats) if source.stats_period.stats is not None else None})
+        self.nicknames = list(source.nicknames)
+        self.team_override = source.team_override
+        self.team = source.team
+        self.is_stats_estimate = source.is_stats_estimate
+        self.warnings = list(source.warnings)
+
+    def _build_set_attributes(self) -> dict:
+        """Set specific attributes the chart depends on (colors, positions and defense, speed, accolades, etc).
+
+        Returns:
+            Stats per 400 PA used to generate the chart.
+        """
+
         # UPDATE IMAGE COLORS
         self.image.color_primary = self._team_color_rgb_str()
         self.image.color_secondary = self._team_color_rgb_str(is_secondary_color=True)
 
         # POSITIONS_AND_DEFENSE, HAND, IP, SPEED, SPEED_LETTER
-        self.positions_and_defense, self.positions_and_real_life_ratings, self.positions_and_games_played = self._positions_and_defense(stats_dict=self.stats_for_card)
+        with self._stage('positions_and_defense'):
+            self.positions_and_defense, self.positions_and_real_life_ratings, self.positions_and_games_played = self._positions_and_defense(stats_dict=self.stats_for_card)
         self.positions_list = list(self.positions_and_defense.keys())
         self.positions_and_defense_for_visuals: dict[str, int] = self.calc_positions_and_defense_for_visuals()
         self.positions_and_defense_string: str = self.positions_and_defense_as_string(is_horizontal=True)
@@ -263,33 +463,135 @@ class ShowdownPlayerCard(BaseModel):
         self.ip: int = self._innings_pitched(innings_pitched=float(self.stats_for_card.get('IP', 0)), games=self.stats_for_card.get('G', 0), games_started=self.stats_for_card.get('GS', 0), ip_per_start=self.stats_for_card.get('IP/GS', 0))
         hand_raw = self.stats_for_card.get('hand', None) if self.player_type == PlayerType.HITTER else ( self.stats_for_card.get('hand_throw', None) or self.stats_for_card.get('hand', None) )
         self.hand: Hand = self._handedness(hand_raw=hand_raw)
-        self.speed: Speed = self.calculate_speed()
-        self.accolades: list[str] = self.parse_accolades()
+        with self._stage('calculate_speed'):
+            self.speed: Speed = self.calculate_speed()
+        with self._stage('parse_accolades'):
+            self.accolades: list[str] = self.parse_accolades()
         self.icons: list[Icon] = self._icons(awards=self.stats_for_card.get('award_summary',''))
 
         # CONVERT STATS TO PER 400 PA
         # MAKES MATH EASIER (20 SIDED DICE)
-        stats_for_400_pa = self.stats_per_n_pa(plate_appearances=400, stats=self.stats_for_card)
+        return self.stats_per_n_pa(plate_appearances=400, stats=self.stats_for_card)
 
-        self.chart: Chart = self._most_accurate_chart(stats_per_400_pa=stats_for_400_pa, offset=int(self.chart_version) - 1)
-        self.projected: dict = self.projected_statline(stats_per_400_pa=self.chart.projected_stats_per_400_pa, command=self.chart.command, pa=self.stats_for_card.get('PA', 650))
+    def _build_card_chart(self, stats_per_400_pa: dict, chart_candidates: list[ChartCandidate] = None, show_image:bool=False, print_to_cli:bool=False) -> None:
+        """Second half of `build_card`. Builds the chart and everything derived from it.
 
-        self.recalculate_points()
+        Args:
+            stats_per_400_pa: Output of `_build_card_attributes`.
+            chart_candidates: Already scored command/outs combinations (ex: from `solve_charts`).
+            show_image (bool): Whether to show the card image after building it.
+            print_to_cli (bool): Whether to print the card information to the CLI.
+
+        Returns:
+            None
+        """
+
+        with self._stage('most_accurate_chart'):
+            self.chart: Chart = self._most_accurate_chart(stats_per_400_pa=stats_per_400_pa, offset=int(self.chart_version) - 1, candidates=chart_candidates)
+        with self._stage('projected_statline'):
+            self.projected: dict = self.projected_statline(stats_per_400_pa=ChartKernel.from_chart(self.chart).projected_stats_per_400_pa(), command=self.chart.command, pa=self.stats_for_card.get('PA', 650))
+
+        with self._stage('recalculate_points'):
+            self.recalculate_points()
 
         # STATS DISPLAYED ON FRONTEND
-        self.real_vs_projected_stats = self._calculate_real_vs_projected_stats()
+        with self._stage('real_vs_projected_stats'):
+            self.real_vs_projected_stats = self._calculate_real_vs_projected_stats()
         self.image.stat_highlights_list = self._generate_stat_highlights_list(stats=self.stats_for_card if not self.nerf_by_run_value else self.stats)
         self.image.award_summary_list = self._generate_award_summary_list(award_summary=self.stats_for_card.get('award_summary', None))
 
         if show_image or self.image.output_folder_path or self.image.upload_to_supabase:
-            self.generate_card_image(show=show_image)
+            with self._stage('generate_card_image'):
+                self.generate_card_image(show=show_image)
 
             if self.image.upload_to_supabase:
-                self.upload_image_to_supabase()
+                with self._stage('upload_to_supabase'):
+                    self.upload_image_to_supabase()
         
         if print_to_cli:
             self.print_player()
 
+# ------------------------------------------------------------------------
+# TRUSTED CONSTRUCTION
+# ------------------------------------------------------------------------
+
+    @classmethod
+    def from_trusted_inputs(cls, name: str, year: str | int, set: Set | str, stats: dict, stats_period: StatsPeriod, era: Era | str | None = None, player_type_override: PlayerType | str | None = None, **fields) -> 'ShowdownPlayerCard':
+        """Create a card from known-good inputs (ex: stats stored in the archive) without running pydantic validation.
+        Fields derived from stats (name, player type, bref id, team, etc) are resolved the same way
+        as the validators, so the built card is identical to `ShowdownPlayerCard(...)`.
+
+        Only use for inputs that are already the correct types. Nothing is coerced except
+        the arguments above, and other keyword arguments are assigned as is.
+
+        Args:
+            name: Player name. The name in stats takes priority.
+            year: Year(s) of the stats.
+            set: Showdown Set.
+            stats: Player stats. Copied (shallow) like the validated path.
+            stats_period: Already built StatsPeriod.
+            era: Era or 'DYNAMIC'/None to derive from the stats period.
+            player_type_override: Optional override to pitcher/hitter.
+            **fields: Any other card fields, already typed. Unknown keys are ignored.
+
+        Returns:
+            ShowdownPlayerCard, built on init unless `build_on_init=False` is passed.
+        """
+        stats = dict(stats)
+        year = str(year) if isinstance(year, int) else year
+        bref_id = fields.pop('bref_id', None)
+        bref_url = fields.pop('bref_url', None)
+        mlb_id = fields.pop('mlb_id', None) or stats.get('mlb_id', None)
+        league = fields.pop('league', None)
+        team = fields.pop('team', None)
+        nationality = fields.pop('nationality', None)
+        values = dict(
+            name=stats.get('name', name),
+            year=year,
+            set=Set(set),
+            stats=stats,
+            stats_period=stats_period,
+            era=cls._era_from_input(era=era, year=year, stats_period=stats_period),
+            player_type=PlayerType(stats.get('type', None) or fields.pop('player_type', None)),
+            player_type_override=cls._player_type_override_from_input(player_type_override=player_type_override, stats_period=stats_period),
+            bref_id=bref_id if bref_id and len(bref_id) > 1 else stats.get('bref_id', ''),
+            bref_url=bref_url or stats.get('bref_url', ''),
+            mlb_id=int(mlb_id) if mlb_id is not None else None,
+            is_stats_estimate=fields.pop('is_stats_estimate', False) or stats.get('is_stats_estimate', False),
+            league=league if (league or 'MLB') != 'MLB' else stats.get('lg_ID', 'MLB'),
+            team=team if (team or Team.MLB) != Team.MLB else Team(stats.get('team_ID', None)),
+            nationality=nationality if (nationality or Nationality.NONE) != Nationality.NONE else Nationality(stats.get('nationality', Nationality.NONE)),
+        ) | fields
+
+        # FRESH DEFAULTS FOR EVERY FIELD NOT PASSED, SO `model_construct` DOESN'T RESOLVE EACH ONE
+        defaults = {name: default() for name, default in cls._trusted_default_factories().items() if name not in values}
+        return cls.model_construct(**(defaults | values))
+
+    @classmethod
+    @cache
+    def _trusted_default_factories(cls) -> dict[str, Callable[[], Any]]:
+        """Callable returning a fresh default for each optional field. Built once per class.
+
+        Matches pydantic's default handling (immutable defaults are shared, everything else is copied)
+        but skips the per field resolution and deep copies that make `model_construct` slow.
+        """
+        factories: dict[str, Callable[[], Any]] = {}
+        for name, field in cls.model_fields.items():
+            if field.is_required():
+                continue
+            default = field.default
+            if field.default_factory is not None:
+                factories[name] = field.default_factory
+            elif default is None or isinstance(default, (str, int, float, bool, Enum)):
+                factories[name] = partial(lambda value: value, default)
+            elif isinstance(default, (list, dict)) and len(default) == 0:
+                factories[name] = type(default)
+            elif isinstance(default, BaseModel) and type(default)() == default:
+                factories[name] = type(default)
+            else:
+                factories[name] = partial(field.get_default, call_default_factory=True)
+        return factories
+
 # ------------------------------------------------------------------------
 # VALIDATORS
 # ------------------------------------------------------------------------
@@ -321,14 +623,18 @@ class ShowdownPlayerCard(BaseModel):
 
     @field_validator('era', mode='before')
     def handle_dynamic_era(cls, era:str, info:ValidationInfo) -> Era:
+        return cls._era_from_input(era=era, year=info.data.get('year', ''), stats_period=info.data.get('stats_period', None))
+
+    @classmethod
+    def _era_from_input(cls, era: Era | str | None, year: str, stats_period: Optional[StatsPeriod]) -> Era:
+        """Era input as an Era. 'DYNAMIC' (or empty) uses the most common era across the stats period's years."""
         if isinstance(era, Era):
             return era
         
-        if era.upper() != 'DYNAMIC':
+        if (era or 'DYNAMIC').upper() != 'DYNAMIC':
             return Era(era)
         
-        year = info.data.get('year', '')
-        stats_period = info.data.get('stats_period', None) or StatsPeriod(year=year)
+        stats_period = stats_period or StatsPeriod(year=year)
         year_list = stats_period.year_list if stats_period.year_list else Era.STEROID.year_range
         eras = []
         for year in year_list:
@@ -413,6 +719,11 @@ class ShowdownPlayerCard(BaseModel):
     @field_validator('player_type_override', mode='before')
     def parse_player_type_override(cls, player_type_override:str, info:ValidationInfo) -> PlayerType:
         """Check for player type override as an input and within the user inputted name."""
+        return cls._player_type_override_from_input(player_type_override=player_type_override, stats_period=info.data.get('stats_period', None))
+
+    @classmethod
+    def _player_type_override_from_input(cls, player_type_override: PlayerType | str | None, stats_period: Optional[StatsPeriod]) -> Optional[PlayerType]:
+        """Player type override from input (ex: '(pitcher)') or the stats period"""
 
         if player_type_override:
             # CHECK IF PLAYER TYPE OVERRIDE IS A PLAYER TYPE ENUM
@@ -425,7 +736,6 @@ class ShowdownPlayerCard(BaseModel):
             return PlayerType(player_type_override)
 
         # CHECK STATS PERIOD FOR OVERRIDE
-        stats_period: StatsPeriod = info.data.get('stats_period', None)
         if stats_period and stats_period.player_type_override and type(stats_period.player_type_override) is PlayerType:
             return stats_period.player_type_override
         
@@ -1820,7 +2130,15 @@ class ShowdownPlayerCard(BaseModel):
 # CHART METHODS
 # ------------------------------------------------------------------------
 
-    def _most_accurate_chart(self, stats_per_400_pa:dict, offset:int) -> Chart:
+    def _chart_year_list(self) -> list[int]:
+        """Years used for the chart's era adjustments and opponent"""
+        year_list = self.stats_period.year_list if not self.is_alternate_era else self.era.year_range
+        # STOP AT LAST YEAR OF STATS PERIOD IF ERA WAS UPDATED DURING SHOWDOWN BOT'S EXISTANCE (2023+)
+        if self.stats_period.last_year >= Era.PITCH_CLOCK.year_range[0] and self.stats_period.last_year >= 2026 and self.era.year_range[-1] > self.stats_period.last_year:
+            year_list = [y for y in year_list if y <= self.stats_period.last_year]
+        return year_list
+
+    def _most_accurate_chart(self, stats_per_400_pa:dict, offset:int, candidates:list[ChartCandidate] = None) -> Chart:
         """Compare accuracy of all the command/outs combinations.
 
         Args:
@@ -1828,6 +2146,8 @@ class ShowdownPlayerCard(BaseModel):
           stats_per_400_pa: Dict with number of results for a given
                             category per 400 PA (ex: {'hr_per_400_pa': 23.65})
           offset: Index of chart accuracy selected.
+          candidates: Already scored command/outs combinations (ex: from `solve_charts`).
+                      If None, combinations are scored here.
 
         Returns:
           The dictionary containing stats for the most accurate command/out
@@ -1835,79 +2155,56 @@ class ShowdownPlayerCard(BaseModel):
           A dictionary containing real life metrics (obp, slg, ...) per 400 PA.
         """
 
-        charts: list[Chart] = []
-
         # DEFINE YEAR LIST FOR CHART
-        year_list = self.stats_period.year_list if not self.is_alternate_era else self.era.year_range
-        # STOP AT LAST YEAR OF STATS PERIOD IF ERA WAS UPDATED DURING SHOWDOWN BOT'S EXISTANCE (2023+)
-        if self.stats_period.last_year >= Era.PITCH_CLOCK.year_range[0] and self.stats_period.last_year >= 2026 and self.era.year_range[-1] > self.stats_period.last_year:
-            year_list = [y for y in year_list if y <= self.stats_period.last_year]
+        year_list = self._chart_year_list()
 
         # SET CONSTANTS
         opponent = self.set.opponent_chart(player_sub_type=self.player_sub_type, era=self.era, year_list=year_list, adjust_for_simulation_accuracy=True)
         pa = self.stats_for_card.get('pa', 400)
+        chart_kwargs = dict(
+            opponent=opponent,
+            set=self.set.value,
+            era_year_list=year_list,
+            year=self.stats_period.last_year, # USED FOR 2026+ COMMAND ESTIMATE ADJUSTMENT
+            era=self.era.value,
+            is_expanded=self.set.has_expanded_chart,
+            pa=pa,
+            stats_per_400_pa=stats_per_400_pa,
+            is_pitcher=self.is_pitcher,
+            player_subtype=self.player_sub_type.value,
+        )
         
+        # SCORE ALL COMMAND/OUT COMBOS IN ONE BATCH
+        # SEE ACCURACY WHEN OVERESTIMATING OBP VS UNDERESTIMATING OBP WHEN ROUNDING # OF OUTS
         command_options = list(set([ c for c in self.set.command_options(player_type=self.player_type) if c not in self.commands_excluded]))
-        for command in command_options:
-            
-            # CREATE CHART WITH COMMAND/OUT COMBO
-            # SEE ACCURACY WHEN OVERESTIMATING OBP VS UNDERESTIMATING OBP WHEN ROUNDING # OF OUTS
-            command_accuracy_weight = self.set.command_accuracy_weighting(command=command, player_sub_type=self.player_sub_type)
-            for use_alternate_outs in [False, True]:
-                
-                outs = 0
-                if use_alternate_outs:
-                    # CHECK FOR LAST CHART'S OUT VALUE AND PROJECTED VS ACTUAL
-                    outs = max( chart.outs + ( chart.sub_21_per_slot_worth * (-1 if chart.is_overestimating_obp else 1) ), 0 )
-
-                    # IF OUTS DIDN'T CHANGE OR ARE 21+, NO NEED TO RECALCULATE
-                    if outs == chart.outs or outs > 20:
-                        continue
-
-                chart = Chart(
-                    command=command,
-                    outs=outs,
-                    opponent=opponent,
-                    set=self.set.value,
-                    era_year_list=year_list,
-                    year=self.stats_period.last_year, # USED FOR 2026+ COMMAND ESTIMATE ADJUSTMENT
-                    era=self.era.value,
-                    is_expanded=self.set.has_expanded_chart,
-                    pa=pa,
-                    stats_per_400_pa=stats_per_400_pa,
-                    is_pitcher=self.is_pitcher,
-                    player_subtype=self.player_sub_type.value,
-                    command_accuracy_weight=command_accuracy_weight,
-                )
-
-                # IF COMMAND OUT COMBO HAS ALREADY BEEN CALC'D PREVIOUSLY, SKIP
-                if chart.command_outs_concat in [c.command_outs_concat for c in charts]:
-                    continue
-
-                charts.append(chart)
+        solver = ChartSolver(set=self.set.value, is_pitcher=self.is_pitcher, is_expanded=self.set.has_expanded_chart)
+        charts: list[ChartCandidate | Chart] = list(candidates) if candidates is not None else solver.search(
+            commands=command_options,
+            command_accuracy_weights=[self.set.command_accuracy_weighting(command=command, player_sub_type=self.player_sub_type) for command in command_options],
+            stats_per_400_pa=stats_per_400_pa,
+            opponent=opponent,
+            era_year_list=year_list,
+            player_subtype=self.player_sub_type.value,
+            year=self.stats_period.last_year,
+        )
 
         # IF MANUAL COMMAND OUT OVERRIDE, ASSIGN THAT BY SETTING ACCURACY TO 100%
+        # OUTS USE THE SLOT WORTH OF THE LAST COMMAND TESTED
         if self.command_out_override:
             chart = Chart(
                 command=self.command_out_override[0],
-                outs=self.command_out_override[1] * chart.sub_21_per_slot_worth,
-                opponent=opponent,
-                set=self.set.value,
-                year=self.stats_period.last_year, # USED FOR 2026+ COMMAND ESTIMATE ADJUSTMENT
-                era_year_list=year_list,
-                era=self.era.value,
-                is_expanded=self.set.has_expanded_chart,
-                pa=pa,
-                stats_per_400_pa=stats_per_400_pa,
-                is_pitcher=self.is_pitcher,
-                player_subtype=self.player_sub_type.value,
+                outs=self.command_out_override[1] * solver.sub_21_per_slot_worth(command_options[-1]),
+                **chart_kwargs,
             )
             chart.accuracy = 1.0
             charts.append(chart)
 
         # FIND MOST ACCURATE CHART
+        # ONLY THE SELECTED COMBO IS BUILT AS A FULL CHART
         charts.sort(key=lambda x: x.accuracy, reverse=True)
         best_chart = charts[offset]
+        if isinstance(best_chart, ChartCandidate):
+            best_chart = solver.to_chart(best_chart, **chart_kwargs)
         self.command_out_accuracies = { f"{ca.command_outs_concat}": round(ca.accuracy,4) for ca in charts }
         self.command_out_accuracy_breakdowns = { f"{ca.command_outs_concat}": ca.accuracy_breakdown for ca in charts }
 
@@ -2295,10 +2592,9 @@ class ShowdownPlayerCard(BaseModel):
         """
 
         # FOR PTS, USE STEROID ERA OPPONENT
-        chart_for_pts = self.chart.model_copy()
-        chart_for_pts.opponent = self.set.wotc_baseline_chart(self.player_type.opponent_type, my_type=self.player_sub_type, adjust_for_simulation_accuracy=True)
-        projections_for_pts_per_400_pa = chart_for_pts.projected_stats_per_400_pa
-        projections_for_pts = self.projected_statline(stats_per_400_pa=projections_for_pts_per_400_pa, command=chart_for_pts.command, pa=650)
+        opponent_for_pts = self.set.wotc_baseline_chart(self.player_type.opponent_type, my_type=self.player_sub_type, adjust_for_simulation_accuracy=True)
+        projections_for_pts_per_400_pa = ChartKernel.from_chart(self.chart, opponent=opponent_for_pts).projected_stats_per_400_pa()
+        projections_for_pts = self.projected_statline(stats_per_400_pa=projections_for_pts_per_400_pa, command=self.chart.command, pa=650)
 
         self.points_breakdown: Points = self.calculate_points(projected=projections_for_pts,
                                         positions_and_defense=self.positions_and_defense,
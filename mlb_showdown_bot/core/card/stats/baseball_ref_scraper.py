@@ -24,11 +24,18 @@ from typing import Optional
 # INTERNAL
 from ...shared.team import Team
 from ...shared.player_position import PlayerType
+from ...shared.rate_limiter import host_rate_limiter
+from ...shared.html_cache import default_html_cache, daily_cache_expiration, datetime_est
+from ...shared.cache_index import CacheIndex
 from ...database.postgres_db import PostgresDB
 from .accolade import Accolade
 from .stats_period import StatsPeriod, StatsPeriodType
+from .bref_table_extractor import game_log_rows
 from ..utils.shared_functions import convert_to_numeric, fill_empty_stat_categories
 
+# BREF STAT CATEGORY -> OLD STAT CATEGORY, FILLED AS CATEGORIES ARE SEEN
+_CONFORMED_STAT_CATEGORIES: dict[str, str] = {}
+
 class BaseballReferenceScraper(BaseModel):
 
     # BASICS
@@ -44,6 +51,7 @@ class BaseballReferenceScraper(BaseModel):
     # MORE OPTIONS
     ignore_cache: bool = False
     ignore_archive: bool = False
+    ignore_html_cache: bool = False
     disable_cleaning_cache: bool = False
     cache_folder_path: str = None
     disable_stats_period_range_updates: bool = False
@@ -329,8 +337,19 @@ class BaseballReferenceScraper(BaseModel):
           HTML string for URL request.
         """
 
+        # RAW HTML CACHE
+        html_cache = None if self.ignore_html_cache else default_html_cache()
+        season = None if self.stats_period.is_full_career or len(self.stats_period.year_list) == 0 else max(self.stats_period.year_list)
+        if html_cache:
+          cached_html = html_cache.get(url, season=season)
+          if cached_html is not None:
+            return cached_html
+
+        # WAIT FOR THE HOST'S REQUESTS PER MINUTE BUDGET, SHARED ACROSS THREADS
+        host_rate_limiter.acquire(url)
         scraper = cloudscraper.create_scraper()
         html = scraper.get(url)
+        host_rate_limiter.report(url, status_code=html.status_code, headers=html.headers)
 
         if html.status_code == 502:
           self.error = "502 - BAD GATEWAY"
@@ -340,6 +359,9 @@ class BaseballReferenceScraper(BaseModel):
           self.error = f"429 - TOO MANY REQUESTS TO {website}. PLEASE TRY AGAIN IN A FEW MINUTES."
           raise TimeoutError(self.error)
 
+        if html_cache and html.status_code == 200:
+          html_cache.put(url, html.text, season=season)
+
         return html.text
 
 # ------------------------------------------------------------------------
@@ -580,7 +602,6 @@ class BaseballReferenceScraper(BaseModel):
         # ADD ALL GAME LOGS BY DEFAULT
         periods = [StatsPeriodType.DATE_RANGE, StatsPeriodType.POSTSEASON]
         for stats_period in periods:
-            if len(periods) > 1: sleep(1.0) # SLEEP TO AVOID 429 ERRORS
             stats_dict[stats_period.stats_dict_key] = self.game_log_list(type=type, years=years_for_loop, stats_period_type=stats_period, reduce_size=True)
 
         # FIX EMPTY STRING DATA
@@ -1513,26 +1534,17 @@ class BaseballReferenceScraper(BaseModel):
         
             period_ext = "year=0&post=1" if stats_period_type == StatsPeriodType.POSTSEASON else f"year={year}"
             url = f"https://www.baseball-reference.com/players/gl.fcgi?id={self.baseball_ref_id}&t={type_ext}&{period_ext}"
-            soup_game_log_page = self.__soup_for_url(url, is_baseball_ref_page=True)
+            game_log_page_html = self.html_for_url(url)
 
-            # CHECK FOR ROWS
+            # PARSE ONLY THE GAME LOG TABLE WITH LXML
             # NOTE: THIS HANDLES BOTH THE OLD AND "UPGRADED" TABLES
             # OLD: ID OF TABLE WAS 'batting_gamelogs' OR 'pitching_gamelogs'
             # UPGRADED: LOOK FOR A TABLE WITH id="players_standard_batting"/"players_standard_pitching" and data-soc-sum-scope-type="player_game"
-            type_prefix = 'pitching' if is_pitcher else 'batting'
-            game_log_records = soup_game_log_page.find_all('tr', attrs={'id': re.compile(f'{type_prefix}_gamelogs.')})
-            is_no_records_old_table = len(game_log_records) == 0
-            if is_no_records_old_table:
-                # CHECK FOR NEW UPGRADED TABLE
-                game_log_table = soup_game_log_page.find('table', attrs={'id': f'players_standard_{type_prefix}'})
-                if game_log_table:
-                    game_log_records = game_log_table.find_all('tr', attrs={'id': re.compile(f'players_standard_{type_prefix}.')})
-                    # FILTER OUT RECORDS WITH "spacer" IN CLASS
-                    game_log_records = [row for row in game_log_records if 'spacer' not in row.get('class', 'N/A')]
+            game_log_records = game_log_rows(html=game_log_page_html, is_pitcher=is_pitcher)
 
             included_categories = ['year_game','ps_round','date_game','team_ID','player_game_span','IP','H','R','ER','BB','SO','HR','HBP','batters_faced','PA','SB','CS','AB','2B','3B','IBB','GIDP','SF','RBI','player_game_result',
                                 'date','team_name_abbr','game_decision',]
-            game_logs_parsed: list[dict] = [self.__parse_generic_bref_row(row=game_log, included_categories=included_categories, exclude_zeros=reduce_size) for game_log in game_log_records]
+            game_logs_parsed: list[dict] = [self.__parse_bref_row_cells(cells=game_log, included_categories=included_categories, exclude_zeros=reduce_size) for game_log in game_log_records]
             total_game_logs.extend(game_logs_parsed)
 
         return total_game_logs
@@ -1553,26 +1565,42 @@ class BaseballReferenceScraper(BaseModel):
         if row is None:
             return {}
 
-        columns = row.find_all()
+        # LEAGUE LEADERS ON BASEBALL REF ARE DENOTED BY BOLD OR ITALIC TEXT
+        cells = [
+            (category_object.get('data-stat'), category_object.get_text(), ('<strong>' in str(category_object) or '<em>' in str(category_object)) if search_for_lg_leader else None)
+            for category_object in row.find_all() if category_object.get('data-stat', None) is not None
+        ]
+        return self.__parse_bref_row_cells(cells=cells, included_categories=included_categories, exclude_zeros=exclude_zeros)
+
+    def __parse_bref_row_cells(self, cells:list[tuple], included_categories:list[str] = [], exclude_zeros:bool=False) -> dict:
+        """Parse stats from the cells of a bref row.
+
+        Args:
+          cells: List of (data-stat, text) or (data-stat, text, is_league_leader) for each cell. 
+                 is_league_leader is None when league leaders aren't checked.
+          included_categories: List of categories to include. If empty include all.
+          exclude_zeros: Exclude stats with 0 as a value.
+
+        Returns:
+          Dict with statistics
+        """
 
         final_stats_dict = {}        
-        for category_object in columns:
+        for cell in cells:
 
-            stat_category:str = category_object.get('data-stat', None)
-            if stat_category is None: continue
+            stat_category:str = cell[0]
             stat_category = self.__conform_stat_category_to_old_structure(stat_category)
 
             if stat_category not in included_categories and len(included_categories) > 0:
                 continue
 
-            if search_for_lg_leader:
-                is_league_leader = '<strong>' in str(category_object) or '<em>' in str(category_object) # LEAGUE LEADERS ON BASEBALL REF ARE DENOTED BY BOLD OR ITALIC TEXT
-
+            is_league_leader = cell[2] if len(cell) > 2 else None
+            if is_league_leader is not None:
                 if stat_category in ('SV','HR','SB','SO'):
                     # SAVE THIS INFO FOR RP, HR, OR SB ICONS
                     final_stats_dict[f'is_{stat_category.lower()}_leader'] = is_league_leader
 
-            stat = category_object.get_text()
+            stat = cell[1]
             fill_blanks_w_zeros = ['GS','W','SV','H','2B','3B','HR','BB','SO','HBP','SF','IBB','CS','batters_faced']
             if stat_category in fill_blanks_w_zeros and len(stat) == 0:
                 stat = '0'
@@ -2072,6 +2100,11 @@ class BaseballReferenceScraper(BaseModel):
           Old stat category
         """
 
+        conformed_stat_category = _CONFORMED_STAT_CATEGORIES.get(stat_category, None)
+        if conformed_stat_category is not None:
+            return conformed_stat_category
+        original_stat_category = stat_category
+
         # PARSE STAT CATEGORY
         # IN NEWER TABLES BREF ADDED "b_" PREFIX TO SOME STATS AND MADE THE TEXT
         if stat_category.startswith('b_') and stat_category not in ['b_war']:
@@ -2110,6 +2143,7 @@ class BaseballReferenceScraper(BaseModel):
         if stat_category not in categories_to_keep_default_case:
             stat_category = stat_category.upper()
 
+        _CONFORMED_STAT_CATEGORIES[original_stat_category] = stat_category
         return stat_category
 
     def __is_team_id_multiple(self, team_id:str) -> bool:
@@ -2155,34 +2189,37 @@ class BaseballReferenceScraper(BaseModel):
         return f"{years_as_str}-{self.baseball_ref_id}{override_type}{override_team}{override_period}.json"
 
     def load_cached_data(self, filename:str) -> dict:
-        """Check if data file exists in local storage, load and return JSON converted to a dict
+        """Check if data file is in the cache index, load and return JSON converted to a dict
         
         Args:
-          data: Dictionary of transformed player data.
           filename: Name of the JSON file.
 
         Returns:
           Dictionary of locally cached player data.
         """
 
-        folder_path = self.cache_folder_path
-        full_path = os.path.join(folder_path, filename)
-
-        # RETURN NONE IF FILE DOES NOT EXIST
-        if not os.path.isfile(full_path) or self.ignore_cache:
+        if self.ignore_cache:
             return None
-        
-        # RETURN NONE IF FILE IS EXPIRED
-        is_file_stale = self.__file_cache_expiration_datetime(full_path) < self.__datetime_est(datetime.now().timestamp())
-        if is_file_stale:
-            self.__remove_old_files(folder_path=folder_path)
+
+        # RETURN NONE IF FILE DOES NOT EXIST OR IS EXPIRED
+        cache_index = self.__cache_index()
+        expires_at = cache_index.expires_at(filename)
+        if expires_at is None or expires_at < datetime.now().timestamp():
+            if expires_at is not None and not self.disable_cleaning_cache:
+                cache_index.remove(filename)
+            self.__remove_old_files(cache_index=cache_index)
             return None
 
-        file = open(full_path, 'r')
-        data = json.loads(file.read())
+        try:
+            with open(os.path.join(self.cache_folder_path, filename), 'r') as file:
+                data = json.loads(file.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            cache_index.remove(filename)
+            return None
+        cache_index.touch(filename)
 
         # REMOVE OTHER STALE FILES
-        self.__remove_old_files(folder_path=folder_path)
+        self.__remove_old_files(cache_index=cache_index)
         
         return data
 
@@ -2201,51 +2238,42 @@ class BaseballReferenceScraper(BaseModel):
         with open(full_path, "w", encoding="utf-8") as file:
             json.dump(data, file, indent=2, ensure_ascii=False)
 
+        # ADD TO INDEX
+        cache_index = self.__cache_index()
+        cache_index.record(filename, size=os.path.getsize(full_path), expires_at=self.__cache_expiration_timestamp(datetime.now().timestamp()))
+
         # REMOVE STALE FILES
-        self.__remove_old_files(folder_path=folder_path)
+        self.__remove_old_files(cache_index=cache_index)
     
-    def __remove_old_files(self, folder_path:str) -> None:
+    def __remove_old_files(self, cache_index:CacheIndex) -> None:
+        """Amortized sweep of expired and least recently used files"""
 
         # DISABLE CLEANING
         if self.disable_cleaning_cache:
             return
 
-        # CLEAR OUT OLD FILES
-        for item in os.listdir(folder_path):
-            if item != '.gitkeep':
-                item_path = os.path.join(folder_path, item)
-                is_file_stale = self.__file_cache_expiration_datetime(item_path) < self.__datetime_est(datetime.now().timestamp())
-                if is_file_stale:
-                    os.remove(item_path)
+        cache_index.sweep_if_due()
 
-    def __file_cache_expiration_datetime(self, path:str) -> datetime:
-        """Check modified date and add timeframe of validity to it. 
+    def __cache_index(self) -> CacheIndex:
+        """Index of files in the cache folder, shared across scrapers.
+        Folder size is capped by STATS_CACHE_MAX_BYTES (defaults to 1 GB)."""
+        max_bytes = os.getenv('STATS_CACHE_MAX_BYTES', None)
+        return CacheIndex.for_folder(
+            self.cache_folder_path, 
+            legacy_expiration=self.__cache_expiration_timestamp, 
+            **({'max_bytes': int(max_bytes)} if max_bytes else {})
+        )
 
-        Rules:
-            - If modified between 7:00 AM and 10:00 AM EST, valid for 30 mins
-            - If modified between 10:01 AM EST and 6:59 AM the next day, valid until 7:00 AM EST the next day
+    def __cache_expiration_timestamp(self, timestamp:float) -> float:
+        """Add timeframe of validity to the time a file was cached. See `daily_cache_expiration` for rules.
         
         Args:
-            - path: String path to file in os.
+            - timestamp: Time the file was cached.
 
         Returns:
-            - datetime object with expiration date.
+            - Expiration timestamp.
         """
-
-        # GET FILE MODIFIED TIME IN EST TIMEZONE
-        datetime_uploaded = self.__datetime_est(timestamp=os.path.getmtime(path))
-
-        # CHECK IF FILE WAS MODIFIED BETWEEN 7:00 AM and 10:00 AM EST
-        if datetime_uploaded.hour >= 7 and datetime_uploaded.hour < 10:
-            return datetime_uploaded + timedelta(minutes=30)
-        
-        # CHECK IF FILE WAS MODIFIED BETWEEN 10:01 AM EST and 6:59 AM the next day
-        return datetime_uploaded.replace(hour=7, minute=0, second=0, microsecond=0) + timedelta(days=1)
-
-    def __datetime_est(self, timestamp:float) -> datetime:
-        """Convert timestamp to EST timezone"""
-        est = pytz.timezone('US/Eastern')
-        return datetime.fromtimestamp(timestamp, tz=est)
+        return daily_cache_expiration(datetime_est(timestamp)).timestamp()
     
     def __last_name(self, name: str) -> str:
         """ Attempt to parse last name from full name.
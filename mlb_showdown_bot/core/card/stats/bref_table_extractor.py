@@ -0,0 +1,101 @@
+import re
+from lxml import etree
+
+# ------------------------------------------------------------------------
+# TABLE EXTRACTION
+# ------------------------------------------------------------------------
+# PLAIN ROWS FROM BASEBALL REFERENCE TABLES USING LXML, WITHOUT BUILDING A BEAUTIFULSOUP TREE FOR THE WHOLE PAGE.
+# EACH ROW IS A LIST OF (data-stat, text) FOR EVERY ELEMENT IN THE ROW WITH A data-stat ATTRIBUTE, IN DOCUMENT ORDER.
+# RESULTS MATCH `BeautifulSoup(html.replace("<!--",""), "lxml")` + `find_all`.
+
+BrefRow = list[tuple[str, str]]
+
+_ID_ATTRIBUTE_REGEX = re.compile(r'''\bid\s*=\s*["']?([^"'\s>]*)''', flags=re.IGNORECASE)
+_TABLE_END_REGEX = re.compile(r'</table\s*>', flags=re.IGNORECASE)
+_TABLE_START_REGEX = re.compile(r'<table\b', flags=re.IGNORECASE)
+_DATA_STAT_XPATH = etree.XPath('.//*[@data-stat]')
+
+
+def bref_page_tree(html: str) -> etree._Element:
+    """lxml tree for a bref page. Commented out tables are uncommented the same way as `__soup_for_url`.
+
+    Args:
+        html: Page HTML.
+
+    Returns:
+        Root element.
+    """
+    tree = etree.HTML(html.replace("<!--", ""))
+    return tree if tree is not None else etree.Element('html')
+
+
+def bref_table_html(html: str, table_id: str) -> str:
+    """HTML for the first table with the id, commented out or not. None if not found.
+
+    Args:
+        html: Page HTML.
+        table_id: Exact id of the table.
+
+    Returns:
+        Table HTML string or None.
+    """
+    table_start_regex = re.compile(rf'''<table\b[^>]*?\bid\s*=\s*(["']?){re.escape(table_id)}\1[\s/>]''', flags=re.IGNORECASE)
+    table_start_match = table_start_regex.search(html)
+    if table_start_match is None:
+        return None
+    table_end_match = _TABLE_END_REGEX.search(html, table_start_match.end())
+    if table_end_match is None:
+        return None
+
+    # BREF TABLES AREN'T NESTED. BAIL OUT IF THIS ONE IS, SO THE CALLER PARSES THE WHOLE PAGE.
+    if _TABLE_START_REGEX.search(html, table_start_match.end(), table_end_match.start()):
+        return None
+    return html[table_start_match.start():table_end_match.end()]
+
+
+def bref_row_cells(row: etree._Element) -> BrefRow:
+    """(data-stat, text) for each element in the row with a data-stat attribute"""
+    return [(element.get('data-stat'), ''.join(element.itertext())) for element in _DATA_STAT_XPATH(row)]
+
+
+def game_log_rows(html: str, is_pitcher: bool) -> list[BrefRow]:
+    """Game log rows from a bref game log page (gl.fcgi).
+
+    Handles both the old and "upgraded" tables:
+        - OLD: ROWS WITH ids LIKE 'batting_gamelogs.123' ANYWHERE ON THE PAGE
+        - UPGRADED: ROWS IN TABLE id="players_standard_batting" WITH ids LIKE 'players_standard_batting.123', EXCLUDING SPACER ROWS
+
+    Only the upgraded table is parsed when the page has no old rows.
+
+    Args:
+        html: Page HTML.
+        is_pitcher: Parse pitching game logs.
+
+    Returns:
+        List of rows, in page order.
+    """
+    type_prefix = 'pitching' if is_pitcher else 'batting'
+    old_row_id_regex = re.compile(f'{type_prefix}_gamelogs.')
+    row_id_regex = re.compile(f'players_standard_{type_prefix}.')
+    table_id = f'players_standard_{type_prefix}'
+
+    # UPGRADED TABLE ONLY, WHEN NO ELEMENT ON THE PAGE COULD BE AN OLD ROW
+    has_old_rows = any(old_row_id_regex.search(element_id) for element_id in _ID_ATTRIBUTE_REGEX.findall(html))
+    table_html = None if has_old_rows else bref_table_html(html=html, table_id=table_id)
+    if table_html is not None:
+        tree = bref_page_tree(table_html)
+    else:
+        # WHOLE PAGE
+        tree = bref_page_tree(html)
+        rows = [row for row in tree.iter('tr') if old_row_id_regex.search(row.get('id', None) or '')]
+        if len(rows) > 0:
+            return [bref_row_cells(row) for row in rows]
+
+    tables = tree.xpath(f'//table[@id="{table_id}"]')
+    if len(tables) == 0:
+        return []
+    rows = [
+        row for row in tables[0].iter('tr')
+        if row_id_regex.search(row.get('id', None) or '') and 'spacer' not in (row.get('class', None) or '').split()
+    ]
+    return [bref_row_cells(row) for row in rows]
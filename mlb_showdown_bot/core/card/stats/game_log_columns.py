@@ -0,0 +1,467 @@
+from datetime import date
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Optional
+import math
+import numpy as np
+
+from ..utils.shared_functions import aggregate_stats, convert_to_numeric, convert_to_date, innings_pitched_from_real_decimal
+from ...shared.team import Team
+
+# EVERY FINITE FLOAT IS A MULTIPLE OF 2^-1074, SO SCALING BY 2^1074 TURNS IT INTO AN EXACT INT.
+# PREFIX SUMS OVER THOSE INTS ARE EXACT AND DIVIDING BACK ROUNDS ONCE, THE SAME RESULT AS `math.fsum`.
+_EXACT_FLOAT_SCALE = 2 ** 1074
+
+# RETURNED WHEN A CATEGORY CAN'T BE READ FROM PREFIX SUMS (EX: TEXT IN A SUMMED CATEGORY)
+_UNSUPPORTED = object()
+
+
+def _innings_pitched_outs(ip: int | float) -> int:
+    """Outs for innings pitched (ex: 6.1 -> 19). Same thirds as `total_ip_for_calculations`."""
+    match round(ip % 1.0, 1):
+        case 0.1: thirds = 1
+        case 0.2: thirds = 2
+        case _: thirds = 0
+    return math.floor(ip) * 3 + thirds
+
+
+def _exact_float(value: float) -> int:
+    """Float scaled by `_EXACT_FLOAT_SCALE`, exactly"""
+    numerator, denominator = float(value).as_integer_ratio()
+    return numerator * (_EXACT_FLOAT_SCALE // denominator)
+
+# ---------------------------------
+# GAME LOG COLUMNS
+# ---------------------------------
+
+class _GameLogColumn:
+    """Values for one game log category, one slot per game. `is_present` marks games that have the category.
+
+    After `finalize`, numbers are also stored in typed arrays (int64 ints, float64 for every number, int64 outs 
+    for IP) along with masks for the checks `aggregate_stats` makes, so summed categories never loop over Python objects.
+    Raw values are kept for text categories (mode, last).
+    """
+
+    def __init__(self, key:str, num_games:int) -> None:
+        self.key = key
+        self.values = np.empty(num_games, dtype=object)
+        self.is_present = np.zeros(num_games, dtype=bool)
+
+    def finalize(self) -> None:
+        num_games = len(self.values)
+        self.is_str = np.zeros(num_games, dtype=bool)
+        self.is_number = np.zeros(num_games, dtype=bool)
+        self.is_float = np.zeros(num_games, dtype=bool)
+        self.is_unsummable = np.zeros(num_games, dtype=bool) # NOT BLANK AND NOT A NUMBER, OR NOT FINITE
+        self.int_values = np.zeros(num_games, dtype=np.int64)
+        self.float_values = np.zeros(num_games, dtype=np.float64)
+        self.outs = np.zeros(num_games, dtype=np.int64) if self.key == 'IP' else None
+
+        for game_index in np.flatnonzero(self.is_present).tolist():
+            value = self.values[game_index]
+            self.is_str[game_index] = type(value) == str
+            if not isinstance(value, (int, float)):
+                self.is_unsummable[game_index] = len(str(value)) != 0 # BLANKS ARE SKIPPED BY `aggregate_stats`
+                continue
+            if isinstance(value, float) and not math.isfinite(value):
+                self.is_unsummable[game_index] = True
+                continue
+            self.is_number[game_index] = True
+            self.float_values[game_index] = value
+            if isinstance(value, float):
+                self.is_float[game_index] = True
+            else:
+                self.int_values[game_index] = value
+            if self.outs is not None:
+                self.outs[game_index] = _innings_pitched_outs(value)
+
+    def is_text(self, column_indexes:np.ndarray) -> bool:
+        """Same check as `aggregate_stats`: more than half of the values are strings"""
+        return int(self.is_str[column_indexes].sum()) / len(column_indexes) > 0.5
+
+    def is_summable(self, column_indexes:np.ndarray) -> bool:
+        """Values can be summed from the typed arrays. IP also needs every value to be a number."""
+        if self.outs is not None:
+            return bool(self.is_number[column_indexes].all())
+        return not self.is_unsummable[column_indexes].any()
+
+    def sum(self, column_indexes:np.ndarray) -> int | float:
+        """Total of the values, skipping blanks. Floats are summed exactly (see `math.fsum`)."""
+        if self.outs is not None:
+            return innings_pitched_from_real_decimal(int(self.outs[column_indexes].sum()) / 3)
+        if not self.is_float[column_indexes].any():
+            return int(self.int_values[column_indexes].sum())
+        return math.fsum(self.float_values[column_indexes].tolist())
+
+
+class GameLogColumns:
+    """
+    Columnar copy of a player's game logs, cleaned and parsed once.
+
+    Holds one column per stat plus parsed date, year and team columns, so each stats period
+    only builds masks (or a binary search slice when games are in date order) instead of cleaning,
+    parsing and re-listing every game log dict. Numeric categories are parsed into int64/float64
+    arrays up front. The columns are a snapshot of the game logs when they were built, so owners
+    that share them across card builds (ex: `CumulativeGameLogStats`) keep them alongside the list.
+
+    Results match cleaning and aggregating the game log dicts one by one. Float sums are exactly 
+    rounded (`math.fsum`), so they can differ from `sum` in the last bit.
+    """
+
+    def __init__(self, game_logs:list[dict[str, Any]], is_pitcher:bool, first_year:int, is_postseason:bool) -> None:
+        self.game_logs = game_logs
+        self.num_games = len(game_logs)
+        self.is_pitcher = is_pitcher
+        self.first_year = first_year
+        self.is_postseason = is_postseason
+
+        num_games = self.num_games
+        self.date_strs: list[Optional[str]] = [None] * num_games
+        self.formatted_date_strs: list[Optional[str]] = [None] * num_games
+        self.dates: list[date] = [date.min] * num_games
+        self.date_ordinals = np.zeros(num_games, dtype=np.int64)
+        self.has_date = np.zeros(num_games, dtype=bool)
+        self.years = np.full(num_games, np.nan)
+        self.teams = np.empty(num_games, dtype=object)
+        self.game_keys: list[list[str]] = []
+        self.game_updates: list[dict[str, Any]] = []
+        self.columns: dict[str, _GameLogColumn] = {}
+        self.date_error: Optional[Exception] = None
+
+        for game_index, game_log_data in enumerate(game_logs):
+            cleaned_game_log = self._clean_game_log(game_index=game_index, game_log_data=game_log_data)
+            self.game_keys.append(list(cleaned_game_log.keys()))
+            for key, value in cleaned_game_log.items():
+                column = self.columns.get(key, None)
+                if column is None:
+                    column = self.columns[key] = _GameLogColumn(key=key, num_games=num_games)
+                column.values[game_index] = value
+                column.is_present[game_index] = True
+
+        for column in self.columns.values():
+            column.finalize()
+
+        # DATE ORDER ENABLES BINARY SEARCH SLICES FOR DATE RANGES
+        self.is_date_ordered = bool(self.has_date.all()) and self.date_error is None \
+                                and bool((self.date_ordinals[1:] >= self.date_ordinals[:-1]).all())
+
+    def matches(self, game_logs:list[dict[str, Any]], is_pitcher:bool, first_year:int, is_postseason:bool) -> bool:
+        """Columns were built from this game log list with the same inputs"""
+        return game_logs is self.game_logs and len(game_logs) == self.num_games and is_pitcher == self.is_pitcher \
+                and first_year == self.first_year and is_postseason == self.is_postseason
+
+    # ---------------------------------
+    # FILTER AND AGGREGATE
+    # ---------------------------------
+
+    def filter(self, year_list:list[int], start_date:Optional[date] = None, end_date:Optional[date] = None, team_override:Team = None) -> np.ndarray:
+        """
+        Indexes of games in the stats period. Game logs are cleaned up in place the same way as
+        aggregating them one by one (formatted `date_game`, G, GS, IP_GS, W).
+
+        Args:
+            year_list (list[int]): Years in the stats period.
+            start_date (date, optional): First date of the range. Only used with `end_date`.
+            end_date (date, optional): Last date of the range. Only used with `start_date`.
+            team_override (Team, optional): Team override for filtering game logs
+
+        Returns:
+            np.ndarray: Indexes of included games, in game log order.
+        """
+        is_date_range = bool(start_date and end_date)
+        if is_date_range and self.date_error is not None:
+            raise self.date_error
+
+        # YEAR AND TEAM MASKS
+        mask = np.isin(self.years, year_list)
+        if team_override:
+            mask &= self.teams == team_override.value
+
+        # DATE RANGE SLICE OR MASK
+        if is_date_range:
+            start_ordinal, end_ordinal = start_date.toordinal(), end_date.toordinal()
+            if self.is_date_ordered:
+                first_index = int(np.searchsorted(self.date_ordinals, start_ordinal, side='left'))
+                last_index = int(np.searchsorted(self.date_ordinals, end_ordinal, side='right'))
+                mask[:first_index] = False
+                mask[last_index:] = False
+            else:
+                mask &= ~self.has_date | ((self.date_ordinals >= start_ordinal) & (self.date_ordinals <= end_ordinal))
+        game_indexes = np.flatnonzero(mask)
+
+        # CLEAN UP GAME LOGS IN PLACE
+        date_strs = self.formatted_date_strs if is_date_range else self.date_strs
+        for game_log_data, date_str in zip(self.game_logs, date_strs):
+            if date_str:
+                game_log_data['date_game'] = date_str
+        for game_index in game_indexes.tolist():
+            self.game_logs[game_index].update(self.game_updates[game_index])
+
+        return game_indexes
+
+    def aggregate(self, game_indexes:np.ndarray, is_date_range:bool, aggregation_methods:dict[str, str]) -> tuple[dict[str, Any], Optional[list[str]]]:
+        """
+        Aggregate stats for the games.
+
+        Args:
+            game_indexes (np.ndarray): Indexes of included games from `filter`.
+            is_date_range (bool): If the stats period is a date range. Uses formatted game dates.
+            aggregation_methods (dict[str, str]): Aggregation method for text categories. Defaults to 'mode'.
+
+        Returns:
+            Tuple of aggregated stats and game dates in order, or None if there are no game dates.
+        """
+        if len(game_indexes) == 0:
+            return {}, None
+
+        # CATEGORIES IN ORDER OF FIRST APPEARANCE
+        num_keys = len([key for key, column in self.columns.items() if column.is_present[game_indexes].any()])
+        keys: dict[str, None] = {}
+        for game_index in game_indexes.tolist():
+            for key in self.game_keys[game_index]:
+                keys[key] = None
+            if len(keys) == num_keys:
+                break
+
+        aggregated_data: dict[str, Any] = {}
+        game_dates: Optional[list[str]] = None
+        for key in keys:
+            column = self.columns[key]
+            column_indexes = game_indexes[column.is_present[game_indexes]]
+            if key == 'date_game':
+                game_dates = self.date_game_values(column_indexes=column_indexes, is_date_range=is_date_range)
+            if key == 'earned_run_avg':
+                continue
+            if not column.is_text(column_indexes) and column.is_summable(column_indexes):
+                value = column.sum(column_indexes)
+            else:
+                values = game_dates if key == 'date_game' else column.values[column_indexes].tolist()
+                value = aggregate_stats(category=key, stats=values, aggregation_method=aggregation_methods.get(key, 'mode'))
+            aggregated_data[key.replace('batters_faced', 'PA')] = value
+
+        return aggregated_data, game_dates
+
+    def date_game_values(self, column_indexes:np.ndarray, is_date_range:bool) -> list[str]:
+        """Game dates as they look in the game logs after filtering. Date ranges use formatted dates (ex: "Apr 3")."""
+        date_strs = self.columns['date_game'].values[column_indexes].tolist()
+        if not is_date_range:
+            return date_strs
+        return [self.formatted_date_strs[i] or date_str for i, date_str in zip(column_indexes.tolist(), date_strs)]
+
+    # ---------------------------------
+    # CLEAN UP
+    # ---------------------------------
+
+    def _clean_game_log(self, game_index:int, game_log_data:dict[str, Any]) -> dict[str, Any]:
+        """
+        Parse date, year and team for a game, and store the updates to apply when it's included.
+
+        Args:
+            game_index (int): Index of the game in the game logs.
+            game_log_data (dict[str, Any]): Game log. Not updated.
+
+        Returns:
+            dict[str, Any]: Copy of the game log as it looks after being included in a stats period.
+        """
+        cleaned_game_log = dict(game_log_data)
+
+        # REMOVE BAD UNICODE CHARACTERS
+        date_game = game_log_data.get('date_game', game_log_data.get('date', None))
+        if date_game:
+            cleaned_game_log['date_game'] = date_game.replace(u'\xa0', u' ')
+
+        # YEAR
+        # OLDER FORMAT HAD DEDICATED YEAR COLUMN
+        game_log_date_str: str = cleaned_game_log.get('date_game', None)
+        is_new_format = game_log_date_str.count('-') >= 2 if game_log_date_str else False
+        doesnt_have_dedicated_year_column = self.is_postseason and is_new_format and game_log_date_str
+        default_year = game_log_date_str.split('-', 1)[0] if doesnt_have_dedicated_year_column else self.first_year
+        year_from_game_log = convert_to_numeric(str(game_log_data.get('year_game', default_year)))
+        if isinstance(year_from_game_log, (int, float)):
+            self.years[game_index] = year_from_game_log
+
+        # DATE
+        if game_log_date_str:
+            self.date_strs[game_index] = game_log_date_str
+            try:
+                game_log_date = self._parse_date(game_log_date_str=game_log_date_str, default_year=default_year)
+                self.dates[game_index] = game_log_date
+                self.date_ordinals[game_index] = game_log_date.toordinal()
+                self.has_date[game_index] = True
+                self.formatted_date_strs[game_index] = game_log_date.strftime("%b %-d")
+            except ValueError as error:
+                # RAISED WHEN A DATE RANGE NEEDS THE DATE
+                self.date_error = self.date_error or error
+
+        # TEAM
+        self.teams[game_index] = game_log_data.get('team_ID', 'n/a')
+
+        # ADD TO GAMES PLAYED
+        game_updates: dict[str, Any] = { 'G': 1 }
+        innings_text = game_log_data.get('player_game_span', None)
+        if self.is_pitcher:
+            is_start = False
+            if innings_text:
+                is_start = 'GS' in str(innings_text) or 'SHO' in str(innings_text) or 'CG' in str(innings_text)
+
+            game_updates['GS'] = int(is_start) or game_log_data.get('GS', 0)
+            if is_start:
+                game_updates['IP_GS'] = game_log_data.get('IP', 0)
+
+        # DECISION
+        decision_text = game_log_data.get('player_game_result', None)
+        if decision_text and self.is_pitcher:
+            is_win_decision = 'W' in str(decision_text)
+            game_updates['W'] = int(is_win_decision)
+
+        self.game_updates.append(game_updates)
+        cleaned_game_log.update(game_updates)
+        return cleaned_game_log
+
+    def _parse_date(self, game_log_date_str:str, default_year:int | str) -> date:
+        """Parse a game log date. Plain "YYYY-MM-DD" dates skip `strptime`."""
+        if len(game_log_date_str) == 10 and game_log_date_str.isascii() and game_log_date_str[4] == '-' and game_log_date_str[7] == '-' \
+            and game_log_date_str[:4].isdigit() and game_log_date_str[5:7].isdigit() and game_log_date_str[8:].isdigit():
+            return date(int(game_log_date_str[:4]), int(game_log_date_str[5:7]), int(game_log_date_str[8:]))
+        return convert_to_date(game_log_date_str, default_year)
+
+
+# ---------------------------------
+# PREFIX SUMS
+# ---------------------------------
+
+class _GameLogColumnPrefixSums:
+    """Running totals for one column over a list of games. Index `n` covers the first `n` games."""
+
+    def __init__(self, column:_GameLogColumn, game_indexes:np.ndarray, values:list[Any]) -> None:
+        def running_total(array:np.ndarray) -> np.ndarray:
+            return np.concatenate([np.zeros(1, dtype=np.int64), np.cumsum(array, dtype=np.int64)])
+
+        is_present = column.is_present[game_indexes]
+        self.key = column.key
+        self.counts = running_total(is_present)
+        self.str_counts = running_total(column.is_str[game_indexes])
+        self.float_counts = running_total(column.is_float[game_indexes])
+        self.unsummable_counts = running_total(is_present & ~column.is_number[game_indexes] if column.outs is not None else column.is_unsummable[game_indexes])
+        self.int_sums = running_total(column.int_values[game_indexes])
+        self.outs_sums = running_total(column.outs[game_indexes]) if column.outs is not None else None
+        self.exact_float_sums = [0] + list(accumulate(_exact_float(value) for value in column.float_values[game_indexes].tolist())) \
+                                    if self.float_counts[-1] > 0 else None
+
+        # LAST VALUE AND MODE FOR TEXT CATEGORIES
+        positions = np.arange(len(game_indexes))
+        self.last_positions = np.maximum.accumulate(np.where(is_present, positions, -1)) if len(game_indexes) > 0 else positions
+        self.values = values
+        self.modes = self._running_modes(values=[value for value, present in zip(values, is_present.tolist()) if present]) \
+                        if self.str_counts[-1] > 0 else None
+
+    def _running_modes(self, values:list[Any]) -> Optional[list[Any]]:
+        """Mode of the first `n` values, for every `n`. Ties go to the value seen first (same as `statistics.mode`).
+        None if values aren't hashable."""
+        modes: list[Any] = [None]
+        counts: dict[Any, int] = {}
+        order: dict[Any, int] = {}
+        first_seen: dict[Any, Any] = {}
+        try:
+            for value in values:
+                count = counts[value] = counts.get(value, 0) + 1
+                order.setdefault(value, len(order))
+                mode_value = first_seen.setdefault(value, value) # EQUAL VALUES (EX: 1 AND 1.0) COUNT AS THE FIRST ONE SEEN
+                current_mode = modes[-1]
+                if len(modes) == 1 or count > counts[current_mode] or (count == counts[current_mode] and order[value] < order[current_mode]):
+                    current_mode = mode_value
+                modes.append(current_mode)
+        except TypeError:
+            return None
+        return modes
+
+    def value(self, num_games:int, aggregation_method:str) -> Any:
+        """Same result as `aggregate_stats` over the column's values in the first `num_games` games, 
+        or `_UNSUPPORTED` when the values can't be aggregated from running totals."""
+        num_values = int(self.counts[num_games])
+        if self.str_counts[num_games] / num_values > 0.5:
+            match aggregation_method:
+                case 'mode': return self.modes[num_values] if self.modes is not None else _UNSUPPORTED
+                case 'last': return self.values[self.last_positions[num_games - 1]]
+                case _: return None
+        if self.unsummable_counts[num_games] > 0:
+            return _UNSUPPORTED
+        if self.outs_sums is not None:
+            return innings_pitched_from_real_decimal(int(self.outs_sums[num_games]) / 3)
+        if self.float_counts[num_games] == 0:
+            return int(self.int_sums[num_games])
+        return self.exact_float_sums[num_games] / _EXACT_FLOAT_SCALE
+
+
+class GameLogPrefixSums:
+    """
+    Running totals of `GameLogColumns` over the games in a date range, so stats for every range that 
+    starts on the same date and ends within it are read in O(1) per category, with one binary search 
+    on the game dates. Used for cumulative date ranges (ex: in-season trends).
+
+    Results match `GameLogColumns.aggregate` for the same games. `is_supported` is False when games 
+    aren't in date order (ranges wouldn't be prefixes), and `aggregate` returns None for ranges 
+    with values that can't be read from running totals.
+    """
+
+    def __init__(self, columns:GameLogColumns, game_indexes:np.ndarray, is_date_range:bool) -> None:
+        self.num_games = len(game_indexes)
+        self.date_ordinals = columns.date_ordinals[game_indexes]
+        self.is_supported = bool(columns.has_date[game_indexes].all()) and bool((self.date_ordinals[1:] >= self.date_ordinals[:-1]).all())
+
+        # CATEGORIES IN ORDER OF FIRST APPEARANCE, WITH THE POSITION OF THE FIRST GAME THAT HAS THEM
+        self.first_positions: dict[str, int] = {}
+        for position, game_index in enumerate(game_indexes.tolist()):
+            for key in columns.game_keys[game_index]:
+                self.first_positions.setdefault(key, position)
+            if len(self.first_positions) == len(columns.columns):
+                break
+
+        self.categories: dict[str, _GameLogColumnPrefixSums] = {}
+        for key in self.first_positions:
+            column = columns.columns[key]
+            if key == 'date_game':
+                values = [None] * self.num_games
+                is_present = column.is_present[game_indexes]
+                for position, date_str in zip(np.flatnonzero(is_present).tolist(), columns.date_game_values(column_indexes=game_indexes[is_present], is_date_range=is_date_range)):
+                    values[position] = date_str
+            else:
+                values = column.values[game_indexes].tolist()
+            self.categories[key] = _GameLogColumnPrefixSums(column=column, game_indexes=game_indexes, values=values)
+
+    def num_games_through(self, end_date:date) -> int:
+        """Number of games on or before the date"""
+        return bisect_right(self.date_ordinals, end_date.toordinal())
+
+    def aggregate(self, num_games:int, aggregation_methods:dict[str, str]) -> Optional[tuple[dict[str, Any], Optional[list[str]]]]:
+        """
+        Aggregated stats for the first `num_games` games.
+
+        Args:
+            num_games (int): Number of games from the start of the range.
+            aggregation_methods (dict[str, str]): Aggregation method for text categories. Defaults to 'mode'.
+
+        Returns:
+            Tuple of aggregated stats and game dates (first and last only), or None if there are no games
+            or the result can't be reproduced from the running totals.
+        """
+        if num_games == 0:
+            return None
+
+        aggregated_data: dict[str, Any] = {}
+        for key, category in self.categories.items():
+            if self.first_positions[key] >= num_games:
+                break
+            if key == 'earned_run_avg':
+                continue
+            value = category.value(num_games=num_games, aggregation_method=aggregation_methods.get(key, 'mode'))
+            if value is _UNSUPPORTED:
+                return None
+            aggregated_data[key.replace('batters_faced', 'PA')] = value
+
+        game_dates = None
+        date_category = self.categories.get('date_game', None)
+        if date_category and self.first_positions['date_game'] < num_games:
+            game_dates = [date_category.values[self.first_positions['date_game']], date_category.values[date_category.last_positions[num_games - 1]]]
+
+        return aggregated_data, game_dates
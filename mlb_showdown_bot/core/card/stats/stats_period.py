@@ -7,9 +7,13 @@ import calendar
 
 # INTERNAL
 from ..utils.shared_functions import aggregate_stats, convert_to_numeric, fill_empty_stat_categories, convert_to_date, convert_year_string_to_list
+from .game_log_columns import GameLogColumns, GameLogPrefixSums
 from ...shared.team import Team
 from ...shared.player_position import PlayerType, Position
 
+# HOW TEXT CATEGORIES ARE AGGREGATED ACROSS GAME LOGS (DEFAULT IS MODE)
+GAME_LOG_STATS_AGG_TYPE = {'team_ID': 'last',}
+
 class StatsPeriodType(str, Enum):
 
     REGULAR_SEASON = "REGULAR"
@@ -517,7 +521,7 @@ class StatsPeriod(BaseModel):
         self._check_and_apply_current_season_adjustment()
         self.display_text = self._display_text()
 
-    def add_stats_from_game_logs(self, game_logs:list[dict[str, Any]], is_pitcher:bool, team_override:Team = None) -> None:
+    def add_stats_from_game_logs(self, game_logs:list[dict[str, Any]], is_pitcher:bool, team_override:Team = None, game_log_columns:GameLogColumns = None) -> None:
         """
         Add stats from game logs to the stats dictionary
         
@@ -525,6 +529,7 @@ class StatsPeriod(BaseModel):
             game_logs (list[dict[str, Any]]): List of game logs. Can be regular season or postseason
             is_pitcher (bool): If the player is a pitcher
             team_override (Team, optional): Team override for filtering game logs
+            game_log_columns (GameLogColumns, optional): Columns already built for the game logs (ex: shared by cards built together).
 
         Returns:
             None
@@ -533,93 +538,79 @@ class StatsPeriod(BaseModel):
         # RETURN IF NO GAME LOGS
         if len(game_logs) == 0: return
         
-        # ADD STATS TO DICTIONARY
-        stats_as_lists: dict[str, list] = {}
-        first_year = self.year_list[0]
-        last_year = self.year_list[-1]
-        is_multi_year = first_year != last_year
-        for game_log_data in game_logs:
+        # FILTER AND AGGREGATE FROM COLUMNS
+        game_log_columns = self._game_log_columns(game_logs=game_logs, is_pitcher=is_pitcher, game_log_columns=game_log_columns)
+        game_indexes = game_log_columns.filter(year_list=self.year_list, start_date=self.start_date, end_date=self.end_date, team_override=team_override)
+        aggregated_data, game_dates = game_log_columns.aggregate(game_indexes=game_indexes, is_date_range=bool(self.is_date_range), aggregation_methods=GAME_LOG_STATS_AGG_TYPE)
+        self._apply_game_log_stats(aggregated_data=aggregated_data, game_dates=game_dates, is_pitcher=is_pitcher)
 
-            # ------------------------
-            # CLEAN UP GAME LOG DATA
-            # ------------------------
+    def add_stats_from_cumulative_game_logs(self, cumulative_game_logs:'CumulativeGameLogStats', game_logs:list[dict[str, Any]], is_pitcher:bool, team_override:Team = None) -> bool:
+        """
+        Same result as `add_stats_from_game_logs`, read from running totals shared by date ranges 
+        that start on the same date. The first call indexes the game logs.
 
-            # REMOVE BAD UNICODE CHARACTERS
-            date_game = game_log_data.get('date_game', game_log_data.get('date', None))
-            if date_game:
-                game_log_data['date_game'] = date_game.replace(u'\xa0', u' ')
-                
-            # CHECK FOR DATE/YEAR FILTER
-            
-            # IF DATE RANGE BASED, CHECK DATES
-            date_check = True
-            game_log_date_str: str = game_log_data.get('date_game', None)
-            is_new_format = game_log_date_str.count('-') >= 2 if game_log_date_str else False
-
-            # OLDER FORMAT HAD DEDICATED YEAR COLUMN
-            doesnt_have_dedicated_year_column = self.type == StatsPeriodType.POSTSEASON and is_new_format and game_log_date_str
-            default_year = game_log_date_str.split('-', 1)[0] if doesnt_have_dedicated_year_column else first_year
-            year_from_game_log = convert_to_numeric(str(game_log_data.get('year_game', default_year)))
-            year_check = year_from_game_log in self.year_list
-
-            if self.is_date_range and game_log_date_str:
-                game_log_date = convert_to_date(game_log_date_str, default_year)
-                
-                # CHECK IF DATE IS WITHIN RANGE
-                date_check = self.start_date <= game_log_date <= self.end_date
+        Args:
+            cumulative_game_logs (CumulativeGameLogStats): Running totals for the game logs.
+            game_logs (list[dict[str, Any]]): List of game logs.
+            is_pitcher (bool): If the player is a pitcher
+            team_override (Team, optional): Team override for filtering game logs
 
-                # UPDATE 'date_game' WITH FORMATTED DATE
-                game_log_data['date_game'] = game_log_date.strftime("%b %-d")
-            
-            # SKIP IF TEAM OVERRIDE IS PRESENT AND TEAM DOESN'T MATCH
-            if team_override and game_log_data.get('team_ID', 'n/a') != team_override.value:
-                continue
-
-            # SKIP ROW IF IT FAILS THE DATE OR YEAR CHECKS
-            if not date_check or not year_check:
-                continue 
-
-            # ADD TO GAMES PLAYED
-            game_log_data['G'] = 1
-            innings_text = game_log_data.get('player_game_span', None)
-            if is_pitcher:
-                is_start = False
-                if innings_text:
-                    is_start = 'GS' in str(innings_text) or 'SHO' in str(innings_text) or 'CG' in str(innings_text)
-                
-                game_log_data['GS'] = int(is_start) or game_log_data.get('GS', 0)
-                if is_start:
-                    game_log_data['IP_GS'] = game_log_data.get('IP', 0)
-
-            # DECISION
-            decision_text = game_log_data.get('player_game_result', None)
-            if decision_text and is_pitcher:
-                is_win_decision = 'W' in str(decision_text)
-                game_log_data['W'] = int(is_win_decision)
-
-            # ------------------------
-            # ADD TO AGGREGATED LISTS
-            # ------------------------
-            for key, value in game_log_data.items():
-                if key in stats_as_lists:
-                    stats_as_lists[key].append(value)
-                else:
-                    stats_as_lists[key] = [value]
-
-
-        stats_agg_type = {'team_ID': 'last',}
-        aggregated_data = { 
-            k.replace('batters_faced', 'PA'): aggregate_stats(category=k, stats=v, aggregation_method=stats_agg_type.get(k, 'mode')) 
-            for k,v in stats_as_lists.items() 
-            if k != 'earned_run_avg'
-        }
+        Returns:
+            bool: True if stats were added. False if the running totals can't be used for this period, 
+                  in which case `add_stats_from_game_logs` should be used.
+        """
+        if not cumulative_game_logs.is_indexed:
+            cumulative_game_logs.index(stats_period=self, game_logs=game_logs, is_pitcher=is_pitcher, team_override=team_override)
+
+        if not cumulative_game_logs.supports(stats_period=self, game_logs=game_logs, is_pitcher=is_pitcher, team_override=team_override):
+            return False
+        
+        aggregated = cumulative_game_logs.aggregated_stats(end_date=self.end_date)
+        if aggregated is None:
+            return False
+        
+        aggregated_data, game_dates = aggregated
+        self._apply_game_log_stats(aggregated_data=aggregated_data, game_dates=game_dates, is_pitcher=is_pitcher)
+        return True
+
+    def _game_log_columns(self, game_logs:list[dict[str, Any]], is_pitcher:bool, game_log_columns:GameLogColumns = None) -> GameLogColumns:
+        """
+        Columnar game logs for the stats period.
+
+        Args:
+            game_logs (list[dict[str, Any]]): List of game logs.
+            is_pitcher (bool): If the player is a pitcher
+            game_log_columns (GameLogColumns, optional): Columns already built. Used when they match the game logs and stats period.
+
+        Returns:
+            GameLogColumns: Cleaned and parsed game logs.
+        """
+        inputs = dict(game_logs=game_logs, is_pitcher=is_pitcher, first_year=self.year_list[0], is_postseason=self.type == StatsPeriodType.POSTSEASON)
+        if game_log_columns is not None and game_log_columns.matches(**inputs):
+            return game_log_columns
+        return GameLogColumns(**inputs)
+
+    def _apply_game_log_stats(self, aggregated_data:dict[str, Any], game_dates:Optional[list[str]], is_pitcher:bool) -> None:
+        """
+        Store stats aggregated from game logs, along with the first and last game dates.
+
+        Args:
+            aggregated_data (dict[str, Any]): Stats aggregated from game logs.
+            game_dates (list[str], optional): Game dates in order. Only the first and last are used.
+            is_pitcher (bool): If the player is a pitcher
+
+        Returns:
+            None
+        """
 
         # CHECK FOR NO-DATA
         if len(aggregated_data) == 0:
             return
 
         # ADD FIRST AND LAST GAME DATES
-        game_dates = stats_as_lists.get('date_game', None)
+        first_year = self.year_list[0]
+        last_year = self.year_list[-1]
+        is_multi_year = first_year != last_year
         if game_dates:
             first_game_date_str: str = str(game_dates[0]).upper().split(' (', 1)[0]
             last_game_date_str: str = str(game_dates[-1]).upper().split(' (', 1)[0]
@@ -681,4 +672,91 @@ class StatsPeriod(BaseModel):
                 text = f"REPLACEMENT"
         if not self.is_mlb:
             text = f"{self.league.value}" + (f" {text}" if text and self.type != StatsPeriodType.REGULAR_SEASON else "")
-        return text
\ No newline at end of file
+        return text
+
+# ---------------------------------
+# CUMULATIVE GAME LOGS
+# ---------------------------------
+
+class CumulativeGameLogStats:
+    """
+    Game logs indexed once into `GameLogColumns` with running totals (`GameLogPrefixSums`) for the widest date range, 
+    so stats for any date range that starts on `start_date` and ends on or before `end_date` are read without 
+    re-aggregating every game. Used for in-season trends, where every trend point is a cumulative date range 
+    from the player's first game. Cards built together share the columns for ranges that fall back to aggregating.
+
+    Results match `StatsPeriod.add_stats_from_game_logs` exactly. When they can't be reproduced 
+    (ex: game logs out of date order, text in a summed category), `aggregated_stats` returns None 
+    and the caller falls back to aggregating the game logs.
+    """
+
+    def __init__(self, start_date:date, end_date:date) -> None:
+        self.start_date = start_date
+        self.end_date = end_date
+        self.is_indexed = False
+        self.is_supported = False
+        self.game_log_columns: Optional[GameLogColumns] = None
+
+    def index(self, stats_period:'StatsPeriod', game_logs:list[dict[str, Any]], is_pitcher:bool, team_override:Team = None) -> None:
+        """
+        Clean the game logs for the full date range and build the running totals. Game logs are updated 
+        in place the same way `add_stats_from_game_logs` updates them.
+
+        Args:
+            stats_period (StatsPeriod): Stats period for any of the date ranges. Used for the years and type.
+            game_logs (list[dict[str, Any]]): List of game logs.
+            is_pitcher (bool): If the player is a pitcher
+            team_override (Team, optional): Team override for filtering game logs
+
+        Returns:
+            None
+        """
+        self.is_indexed = True
+        self.game_logs = game_logs
+        self.num_game_logs = len(game_logs)
+        self.is_pitcher = is_pitcher
+        self.team_override = team_override
+        self.type = stats_period.type
+        self.year_list = list(stats_period.year_list)
+
+        self.game_log_columns = stats_period._game_log_columns(game_logs=game_logs, is_pitcher=is_pitcher)
+        game_indexes = self.game_log_columns.filter(year_list=self.year_list, start_date=self.start_date, end_date=self.end_date, team_override=team_override)
+        self.prefix_sums = GameLogPrefixSums(columns=self.game_log_columns, game_indexes=game_indexes, is_date_range=True)
+        
+        # DATE RANGES ARE ONLY PREFIXES OF THE GAME LOGS IF GAMES ARE IN DATE ORDER
+        self.is_supported = self.prefix_sums.is_supported
+
+    def supports(self, stats_period:'StatsPeriod', game_logs:list[dict[str, Any]], is_pitcher:bool, team_override:Team = None) -> bool:
+        """
+        Check that the stats period and game logs match what was indexed.
+
+        Args:
+            stats_period (StatsPeriod): Stats period to add stats to.
+            game_logs (list[dict[str, Any]]): List of game logs.
+            is_pitcher (bool): If the player is a pitcher
+            team_override (Team, optional): Team override for filtering game logs
+
+        Returns:
+            bool: True if `aggregated_stats` can be used for the stats period.
+        """
+        return self.is_indexed and self.is_supported \
+                and game_logs is self.game_logs and len(game_logs) == self.num_game_logs \
+                and is_pitcher == self.is_pitcher and team_override == self.team_override \
+                and stats_period.type == self.type and stats_period.type == StatsPeriodType.DATE_RANGE \
+                and stats_period.year_list == self.year_list \
+                and stats_period.start_date == self.start_date \
+                and stats_period.end_date is not None and stats_period.end_date <= self.end_date
+
+    def aggregated_stats(self, end_date:date) -> Optional[tuple[dict[str, Any], Optional[list[str]]]]:
+        """
+        Aggregated stats for games from `start_date` through `end_date`.
+
+        Args:
+            end_date (date): Last date of the range.
+
+        Returns:
+            Tuple of aggregated stats and game dates (first and last only), or None if there are no games
+            or the result can't be reproduced from the running totals.
+        """
+        num_games = self.prefix_sums.num_games_through(end_date=end_date)
+        return self.prefix_sums.aggregate(num_games=num_games, aggregation_methods=GAME_LOG_STATS_AGG_TYPE)
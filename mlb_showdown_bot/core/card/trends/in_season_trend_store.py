@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Optional
+from pydantic import BaseModel
+
+from .trends import TrendDatapoint
+from ..showdown_player_card import ShowdownPlayerCard
+from ..utils.shared_functions import convert_to_date
+from ...database.postgres_db import PostgresDB
+from ...version import __version__
+
+# ------------------------------------------------------------------------
+# TREND KEY
+# ------------------------------------------------------------------------
+
+# CARD INPUTS THAT CHANGE A TREND DATAPOINT, OTHER THAN STATS AND THE STATS PERIOD
+TREND_CARD_FIELDS = [
+    'set', 'era', 'chart_version', 'player_type_override', 'team_override', 'wbc_team', 'wbc_year', 'league',
+    'is_stats_estimate', 'is_wotc', 'date_override', 'command_out_override', 'commands_excluded',
+    'is_variable_speed_00_01', 'nerf_by_run_value',
+]
+
+
+def in_season_trend_key(actual_card: ShowdownPlayerCard, trend_card: ShowdownPlayerCard, date_aggregation: str, team_filter: Optional[str] = None) -> str:
+    """Hash for a player's in-season trend line. Datapoints for every date range of the line share the key.
+
+    Args:
+        actual_card: Built card for the player's season.
+        trend_card: Any of the (unbuilt) cards used for the trend datapoints.
+        date_aggregation: Date aggregation of the trend line (ex: WEEK).
+        team_filter: Team abbreviation the game logs were filtered to, if any.
+
+    Returns:
+        SHA256 hex digest.
+    """
+    inputs = {
+        'type': 'in_season_trend',
+        'player_id': in_season_trend_player_id(actual_card),
+        'player_type': actual_card.player_type,
+        'year': actual_card.stats_period.year_list[0],
+        'date_aggregation': date_aggregation.upper(),
+        'team_filter': team_filter,
+        'card': trend_card.model_dump(mode='json', include=set(TREND_CARD_FIELDS)),
+        'special_edition': trend_card.image.special_edition, # CHANGES TEAM COLORS
+        'version': __version__,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def in_season_trend_player_id(card: ShowdownPlayerCard) -> str:
+    """MLB ID when available, otherwise bref ID or name"""
+    return str(card.mlb_id or card.bref_id or card.name)
+
+
+# ------------------------------------------------------------------------
+# GAMES PER DATE RANGE
+# ------------------------------------------------------------------------
+
+class TrendGameSummary(BaseModel):
+    """Games included in a trend datapoint's date range. A stored datapoint is reused while this is unchanged."""
+
+    num_games: int
+    last_game_date: Optional[str] = None
+
+
+def trend_game_summaries(game_logs: list[dict[str, Any]], year: int, date_ranges: list[tuple[date, date]]) -> dict[str, TrendGameSummary]:
+    """Number of games and last game date for each date range.
+
+    Args:
+        game_logs: Game logs used for the trend line.
+        year: Season year. Used for game logs without a year in the date.
+        date_ranges: Start and end date of each datapoint.
+
+    Returns:
+        Dict of end date ("YYYY-MM-DD") to game summary.
+    """
+    game_dates: list[date] = []
+    for game_log in game_logs:
+        game_log_date_str = game_log.get('date', game_log.get('date_game', None))
+        if game_log_date_str:
+            game_dates.append(convert_to_date(game_log_date_str=game_log_date_str, year=year))
+    game_dates.sort()
+
+    summaries: dict[str, TrendGameSummary] = {}
+    for start_date, end_date in date_ranges:
+        first_index, last_index = bisect_left(game_dates, start_date), bisect_right(game_dates, end_date)
+        summaries[end_date.strftime('%Y-%m-%d')] = TrendGameSummary(
+            num_games=max(last_index - first_index, 0),
+            last_game_date=game_dates[last_index - 1].strftime('%Y-%m-%d') if last_index > first_index else None,
+        )
+    return summaries
+
+
+# ------------------------------------------------------------------------
+# STORE
+# ------------------------------------------------------------------------
+
+class StoredTrendDatapoint(BaseModel):
+    """Precomputed in-season trend datapoint and the games it was built from"""
+
+    end_date: str
+    game_summary: TrendGameSummary
+    trend: TrendDatapoint
+
+
+class InSeasonTrendStore:
+    """In-season trend datapoints precomputed nightly for active players (`database in_season_trends`).
+
+    Stored in internal.in_season_trend_datapoint, one row per trend key and date range end date.
+    """
+
+    def __init__(self, is_archive: bool = True) -> None:
+        self.is_archive = is_archive
+
+    def create_table(self) -> bool:
+        db = PostgresDB(is_archive=self.is_archive)
+        try:
+            return db.create_in_season_trend_table()
+        finally:
+            db.close_connection()
+
+    def get_many(self, trend_keys: list[str]) -> dict[str, dict[str, StoredTrendDatapoint]]:
+        """Stored datapoints for the keys that were found.
+
+        Args:
+            trend_keys: Keys from `in_season_trend_key`.
+
+        Returns:
+            Dict of trend key to stored datapoints by end date ("YYYY-MM-DD").
+        """
+        db = PostgresDB(is_archive=self.is_archive)
+        try:
+            rows_by_key = db.fetch_in_season_trend_datapoints(trend_keys=trend_keys)
+        finally:
+            db.close_connection()
+
+        stored_datapoints: dict[str, dict[str, StoredTrendDatapoint]] = {}
+        for trend_key, rows in rows_by_key.items():
+            stored_datapoints[trend_key] = {}
+            for row in rows:
+                end_date = row['end_date'].strftime('%Y-%m-%d')
+                last_game_date = row['last_game_date'].strftime('%Y-%m-%d') if row['last_game_date'] else None
+                stored_datapoints[trend_key][end_date] = StoredTrendDatapoint(
+                    end_date=end_date,
+                    game_summary=TrendGameSummary(num_games=row['num_games'], last_game_date=last_game_date),
+                    trend=TrendDatapoint(**row['trend']),
+                )
+        return stored_datapoints
+
+    def put(self, trend_key: str, actual_card: ShowdownPlayerCard, date_aggregation: str, datapoints: list[StoredTrendDatapoint]) -> None:
+        """Store datapoints for one trend line.
+
+        Args:
+            trend_key: Key from `in_season_trend_key`.
+            actual_card: Built card for the player's season.
+            date_aggregation: Date aggregation of the trend line (ex: WEEK).
+            datapoints: Datapoints to insert or replace.
+        """
+        rows = [
+            {
+                'trend_key': trend_key,
+                'end_date': datapoint.end_date,
+                'player_id': in_season_trend_player_id(actual_card),
+                'year': actual_card.stats_period.year_list[0],
+                'showdown_set': actual_card.set.value,
+                'date_aggregation': date_aggregation.upper(),
+                'num_games': datapoint.game_summary.num_games,
+                'last_game_date': datapoint.game_summary.last_game_date,
+                'trend': datapoint.trend.model_dump(mode='json'),
+            }
+            for datapoint in datapoints
+        ]
+        db = PostgresDB(is_archive=self.is_archive)
+        try:
+            db.upload_in_season_trend_datapoints(rows=rows, version=__version__)
+        finally:
+            db.close_connection()
+
+    def prune(self, years_to_keep: list[int] = None) -> None:
+        """Delete datapoints from other versions (and other years when `years_to_keep` is provided)"""
+        db = PostgresDB(is_archive=self.is_archive)
+        try:
+            db.delete_in_season_trend_datapoints(version=__version__, years_to_keep=years_to_keep)
+        finally:
+            db.close_connection()
+
+
+_default_in_season_trend_store: Optional[InSeasonTrendStore] = None
+
+def default_in_season_trend_store() -> Optional[InSeasonTrendStore]:
+    """Store read by in-season trend generation. None unless IN_SEASON_TREND_STORE is set.
+
+    IN_SEASON_TREND_STORE: ARCHIVE or LOGS, the database the nightly command writes to
+                           (`--env prod` writes to ARCHIVE).
+
+    Returns:
+        InSeasonTrendStore or None.
+    """
+    global _default_in_season_trend_store
+    database_str = os.getenv('IN_SEASON_TREND_STORE', None)
+    if not database_str:
+        return None
+    if _default_in_season_trend_store is None:
+        _default_in_season_trend_store = InSeasonTrendStore(is_archive=database_str.upper() == 'ARCHIVE')
+    return _default_in_season_trend_store
@@ -36,7 +36,18 @@ def total_innings_pitched(ip_list: list[float]) -> float:
         converted_stats.append(total_ip_for_calculations(stat))
     
     # GET TOTAL AND CONVERT BACK TO "BASEBALL" DECIMAL
-    total_real_decimal = sum(converted_stats)
+    return innings_pitched_from_real_decimal(sum(converted_stats))
+
+def innings_pitched_from_real_decimal(total_real_decimal: float) -> float:
+    """
+    Convert innings pitched from real decimals back to "baseball" decimals.
+
+    Args:
+        total_real_decimal (float): Innings pitched with thirds as decimals (e.g. 25.66)
+
+    Returns:
+        float: Innings pitched (e.g. 25.2)
+    """
     total_decimal_part = total_real_decimal % 1.0
     new_total_decimal_part = 0.0
     match round(total_decimal_part, 1):
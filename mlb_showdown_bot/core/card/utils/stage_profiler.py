@@ -0,0 +1,42 @@
+from contextlib import contextmanager, nullcontext
+from time import perf_counter, thread_time
+from typing import Iterator
+from pydantic import BaseModel
+
+# SHARED NO-OP CONTEXT USED WHEN PROFILING IS OFF, SO DISABLED STAGES COST ONE ATTRIBUTE CHECK
+NO_STAGE = nullcontext()
+
+
+class StageTiming(BaseModel):
+    """Accumulated wall and CPU time for one stage of building a card"""
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    calls: int = 0
+
+
+class StageProfile(BaseModel):
+    """Per-stage timings for a card build.
+
+    Stages are stored in the order they first ran. CPU time is measured per thread
+    (`time.thread_time`) so concurrent requests on the same server don't inflate each other.
+    A stage that runs more than once accumulates into the same entry.
+    """
+    stages: dict[str, StageTiming] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the wrapped block and add it to the stage's totals.
+
+        Args:
+            name: Stage name (ex: 'clean_stats').
+        """
+        wall_start, cpu_start = perf_counter(), thread_time()
+        try:
+            yield
+        finally:
+            timing = self.stages.get(name, None)
+            if timing is None:
+                timing = self.stages[name] = StageTiming()
+            timing.wall_ms = round(timing.wall_ms + (perf_counter() - wall_start) * 1000, 3)
+            timing.cpu_ms = round(timing.cpu_ms + (thread_time() - cpu_start) * 1000, 3)
+            timing.calls += 1
@@ -14,7 +14,7 @@ import unidecode
 from ..showdown_player_card import ShowdownPlayerCard, Set, Era, Edition, Speed, \
                                     PlayerType, Chart, ChartCategory, Expansion, PlayerSubType, \
                                     Points, Position, StatsPeriod, StatsPeriodType, ShowdownImage \
-                                    , StatHighlightsType
+                                    , StatHighlightsType, ChartKernel
 from ...database.postgres_db import PostgresDB, PlayerArchive
 from ...card.stats.normalized_player_stats import NormalizedPlayerStats, PlayerStatsNormalizer
 
@@ -202,10 +202,9 @@ class WotcPlayerCard(ShowdownPlayerCard):
         self.projected = self.projected_statline(stats_per_400_pa=chart_results_per_400_pa, command=self.chart.command, pa=self.stats_for_card.get('PA', 650))
 
         # ADD ESTIMATED PTS
-        chart_for_pts = self.chart.model_copy()
-        chart_for_pts.opponent = self.set.wotc_baseline_chart(self.player_type.opponent_type, my_type=self.player_sub_type, adjust_for_simulation_accuracy=True)
-        projections_for_pts_per_400_pa = chart_for_pts.projected_stats_per_400_pa
-        projections_for_pts = self.projected_statline(stats_per_400_pa=projections_for_pts_per_400_pa, command=chart_for_pts.command, pa=650)
+        opponent_for_pts = self.set.wotc_baseline_chart(self.player_type.opponent_type, my_type=self.player_sub_type, adjust_for_simulation_accuracy=True)
+        projections_for_pts_per_400_pa = ChartKernel.from_chart(self.chart, opponent=opponent_for_pts).projected_stats_per_400_pa()
+        projections_for_pts = self.projected_statline(stats_per_400_pa=projections_for_pts_per_400_pa, command=self.chart.command, pa=650)
         self.points_estimated_breakdown = self.calculate_points(projected=projections_for_pts, positions_and_defense=self.positions_and_defense, speed_or_ip=self.ip if self.is_pitcher else self.speed.speed)
         self.points_estimated = self.points_estimated_breakdown.total_points
         self.points_diff_estimated_vs_actual = (self.points_estimated or 0) - (self.points or 0)
@@ -3,7 +3,7 @@ from typing import Any
 
 from ..shared.player_position import PlayerType, Position, PlayerSubType
 
-from .mlb_season_averages import MLB_SEASON_AVGS
+from .season_averages_table import MLB_SEASON_AVGS_TABLE
 from .helpers_and_weights import (
     DEFAULT_LINEAR_WEIGHTS, COUNTING_STATS_TO_SCALE_FOR_PA_BASIS, REPLACEMENT_RUN_GAP_PA_BASIS,
     num, round_if_float, scale_counting_stats_to_pa_basis,
@@ -47,10 +47,10 @@ def get_replacement_hitting_avgs(
         - WAR-style baseline: runs_below_avg=30 over 600 PA
         - To convert output to another PA basis, use convert_replacement_stats_to_pa_basis(...)
     """
-    if year not in MLB_SEASON_AVGS:
+    if year not in MLB_SEASON_AVGS_TABLE:
         raise KeyError(f"No league averages found for year {year}")
 
-    stat_line = deepcopy(MLB_SEASON_AVGS[year])
+    stat_line = MLB_SEASON_AVGS_TABLE.season(year)
     linear_weights = weights or DEFAULT_LINEAR_WEIGHTS
 
     pa = num(stat_line.get("PA"))
@@ -109,7 +109,7 @@ def get_replacement_hitting_avgs(
         stat_line["OPS"] = num(stat_line["OBP"]) + num(stat_line["SLG"])
 
     ratio = (target_run_rate / league_run_rate) if league_run_rate > 0 else 0.0
-    base_line = MLB_SEASON_AVGS[year]
+    base_line = MLB_SEASON_AVGS_TABLE.season(year)
     if isinstance(base_line.get("R/G"), (int, float)):
         stat_line["R/G"] = num(base_line.get("R/G")) * ratio
         stat_line["R"] = stat_line["R/G"]
@@ -141,7 +141,7 @@ def build_replacement_hitting_table(
             runs_below_avg=runs_below_avg,
             weights=weights,
         )
-        for year in MLB_SEASON_AVGS
+        for year in MLB_SEASON_AVGS_TABLE.years
     }
 
 
@@ -155,10 +155,10 @@ def get_replacement_pitching_avgs(
     Replacement pitcher baseline is worse than average and therefore allows
     more run value per PA.
     """
-    if year not in MLB_SEASON_AVGS:
+    if year not in MLB_SEASON_AVGS_TABLE:
         raise KeyError(f"No league averages found for year {year}")
 
-    stat_line = deepcopy(MLB_SEASON_AVGS[year])
+    stat_line = MLB_SEASON_AVGS_TABLE.season(year)
     linear_weights = weights or DEFAULT_LINEAR_WEIGHTS
 
     pa = num(stat_line.get("PA"))
@@ -189,7 +189,7 @@ def get_replacement_pitching_avgs(
         if isinstance(stat_line.get(stat), (int, float)):
             stat_line[stat] = num(stat_line[stat]) * hit_scale
 
-    base_line = MLB_SEASON_AVGS[year]
+    base_line = MLB_SEASON_AVGS_TABLE.season(year)
 
     if isinstance(stat_line.get("SO"), (int, float)) and hit_scale > 0:
         stat_line["SO"] = num(base_line.get("SO")) / hit_scale
@@ -263,7 +263,7 @@ def build_replacement_pitching_table(
             runs_above_avg=runs_above_avg,
             weights=weights,
         )
-        for year in MLB_SEASON_AVGS
+        for year in MLB_SEASON_AVGS_TABLE.years
     }
 
 
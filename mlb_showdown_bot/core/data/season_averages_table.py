@@ -0,0 +1,139 @@
+import numpy as np
+
+from .mlb_season_averages import MLB_SEASON_AVGS
+
+# -----------------------------------
+# MARK: - CONSTANTS
+# -----------------------------------
+
+# SEASON AVERAGES ARE SCALED BY 2^80 INTO PYTHON INTS, SO PREFIX SUM DIFFERENCES FOR
+# ANY YEAR RANGE DON'T PICK UP FLOAT CANCELLATION ERROR. THE TOTAL IS ROUNDED ONCE WHEN
+# DIVIDED, WHICH CAN DIFFER FROM A LEFT TO RIGHT FLOAT `sum` IN THE LAST BIT. AFTER
+# ROUNDING TO `digits` THE AVERAGES MATCH THE PREVIOUS FLOAT SUM FOR THE SHIPPED DATA,
+# BUT THAT IS CHECKED AGAINST THE DATA, NOT GUARANTEED IN GENERAL.
+_EXACT_SUM_SCALE = 2 ** 80
+
+
+# -----------------------------------
+# MARK: - SEASON AVERAGES TABLE
+# -----------------------------------
+
+class SeasonAveragesTable:
+    """Dense year x stat matrix of MLB season averages with cumulative sums.
+
+    Built from a {year: {stat: value}} dict. Missing years in the source
+    range are stored as empty rows and missing/None stats as NaN. Call
+    `rebuild` after the source dict is updated in-process.
+
+    Attributes:
+        years: Sorted list of years present in the source dict.
+        stats: Stat names (column order).
+        values: Float matrix (year x stat), NaN where a stat is missing.
+    """
+
+    def __init__(self, season_avgs: dict[int, dict[str, float | None]]) -> None:
+        self.season_avgs = season_avgs
+        self.years: list[int] = sorted(season_avgs.keys())
+        self.min_year: int = self.years[0] if self.years else 0
+        self.max_year: int = self.years[-1] if self.years else 0
+
+        # STAT COLUMNS IN FIRST SEEN ORDER SO ROWS ROUND TRIP TO THE SAME DICT ORDER
+        self.stats: list[str] = []
+        for year in self.years:
+            for stat in season_avgs[year]:
+                if stat not in self.stats:
+                    self.stats.append(stat)
+        self.stat_index: dict[str, int] = { stat: i for i, stat in enumerate(self.stats) }
+
+        num_rows = (self.max_year - self.min_year + 1) if self.years else 0
+        self.values = np.full((num_rows, len(self.stats)), np.nan)
+        self._row_stats: list[list[str] | None] = [None] * num_rows
+        exact_values = np.zeros((num_rows, len(self.stats)), dtype=object)
+        for year in self.years:
+            row = year - self.min_year
+            self._row_stats[row] = list(season_avgs[year].keys())
+            for stat, value in season_avgs[year].items():
+                if not isinstance(value, (int, float)):
+                    continue
+                col = self.stat_index[stat]
+                self.values[row, col] = value
+                exact_values[row, col] = int(value * _EXACT_SUM_SCALE)
+        self.values.flags.writeable = False
+
+        # PREFIX SUMS WITH A LEADING ZERO ROW, SO YEARS [a, b) SUM TO cumsum[b] - cumsum[a]
+        zero_row = np.zeros((1, len(self.stats)), dtype=object)
+        self._exact_cumsum = np.vstack([zero_row, np.cumsum(exact_values, axis=0)])
+        self._count_cumsum = np.vstack([
+            np.zeros((1, len(self.stats)), dtype=np.int64),
+            np.cumsum(~np.isnan(self.values), axis=0, dtype=np.int64)
+        ])
+
+    def rebuild(self) -> None:
+        """Rebuild the matrix and prefix sums from the current contents of the source dict.
+        Swaps in every attribute at once, so concurrent readers see either the old or the new table.
+        """
+        self.__dict__ = SeasonAveragesTable(self.season_avgs).__dict__
+
+    def __contains__(self, year: int) -> bool:
+        return self._row(year) is not None
+
+    def _row(self, year: int) -> int | None:
+        """Matrix row for a year, None if the year has no averages"""
+        row = year - self.min_year
+        if row < 0 or row >= len(self._row_stats) or self._row_stats[row] is None:
+            return None
+        return row
+
+    def season(self, year: int) -> dict[str, float | None]:
+        """Stat line for a single season.
+
+        Args:
+            year: Season year.
+
+        Returns:
+            New dict of stat -> value (None where missing), empty if year is not in the table.
+        """
+        row = self._row(year)
+        if row is None:
+            return {}
+        row_values = self.values[row].tolist()
+        return { stat: (None if np.isnan(row_values[self.stat_index[stat]]) else row_values[self.stat_index[stat]]) for stat in self._row_stats[row] }
+
+    def average(self, year_list: list[int], digits: int = 4) -> dict[str, float]:
+        """Average of each stat across a list of years.
+
+        Years without averages are ignored, as are None values for a stat. Stats
+        with no values in any year are left out of the result.
+
+        Args:
+            year_list: Years to average. Does not need to be sorted or contiguous.
+            digits: Number of digits to round each average to.
+
+        Returns:
+            Dict of stat -> rounded average. Empty if none of the years are in the table.
+        """
+        rows = sorted({ row for row in (self._row(year) for year in year_list) if row is not None })
+        if len(rows) == 0:
+            return {}
+
+        # SPLIT INTO CONTIGUOUS RUNS AND SUM EACH WITH ONE PREFIX SUM DIFFERENCE
+        totals = np.zeros(len(self.stats), dtype=object)
+        counts = np.zeros(len(self.stats), dtype=np.int64)
+        run_start = rows[0]
+        for index, row in enumerate(rows):
+            is_run_end = index == len(rows) - 1 or rows[index + 1] != row + 1
+            if not is_run_end:
+                continue
+            totals += self._exact_cumsum[row + 1] - self._exact_cumsum[run_start]
+            counts += self._count_cumsum[row + 1] - self._count_cumsum[run_start]
+            if index < len(rows) - 1:
+                run_start = rows[index + 1]
+
+        totals, counts = totals.tolist(), counts.tolist()
+        return {
+            stat: round((totals[i] / _EXACT_SUM_SCALE) / counts[i], digits)
+                for i, stat in enumerate(self.stats) if counts[i] > 0
+        }
+
+
+MLB_SEASON_AVGS_TABLE = SeasonAveragesTable(MLB_SEASON_AVGS)
@@ -4095,7 +4095,8 @@ class PostgresDB:
                 thumbnail_storage_path text,
                 user_id text,
                 is_hidden boolean NOT NULL DEFAULT FALSE,
-                card_result jsonb
+                card_result jsonb,
+                card_stage_profile jsonb
             );
         """
 
@@ -4110,6 +4111,10 @@ class PostgresDB:
             ALTER TABLE internal.log_custom_card_bot
                 ADD COLUMN IF NOT EXISTS is_hidden boolean NOT NULL DEFAULT FALSE;
         """
+        migrate_card_stage_profile_sql = """
+            ALTER TABLE internal.log_custom_card_bot
+                ADD COLUMN IF NOT EXISTS card_stage_profile jsonb;
+        """
         try:
             with self.connection.cursor() as cur:
                 cur.execute(schema_check_sql)
@@ -4117,6 +4122,7 @@ class PostgresDB:
                 cur.execute(index_sql)
                 cur.execute(user_id_index_sql)
                 cur.execute(migrate_is_hidden_sql)
+                cur.execute(migrate_card_stage_profile_sql)
                 self.connection.commit()
         except Exception as error:
             traceback.print_exc()
@@ -4274,7 +4280,7 @@ class PostgresDB:
             
         # BUILD CARD SUBMISSION OBJECT
         columns_not_on_card_object = [
-            'error', 'error_for_user', 'scraper_load_time', 'historical_season_trends', 'in_season_trends'
+            'error', 'error_for_user', 'scraper_load_time', 'historical_season_trends', 'in_season_trends', 'card_stage_profile'
         ]
         if card:
             # CARD IS POPULATED
@@ -4597,63 +4603,153 @@ class PostgresDB:
         # ENSURE TABLE IS ALREADY BUILT
         self.create_dim_card_table()
         
-        cursor = self.connection.cursor()
-        
-        try:
+        # Process cards in batches
+        total_cards = len(showdown_cards)
+        for i in range(0, total_cards, batch_size):
+            batch = showdown_cards[i:i + batch_size]
+            batch_num = (i // batch_size) + 1
+            total_batches = (total_cards + batch_size - 1) // batch_size
             
-            # Process cards in batches
-            total_cards = len(showdown_cards)
-            for i in range(0, total_cards, batch_size):
-                batch = showdown_cards[i:i + batch_size]
-                batch_num = (i // batch_size) + 1
-                total_batches = (total_cards + batch_size - 1) // batch_size
-                
-                print(f"Uploading batch {batch_num}/{total_batches} ({len(batch)} cards)...")
-                
-                # Prepare batch data
-                batch_data = []
-                for showdown in batch:
-                    card_data = showdown.as_json()
-                    
-                    # Clean up the data for JSON storage
-                    bref_or_mlb_id = str(showdown.mlb_id) if showdown.mlb_id else showdown.bref_id
-                    id_fields = [field for field in [showdown.year, bref_or_mlb_id, f'({showdown.player_type_override.value})' if showdown.player_type_override else None] if field is not None]
-                    player_id = "-".join(id_fields).lower()
-                    card_data['player_id'] = player_id
-                    card_data['name'] = unidecode(card_data['name'])
-                    card_data['id'] = "-".join([player_id, showdown.set.value])
-
-                    batch_data.append((card_data['id'], card_data['player_id'], showdown.set.value, showdown.version, card_data))
-
-                # Insert batch
-                insert_query = """
-                    INSERT INTO internal.dim_card (id, player_id, showdown_set, version, card_data) 
-                    VALUES %s
-                    ON CONFLICT (player_id, showdown_set, version) 
-                    DO UPDATE SET 
-                        card_data = EXCLUDED.card_data,
-                        modified_date = NOW()
-                """
+            print(f"Uploading batch {batch_num}/{total_batches} ({len(batch)} cards)...")
+            self.upload_dim_card_rows(rows=[self.dim_card_row(showdown) for showdown in batch], batch_size=batch_size)
+            print(f"  ✓ Uploaded {len(batch)} cards")
+        
+        print(f"✓ Successfully uploaded {total_cards} showdown cards to database")
+
+    def dim_card_row(self, showdown: ShowdownPlayerCard) -> tuple:
+        """Serialize a card into an internal.dim_card row.
+
+        Args:
+            showdown: Card to serialize.
+
+        Returns:
+            Tuple of (id, player_id, showdown_set, version, card_data).
+        """
+        card_data = showdown.as_json()
+        
+        # Clean up the data for JSON storage
+        bref_or_mlb_id = str(showdown.mlb_id) if showdown.mlb_id else showdown.bref_id
+        id_fields = [field for field in [showdown.year, bref_or_mlb_id, f'({showdown.player_type_override.value})' if showdown.player_type_override else None] if field is not None]
+        player_id = "-".join(id_fields).lower()
+        card_data['player_id'] = player_id
+        card_data['name'] = unidecode(card_data['name'])
+        card_data['id'] = "-".join([player_id, showdown.set.value])
+
+        return (card_data['id'], card_data['player_id'], showdown.set.value, showdown.version, card_data)
+
+    def upload_dim_card_rows(self, rows: list[tuple], batch_size: int = 1000, checkpoint: Optional[dict] = None) -> None:
+        """Upsert serialized cards into internal.dim_card in one transaction.
 
+        Args:
+            rows: Output of `dim_card_row` for each card.
+            batch_size: Page size for execute_values.
+            checkpoint: Optional upload checkpoint (run_key, next_unit_index, cards_uploaded).
+                        Saved in the same transaction, so it always matches what was committed.
+
+        Returns:
+            None
+        """
+        # CONNECTIONS ARE AUTOCOMMIT, TURN IT OFF SO EVERY PAGE AND THE CHECKPOINT COMMIT TOGETHER
+        self.connection.autocommit = False
+        cursor = self.connection.cursor()
+        try:
+            insert_query = """
+                INSERT INTO internal.dim_card (id, player_id, showdown_set, version, card_data) 
+                VALUES %s
+                ON CONFLICT (player_id, showdown_set, version) 
+                DO UPDATE SET 
+                    card_data = EXCLUDED.card_data,
+                    modified_date = NOW()
+            """
+            if len(rows) > 0:
                 execute_values(
                     cursor, 
                     insert_query, 
-                    batch_data,
+                    rows,
                     template=None,
                     page_size=batch_size
                 )
-                
-                self.connection.commit()
-                print(f"  ✓ Uploaded {len(batch)} cards")
-            
-            print(f"✓ Successfully uploaded {total_cards} showdown cards to database")
+
+            if checkpoint:
+                cursor.execute("""
+                    INSERT INTO internal.dim_card_upload_checkpoint (run_key, next_unit_index, cards_uploaded)
+                    VALUES (%(run_key)s, %(next_unit_index)s, %(cards_uploaded)s)
+                    ON CONFLICT (run_key)
+                    DO UPDATE SET
+                        next_unit_index = EXCLUDED.next_unit_index,
+                        cards_uploaded = EXCLUDED.cards_uploaded,
+                        modified_date = NOW()
+                """, checkpoint)
             
+            self.connection.commit()
         except Exception as e:
             print(f"ERROR uploading to database: {e}")
             self.connection.rollback()
             raise
         finally:
             cursor.close()
+            self.connection.autocommit = True
+
+    def create_dim_card_upload_checkpoint_table(self) -> bool:
+        """Create the table tracking the last committed batch of a streaming dim_card upload.
+        
+        Returns:
+            True if creation was successful or table already exists, False otherwise.
+        """
+
+        if self.connection is None:
+            print("No database connection available for creating dim_card_upload_checkpoint table.")
+            return False
+        
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("CREATE SCHEMA IF NOT EXISTS internal;")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS internal.dim_card_upload_checkpoint (
+                    run_key character varying(64) NOT NULL PRIMARY KEY,
+                    next_unit_index integer NOT NULL,
+                    cards_uploaded integer NOT NULL DEFAULT 0,
+                    modified_date timestamp without time zone DEFAULT now()
+                );
+                """
+            )
+            self.connection.commit()
+            return True
+
+        except Exception as e:
+            print("Error creating dim_card_upload_checkpoint table:", e)
+            traceback.print_exc()
+            return False
+
+    def fetch_dim_card_upload_checkpoint(self, run_key: str) -> Optional[dict]:
+        """Fetch the checkpoint for a streaming dim_card upload run.
+
+        Args:
+            run_key: Key identifying the run's ordered list of (player, set) work units.
+
+        Returns:
+            Dict with next_unit_index and cards_uploaded, None if the run has no checkpoint.
+        """
+        results = self.execute_query(
+            query=sql.SQL("SELECT next_unit_index, cards_uploaded FROM internal.dim_card_upload_checkpoint WHERE run_key = %s"),
+            filter_values=(run_key,)
+        )
+        return results[0] if results else None
+
+    def delete_dim_card_upload_checkpoint(self, run_key: str) -> None:
+        """Delete the checkpoint of a finished streaming dim_card upload run, so the next run over the same work units starts over.
+
+        Args:
+            run_key: Key identifying the run's ordered list of (player, set) work units.
+
+        Returns:
+            None
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("DELETE FROM internal.dim_card_upload_checkpoint WHERE run_key = %s", (run_key,))
+        finally:
+            cursor.close()
 
     # Rate stats: averaged across years (rates don't compound). Everything else is a counting stat and is summed.
     _RATE_STAT_NAMES = [
@@ -4726,6 +4822,521 @@ class PostgresDB:
         finally:
             cursor.close()
 
+# ------------------------------------------------------------------------
+# CARD CACHE
+# ------------------------------------------------------------------------
+
+    def create_card_cache_table(self, table_name: str = 'card_cache') -> bool:
+        """Create the table storing built cards by content hash (see `core/card/card_cache.py`).
+
+        Args:
+            table_name: Table in the internal schema. Other cached data (ex: career trends) uses its own table.
+
+        Returns:
+            True if creation was successful or table already exists, False otherwise.
+        """
+
+        if self.connection is None:
+            print(f"No database connection available for creating {table_name} table.")
+            return False
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("CREATE SCHEMA IF NOT EXISTS internal;")
+            cursor.execute(sql.SQL("""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    cache_key character varying(64) NOT NULL PRIMARY KEY,
+                    version character varying(20) NOT NULL,
+                    card_data jsonb NOT NULL,
+                    created_date timestamp without time zone DEFAULT now(),
+                    last_accessed_date timestamp without time zone DEFAULT now()
+                );
+                CREATE INDEX IF NOT EXISTS {index} ON {table} (last_accessed_date);
+                """).format(
+                    table=sql.Identifier('internal', table_name),
+                    index=sql.Identifier(f'{table_name}_last_accessed_date_idx'),
+                )
+            )
+            self.connection.commit()
+            return True
+
+        except Exception as e:
+            print(f"Error creating {table_name} table:", e)
+            traceback.print_exc()
+            return False
+
+    def fetch_cached_cards(self, cache_keys: list[str], table_name: str = 'card_cache') -> dict[str, dict]:
+        """Fetch cached cards and mark them as recently used.
+
+        Args:
+            cache_keys: Card cache keys to look up.
+            table_name: Cache table in the internal schema.
+
+        Returns:
+            Dict of cache key to card data for keys that were found.
+        """
+        if self.connection is None or len(cache_keys) == 0:
+            return {}
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(sql.SQL("""
+                UPDATE {table}
+                SET last_accessed_date = NOW()
+                WHERE cache_key = ANY(%s)
+                RETURNING cache_key, card_data
+            """).format(table=sql.Identifier('internal', table_name)), (list(cache_keys),))
+            results = cursor.fetchall()
+            self.connection.commit()
+            return { cache_key: card_data for cache_key, card_data in results }
+        except Exception as e:
+            print(f"Error fetching cached cards: {e}")
+            self.connection.rollback()
+            return {}
+
+    def upload_cached_cards(self, cards: dict[str, dict], version: str, table_name: str = 'card_cache') -> None:
+        """Upsert built cards into the card cache.
+
+        Args:
+            cards: Dict of cache key to card data.
+            version: Showdown Bot version the cards were built with.
+            table_name: Cache table in the internal schema.
+
+        Returns:
+            None
+        """
+        if self.connection is None or len(cards) == 0:
+            return
+        try:
+            cursor = self.connection.cursor()
+            execute_values(
+                cursor,
+                sql.SQL("""
+                    INSERT INTO {table} (cache_key, version, card_data)
+                    VALUES %s
+                    ON CONFLICT (cache_key)
+                    DO UPDATE SET
+                        card_data = EXCLUDED.card_data,
+                        last_accessed_date = NOW()
+                """).format(table=sql.Identifier('internal', table_name)),
+                [(cache_key, version, card_data) for cache_key, card_data in cards.items()],
+            )
+            self.connection.commit()
+        except Exception as e:
+            print(f"Error uploading cached cards: {e}")
+            self.connection.rollback()
+
+    def prune_card_cache(self, version: str, max_entries: int, table_name: str = 'card_cache') -> None:
+        """Delete cached cards from other versions and the least recently used cards over the limit.
+
+        Args:
+            version: Current Showdown Bot version. Cards built by any other version are deleted.
+            max_entries: Max number of cached cards to keep.
+            table_name: Cache table in the internal schema.
+
+        Returns:
+            None
+        """
+        if self.connection is None:
+            return
+        try:
+            cursor = self.connection.cursor()
+            table = sql.Identifier('internal', table_name)
+            cursor.execute(sql.SQL("DELETE FROM {table} WHERE version <> %s").format(table=table), (version,))
+            cursor.execute(sql.SQL("""
+                DELETE FROM {table}
+                WHERE cache_key IN (
+                    SELECT cache_key FROM {table}
+                    ORDER BY last_accessed_date DESC
+                    OFFSET %s
+                )
+            """).format(table=table), (max_entries,))
+            self.connection.commit()
+        except Exception as e:
+            print(f"Error pruning card cache: {e}")
+            self.connection.rollback()
+
+# ------------------------------------------------------------------------
+# IN SEASON TRENDS
+# ------------------------------------------------------------------------
+
+    def create_in_season_trend_table(self) -> bool:
+        """Create the table storing precomputed in-season trend datapoints (see `core/card/trends/in_season_trend_store.py`).
+
+        Returns:
+            True if creation was successful or table already exists, False otherwise.
+        """
+
+        if self.connection is None:
+            print("No database connection available for creating in_season_trend_datapoint table.")
+            return False
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("CREATE SCHEMA IF NOT EXISTS internal;")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS internal.in_season_trend_datapoint (
+                    trend_key character varying(64) NOT NULL,
+                    end_date date NOT NULL,
+                    player_id character varying(20),
+                    year integer,
+                    showdown_set character varying(10),
+                    date_aggregation character varying(10),
+                    version character varying(20) NOT NULL,
+                    num_games integer NOT NULL,
+                    last_game_date date,
+                    trend jsonb NOT NULL,
+                    modified_date timestamp without time zone DEFAULT now(),
+                    PRIMARY KEY (trend_key, end_date)
+                );
+                CREATE INDEX IF NOT EXISTS in_season_trend_datapoint_player_idx ON internal.in_season_trend_datapoint (player_id, year);
+                """
+            )
+            self.connection.commit()
+            return True
+
+        except Exception as e:
+            print("Error creating in_season_trend_datapoint table:", e)
+            traceback.print_exc()
+            return False
+
+    def fetch_in_season_trend_datapoints(self, trend_keys: list[str]) -> dict[str, list[dict]]:
+        """Fetch precomputed in-season trend datapoints.
+
+        Args:
+            trend_keys: In-season trend keys to look up.
+
+        Returns:
+            Dict of trend key to rows (end_date, num_games, last_game_date, trend) ordered by end date.
+        """
+        if self.connection is None or len(trend_keys) == 0:
+            return {}
+        try:
+            cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+            cursor.execute("""
+                SELECT trend_key, end_date, num_games, last_game_date, trend
+                FROM internal.in_season_trend_datapoint
+                WHERE trend_key = ANY(%s)
+                ORDER BY trend_key, end_date
+            """, (list(trend_keys),))
+            datapoints: dict[str, list[dict]] = {}
+            for row in cursor.fetchall():
+                datapoints.setdefault(row.pop('trend_key'), []).append(dict(row))
+            return datapoints
+        except Exception as e:
+            print(f"Error fetching in-season trend datapoints: {e}")
+            self.connection.rollback()
+            return {}
+
+    def upload_in_season_trend_datapoints(self, rows: list[dict], version: str) -> None:
+        """Upsert precomputed in-season trend datapoints.
+
+        Args:
+            rows: Dicts with trend_key, end_date, player_id, year, showdown_set, date_aggregation, num_games, last_game_date and trend.
+            version: Showdown Bot version the datapoints were built with.
+
+        Returns:
+            None
+        """
+        if self.connection is None or len(rows) == 0:
+            return
+        try:
+            cursor = self.connection.cursor()
+            execute_values(
+                cursor,
+                """
+                    INSERT INTO internal.in_season_trend_datapoint (trend_key, end_date, player_id, year, showdown_set, date_aggregation, version, num_games, last_game_date, trend)
+                    VALUES %s
+                    ON CONFLICT (trend_key, end_date)
+                    DO UPDATE SET
+                        num_games = EXCLUDED.num_games,
+                        last_game_date = EXCLUDED.last_game_date,
+                        trend = EXCLUDED.trend,
+                        modified_date = NOW()
+                """,
+                [
+                    (row['trend_key'], row['end_date'], row['player_id'], row['year'], row['showdown_set'], row['date_aggregation'], version, 
+                     row['num_games'], row['last_game_date'], json.dumps(row['trend']))
+                    for row in rows
+                ],
+            )
+            self.connection.commit()
+        except Exception as e:
+            print(f"Error uploading in-season trend datapoints: {e}")
+            self.connection.rollback()
+
+    def delete_in_season_trend_datapoints(self, version: str, years_to_keep: list[int] = None) -> None:
+        """Delete in-season trend datapoints built by other versions or for other years.
+
+        Args:
+            version: Current Showdown Bot version. Datapoints built by any other version are deleted.
+            years_to_keep: Optional list of years to keep. Datapoints for other years are deleted.
+
+        Returns:
+            None
+        """
+        if self.connection is None:
+            return
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("DELETE FROM internal.in_season_trend_datapoint WHERE version <> %s", (version,))
+            if years_to_keep:
+                cursor.execute("DELETE FROM internal.in_season_trend_datapoint WHERE year <> ALL(%s)", (list(years_to_keep),))
+            self.connection.commit()
+        except Exception as e:
+            print(f"Error deleting in-season trend datapoints: {e}")
+            self.connection.rollback()
+
+# ------------------------------------------------------------------------
+# SCRAPE JOBS
+# ------------------------------------------------------------------------
+
+    def create_scrape_job_tables(self) -> bool:
+        """Create the persistent work queue for archive scrape jobs (see `core/archive/scrape_job_queue.py`).
+
+        Returns:
+            True if creation was successful or tables already exist, False otherwise.
+        """
+
+        if self.connection is None:
+            print("No database connection available for creating scrape job tables.")
+            return False
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("CREATE SCHEMA IF NOT EXISTS internal;")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS internal.scrape_job (
+                    job_key character varying(100) PRIMARY KEY,
+                    description text,
+                    created_date timestamp without time zone DEFAULT now()
+                );
+                CREATE TABLE IF NOT EXISTS internal.scrape_job_item (
+                    job_key character varying(100) NOT NULL REFERENCES internal.scrape_job (job_key) ON DELETE CASCADE,
+                    item_id character varying(100) NOT NULL,
+                    priority integer NOT NULL,
+                    state character varying(10) NOT NULL DEFAULT 'PENDING',
+                    attempts integer NOT NULL DEFAULT 0,
+                    retry_at timestamp without time zone,
+                    lease_owner character varying(100),
+                    lease_expires_at timestamp without time zone,
+                    last_error text,
+                    started_date timestamp without time zone,
+                    completed_date timestamp without time zone,
+                    PRIMARY KEY (job_key, item_id)
+                );
+                CREATE INDEX IF NOT EXISTS scrape_job_item_claim_idx ON internal.scrape_job_item (job_key, state, priority);
+                """
+            )
+            self.connection.commit()
+            return True
+
+        except Exception as e:
+            print("Error creating scrape job tables:", e)
+            traceback.print_exc()
+            return False
+
+    def enqueue_scrape_job_items(self, job_key: str, item_ids: list[str], description: str = None) -> int:
+        """Create the job if needed and add items in priority order. Items already in the job keep their state.
+
+        Args:
+            job_key: Unique key for the job.
+            item_ids: Item ids in the order they should be processed.
+            description: Optional job description.
+
+        Returns:
+            Number of new items added.
+        """
+        if self.connection is None:
+            return 0
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                INSERT INTO internal.scrape_job (job_key, description) VALUES (%s, %s)
+                ON CONFLICT (job_key) DO NOTHING
+            """, (job_key, description))
+
+            # NEW ITEMS GO AFTER EXISTING ONES
+            cursor.execute("SELECT COALESCE(MAX(priority) + 1, 0) FROM internal.scrape_job_item WHERE job_key = %s", (job_key,))
+            first_priority = cursor.fetchone()[0]
+            added_items = []
+            if len(item_ids) > 0:
+                added_items = execute_values(
+                    cursor,
+                    """
+                        INSERT INTO internal.scrape_job_item (job_key, item_id, priority)
+                        VALUES %s
+                        ON CONFLICT (job_key, item_id) DO NOTHING
+                        RETURNING item_id
+                    """,
+                    [(job_key, item_id, first_priority + index) for index, item_id in enumerate(item_ids)],
+                    page_size=1000,
+                    fetch=True,
+                )
+            self.connection.commit()
+            return len(added_items)
+        except Exception as e:
+            print(f"Error enqueuing scrape job items: {e}")
+            self.connection.rollback()
+            return 0
+
+    def claim_scrape_job_items(self, job_key: str, worker_id: str, limit: int, lease_seconds: float) -> list[str]:
+        """Lease the next items of a job. Claims pending items that are due and in flight items whose lease expired.
+        Rows are locked with SKIP LOCKED, so concurrent workers never claim the same item.
+
+        Args:
+            job_key: Job to claim items from.
+            worker_id: Unique id for the worker holding the lease.
+            limit: Max number of items to claim.
+            lease_seconds: Seconds until the lease expires and the item can be claimed by another worker.
+
+        Returns:
+            Claimed item ids in priority order.
+        """
+        if self.connection is None:
+            return []
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                WITH next_items AS (
+                    SELECT job_key, item_id
+                    FROM internal.scrape_job_item
+                    WHERE job_key = %(job_key)s
+                      AND (
+                        (state = 'PENDING' AND (retry_at IS NULL OR retry_at <= NOW()))
+                        OR (state = 'IN_FLIGHT' AND lease_expires_at < NOW())
+                      )
+                    ORDER BY priority
+                    LIMIT %(limit)s
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE internal.scrape_job_item AS item
+                SET state = 'IN_FLIGHT',
+                    lease_owner = %(worker_id)s,
+                    lease_expires_at = NOW() + make_interval(secs => %(lease_seconds)s),
+                    attempts = item.attempts + 1,
+                    started_date = NOW()
+                FROM next_items
+                WHERE item.job_key = next_items.job_key AND item.item_id = next_items.item_id
+                RETURNING item.item_id, item.priority
+            """, {'job_key': job_key, 'worker_id': worker_id, 'limit': limit, 'lease_seconds': lease_seconds})
+            claimed_items = sorted(cursor.fetchall(), key=lambda row: row[1])
+            self.connection.commit()
+            return [item_id for item_id, _ in claimed_items]
+        except Exception as e:
+            print(f"Error claiming scrape job items: {e}")
+            self.connection.rollback()
+            return []
+
+    def complete_scrape_job_item(self, job_key: str, item_id: str) -> None:
+        """Mark an item as done"""
+        if self.connection is None:
+            return
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                UPDATE internal.scrape_job_item
+                SET state = 'DONE', completed_date = NOW(), lease_owner = NULL, lease_expires_at = NULL, retry_at = NULL, last_error = NULL
+                WHERE job_key = %s AND item_id = %s
+            """, (job_key, item_id))
+            self.connection.commit()
+        except Exception as e:
+            print(f"Error completing scrape job item {item_id}: {e}")
+            self.connection.rollback()
+
+    def renew_scrape_job_leases(self, job_key: str, worker_id: str, lease_seconds: float) -> None:
+        """Extend the lease of every in flight item the worker holds, so items waiting on rate limiter backoffs aren't claimed again.
+
+        Args:
+            job_key: Job of the items.
+            worker_id: Worker holding the leases.
+            lease_seconds: Seconds from now until the leases expire.
+        """
+        if self.connection is None:
+            return
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                UPDATE internal.scrape_job_item
+                SET lease_expires_at = NOW() + make_interval(secs => %(lease_seconds)s)
+                WHERE job_key = %(job_key)s AND lease_owner = %(worker_id)s AND state = 'IN_FLIGHT'
+            """, {'job_key': job_key, 'worker_id': worker_id, 'lease_seconds': lease_seconds})
+            self.connection.commit()
+        except Exception as e:
+            print(f"Error renewing scrape job leases: {e}")
+            self.connection.rollback()
+
+    def fail_scrape_job_item(self, job_key: str, item_id: str, error: str, max_attempts: int = 1, retry_delay_seconds: Optional[float] = None) -> None:
+        """Schedule a retry for a failed item with exponential backoff, or mark it FAILED once it's out of attempts.
+
+        Args:
+            job_key: Job of the item.
+            item_id: Item that failed.
+            error: Error message.
+            max_attempts: Attempts (claims) allowed for the item.
+            retry_delay_seconds: Delay before the first retry, doubled for each attempt. None marks the item as FAILED.
+        """
+        if self.connection is None:
+            return
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                UPDATE internal.scrape_job_item
+                SET state = CASE WHEN %(is_final)s OR attempts >= %(max_attempts)s THEN 'FAILED' ELSE 'PENDING' END,
+                    retry_at = CASE WHEN %(is_final)s OR attempts >= %(max_attempts)s THEN NULL
+                                    ELSE NOW() + make_interval(secs => %(retry_delay_seconds)s * POWER(2, GREATEST(attempts - 1, 0))) END,
+                    completed_date = CASE WHEN %(is_final)s OR attempts >= %(max_attempts)s THEN NOW() ELSE NULL END,
+                    lease_owner = NULL, lease_expires_at = NULL, last_error = %(error)s
+                WHERE job_key = %(job_key)s AND item_id = %(item_id)s
+            """, {
+                'job_key': job_key, 'item_id': item_id, 'error': error, 'max_attempts': max_attempts,
+                'is_final': retry_delay_seconds is None, 'retry_delay_seconds': retry_delay_seconds or 0,
+            })
+            self.connection.commit()
+        except Exception as e:
+            print(f"Error failing scrape job item {item_id}: {e}")
+            self.connection.rollback()
+
+    def fetch_scrape_job_status(self, job_key: str = None, throughput_minutes: int = 15, limit: int = 10) -> list[dict]:
+        """Item counts by state and recent throughput for scrape jobs.
+
+        Args:
+            job_key: Optional job to fetch. Defaults to the most recent jobs.
+            throughput_minutes: Window used for items completed per minute.
+            limit: Max number of jobs when job_key isn't provided.
+
+        Returns:
+            List of dicts with job_key, description, created_date, pending, retrying, in_flight, done, failed,
+            last_completed_date and recent_done, newest first.
+        """
+        if self.connection is None:
+            return []
+        try:
+            cursor = self.connection.cursor(cursor_factory=RealDictCursor)
+            cursor.execute("""
+                SELECT
+                    job.job_key,
+                    job.description,
+                    job.created_date,
+                    COUNT(*) FILTER (WHERE item.state = 'PENDING' AND item.retry_at IS NULL) AS pending,
+                    COUNT(*) FILTER (WHERE item.state = 'PENDING' AND item.retry_at IS NOT NULL) AS retrying,
+                    COUNT(*) FILTER (WHERE item.state = 'IN_FLIGHT') AS in_flight,
+                    COUNT(*) FILTER (WHERE item.state = 'DONE') AS done,
+                    COUNT(*) FILTER (WHERE item.state = 'FAILED') AS failed,
+                    MAX(item.completed_date) AS last_completed_date,
+                    COUNT(*) FILTER (WHERE item.state IN ('DONE', 'FAILED') AND item.completed_date >= NOW() - make_interval(mins => %(throughput_minutes)s)) AS recent_done
+                FROM internal.scrape_job AS job
+                LEFT JOIN internal.scrape_job_item AS item ON item.job_key = job.job_key
+                WHERE %(job_key)s IS NULL OR job.job_key = %(job_key)s
+                GROUP BY job.job_key, job.description, job.created_date
+                ORDER BY job.created_date DESC
+                LIMIT %(limit)s
+            """, {'job_key': job_key, 'throughput_minutes': throughput_minutes, 'limit': limit})
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"Error fetching scrape job status: {e}")
+            self.connection.rollback()
+            return []
+
 # ------------------------------------------------------------------------
 # STATUSES
 # ------------------------------------------------------------------------
@@ -6,6 +6,7 @@ from .exceptions import FanGraphsError
 from .models import FieldingStats
 
 from ..card.stats.stats_period import StatsPeriod
+from ..shared.rate_limiter import host_rate_limiter
 
 _LEADERBOARD_CACHE: dict[tuple, tuple[list, datetime]] = {}
 _LEADERBOARD_CACHE_TTL = timedelta(hours=8)
@@ -28,7 +29,9 @@ class FangraphsAPIClient:
         url = f"{self.BASE_URL}/{endpoint}"
         
         try:
+            host_rate_limiter.acquire(url)
             response = self.session.get(url, params=params, timeout=self.timeout)
+            host_rate_limiter.report(url, status_code=response.status_code, headers=response.headers)
             response.raise_for_status()
             response_data = response.json()
             if type(response_data) == dict and 'data' in response_data:
@@ -118,7 +118,8 @@ class MLBStatsAPI:
                 StatTypeEnum.STAT_SPLITS,
                 StatTypeEnum.GAME_LOG,
             ],
-            limit_hydrated_fields=True
+            limit_hydrated_fields=True,
+            lazy_stats=True,
         )
         
         return players
@@ -186,6 +187,8 @@ class MLBStatsAPI:
                 return f"\033[36m{source}\033[0m"
             if normalized == "MEMORY":
                 return f"\033[35m{source}\033[0m"
+            if normalized == "SHARED":
+                return f"\033[34m{source}\033[0m"
             return source
 
         def render_progress_tables() -> None:
@@ -1,16 +1,21 @@
 
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 from pydantic import BaseModel
 import requests
 import time
 import json
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+
+from .response_cache import ResponseCache, default_response_cache
+from ..shared.single_flight import SingleFlight
+from ..shared.rate_limiter import host_rate_limiter
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# In flight requests shared by every client in the process
+_request_single_flight = SingleFlight()
+
 class BaseMLBClient(BaseModel):
     """Base client providing shared HTTP functionality for all MLB API endpoints"""
 
@@ -19,15 +24,18 @@ class BaseMLBClient(BaseModel):
     timeout: int = 30
     rate_limit_delay: float = 0.2
     use_cache: bool = True
-    cache_ttl: int = 300  # 5 minutes default
+    cache_ttl: Optional[int] = None  # Seconds. Defaults to the client's `default_cache_ttl`
+    response_cache: Any = None  # ResponseCache. Defaults to the process wide memory + shared cache
     max_retries: int = 3
     headers: Dict[str, str] = {}
     session: Any = None
     last_response_from_cache: Optional[bool] = None
     last_response_cache_layer: str = "UNKNOWN"
 
-    # Instance variables for rate limiting and caching
-    _cache: Dict[str, Dict[str, Any]] = {}
+    # Cache TTL for the client's endpoints, overridden by each client
+    default_cache_ttl: ClassVar[int] = 300  # 5 minutes
+
+    # Instance variables for rate limiting
     _last_request_time = 0.0
     
     # -------------------
@@ -66,12 +74,55 @@ class BaseMLBClient(BaseModel):
         use_cache = cache_override if cache_override is not None else self.use_cache
         
         # Check cache first
-        if use_cache and self._is_cache_valid(cache_key):
-            print(f"Cache hit for {endpoint}")
+        if use_cache:
+            data, cache_layer = self._response_cache().get(cache_key)
+            if cache_layer is not None:
+                print(f"Cache hit for {endpoint}")
+                self.last_response_from_cache = True
+                self.last_response_cache_layer = cache_layer.value
+                return data
+        
+        # Coalesce concurrent identical requests in this process into one HTTP call
+        data, is_shared_call = _request_single_flight.do(
+            f"{self.base_url}/{cache_key}", 
+            lambda: self._fetch(endpoint=endpoint, params=params, cache_key=cache_key, use_cache=use_cache)
+        )
+        if is_shared_call:
             self.last_response_from_cache = True
-            self.last_response_cache_layer = "MEMORY"
-            return self._cache[cache_key]['data']
+            self.last_response_cache_layer = "SINGLE_FLIGHT"
+        return data
+
+    def _fetch(self, endpoint: str, params: Optional[Dict], cache_key: str, use_cache: bool) -> Dict[str, Any] | list:
+        """
+        HTTP request with rate limiting and retries. When another process on the host is already
+        fetching the same request, waits for its response in the shared cache instead.
         
+        Args:
+            endpoint: Cleaned API endpoint (without base URL)
+            params: Query parameters
+            cache_key: Cache key for the request
+            use_cache: Cache the response
+            
+        Returns:
+            JSON response data
+        """
+        response_cache = self._response_cache() if use_cache else None
+        if response_cache is not None and not response_cache.lock_shared_fill(cache_key, lease_seconds=self.timeout):
+            data, cache_layer = response_cache.wait_for_shared_fill(cache_key, timeout_seconds=self.timeout)
+            if cache_layer is not None:
+                self.last_response_from_cache = True
+                self.last_response_cache_layer = cache_layer.value
+                return data
+            # Other process failed or timed out, fetch it here
+
+        try:
+            return self._fetch_with_retries(endpoint=endpoint, params=params, cache_key=cache_key, use_cache=use_cache)
+        finally:
+            if response_cache is not None:
+                response_cache.unlock_shared_fill(cache_key)
+
+    def _fetch_with_retries(self, endpoint: str, params: Optional[Dict], cache_key: str, use_cache: bool) -> Dict[str, Any] | list:
+        """HTTP request with rate limiting and retries"""
         # Enforce rate limiting
         self._enforce_rate_limit()
         
@@ -89,7 +140,7 @@ class BaseMLBClient(BaseModel):
 
                 # Cache successful response
                 if use_cache:
-                    self._cache_response(cache_key, data)
+                    self._cache_response(cache_key, data, ttl_seconds=self._cache_ttl_for_response(endpoint, data))
                 
                 return data
                 
@@ -124,6 +175,8 @@ class BaseMLBClient(BaseModel):
         from_cache = bool(getattr(response, "from_cache", False))
         self.last_response_from_cache = from_cache
         self.last_response_cache_layer = "REQUESTS_CACHE" if from_cache else "LIVE"
+        if not from_cache:
+            host_rate_limiter.report(url, status_code=response.status_code, headers=response.headers)
 
         response.raise_for_status()
         return response.json()
@@ -136,25 +189,30 @@ class BaseMLBClient(BaseModel):
             return f"{endpoint}:{sorted_params}"
         return endpoint
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cache entry exists and is still valid"""
-        if cache_key not in self._cache:
-            return False
-        
-        cache_entry = self._cache[cache_key]
-        age = datetime.now() - cache_entry['timestamp']
-        return age < timedelta(seconds=self.cache_ttl)
+    def _response_cache(self) -> ResponseCache:
+        """Cache used by the client"""
+        return self.response_cache if self.response_cache is not None else default_response_cache()
+
+    def _cache_ttl_seconds(self) -> int:
+        """TTL for responses from this client"""
+        return self.cache_ttl if self.cache_ttl is not None else self.default_cache_ttl
     
-    def _cache_response(self, cache_key: str, data: Dict[str, Any]) -> None:
-        """Cache the response data"""
-        self._cache[cache_key] = {
-            'data': data,
-            'timestamp': datetime.now()
-        }
+    def _cache_ttl_for_response(self, endpoint: str, data: Dict[str, Any] | list) -> int:
+        """TTL for a response. Clients override this when freshness depends on the response itself (ex: game state)."""
+        return self._cache_ttl_seconds()
+    
+    def _cache_response(self, cache_key: str, data: Dict[str, Any], ttl_seconds: Optional[int] = None) -> None:
+        """Cache the response data. TTL defaults to the client's TTL"""
+        ttl_seconds = ttl_seconds if ttl_seconds is not None else self._cache_ttl_seconds()
+        self._response_cache().put(cache_key, data, ttl_seconds=ttl_seconds)
         logger.debug(f"Cached response for {cache_key}")
     
     def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between requests"""
+        """Enforce rate limiting between requests. Hosts in `host_rate_limiter` share one budget across threads."""
+        if host_rate_limiter.bucket(self.base_url) is not None:
+            host_rate_limiter.acquire(self.base_url)
+            return
+
         current_time = time.time()
         time_since_last = current_time - self._last_request_time
         
@@ -165,13 +223,17 @@ class BaseMLBClient(BaseModel):
         self._last_request_time = time.time()
     
     def clear_cache(self) -> None:
-        """Clear all cached responses"""
-        self._cache.clear()
+        """Clear all cached responses (memory and shared)"""
+        self._response_cache().clear()
         logger.info("Cache cleared")
     
-    def get_cache_stats(self) -> Dict[str, int]:
-        """Get cache statistics"""
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache statistics. Entry counts are for the memory cache, 
+        hits/misses/evictions/bytes are under `memory` and `shared` (None when disabled)."""
+        stats = self._response_cache().stats()
         return {
-            'total_entries': len(self._cache),
-            'valid_entries': sum(1 for key in self._cache.keys() if self._is_cache_valid(key))
+            'total_entries': stats['memory']['entries'],
+            'valid_entries': stats['memory']['valid_entries'],
+            'cache_ttl': self._cache_ttl_seconds(),
+            **stats,
         }
\ No newline at end of file
@@ -1,15 +1,88 @@
-from datetime import date as dt_date, datetime, timedelta
-from typing import Any, Optional
+from collections import OrderedDict
+from datetime import date as dt_date, datetime, timedelta, timezone
+from threading import Lock
+from typing import Any, Callable, Optional, ClassVar
 from zoneinfo import ZoneInfo
+import json
 
 from ..base_client import BaseMLBClient
 from ..models.games.schedule import Schedule, GameScheduled
 from ..models.teams.team import ShowdownTeam
 
+# Extracted team boxscores of recently polled games, keyed by (game_pk, side).
+# Repeat polls of a game only rebuild a team's section when its fingerprint changed.
+_MAX_TEAM_BOXSCORE_SECTIONS = 128
+_team_boxscore_sections: OrderedDict[tuple[int, str], tuple[str, dict]] = OrderedDict()
+_team_boxscore_sections_lock = Lock()
+
 
 class GamesClient(BaseMLBClient):
     """Client for game-related MLB Stats API endpoints."""
 
+    default_cache_ttl: ClassVar[int] = 60  # 1 minute, live game data
+
+    # Cache TTL by `abstractGameState`, used unless `cache_ttl` is set explicitly
+    final_game_cache_ttl: ClassVar[int] = 60 * 60 * 24 * 30  # 30 days, final games don't change
+    preview_game_cache_ttl: ClassVar[int] = 60 * 60 * 3  # 3 hours, capped at the time until first pitch
+    live_game_cache_ttl: ClassVar[int] = 5  # 5 seconds
+
+    # -------------------------
+    # CACHE TTL
+    # -------------------------
+
+    def _cache_ttl_for_response(self, endpoint: str, data: dict | list) -> int:
+        """TTL based on the state of the game(s) in the response. 
+        Schedules use the shortest TTL of their games, so one live game keeps the whole schedule fresh."""
+        if self.cache_ttl is not None or not isinstance(data, dict):
+            return super()._cache_ttl_for_response(endpoint, data)
+
+        if endpoint.endswith("/feed/live"):
+            game_data = data.get("gameData", {})
+            return self._game_state_cache_ttl(
+                abstract_game_state=(game_data.get("status") or {}).get("abstractGameState"),
+                game_datetime=(game_data.get("datetime") or {}).get("dateTime"),
+            )
+        
+        if endpoint == "schedule":
+            games = [game for date_block in data.get("dates", []) for game in date_block.get("games", [])]
+            if len(games) == 0:
+                return self.default_cache_ttl
+            return min(
+                self._game_state_cache_ttl(
+                    abstract_game_state=(game.get("status") or {}).get("abstractGameState"),
+                    game_datetime=game.get("gameDate"),
+                )
+                for game in games
+            )
+
+        return super()._cache_ttl_for_response(endpoint, data)
+
+    def _game_state_cache_ttl(self, abstract_game_state: Optional[str], game_datetime: Optional[str]) -> int:
+        """Cache TTL for a game.
+
+        Args:
+            abstract_game_state: MLB API abstract game state (Preview, Live, Final).
+            game_datetime: Scheduled first pitch as an ISO UTC string.
+
+        Returns:
+            TTL in seconds. Unknown states use the client's default TTL.
+        """
+        match abstract_game_state:
+            case "Final":
+                return self.final_game_cache_ttl
+            case "Live":
+                return self.live_game_cache_ttl
+            case "Preview":
+                try:
+                    first_pitch = datetime.fromisoformat(game_datetime.replace("Z", "+00:00"))
+                    seconds_until_first_pitch = int((first_pitch - datetime.now(timezone.utc)).total_seconds())
+                except (AttributeError, ValueError):
+                    return self.default_cache_ttl
+                # GAMES PAST THEIR START TIME (EX: DELAYS) CAN GO LIVE ANY MOMENT
+                return min(self.preview_game_cache_ttl, max(seconds_until_first_pitch, self.default_cache_ttl))
+            case _:
+                return self.default_cache_ttl
+
     # -------------------------
     # BOXSCORE / GAME DETAIL
     # -------------------------
@@ -20,7 +93,8 @@ class GamesClient(BaseMLBClient):
         Uses the MLB Stats API ``/game/{gamePk}/feed/live`` endpoint which
         provides ``gameData``, ``liveData.boxscore`` and ``liveData.linescore``
         in one call, then distills the ~200 KB response down to a compact dict
-        suitable for the frontend boxscore view.
+        suitable for the frontend boxscore view. Team sections are reused from
+        the previous poll of the game when nothing in them changed.
         """
         raw = self._make_request(f"../v1.1/game/{game_pk}/feed/live")
 
@@ -225,8 +299,17 @@ class GamesClient(BaseMLBClient):
                 "official_date": game_data.get("datetime", {}).get("officialDate"),
             },
             "teams": {
-                "away": _extract_team_boxscore("away"),
-                "home": _extract_team_boxscore("home"),
+                side: self._team_boxscore_section(
+                    game_pk=game_pk,
+                    side=side,
+                    fingerprint=self._team_boxscore_fingerprint(
+                        team_box=boxscore.get("teams", {}).get(side, {}),
+                        team_raw=game_data.get("teams", {}).get(side, {}),
+                        game_status=game_data.get("status", {}),
+                    ),
+                    build=_extract_team_boxscore,
+                )
+                for side in ("away", "home")
             },
             "linescore": {
                 "current_inning": linescore_raw.get("currentInning"),
@@ -280,6 +363,43 @@ class GamesClient(BaseMLBClient):
             "most_recent_play": _extract_most_recent_play(plays_raw),
         }
 
+    def _team_boxscore_fingerprint(self, team_box: dict, team_raw: dict, game_status: dict) -> str:
+        """Cheap summary of everything a team's boxscore section is built from. 
+        Player stat lines roll up into `teamStats`, substitutions change the batter/pitcher lists and positions."""
+        players_dict = team_box.get("players", {})
+        position_counts = [len((players_dict.get(f"ID{player_id}") or {}).get("allPositions") or []) for player_id in team_box.get("batters", [])]
+        return json.dumps([
+            team_box.get("teamStats"), team_box.get("battingOrder"), team_box.get("batters"), team_box.get("pitchers"),
+            position_counts, team_box.get("info"), team_box.get("note"), team_raw.get("record"), game_status.get("statusCode"),
+        ], sort_keys=True, default=str)
+
+    def _team_boxscore_section(self, game_pk: int, side: str, fingerprint: str, build: Callable[[str], dict]) -> dict:
+        """Team boxscore section from the previous poll of the game, rebuilt only when its fingerprint changed.
+
+        Args:
+            game_pk: Game id.
+            side: Team side (away, home).
+            fingerprint: Fingerprint of the team's raw boxscore data.
+            build: Builds the section for a side.
+
+        Returns:
+            Team boxscore section.
+        """
+        key = (game_pk, side)
+        with _team_boxscore_sections_lock:
+            cached = _team_boxscore_sections.get(key, None)
+            if cached is not None and cached[0] == fingerprint:
+                _team_boxscore_sections.move_to_end(key)
+                return cached[1]
+
+        section = build(side)
+        with _team_boxscore_sections_lock:
+            _team_boxscore_sections[key] = (fingerprint, section)
+            _team_boxscore_sections.move_to_end(key)
+            while len(_team_boxscore_sections) > _MAX_TEAM_BOXSCORE_SECTIONS:
+                _team_boxscore_sections.popitem(last=False)
+        return section
+
     def _resolve_target_date(self, date_str: Optional[str], tz_name: str) -> dt_date:
         if date_str:
             return datetime.strptime(date_str, "%Y-%m-%d").date()
@@ -3,10 +3,12 @@ from pprint import pprint
 from ..base_client import BaseMLBClient
 from ..models.leagues.league import League, SportEnum, LeagueEnum
 from ..models.leagues.standings import StandingsType, Standings
-from typing import Optional, List
+from typing import Optional, List, ClassVar
 
 class LeaguesClient(BaseMLBClient):
     """Client for league related endpoints - inherits all base functionality"""
+
+    default_cache_ttl: ClassVar[int] = 60 * 15  # 15 minutes, standings
     
     def get_leagues(self, sport_id:int = 1, season: Optional[int] = None, seasons: Optional[List[int]] = None, abbreviations: Optional[List[str]] = None, onlyActive: bool = True) -> List[League]:
         """Get league information by ID
@@ -2,11 +2,13 @@ from pprint import pprint
 
 from ..base_client import BaseMLBClient
 from ..models.metadata.metadata import SituationCode
-from typing import Optional, List
+from typing import Optional, List, ClassVar
 
 class MetadataClient(BaseMLBClient):
     """Client for metadata related endpoints - inherits all base functionality"""
 
+    default_cache_ttl: ClassVar[int] = 60 * 60 * 24  # 1 day
+
     def get_situation_codes(self) -> List[SituationCode]:
         """Get list of situation codes (ex: Home/Away, vs LHP/RHP, etc)"""
 
@@ -1,11 +1,12 @@
 """Player and person-related API endpoints"""
 
 from pprint import pprint
-from time import sleep
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, ClassVar
 from datetime import datetime
 from ..base_client import BaseMLBClient
+from ...shared.fetch_scheduler import FetchScheduler
 from ..models.person import Players, Player, FreeAgent, StatTypeEnum
+from ..models.stats.stats import LAZY_STATS_CONTEXT_KEY
 from ..models.leagues.league import LeagueListEnum
 from ...card.stats.stats_period import StatsPeriod, StatsPeriodYearType, StatsPeriodType, PlayerType
 import json
@@ -49,6 +50,8 @@ _STAT_KEYS = [
 class PeopleClient(BaseMLBClient):
     """Client for person/player related endpoints - inherits all base functionality"""
 
+    default_cache_ttl: ClassVar[int] = 60 * 5  # 5 minutes, stats change during games
+
     # -----------------------
     # STANDARD PLAYERS
     # -----------------------
@@ -144,7 +147,8 @@ class PeopleClient(BaseMLBClient):
                 league_list=league_list,
                 stat_types=types if types else None,
                 limit_hydrated_fields=True,
-                additional_sit_codes=additional_sit_codes
+                additional_sit_codes=additional_sit_codes,
+                lazy_stats=True,
             )
             if len(players.players) > 0:
                 return players.players[0]
@@ -154,7 +158,7 @@ class PeopleClient(BaseMLBClient):
             print(f"Error fetching player with ID {player_id}: {e}")
             raise e
 
-    def get_players(self, player_ids: List[int], include_stats: bool = False, type: Optional[PlayerType] = None, seasons: Optional[List[int]] = None, league_list: Optional[LeagueListEnum] = None, stat_types: Optional[List[StatTypeEnum]] = None, limit_hydrated_fields: Optional[bool] = False, additional_sit_codes: Optional[List[str]] = None) -> Players:
+    def get_players(self, player_ids: List[int], include_stats: bool = False, type: Optional[PlayerType] = None, seasons: Optional[List[int]] = None, league_list: Optional[LeagueListEnum] = None, stat_types: Optional[List[StatTypeEnum]] = None, limit_hydrated_fields: Optional[bool] = False, additional_sit_codes: Optional[List[str]] = None, max_in_flight: int = 4, lazy_stats: bool = False) -> Players:
         """Get multiple players by their IDs. Results in a Players object which contains a list of Player objects.
         
         Args:
@@ -166,6 +170,8 @@ class PeopleClient(BaseMLBClient):
             stat_types: Optional list of StatTypeEnum to specify which stat types to include if include_stats is True
             limit_hydrated_fields: If True, limits the fields returned in the stats hydration to only those necessary for card generation (basic stats and sabermetrics), which can improve performance when fetching large numbers of players with stats.
             additional_sit_codes: Optional list of additional situation codes to include in the stats hydration (beyond the default of SP/RP for pitchers), which can be useful for certain card types that require specific splits. Only applicable if include_stats is True.
+            max_in_flight: Max number of 10 player chunk requests in flight at the same time.
+            lazy_stats: Keep heavy stat splits (game logs, stat splits, rankings) as raw JSON until they're used. See `StatGroup.get_splits`.
 
         Returns:
             Players object containing a list of Player objects
@@ -173,58 +179,71 @@ class PeopleClient(BaseMLBClient):
 
         # MLB API allows up to 10 player IDs per request, so we will chunk the request into multiple calls if needed.
         player_id_chunks = [player_ids[i:i + 10] for i in range(0, len(player_ids), 10)]
-        all_players: list[Player] = []
-        for index, chunk in enumerate(player_id_chunks):
+        hydrations = [
+            'currentTeam',
+            'rookieSeasons',
+            'awards',
+            'xrefId',
+        ]
+        fields = None
+        if include_stats:
+            # Defaults
+            hydrations.append('team(league)')
 
+            # Add seasons
+            seasons_hydration = ""
+            if seasons:
+                seasons_list_str = ",".join([str(season) for season in seasons])
+                seasons_hydration = f",seasons=[{seasons_list_str}]" if len(seasons) > 0 else ""
+
+            stat_types = stat_types if stat_types else ([StatTypeEnum.SABERMETRICS] if league_list and 'milb' in league_list.value.lower() else [StatTypeEnum.SABERMETRICS, StatTypeEnum.RANKINGS_BY_YEAR])
+            pitcher_stat_groups = ['pitching', 'fielding']
+            hitter_stat_groups = ['hitting', 'fielding']
+            league_list_hydration = f",leagueListId={league_list.value}" if league_list else ""
+            is_milb = league_list and 'milb' in league_list.value.lower()
+            sit_codes = ['sp', 'rp'] if type == PlayerType.PITCHER else []
+            if additional_sit_codes:
+                sit_codes.extend(additional_sit_codes)
+            sit_code_str = f",sitCodes=[{','.join(sit_codes)}]" if sit_codes and len(sit_codes) > 0 and not is_milb else ''
+            if type:
+                match type:
+                    case PlayerType.PITCHER:
+                        hydrations.append(f'stats(team(league),group=[{",".join(pitcher_stat_groups)}],type=[{",".join([st.value for st in stat_types])}]{seasons_hydration}{league_list_hydration}{sit_code_str})')
+                    case PlayerType.HITTER:
+                        hydrations.append(f'stats(team(league),group=[{",".join(hitter_stat_groups)}],type=[{",".join([st.value for st in stat_types])}]{seasons_hydration}{league_list_hydration}{sit_code_str})')
+            else:
+                unique_groups = set(pitcher_stat_groups + hitter_stat_groups)
+                hydrations.append(f'stats(team(league),group=[{",".join(unique_groups)}],type=[{",".join([st.value for st in stat_types])}]{seasons_hydration}{league_list_hydration}{sit_code_str})')
+
+            if limit_hydrated_fields:
+                fields = ','.join(_PLAYER_FIELDS + _STAT_KEYS)
+
+        def fetch_chunk(chunk: List[int]) -> list[dict]:
             params = {
                 'personIds': ",".join([str(pid) for pid in chunk]),
             }
-            hydrations = [
-                'currentTeam',
-                'rookieSeasons',
-                'awards',
-                'xrefId',
-            ]
-            if include_stats:
-                # Defaults
-                hydrations.append('team(league)')
-
-                # Add seasons
-                if seasons:
-                    seasons_list_str = ",".join([str(season) for season in seasons])
-                    seasons_hydration = f",seasons=[{seasons_list_str}]" if len(seasons) > 0 else ""
-
-                stat_types = stat_types if stat_types else ([StatTypeEnum.SABERMETRICS] if league_list and 'milb' in league_list.value.lower() else [StatTypeEnum.SABERMETRICS, StatTypeEnum.RANKINGS_BY_YEAR])
-                pitcher_stat_groups = ['pitching', 'fielding']
-                hitter_stat_groups = ['hitting', 'fielding']
-                league_list_hydration = f",leagueListId={league_list.value}" if league_list else ""
-                is_milb = league_list and 'milb' in league_list.value.lower()
-                sit_codes = ['sp', 'rp'] if type == PlayerType.PITCHER else []
-                if additional_sit_codes:
-                    sit_codes.extend(additional_sit_codes)
-                sit_code_str = f",sitCodes=[{','.join(sit_codes)}]" if sit_codes and len(sit_codes) > 0 and not is_milb else ''
-                if type:
-                    match type:
-                        case PlayerType.PITCHER:
-                            hydrations.append(f'stats(team(league),group=[{",".join(pitcher_stat_groups)}],type=[{",".join([st.value for st in stat_types])}]{seasons_hydration}{league_list_hydration}{sit_code_str})')
-                        case PlayerType.HITTER:
-                            hydrations.append(f'stats(team(league),group=[{",".join(hitter_stat_groups)}],type=[{",".join([st.value for st in stat_types])}]{seasons_hydration}{league_list_hydration}{sit_code_str})')
-                else:
-                    unique_groups = set(pitcher_stat_groups + hitter_stat_groups)
-                    hydrations.append(f'stats(team(league),group=[{",".join(unique_groups)}],type=[{",".join([st.value for st in stat_types])}]{seasons_hydration}{league_list_hydration}{sit_code_str})')
-
-                if limit_hydrated_fields:
-                    params['fields'] = ','.join(_PLAYER_FIELDS + _STAT_KEYS)
-
+            if fields:
+                params['fields'] = fields
             params['hydrate'] = ','.join(hydrations)
             data = self._make_request('people', params)
-            
-            all_players.extend(data.get('people', []))
+            return data.get('people', [])
+
+        validation_context = { LAZY_STATS_CONTEXT_KEY: lazy_stats }
+        if len(player_id_chunks) <= 1:
+            return Players.model_validate({ 'people': [player for chunk in player_id_chunks for player in fetch_chunk(chunk)] }, context=validation_context)
 
-            if index > 0:  # Add a short delay between requests to avoid hitting rate limits
-                sleep(0.15)
+        # FETCH CHUNKS CONCURRENTLY. REQUESTS SHARE THE STATS API BUDGET IN `host_rate_limiter`, 
+        # AND A FAILED CHUNK IS RETRIED ON ITS OWN (404s EXCLUDED)
+        chunk_results: list[list[dict]] = [[] for _ in player_id_chunks]
+        scheduler = FetchScheduler(max_in_flight=min(max_in_flight, len(player_id_chunks)), max_retries=2, is_retryable=lambda error: 'not found' not in str(error).lower())
+        for (index, _), people, error in scheduler.run(jobs=enumerate(player_id_chunks), fetch=lambda job: fetch_chunk(job[1])):
+            if error is not None:
+                raise error
+            chunk_results[index] = people
 
-        return Players(people=all_players)
+        # KEEP THE INPUT ORDER
+        all_players = [player for people in chunk_results for player in people]
+        return Players.model_validate({ 'people': all_players }, context=validation_context)
 
     # -----------------------
     # FREE AGENTS
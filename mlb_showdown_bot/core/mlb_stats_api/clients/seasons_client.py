@@ -2,11 +2,13 @@ from pprint import pprint
 
 from ..models.seasons.season import Season
 from ..base_client import BaseMLBClient
-from typing import Optional, List
+from typing import Optional, List, ClassVar
 
 class SeasonsClient(BaseMLBClient):
     """Client for season related endpoints - inherits all base functionality"""
 
+    default_cache_ttl: ClassVar[int] = 60 * 60 * 24  # 1 day
+
     def get_seasons(self, sport_id: int = 1, league_id: Optional[int] = None, season: Optional[int] = None) -> List[Season]:
         """Get list of seasons for a given sport"""
 
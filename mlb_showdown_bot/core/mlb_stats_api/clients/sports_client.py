@@ -2,11 +2,13 @@ from pprint import pprint
 
 from ..base_client import BaseMLBClient
 from ..models.sports.sport import Sport, SportEnum
-from typing import Optional, List
+from typing import Optional, List, ClassVar
 
 class SportsClient(BaseMLBClient):
     """Client for sports related endpoints - inherits all base functionality"""
 
+    default_cache_ttl: ClassVar[int] = 60 * 60 * 24  # 1 day
+
     def get_sports(self, season_id: Optional[int] = None, onlyActive: bool = True) -> List[Sport]:
         """Get list of sports (ex: MLB, INT, NLB)"""
 
@@ -4,11 +4,13 @@ from ..models.stats.leaders import LeadersGroup
 from ..models.stats.enums import LeaderLeaderStatEnum, StatGroupEnum, StatTypeEnum
 from ..models.stats.enums import PlayerPoolEnum
 from ..base_client import BaseMLBClient
-from typing import Optional, List
+from typing import Optional, List, ClassVar
 
 class StatsClient(BaseMLBClient):
     """Client for stats related endpoints - inherits all base functionality"""
 
+    default_cache_ttl: ClassVar[int] = 60 * 5  # 5 minutes, leaders change during games
+
     def get_leaders(self, sport_id: int = 1, season: int = None, categories: List[LeaderLeaderStatEnum] = None, statGroups: List[StatGroupEnum] = None, playerPool: PlayerPoolEnum = None, limit: Optional[int] = None, days_back: Optional[int] = None) -> List[LeadersGroup]:
         """Get list of leaders for a given sport and season"""
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, ClassVar
 from ..base_client import BaseMLBClient
 from ..models.teams.team import Team
 from ..models.teams.roster import Roster, RosterTypeEnum
@@ -7,6 +7,8 @@ from ..models.teams.roster import Roster, RosterTypeEnum
 class TeamsClient(BaseMLBClient):
     """Client for team related endpoints - inherits all base functionality"""
 
+    default_cache_ttl: ClassVar[int] = 60 * 60  # 1 hour, rosters change with daily transactions
+
     # -------------------------
     # TEAMS LIST
     # -------------------------
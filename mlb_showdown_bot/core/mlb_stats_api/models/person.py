@@ -78,7 +78,7 @@ class Player(Person):
         for stats_group in self.stats:
             if stats_group.group.display_name == group_type.value and stats_group.type.display_name in [t.value for t in types]:
 
-                for split in stats_group.splits:
+                for split in stats_group.get_splits() or []:
                     is_included = group_type == StatTypeEnum.CAREER or int(split.season) in seasons
                     if is_included:
                         final_list.append(split)
@@ -88,6 +88,11 @@ class Player(Person):
         
         return final_list
     
+    def load_stats(self) -> None:
+        """Validate any splits deferred in lazy mode (ex: before dumping the model)"""
+        for stats_group in self.stats or []:
+            stats_group.get_splits()
+
     @property
     def fangraphs_id(self) -> Optional[int]:
         """Retrieve the Fangraphs ID from xrefIds if available"""
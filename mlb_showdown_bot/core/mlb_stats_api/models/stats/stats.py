@@ -1,11 +1,24 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, ValidationInfo, model_validator
 from typing import Any, Dict, Optional, List
 
 from ..teams.team import Team
 from ..sports.sport import Sport
-from .enums import GameTypeEnum
+from .enums import GameTypeEnum, StatTypeEnum
 from ..generic import DisplayNameGeneric
 
+# VALIDATION CONTEXT KEY FOR LAZY MODE (EX: `Players.model_validate(data, context={LAZY_STATS_CONTEXT_KEY: True})`)
+LAZY_STATS_CONTEXT_KEY = 'lazy_stats'
+
+# STAT TYPES WITH LARGE SPLIT LISTS. IN LAZY MODE THEIR SPLITS STAY RAW JSON UNTIL `get_splits` IS CALLED.
+LAZY_STAT_TYPES = {
+    StatTypeEnum.GAME_LOG.value,
+    StatTypeEnum.STAT_SPLITS.value,
+    StatTypeEnum.CAREER_STAT_SPLITS.value,
+    StatTypeEnum.RANKINGS_BY_YEAR.value,
+    StatTypeEnum.PLAY_LOG.value,
+    StatTypeEnum.PITCH_LOG.value,
+}
+
 
 class StatGroup(BaseModel):
     type: DisplayNameGeneric
@@ -13,6 +26,35 @@ class StatGroup(BaseModel):
     exemptions: Optional[List] = None
     splits: Optional[List['StatSplit']] = None
 
+    # RAW SPLITS FOR LAZY GROUPS, VALIDATED ON FIRST `get_splits`
+    _raw_splits: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+
+    @model_validator(mode='wrap')
+    @classmethod
+    def defer_heavy_splits(cls, data: Any, handler, info: ValidationInfo) -> 'StatGroup':
+        """In lazy mode, skip validating splits for `LAZY_STAT_TYPES` until they're used"""
+        is_lazy = (info.context or {}).get(LAZY_STATS_CONTEXT_KEY, False)
+        if not is_lazy or not isinstance(data, dict) or not data.get('splits'):
+            return handler(data)
+        if (data.get('type') or {}).get('displayName', None) not in LAZY_STAT_TYPES:
+            return handler(data)
+
+        stat_group = handler({ key: value for key, value in data.items() if key != 'splits' })
+        stat_group._raw_splits = data['splits']
+        return stat_group
+
+    @property
+    def is_loaded(self) -> bool:
+        """False while splits are still raw JSON"""
+        return self._raw_splits is None
+
+    def get_splits(self) -> Optional[List['StatSplit']]:
+        """Splits for the group, validating deferred splits the first time"""
+        if self._raw_splits is not None:
+            self.splits = _STAT_SPLIT_LIST_ADAPTER.validate_python(self._raw_splits)
+            self._raw_splits = None
+        return self.splits
+
 
 class StatSplit(BaseModel):
     model_config = {"populate_by_name": True}
@@ -36,4 +78,5 @@ class Split(BaseModel):
     sort_order: Optional[int] = Field(None, alias='sortOrder')
 
 
-StatSplit.model_rebuild()
\ No newline at end of file
+StatSplit.model_rebuild()
+_STAT_SPLIT_LIST_ADAPTER = TypeAdapter(List[StatSplit])
@@ -0,0 +1,440 @@
+import json
+import logging
+import os
+import sqlite3
+import zlib
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from time import sleep, time
+from typing import Any, Optional
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------------
+# RESPONSE CACHE
+# ------------------------------------------------------------------------
+# TWO TIERS FOR MLB STATS API RESPONSES:
+#   1. MEMORY: IN-PROCESS LRU OF PARSED RESPONSES, BOUNDED BY THE SIZE OF THEIR JSON
+#   2. SHARED: SQLITE FILE USED BY EVERY PROCESS ON THE HOST (EX: GUNICORN WORKERS), BOUNDED THE SAME WAY
+# A SHARED HIT IS PROMOTED TO MEMORY WITH THE SAME EXPIRATION.
+# FILL LOCKS IN THE SHARED TIER LET ONE PROCESS FETCH A RESPONSE WHILE THE OTHERS WAIT FOR IT.
+
+DEFAULT_MEMORY_MAX_BYTES = 64 * 1024 ** 2 # 64 MB
+DEFAULT_SHARED_MAX_BYTES = 512 * 1024 ** 2 # 512 MB
+SHARED_BUSY_TIMEOUT_SECONDS = 5 # WRITES WAIT THIS LONG FOR OTHER PROCESSES. READS NEVER WAIT.
+
+
+class CacheLayer(str, Enum):
+    MEMORY = 'MEMORY'
+    SHARED = 'SHARED'
+
+
+class MemoryResponseCache:
+    """In-process LRU of parsed responses. Least recently used entries are evicted once the JSON size of
+    all entries is over `max_bytes`. Expired entries are dropped when read or when they reach the LRU end."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict() # KEY -> (DATA, EXPIRES AT, SIZE)
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached data for the key, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None or entry[1] <= time():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, data: Any, size: int, expires_at: float) -> None:
+        """Add or replace the key. Data larger than the whole budget isn't cached."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (data, expires_at, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            now = time()
+            return {
+                'entries': len(self._entries),
+                'valid_entries': sum(1 for _, expires_at, _ in self._entries.values() if expires_at > now),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        """Caller holds the lock"""
+        _, _, size = self._entries.pop(key)
+        self.total_bytes -= size
+
+
+class SharedResponseCache:
+    """Responses stored zlib compressed in a SQLite file, shared by every process on the host.
+
+    Expired entries are deleted in sweeps that run at most every `sweep_interval_seconds` (or every
+    `sweep_every_writes` writes), which also evict least recently used entries until the file is under `max_bytes`.
+    Reads are read only. Last access times of hits are batched in memory and written with the next write, or
+    every `touch_flush_every` hits / `touch_flush_interval_seconds`, skipping the flush when another process is writing.
+    Busy database errors count as a miss. Other SQLite errors (ex: read only file system) disable the tier instead of failing requests.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_SHARED_MAX_BYTES, sweep_interval_seconds: float = 300.0, sweep_every_writes: int = 500, touch_flush_every: int = 200, touch_flush_interval_seconds: float = 60.0) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.sweep_every_writes = sweep_every_writes
+        self.touch_flush_every = touch_flush_every
+        self.touch_flush_interval_seconds = touch_flush_interval_seconds
+        self.is_disabled = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._last_sweep = time()
+        self._writes_since_sweep = 0
+        self._pending_touches: dict[str, float] = {} # KEY -> LAST ACCESS NOT YET WRITTEN
+        self._last_touch_flush = time()
+
+    def get(self, key: str) -> Optional[tuple[str, float]]:
+        """(JSON text, expires at) for the key, or None when missing or expired"""
+        if self.is_disabled:
+            return None
+        now = time()
+        with self._lock:
+            try:
+                db = self._db()
+                row = db.execute('SELECT value, expires_at FROM response WHERE key = ? AND expires_at > ?', (key, now)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+            except sqlite3.Error as e:
+                self._handle_error(e)
+                return None
+            self.hits += 1
+
+            # LAST ACCESS ONLY ORDERS LRU EVICTION, SO IT'S WRITTEN IN BATCHES INSTEAD OF ON EVERY HIT
+            self._pending_touches[key] = now
+            if len(self._pending_touches) >= self.touch_flush_every or now - self._last_touch_flush >= self.touch_flush_interval_seconds:
+                try:
+                    self._flush_touches(is_blocking=False)
+                except sqlite3.Error as e:
+                    self._handle_error(e)
+        return zlib.decompress(row[0]).decode('utf-8'), row[1]
+
+    def put(self, key: str, json_text: str, expires_at: float) -> None:
+        """Add or replace the key"""
+        if self.is_disabled:
+            return
+        value = zlib.compress(json_text.encode('utf-8'), 1)
+        with self._lock:
+            try:
+                db = self._db()
+                self._pending_touches.pop(key, None)
+                db.execute('INSERT OR REPLACE INTO response (key, value, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)', (key, value, len(value), expires_at, time()))
+                db.commit()
+                self._flush_touches()
+            except sqlite3.Error as e:
+                self._handle_error(e)
+                return
+            self._writes_since_sweep += 1
+        if time() - self._last_sweep >= self.sweep_interval_seconds or self._writes_since_sweep >= self.sweep_every_writes:
+            self.sweep()
+
+    def sweep(self) -> None:
+        """Delete expired entries, then least recently used entries until the file is under `max_bytes`"""
+        if self.is_disabled:
+            return
+        now = time()
+        with self._lock:
+            try:
+                self._flush_touches()
+                db = self._db()
+                num_removed = db.execute('DELETE FROM response WHERE expires_at <= ?', (now,)).rowcount
+                db.execute('DELETE FROM fill_lock WHERE expires_at <= ?', (now,))
+
+                # LRU EVICTION
+                total_bytes = db.execute('SELECT COALESCE(SUM(size), 0) FROM response').fetchone()[0]
+                keys_to_remove = []
+                if self.max_bytes and total_bytes > self.max_bytes:
+                    for key, size in db.execute('SELECT key, size FROM response ORDER BY last_access'):
+                        if total_bytes <= self.max_bytes:
+                            break
+                        keys_to_remove.append(key)
+                        total_bytes -= size
+                db.executemany('DELETE FROM response WHERE key = ?', [(key,) for key in keys_to_remove])
+                db.commit()
+            except sqlite3.Error as e:
+                self._handle_error(e)
+                return
+            self.evictions += num_removed + len(keys_to_remove)
+            self._last_sweep = now
+            self._writes_since_sweep = 0
+
+    def try_lock(self, key: str, lease_seconds: float) -> bool:
+        """Take the fill lock for the key, so other processes wait for this one's response.
+        Locks expire after `lease_seconds` in case the holder dies.
+
+        Returns:
+            True if the lock was taken (or the tier is unavailable), False if another process holds it.
+        """
+        if self.is_disabled:
+            return True
+        now = time()
+        with self._lock:
+            try:
+                db = self._db()
+                num_locked = db.execute("""
+                    INSERT INTO fill_lock (key, owner, expires_at) VALUES (?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                    WHERE fill_lock.expires_at <= ?
+                """, (key, os.getpid(), now + lease_seconds, now)).rowcount
+                db.commit()
+            except sqlite3.Error as e:
+                self._handle_error(e)
+                return True
+        return num_locked > 0
+
+    def is_locked(self, key: str) -> bool:
+        """True while another process holds an unexpired fill lock for the key"""
+        if self.is_disabled:
+            return False
+        with self._lock:
+            try:
+                row = self._db().execute('SELECT 1 FROM fill_lock WHERE key = ? AND expires_at > ?', (key, time())).fetchone()
+            except sqlite3.Error as e:
+                self._handle_error(e)
+                return False
+        return row is not None
+
+    def unlock(self, key: str) -> None:
+        """Release the fill lock if this process holds it"""
+        if self.is_disabled:
+            return
+        with self._lock:
+            try:
+                db = self._db()
+                db.execute('DELETE FROM fill_lock WHERE key = ? AND owner = ?', (key, os.getpid()))
+                db.commit()
+            except sqlite3.Error as e:
+                self._handle_error(e)
+
+    def clear(self) -> None:
+        """Delete every entry. Clears the cache for all processes on the host."""
+        if self.is_disabled:
+            return
+        with self._lock:
+            try:
+                db = self._db()
+                db.execute('DELETE FROM response')
+                db.commit()
+                self._pending_touches.clear()
+            except sqlite3.Error as e:
+                self._handle_error(e)
+
+    def stats(self) -> dict[str, int]:
+        entries, valid_entries, total_bytes = 0, 0, 0
+        if not self.is_disabled:
+            with self._lock:
+                try:
+                    entries, valid_entries, total_bytes = self._db().execute(
+                        'SELECT COUNT(*), COALESCE(SUM(expires_at > ?), 0), COALESCE(SUM(size), 0) FROM response', (time(),)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    self._handle_error(e)
+        return {
+            'entries': entries,
+            'valid_entries': valid_entries,
+            'bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'is_disabled': self.is_disabled,
+        }
+
+    def _db(self) -> sqlite3.Connection:
+        """Connection for this process. Caller holds the lock."""
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+
+        # CONNECTIONS CAN'T BE SHARED WITH FORKED WORKER PROCESSES (EX: GUNICORN PRELOAD)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=SHARED_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        self._connection_pid = os.getpid()
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS response (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS response_last_access ON response (last_access)')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS fill_lock (key TEXT PRIMARY KEY, owner INTEGER NOT NULL, expires_at REAL NOT NULL)')
+        self._connection.commit()
+        return self._connection
+
+    def _flush_touches(self, is_blocking: bool = True) -> None:
+        """Write batched last access times. Caller holds the lock.
+
+        Args:
+            is_blocking: Wait up to the connection's busy timeout for other writers. When False (read path),
+                a busy database skips the flush and keeps the touches for the next one.
+        """
+        if len(self._pending_touches) == 0:
+            return
+        db = self._db()
+        touches = [(last_access, key) for key, last_access in self._pending_touches.items()]
+        if not is_blocking:
+            db.execute('PRAGMA busy_timeout = 0')
+        try:
+            db.executemany('UPDATE response SET last_access = MAX(last_access, ?) WHERE key = ?', touches)
+            db.commit()
+        except sqlite3.Error as e:
+            if db.in_transaction:
+                db.rollback()
+            if not self._is_busy_error(e):
+                raise
+            logger.debug(f"Skipped shared MLB API response cache last access flush: {e}")
+            # DON'T LET TOUCHES PILE UP WHILE THE FILE STAYS BUSY, THEY ONLY AFFECT EVICTION ORDER
+            if len(self._pending_touches) >= self.touch_flush_every * 10:
+                self._pending_touches.clear()
+            return
+        finally:
+            if not is_blocking:
+                db.execute(f'PRAGMA busy_timeout = {SHARED_BUSY_TIMEOUT_SECONDS * 1000}')
+        self._pending_touches.clear()
+        self._last_touch_flush = time()
+
+    def _is_busy_error(self, error: sqlite3.Error) -> bool:
+        return 'locked' in str(error).lower() or 'busy' in str(error).lower()
+
+    def _handle_error(self, error: sqlite3.Error) -> None:
+        """Busy databases are treated as a miss. Anything else disables the tier."""
+        if self._is_busy_error(error):
+            logger.debug(f"Shared MLB API response cache busy: {error}")
+            return
+        logger.warning(f"Disabling shared MLB API response cache at {self.path}: {error}")
+        self.is_disabled = True
+
+
+class ResponseCache:
+    """Memory tier in front of an optional shared tier"""
+
+    def __init__(self, memory: MemoryResponseCache, shared: Optional[SharedResponseCache] = None) -> None:
+        self.memory = memory
+        self.shared = shared
+
+    def get(self, key: str) -> tuple[Optional[Any], Optional[CacheLayer]]:
+        """Cached data for the key and the layer it came from. (None, None) on a miss."""
+        data = self.memory.get(key)
+        if data is not None:
+            return data, CacheLayer.MEMORY
+        if self.shared is None:
+            return None, None
+
+        shared_entry = self.shared.get(key)
+        if shared_entry is None:
+            return None, None
+        json_text, expires_at = shared_entry
+        data = json.loads(json_text)
+        self.memory.put(key=key, data=data, size=len(json_text), expires_at=expires_at)
+        return data, CacheLayer.SHARED
+
+    def put(self, key: str, data: Any, ttl_seconds: float) -> None:
+        """Cache data in both tiers for `ttl_seconds`"""
+        if ttl_seconds <= 0:
+            return
+        json_text = json.dumps(data, separators=(',', ':'))
+        expires_at = time() + ttl_seconds
+        self.memory.put(key=key, data=data, size=len(json_text), expires_at=expires_at)
+        if self.shared is not None:
+            self.shared.put(key=key, json_text=json_text, expires_at=expires_at)
+
+    def lock_shared_fill(self, key: str, lease_seconds: float) -> bool:
+        """True when this process should fetch the key. False when another process on the host is fetching it."""
+        return self.shared is None or self.shared.try_lock(key=key, lease_seconds=lease_seconds)
+
+    def unlock_shared_fill(self, key: str) -> None:
+        if self.shared is not None:
+            self.shared.unlock(key=key)
+
+    def wait_for_shared_fill(self, key: str, timeout_seconds: float, poll_interval_seconds: float = 0.05) -> tuple[Optional[Any], Optional[CacheLayer]]:
+        """Wait for the process holding the key's fill lock to cache its response.
+
+        Returns:
+            Cached data and layer, or (None, None) if the other process failed or didn't finish within `timeout_seconds`.
+        """
+        if self.shared is None:
+            return None, None
+        deadline = time() + timeout_seconds
+        while time() < deadline and self.shared.is_locked(key=key):
+            sleep(poll_interval_seconds)
+        return self.get(key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    def stats(self) -> dict[str, dict]:
+        return {
+            CacheLayer.MEMORY.value.lower(): self.memory.stats(),
+            CacheLayer.SHARED.value.lower(): self.shared.stats() if self.shared is not None else None,
+        }
+
+
+# ------------------------------------------------------------------------
+# DEFAULT CACHE
+# ------------------------------------------------------------------------
+
+_default_response_cache: Optional[ResponseCache] = None
+_default_response_cache_lock = Lock()
+
+def default_response_cache() -> ResponseCache:
+    """Process wide response cache configured with environment variables.
+
+    MLB_API_CACHE_MAX_BYTES: Memory tier budget. Defaults to 64 MB.
+    MLB_API_SHARED_CACHE: Set to 0 (or false) to disable the shared tier.
+    MLB_API_SHARED_CACHE_PATH: SQLite file for the shared tier. Defaults to `cache/mlb_stats_api.sqlite` in the repo.
+    MLB_API_SHARED_CACHE_MAX_BYTES: Shared tier budget. Defaults to 512 MB.
+
+    Returns:
+        ResponseCache object.
+    """
+    global _default_response_cache
+    with _default_response_cache_lock:
+        if _default_response_cache is None:
+            memory = MemoryResponseCache(max_bytes=int(os.getenv('MLB_API_CACHE_MAX_BYTES', DEFAULT_MEMORY_MAX_BYTES)))
+            shared = None
+            if os.getenv('MLB_API_SHARED_CACHE', '1').lower() not in ('0', 'false'):
+                path = os.getenv('MLB_API_SHARED_CACHE_PATH', None) or os.path.join(Path(os.path.dirname(__file__)).parent.parent.parent, 'cache', 'mlb_stats_api.sqlite')
+                shared = SharedResponseCache(path=path, max_bytes=int(os.getenv('MLB_API_SHARED_CACHE_MAX_BYTES', DEFAULT_SHARED_MAX_BYTES)))
+            _default_response_cache = ResponseCache(memory=memory, shared=shared)
+
+    return _default_response_cache
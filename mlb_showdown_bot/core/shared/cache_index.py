@@ -0,0 +1,157 @@
+import os
+import sqlite3
+from threading import Lock
+from time import time
+from typing import Callable, Optional
+
+# ------------------------------------------------------------------------
+# CACHE INDEX
+# ------------------------------------------------------------------------
+
+INDEX_FILENAME = '.cache_index.sqlite'
+DEFAULT_MAX_BYTES = 1024 ** 3 # 1 GB
+
+
+class CacheIndex:
+    """SQLite index of the files in a cache folder, with their size, expiry and last access.
+
+    Lookups are a primary key read instead of listing and stat-ing the folder. Expired files are
+    deleted in sweeps that run at most every `sweep_interval_seconds` (or every `sweep_every_writes` writes),
+    which also evict least recently used files until the folder is under `max_bytes`.
+
+    Files already in the folder when the index is created are added once, expiring by `legacy_expiration`.
+    Use `for_folder` to share one index per folder across the process.
+    """
+
+    def __init__(self, folder_path: str, max_bytes: int = DEFAULT_MAX_BYTES, sweep_interval_seconds: float = 300.0, sweep_every_writes: int = 500, legacy_expiration: Callable[[float], float] = None) -> None:
+        self.folder_path = folder_path
+        self.max_bytes = max_bytes
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.sweep_every_writes = sweep_every_writes
+        self.legacy_expiration = legacy_expiration
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._last_sweep = time()
+        self._writes_since_sweep = 0
+        os.makedirs(self.folder_path, exist_ok=True)
+
+    _indexes: dict[str, 'CacheIndex'] = {}
+    _indexes_lock = Lock()
+
+    @classmethod
+    def for_folder(cls, folder_path: str, **kwargs) -> 'CacheIndex':
+        """Shared index for the folder. Keyword args are only used when the index is first created."""
+        folder_path = os.path.abspath(folder_path)
+        with cls._indexes_lock:
+            cache_index = cls._indexes.get(folder_path, None)
+            if cache_index is None:
+                cache_index = cls._indexes[folder_path] = cls(folder_path=folder_path, **kwargs)
+            return cache_index
+
+    # ---------------------------------
+    # ENTRIES
+    # ---------------------------------
+
+    def expires_at(self, key: str) -> Optional[float]:
+        """Expiration timestamp for the key, or None if it isn't cached"""
+        with self._lock:
+            row = self._db().execute('SELECT expires_at FROM cache_entry WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def record(self, key: str, size: int, expires_at: float) -> None:
+        """Add or replace the key after its file is written"""
+        now = time()
+        with self._lock:
+            db = self._db()
+            db.execute('INSERT OR REPLACE INTO cache_entry (key, size, expires_at, last_access) VALUES (?, ?, ?, ?)', (key, size, expires_at, now))
+            db.commit()
+            self._writes_since_sweep += 1
+
+    def touch(self, key: str) -> None:
+        """Mark the key as used, for LRU eviction"""
+        with self._lock:
+            db = self._db()
+            db.execute('UPDATE cache_entry SET last_access = ? WHERE key = ?', (time(), key))
+            db.commit()
+
+    def remove(self, key: str) -> None:
+        """Delete the key and its file"""
+        with self._lock:
+            db = self._db()
+            db.execute('DELETE FROM cache_entry WHERE key = ?', (key,))
+            db.commit()
+        self._remove_file(key)
+
+    # ---------------------------------
+    # SWEEPS
+    # ---------------------------------
+
+    def sweep_if_due(self) -> None:
+        """Sweep when the interval or write count since the last sweep is reached"""
+        if time() - self._last_sweep >= self.sweep_interval_seconds or self._writes_since_sweep >= self.sweep_every_writes:
+            self.sweep()
+
+    def sweep(self) -> None:
+        """Delete expired files, then least recently used files until the folder is under `max_bytes`"""
+        now = time()
+        with self._lock:
+            db = self._db()
+            keys_to_remove = [row[0] for row in db.execute('SELECT key FROM cache_entry WHERE expires_at < ?', (now,))]
+
+            # LRU EVICTION
+            total_bytes = db.execute('SELECT COALESCE(SUM(size), 0) FROM cache_entry WHERE expires_at >= ?', (now,)).fetchone()[0]
+            if self.max_bytes and total_bytes > self.max_bytes:
+                for key, size in db.execute('SELECT key, size FROM cache_entry WHERE expires_at >= ? ORDER BY last_access', (now,)):
+                    if total_bytes <= self.max_bytes:
+                        break
+                    keys_to_remove.append(key)
+                    total_bytes -= size
+
+            db.executemany('DELETE FROM cache_entry WHERE key = ?', [(key,) for key in keys_to_remove])
+            db.commit()
+            self._last_sweep = now
+            self._writes_since_sweep = 0
+
+        for key in keys_to_remove:
+            self._remove_file(key)
+
+    # ---------------------------------
+    # DATABASE
+    # ---------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        """Connection for this process. Caller holds the lock."""
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+
+        # CONNECTIONS CAN'T BE SHARED WITH FORKED WORKER PROCESSES
+        index_path = os.path.join(self.folder_path, INDEX_FILENAME)
+        is_new_index = not os.path.isfile(index_path)
+        self._connection = sqlite3.connect(index_path, timeout=30, check_same_thread=False)
+        self._connection_pid = os.getpid()
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS cache_entry (key TEXT PRIMARY KEY, size INTEGER NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS cache_entry_expires_at ON cache_entry (expires_at)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS cache_entry_last_access ON cache_entry (last_access)')
+        if is_new_index:
+            self._index_existing_files()
+        self._connection.commit()
+        return self._connection
+
+    def _index_existing_files(self) -> None:
+        """Add files cached before the index existed (one folder scan)"""
+        rows = []
+        for entry in os.scandir(self.folder_path):
+            if not entry.is_file() or entry.name.startswith('.'):
+                continue
+            stat = entry.stat()
+            expires_at = self.legacy_expiration(stat.st_mtime) if self.legacy_expiration else stat.st_mtime
+            rows.append((entry.name, stat.st_size, expires_at, stat.st_mtime))
+        self._connection.executemany('INSERT OR REPLACE INTO cache_entry (key, size, expires_at, last_access) VALUES (?, ?, ?, ?)', rows)
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(os.path.join(self.folder_path, key))
+        except FileNotFoundError:
+            pass
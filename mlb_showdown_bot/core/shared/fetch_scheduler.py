@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from time import monotonic
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# ERRORS RAISED FOR THESE RESPONSES ARE RETRIED. THE HOST'S BUDGET HAS ALREADY BACKED OFF BY THEN.
+RETRYABLE_ERROR_SIGNALS = ['429', '502', 'BAD GATEWAY']
+
+
+def is_retryable_fetch_error(error: Exception) -> bool:
+    """True for the 429 and 502 TimeoutErrors raised by the scrapers (ex: `BaseballReferenceScraper.html_for_url`)"""
+    error_message = str(error).upper()
+    return any(signal in error_message for signal in RETRYABLE_ERROR_SIGNALS)
+
+
+class FetchScheduler:
+    """Runs fetch jobs on a thread pool, keeping up to `max_in_flight` in flight.
+
+    Requests still go through `host_rate_limiter`, so the pool only fills gaps while each host
+    stays within its requests per minute budget. Jobs that fail with a 429 or 502 (or any error
+    `is_retryable` accepts) are retried on their own up to `max_retries` times, after the host's backoff.
+    """
+
+    def __init__(self, max_in_flight: int = 4, max_retries: int = 2, is_retryable: Callable[[Exception], bool] = is_retryable_fetch_error) -> None:
+        self.max_in_flight = max(max_in_flight, 1)
+        self.max_retries = max_retries
+        self.is_retryable = is_retryable
+
+    def run(self, jobs: Iterable[Any], fetch: Callable[[Any], Any], heartbeat: Callable[[], None] = None, heartbeat_interval_seconds: float = 60.0) -> Iterator[tuple[Any, Optional[Any], Optional[Exception]]]:
+        """Fetch each job, yielding results as they complete. Jobs are pulled lazily from `jobs`, one per free slot.
+
+        Args:
+            jobs: Jobs to fetch (ex: PlayerStats).
+            fetch: Function called with each job on a worker thread.
+            heartbeat: Optional function called on the caller's thread every `heartbeat_interval_seconds` while jobs are in flight (ex: renew leases).
+            heartbeat_interval_seconds: Seconds between heartbeats.
+
+        Returns:
+            Iterator of (job, result, error) in completion order. Error is None on success.
+        """
+        jobs_iter = iter(jobs)
+        in_flight: dict[Future, tuple[Any, int]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+
+            def submit_next() -> None:
+                for job in jobs_iter:
+                    in_flight[executor.submit(fetch, job)] = (job, 0)
+                    return
+
+            for _ in range(self.max_in_flight):
+                submit_next()
+
+            last_heartbeat = monotonic()
+            while in_flight:
+                done, _ = wait(in_flight, timeout=heartbeat_interval_seconds if heartbeat else None, return_when=FIRST_COMPLETED)
+                if heartbeat and monotonic() - last_heartbeat >= heartbeat_interval_seconds:
+                    heartbeat()
+                    last_heartbeat = monotonic()
+                for future in done:
+                    job, num_retries = in_flight.pop(future)
+                    error = future.exception()
+                    if error is not None and num_retries < self.max_retries and self.is_retryable(error):
+                        print(f"RETRYING AFTER {error}")
+                        in_flight[executor.submit(fetch, job)] = (job, num_retries + 1)
+                        continue
+
+                    submit_next()
+                    yield job, (future.result() if error is None else None), error
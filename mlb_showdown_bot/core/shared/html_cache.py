@@ -0,0 +1,232 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+from urllib.parse import urlparse
+import pytz
+
+# ------------------------------------------------------------------------
+# FRESHNESS
+# ------------------------------------------------------------------------
+
+class HtmlPageType(str, Enum):
+    PLAYER_PAGE = 'PLAYER_PAGE'   # BREF PLAYER HOMEPAGE AND ADVANCED PAGES
+    GAME_LOGS = 'GAME_LOGS'
+    SPLITS = 'SPLITS'
+    LEAGUE = 'LEAGUE'             # BREF LEAGUE PLAYER LISTS
+    STATCAST = 'STATCAST'
+    SEARCH = 'SEARCH'             # BING SEARCH FOR BREF IDS
+    OTHER = 'OTHER'
+
+    @classmethod
+    def for_url(cls, url: str) -> 'HtmlPageType':
+        parsed_url = urlparse(url)
+        host, path = parsed_url.netloc.lower(), parsed_url.path
+        if 'baseball-reference.com' in host:
+            if path.startswith('/players/gl.fcgi'):
+                return cls.GAME_LOGS
+            if path.startswith('/players/split.fcgi'):
+                return cls.SPLITS
+            if path.startswith('/players/'):
+                return cls.PLAYER_PAGE
+            if path.startswith('/leagues/'):
+                return cls.LEAGUE
+        if 'baseballsavant' in host:
+            return cls.STATCAST
+        if 'bing.com' in host:
+            return cls.SEARCH
+        return cls.OTHER
+
+
+class HtmlFreshness(str, Enum):
+    SEASON = 'SEASON' # PAGES FETCHED AFTER THEIR SEASON FINISHED NEVER EXPIRE, OTHERWISE USES THE DAILY RULE
+    DAILY = 'DAILY'   # EXPIRES AT 7 AM EST (30 MINS WHEN FETCHED 7-10 AM EST)
+    FOREVER = 'FOREVER'
+    NEVER = 'NEVER'   # NOT CACHED
+
+
+DEFAULT_PAGE_FRESHNESS: dict[HtmlPageType, HtmlFreshness] = {
+    HtmlPageType.PLAYER_PAGE: HtmlFreshness.SEASON,
+    HtmlPageType.GAME_LOGS: HtmlFreshness.SEASON,
+    HtmlPageType.SPLITS: HtmlFreshness.SEASON,
+    HtmlPageType.LEAGUE: HtmlFreshness.SEASON,
+    HtmlPageType.STATCAST: HtmlFreshness.SEASON,
+    HtmlPageType.SEARCH: HtmlFreshness.DAILY,
+    HtmlPageType.OTHER: HtmlFreshness.NEVER,
+}
+
+# SEASON IN THE URL (EX: "year=2023", "startYear=2023", "/leagues/majors/2023-standard-batting.shtml")
+_URL_SEASON_REGEX = re.compile(r'(?:[?&](?:year|startYear|endYear)=|/)(\d{4})(?=[&\-/.]|$)')
+
+
+def datetime_est(timestamp: float) -> datetime:
+    """Convert timestamp to EST timezone"""
+    return datetime.fromtimestamp(timestamp, tz=pytz.timezone('US/Eastern'))
+
+
+def daily_cache_expiration(fetched_at: datetime) -> datetime:
+    """Expiration for data refreshed daily with the overnight stats updates.
+
+    Rules:
+        - If fetched between 7:00 AM and 10:00 AM EST, valid for 30 mins
+        - If fetched between 10:01 AM EST and 6:59 AM the next day, valid until 7:00 AM EST the next day
+
+    Args:
+        fetched_at: Fetch datetime in EST.
+
+    Returns:
+        datetime object with expiration date.
+    """
+    if fetched_at.hour >= 7 and fetched_at.hour < 10:
+        return fetched_at + timedelta(minutes=30)
+    return fetched_at.replace(hour=7, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+def url_season(url: str) -> Optional[int]:
+    """Latest season in the URL, if any (year=0 is used for career postseason pages)"""
+    seasons = [int(season) for season in _URL_SEASON_REGEX.findall(url) if 1800 < int(season) < 2200]
+    return max(seasons) if seasons else None
+
+
+# ------------------------------------------------------------------------
+# HTML CACHE
+# ------------------------------------------------------------------------
+
+class HtmlCache:
+    """Raw HTML responses stored gzipped on disk, one file per URL (named by the URL's SHA256).
+
+    Each file starts with a JSON header line holding the URL and fetch timestamp. Freshness is checked
+    on read using the page type's `HtmlFreshness` and the fetch timestamp, so parser changes can be 
+    re-run over every cached page without downloading again.
+    """
+
+    def __init__(self, folder_path: str, page_freshness: dict[HtmlPageType, HtmlFreshness] = None) -> None:
+        self.folder_path = folder_path
+        self.page_freshness = DEFAULT_PAGE_FRESHNESS | (page_freshness or {})
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        os.makedirs(self.folder_path, exist_ok=True)
+
+    def get(self, url: str, season: Optional[int] = None) -> Optional[str]:
+        """Cached HTML for the URL, or None when missing or expired.
+
+        Args:
+            url: Request URL.
+            season: Season the page is fetched for. Used when the URL has no season (ex: player homepage).
+
+        Returns:
+            HTML string or None.
+        """
+        freshness = self.freshness(url=url, season=season)
+        if freshness == HtmlFreshness.NEVER:
+            return None
+        try:
+            with gzip.open(self._path(url), 'rt', encoding='utf-8') as file:
+                header = json.loads(file.readline())
+                if header.get('url', None) != url or self._is_expired(fetched_at=header['fetched_at'], freshness=freshness, season=url_season(url) or season):
+                    self._count(is_hit=False)
+                    return None
+                html = file.read()
+        except (FileNotFoundError, OSError, EOFError, ValueError, KeyError):
+            self._count(is_hit=False)
+            return None
+
+        self._count(is_hit=True)
+        return html
+
+    def put(self, url: str, html: str, season: Optional[int] = None) -> None:
+        """Store HTML for the URL with the current time as the fetch timestamp.
+
+        Args:
+            url: Request URL.
+            html: Response text.
+            season: Season the page is fetched for. Pages that are never cached are skipped.
+        """
+        if self.freshness(url=url, season=season) == HtmlFreshness.NEVER:
+            return
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # WRITE TO A TEMP FILE FIRST SO READERS NEVER SEE A PARTIAL FILE
+        header = json.dumps({ 'url': url, 'fetched_at': datetime.now().timestamp() })
+        temp_path = f"{path}.{os.getpid()}.{id(html)}.tmp"
+        with gzip.open(temp_path, 'wt', encoding='utf-8', compresslevel=6) as file:
+            file.write(f"{header}\n")
+            file.write(html)
+        os.replace(temp_path, path)
+
+    def freshness(self, url: str, season: Optional[int] = None) -> HtmlFreshness:
+        """Freshness for the URL's page type. SEASON is resolved per entry on read (see `_is_expired`)."""
+        return self.page_freshness.get(HtmlPageType.for_url(url), HtmlFreshness.NEVER)
+
+    def _is_expired(self, fetched_at: float, freshness: HtmlFreshness, season: Optional[int] = None) -> bool:
+        """Whether a cached entry is stale.
+
+        Args:
+            fetched_at: Fetch timestamp from the entry's header.
+            freshness: Freshness of the URL's page type.
+            season: Season of the page, if known.
+
+        Returns:
+            True if the entry has to be fetched again.
+        """
+        if freshness == HtmlFreshness.FOREVER:
+            return False
+        fetched_at_est = datetime_est(fetched_at)
+        # ONLY PAGES FETCHED AFTER THE SEASON FINISHED ARE COMPLETE
+        if freshness == HtmlFreshness.SEASON and season is not None and fetched_at_est.year > season:
+            return False
+        now = datetime_est(datetime.now().timestamp())
+        return daily_cache_expiration(fetched_at_est) < now
+
+    def _path(self, url: str) -> str:
+        url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.folder_path, url_hash[:2], f"{url_hash}.html.gz")
+
+    def _count(self, is_hit: bool) -> None:
+        with self._lock:
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+# ------------------------------------------------------------------------
+# DEFAULT CACHE
+# ------------------------------------------------------------------------
+
+_default_html_cache: Optional[HtmlCache] = None
+_default_html_cache_lock = Lock()
+
+def default_html_cache() -> Optional[HtmlCache]:
+    """Process wide HTML cache configured with environment variables. None when caching is disabled.
+
+    HTML_CACHE: Set to 1 (or true) to enable.
+    HTML_CACHE_PATH: Cache folder. Defaults to `cache/html` in the repo.
+    HTML_CACHE_FRESHNESS: Overrides by page type (ex: "PLAYER_PAGE=DAILY,SEARCH=NEVER").
+
+    Returns:
+        HtmlCache or None.
+    """
+    global _default_html_cache
+    if os.getenv('HTML_CACHE', '').lower() not in ('1', 'true'):
+        return None
+
+    with _default_html_cache_lock:
+        if _default_html_cache is None:
+            folder_path = os.getenv('HTML_CACHE_PATH', None) or os.path.join(Path(os.path.dirname(__file__)).parent.parent.parent, 'cache', 'html')
+            page_freshness = {}
+            for page_freshness_str in os.getenv('HTML_CACHE_FRESHNESS', '').split(','):
+                if '=' in page_freshness_str:
+                    page_type, freshness = page_freshness_str.split('=', 1)
+                    page_freshness[HtmlPageType(page_type.strip().upper())] = HtmlFreshness(freshness.strip().upper())
+            _default_html_cache = HtmlCache(folder_path=folder_path, page_freshness=page_freshness)
+
+    return _default_html_cache
@@ -0,0 +1,151 @@
+import os
+from threading import Lock
+from time import monotonic, sleep
+from typing import Optional
+from urllib.parse import urlparse
+
+# ---------------------------------
+# BUDGETS
+# ---------------------------------
+
+# REQUESTS PER MINUTE AND BURST SIZE FOR EACH HOST. HOSTS NOT LISTED ARE NOT LIMITED.
+# BASEBALL REFERENCE BLOCKS CLIENTS FOR AN HOUR OVER 20 REQUESTS PER MINUTE.
+DEFAULT_HOST_BUDGETS: dict[str, tuple[float, int]] = {
+    'www.baseball-reference.com': (18, 3),
+    'baseballsavant.mlb.com': (60, 10),
+    'www.fangraphs.com': (60, 10),
+    'statsapi.mlb.com': (300, 5),
+}
+
+# ADAPTIVE BACKOFF
+BACKOFF_STATUS_CODES = { 429: 60.0, 502: 10.0, 503: 10.0 } # STATUS CODE: FIRST BACKOFF IN SECONDS
+MAX_BACKOFF_SECONDS = 900.0
+BACKOFF_RATE_MULTIPLIER = 0.5 # RATE IS CUT ON EVERY BACKOFF...
+RECOVERY_STEP = 0.05 # ...AND RECOVERS BY THIS PCT OF THE BUDGET ON EVERY SUCCESS
+MIN_REQUESTS_PER_MINUTE = 1.0
+
+
+class HostTokenBucket:
+    """Requests per minute budget for one host, shared by every thread in the process.
+
+    Tokens refill at the current rate up to `burst`. Each request takes a token, waiting if none are left.
+    When the host responds with 429 or 502/503 the rate is cut and every request waits out a backoff
+    (the Retry-After header when the host sends one), then the rate recovers as requests succeed.
+    """
+
+    def __init__(self, host: str, requests_per_minute: float, burst: int = 1) -> None:
+        self.host = host
+        self.requests_per_minute = requests_per_minute
+        self.current_requests_per_minute = requests_per_minute
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.paused_until = 0.0
+        self.consecutive_backoffs = 0
+        self._updated_at = monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> float:
+        """Wait for a token.
+
+        Returns:
+            Seconds waited.
+        """
+        seconds_waited = 0.0
+        while True:
+            with self._lock:
+                now = monotonic()
+                self._refill(now)
+                wait_seconds = max(self.paused_until - now, 0.0)
+                if wait_seconds == 0.0:
+                    if self.tokens >= 1.0:
+                        self.tokens -= 1.0
+                        return seconds_waited
+                    wait_seconds = (1.0 - self.tokens) * 60.0 / self.current_requests_per_minute
+            sleep(wait_seconds)
+            seconds_waited += wait_seconds
+
+    def report(self, status_code: int, retry_after: Optional[float] = None) -> None:
+        """Adjust the rate for a response.
+
+        Args:
+            status_code: HTTP status code of the response.
+            retry_after: Seconds from the Retry-After header, if any.
+        """
+        with self._lock:
+            first_backoff_seconds = BACKOFF_STATUS_CODES.get(status_code, None)
+            if first_backoff_seconds is not None:
+                self.consecutive_backoffs += 1
+                self.current_requests_per_minute = max(self.current_requests_per_minute * BACKOFF_RATE_MULTIPLIER, MIN_REQUESTS_PER_MINUTE)
+                backoff_seconds = retry_after or min(first_backoff_seconds * 2 ** (self.consecutive_backoffs - 1), MAX_BACKOFF_SECONDS)
+                self.paused_until = max(self.paused_until, monotonic() + backoff_seconds)
+                self.tokens = 0.0
+                print(f"{status_code} FROM {self.host}. PAUSING {round(backoff_seconds)}s, THEN {round(self.current_requests_per_minute, 1)} REQUESTS/MIN")
+            elif status_code < 400:
+                self.consecutive_backoffs = 0
+                self.current_requests_per_minute = min(self.requests_per_minute, self.current_requests_per_minute + self.requests_per_minute * RECOVERY_STEP)
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(float(self.burst), self.tokens + (now - self._updated_at) * self.current_requests_per_minute / 60.0)
+        self._updated_at = now
+
+
+class HostRateLimiter:
+    """Token buckets by host. Use the module level `host_rate_limiter`, so budgets are shared across the process.
+
+    Budgets default to `DEFAULT_HOST_BUDGETS` and can be overridden with the HOST_REQUESTS_PER_MINUTE
+    env var (ex: "www.baseball-reference.com=12,baseballsavant.mlb.com=30") or `configure`.
+    """
+
+    def __init__(self, host_budgets: dict[str, tuple[float, int]] = None) -> None:
+        self.host_budgets = dict(host_budgets or DEFAULT_HOST_BUDGETS)
+        for host_budget in os.getenv('HOST_REQUESTS_PER_MINUTE', '').split(','):
+            if '=' in host_budget:
+                host, requests_per_minute = host_budget.split('=', 1)
+                _, burst = self.host_budgets.get(host.strip(), (None, 1))
+                self.host_budgets[host.strip()] = (float(requests_per_minute), burst)
+        self._buckets: dict[str, HostTokenBucket] = {}
+        self._lock = Lock()
+
+    def configure(self, host: str, requests_per_minute: float, burst: int = None) -> None:
+        """Set the budget for a host. Replaces the host's bucket."""
+        with self._lock:
+            burst = burst or self.host_budgets.get(host, (None, 1))[1]
+            self.host_budgets[host] = (requests_per_minute, burst)
+            self._buckets.pop(host, None)
+
+    def bucket(self, url: str) -> Optional[HostTokenBucket]:
+        """Bucket for the URL's host. None if the host isn't limited."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host, None)
+            if bucket is None and host in self.host_budgets:
+                requests_per_minute, burst = self.host_budgets[host]
+                bucket = self._buckets[host] = HostTokenBucket(host=host, requests_per_minute=requests_per_minute, burst=burst)
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Wait until a request to the URL's host fits the budget.
+
+        Returns:
+            Seconds waited.
+        """
+        bucket = self.bucket(url)
+        return bucket.acquire() if bucket else 0.0
+
+    def report(self, url: str, status_code: int, headers: dict = None) -> None:
+        """Report a response from the URL's host, backing off on 429 and 502/503 responses.
+
+        Args:
+            url: Request URL.
+            status_code: HTTP status code of the response.
+            headers: Response headers. Used for Retry-After.
+        """
+        bucket = self.bucket(url)
+        if bucket is None:
+            return
+        retry_after_str = str((headers or {}).get('Retry-After', '') or '')
+        retry_after = float(retry_after_str) if retry_after_str.isdigit() else None
+        bucket.report(status_code=status_code, retry_after=retry_after)
+
+
+host_rate_limiter = HostRateLimiter()
@@ -0,0 +1,62 @@
+from threading import Event, Lock
+from typing import Any, Callable, Optional
+
+
+class _Call:
+    """A call in flight and its outcome"""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.num_waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key: the first caller runs the function, callers arriving
+    while it's in flight wait and get its result (or exception). Nothing is kept once the call finishes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call] = {}
+        self._lock = Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """Run `fn`, or wait for the call already in flight for the key.
+
+        Args:
+            key: Key identifying identical calls.
+            fn: Function to run when no call is in flight for the key.
+
+        Returns:
+            Tuple of (result, is_shared). is_shared is True when the result came from another caller's call.
+        """
+        with self._lock:
+            call = self._calls.get(key, None)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.num_waiters += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Number of keys with a call in flight"""
+        with self._lock:
+            return len(self._calls)
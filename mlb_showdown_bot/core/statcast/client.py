@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 import re
 import json
 from ..card.stats.stats_period import StatsPeriod
+from ..shared.rate_limiter import host_rate_limiter
 from .models import StatcastLeaderboardEntry
 
 _LEADERBOARD_CACHE: dict[tuple, tuple[list, datetime]] = {}
@@ -34,7 +35,9 @@ class StatcastAPIClient:
         
         try:
             
+            host_rate_limiter.acquire(url)
             response = self.session.get(url, params=params, timeout=self.timeout)
+            host_rate_limiter.report(url, status_code=response.status_code, headers=response.headers)
             response.raise_for_status()
             
             # USE DICTREADER TO CONVERT CSV TO LIST OF DICTS
@@ -60,8 +63,10 @@ class StatcastAPIClient:
           HTML string for URL request.
         """
 
+        host_rate_limiter.acquire(url)
         scraper = cloudscraper.create_scraper()
         html = scraper.get(url)
+        host_rate_limiter.report(url, status_code=html.status_code, headers=html.headers)
 
         if html.status_code == 502:
             self.error = "502 - BAD GATEWAY"
@@ -0,0 +1,78 @@
+from typing import Optional, List
+from time import sleep
+from datetime import date, timedelta
+
+from ...core.mlb_stats_api import MLBStatsAPI, LeagueEnum, RosterTypeEnum
+from ...core.card.card_generation import generate_cards as _generate_cards
+from ...core.card.showdown_player_card import Set as ShowdownSet
+from ...core.card.trends.in_season_trend_store import InSeasonTrendStore
+
+def precompute_in_season_trends(
+    seasons: str,
+    env: str = 'dev',
+    showdown_sets: Optional[List[str]] = None,
+    player_ids: Optional[List[int]] = None,
+    league_ids: Optional[List[int]] = None,
+    chunk_size: int = 10,
+    limit: Optional[int] = None,
+) -> None:
+    """Precompute weekly in-season trend datapoints for active players and store them in Postgres.
+    Stored datapoints are only rebuilt when their date range has new games, so daily runs only build the latest weeks."""
+    is_production = env.lower() == "prod"
+
+    season_list = [int(season.strip()) for season in seasons.split(',')] if seasons else None
+    if season_list is None:
+        print("Required: Please specify at least one season using the --seasons option (e.g. --seasons 2025)")
+        return
+    showdown_sets = showdown_sets or [s.value for s in ShowdownSet]
+
+    # -----------------
+    # 1. PREPARE TABLE
+    # -----------------
+    trend_store = InSeasonTrendStore(is_archive=is_production)
+    trend_store.create_table()
+    trend_store.prune(years_to_keep=season_list)
+
+    # -----------------
+    # 2. ACTIVE PLAYERS
+    # -----------------
+    two_way_ids: list[int] = []
+    if player_ids is None:
+        print("Fetching active roster data from MLB API...")
+        _mlb_api = MLBStatsAPI(use_persistent_cache=True)
+        leagues = league_ids or [LeagueEnum.AL.value, LeagueEnum.NL.value]
+        rosters = _mlb_api.fetch_rosters_by_season(seasons=season_list, league_ids=leagues, roster_type=RosterTypeEnum.MAN_40.value)
+        player_ids = list(dict.fromkeys(roster['player_id'] for roster in rosters))
+        two_way_ids = [roster['player_id'] for roster in rosters if roster.get('position', 'N/A') == 'TWP']
+    if limit:
+        player_ids = player_ids[:limit]
+    print(f"Precomputing in-season trends for {len(player_ids)} players across {len(showdown_sets)} sets.")
+
+    # -----------------
+    # 3. BUILD AND STORE TRENDS
+    # -----------------
+    # SAME SETTINGS AS ROSTER CARDS, SO THE ROSTER SNAPSHOT READS THESE DATAPOINTS
+    card_settings = {
+        "year": season_list[0],
+        "stat_highlights_type": "ALL",
+        "stats_period_type": "REGULAR",
+    }
+    player_id_chunks = [player_ids[i:i + chunk_size] for i in range(0, len(player_ids), chunk_size)]
+    num_trend_lines = 0
+    for idx, chunk in enumerate(player_id_chunks):
+        print(f"Processing chunk {idx + 1}/{len(player_id_chunks)} with player IDs: {chunk}")
+        chunk_card_data = _generate_cards(
+            player_ids=chunk,
+            years=season_list,
+            sets=showdown_sets,
+            keep_as_py_objects=True,
+            points_change_cutoff_date=date.today() - timedelta(days=7),
+            two_way_ids=two_way_ids,
+            in_season_trend_store=trend_store,
+            update_in_season_trend_store=True,
+            **card_settings
+        )
+        num_trend_lines += len([result for result in chunk_card_data if result.get("in_season_trends", None)])
+        sleep(2)  # Add a delay between chunks to avoid overwhelming the API
+
+    print(f"✅ Stored in-season trends for {num_trend_lines} player cards.")
@@ -0,0 +1,156 @@
+import argparse
+import gzip
+import json
+import os, sys
+import random
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+from bs4 import BeautifulSoup
+sys.path.append(os.path.join(Path(os.path.join(os.path.dirname(__file__))).parent))
+from mlb_showdown_bot.core.card.stats.baseball_ref_scraper import BaseballReferenceScraper
+from mlb_showdown_bot.core.card.stats.bref_table_extractor import game_log_rows
+from mlb_showdown_bot.core.card.stats.stats_period import StatsPeriod, StatsPeriodType
+
+# PARSE ARGS
+parser = argparse.ArgumentParser(description="Benchmark game log parsing (BeautifulSoup whole page vs lxml table extraction) and check the output is identical. No network needed.")
+parser.add_argument('-c', '--corpus', help='Folder of saved pages: HTML cache (HTML_CACHE=1) .html.gz files or plain .html files', type=str, default=os.path.join(Path(os.path.dirname(__file__)).parent, 'cache', 'html'))
+parser.add_argument('-n', '--num_synthetic', help='Number of synthetic bref style game log pages to add to the corpus', type=int, default=40)
+parser.add_argument('-r', '--seed', help='Random seed for synthetic pages', type=int, default=7)
+args = parser.parse_args()
+
+INCLUDED_CATEGORIES = ['year_game','ps_round','date_game','team_ID','player_game_span','IP','H','R','ER','BB','SO','HR','HBP','batters_faced','PA','SB','CS','AB','2B','3B','IBB','GIDP','SF','RBI','player_game_result',
+                       'date','team_name_abbr','game_decision',]
+
+
+# ---------------------------------
+# CORPUS
+# ---------------------------------
+
+def load_corpus(folder_path: str) -> list[tuple[str, str]]:
+    """(name, html) for saved game log pages"""
+    pages: list[tuple[str, str]] = []
+    if not os.path.isdir(folder_path):
+        return pages
+    for path in sorted(Path(folder_path).rglob('*')):
+        if path.name.endswith('.html.gz'):
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                header = json.loads(file.readline())
+                if 'gl.fcgi' in header.get('url', ''):
+                    pages.append((header['url'], file.read()))
+        elif path.suffix == '.html':
+            pages.append((path.name, path.read_text(encoding='utf-8')))
+    return pages
+
+
+def synthetic_page(rng: random.Random, is_pitcher: bool, is_old_table: bool, year: int) -> str:
+    """Bref style game log page with nav, commented tables, header/spacer rows and a totals footer"""
+    type_prefix = 'pitching' if is_pitcher else 'batting'
+    stat_prefix = 'p_' if is_pitcher else 'b_'
+    counting_stats = ['ip', 'h', 'r', 'er', 'bb', 'so', 'hr', 'hbp', 'bfp'] if is_pitcher else ['pa', 'ab', 'r', 'h', 'doubles', 'triples', 'hr', 'rbi', 'bb', 'ibb', 'so', 'hbp', 'sf', 'gidp', 'sb', 'cs']
+    if is_old_table:
+        counting_stats = [stat.replace('doubles', '2B').replace('triples', '3B').replace('bfp', 'batters_faced').upper() if stat != 'bfp' else 'batters_faced' for stat in counting_stats]
+
+    header_cells = ''.join(f'<th data-stat="{stat if is_old_table else stat_prefix + stat}" class="poptip">{stat.upper()}</th>' for stat in counting_stats)
+    rows = []
+    game_date = date(year, 3, 28)
+    for game_num in range(1, rng.randint(5, 162)):
+        if game_num % 20 == 0:
+            rows.append(f'<tr class="thead"><th data-stat="ranker">Rk</th>{header_cells}</tr>')
+        if rng.random() < 0.03:
+            rows.append('<tr class="spacer partial_table"><td colspan="20"></td></tr>')
+        date_str = game_date.strftime('%b %-d') + ('&nbsp;(1)' if rng.random() < 0.05 else '') if is_old_table else game_date.strftime('%Y-%m-%d')
+        team = rng.choice(['LAA', 'NYY', 'SEA'])
+        cells = [
+            f'<th scope="row" class="right" data-stat="ranker">{game_num}</th>',
+            f'<td class="left" data-stat="{"date_game" if is_old_table else "date"}" csk="{game_num}"><a href="/boxes/{team}/{team}{year}0401.shtml">{date_str}</a></td>',
+            f'<td class="left" data-stat="{"team_ID" if is_old_table else "team_name_abbr"}"><a href="/teams/{team}/{year}.shtml">{team}</a></td>',
+            f'<td data-stat="game_location">{rng.choice(["", "@"])}</td>',
+            f'<td data-stat="game_result">{rng.choice(["W 5-2", "L 1-3", "W 10-9 (10)"])}</td>',
+            f'<td data-stat="player_game_span">{rng.choice(["CG", "GS-8", "7-9", "GS-6(W)"])}</td>',
+        ]
+        if is_pitcher:
+            cells.append(f'<td data-stat="{"player_game_result" if is_old_table else "game_decision"}">{rng.choice(["W(5-2)", "L(1-3)", "S(4)", "BW(3-1)", "BL(0-1)", "H(2)", ""])}</td>')
+        for stat in counting_stats:
+            value = rng.choice(['', '0', '1', '2', '4', '6.1', '0.2']) if stat in ('ip', 'IP') else rng.choice(['', '0', '0', '1', '1', '2', '3'])
+            value = f'<strong>{value}</strong>' if value and rng.random() < 0.02 else value
+            cells.append(f'<td class="right" data-stat="{stat if is_old_table else stat_prefix + stat}">{value}</td>')
+        row_id = f'{type_prefix}_gamelogs.{game_num}' if is_old_table else f'players_standard_{type_prefix}.{game_num}'
+        rows.append(f'<tr id="{row_id}" data-row="{game_num}">{"".join(cells)}</tr>\n')
+        game_date += timedelta(days=rng.choice([1, 1, 2, 5]))
+
+    table_id = f'{type_prefix}_gamelogs' if is_old_table else f'players_standard_{type_prefix}'
+    table = f'''<table class="stats_table sortable" id="{table_id}" data-cols-to-freeze=",3" data-soc-sum-scope-type="player_game">
+<caption>{year} Game Log</caption>
+<thead><tr><th data-stat="ranker">Rk</th>{header_cells}</tr></thead>
+<tbody>{"".join(rows)}</tbody>
+<tfoot><tr id="{table_id}_totals"><th data-stat="ranker"></th><td data-stat="{stat_prefix}hr">31</td></tr></tfoot>
+</table>'''
+    is_commented = rng.random() < 0.5
+    table_div = f'<div class="table_container" id="div_{table_id}">{table}</div>'
+    table_div = f'<div class="placeholder"></div>\n<!--\n{table_div}\n-->' if is_commented else table_div
+    other_table = f'<!-- <div><table id="{"players_standard_fielding" if rng.random() < 0.5 else "team_splits"}"><tr id="x.1"><td data-stat="b_hr">9</td></tr></table></div> -->'
+    return f'''<!DOCTYPE html><html data-version="klecko-" lang="en"><head><meta charset="utf-8"><title>Player {year} Game Logs</title>
+<script>var sr_goog_rand = "{rng.random()}"; if (a < b && c > d) {{}}</script></head>
+<body class="bbr"><div id="wrap"><div id="header"><nav><ul><li><a href="/">Home</a></li><li><a href="/players/">Players</a></li></ul></nav></div>
+<div id="content" role="main"><h1><span>Player {year} Batting Game Logs</span></h1>
+<div id="all_{table_id}" class="table_wrapper"><div class="section_heading"><h2>{year} Game Log</h2></div>{table_div}</div>
+<div id="all_other" class="table_wrapper">{other_table}</div>
+<p>&copy; Copyright Sports Reference &amp; friends</p></div></div></body></html>'''
+
+
+# ---------------------------------
+# PARSERS
+# ---------------------------------
+
+def game_logs_soup(scraper: BaseballReferenceScraper, html: str, is_pitcher: bool, reduce_size: bool) -> list[dict]:
+    """Game log parsing the way it was done before: BeautifulSoup for the whole page"""
+    soup_game_log_page = BeautifulSoup(html.replace("<!--", ""), "lxml")
+    type_prefix = 'pitching' if is_pitcher else 'batting'
+    game_log_records = soup_game_log_page.find_all('tr', attrs={'id': re.compile(f'{type_prefix}_gamelogs.')})
+    if len(game_log_records) == 0:
+        game_log_table = soup_game_log_page.find('table', attrs={'id': f'players_standard_{type_prefix}'})
+        if game_log_table:
+            game_log_records = game_log_table.find_all('tr', attrs={'id': re.compile(f'players_standard_{type_prefix}.')})
+            game_log_records = [row for row in game_log_records if 'spacer' not in row.get('class', 'N/A')]
+    return [scraper._BaseballReferenceScraper__parse_generic_bref_row(row=game_log, included_categories=INCLUDED_CATEGORIES, exclude_zeros=reduce_size) for game_log in game_log_records]
+
+
+def game_logs_lxml(scraper: BaseballReferenceScraper, html: str, is_pitcher: bool, reduce_size: bool) -> list[dict]:
+    """Game log parsing used by `game_log_list`"""
+    return [scraper._BaseballReferenceScraper__parse_bref_row_cells(cells=game_log, included_categories=INCLUDED_CATEGORIES, exclude_zeros=reduce_size) for game_log in game_log_rows(html=html, is_pitcher=is_pitcher)]
+
+
+if __name__ == "__main__":
+
+    rng = random.Random(args.seed)
+    pages = load_corpus(args.corpus)
+    print(f"{len(pages)} saved game log pages in {args.corpus}")
+    for index in range(args.num_synthetic):
+        is_pitcher, is_old_table = rng.random() < 0.5, rng.random() < 0.3
+        pages.append((f"synthetic-{index}-{'pitching' if is_pitcher else 'batting'}{'-old' if is_old_table else ''}", synthetic_page(rng=rng, is_pitcher=is_pitcher, is_old_table=is_old_table, year=rng.randint(1990, 2025))))
+
+    scraper = BaseballReferenceScraper(name='troutmi01', year='2023', stats_period=StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year='2023'), ignore_cache=True)
+    soup_seconds, lxml_seconds, num_game_logs, mismatches = 0.0, 0.0, 0, []
+    for name, html in pages:
+        for is_pitcher in [False, True]:
+            for reduce_size in [True, False]:
+                start = perf_counter()
+                soup_game_logs = game_logs_soup(scraper=scraper, html=html, is_pitcher=is_pitcher, reduce_size=reduce_size)
+                soup_seconds += perf_counter() - start
+
+                start = perf_counter()
+                lxml_game_logs = game_logs_lxml(scraper=scraper, html=html, is_pitcher=is_pitcher, reduce_size=reduce_size)
+                lxml_seconds += perf_counter() - start
+
+                num_game_logs += len(lxml_game_logs)
+                if json.dumps(soup_game_logs) != json.dumps(lxml_game_logs):
+                    mismatches.append(f"{name} (pitcher={is_pitcher}, reduce_size={reduce_size})")
+
+    print(f"{len(pages)} pages, {num_game_logs} game logs parsed")
+    print(f"BeautifulSoup: {soup_seconds:.2f}s")
+    print(f"lxml:          {lxml_seconds:.2f}s ({soup_seconds / max(lxml_seconds, 1e-9):.1f}x)")
+    print(f"Mismatches:    {len(mismatches)}")
+    for mismatch in mismatches[:20]:
+        print(f"  {mismatch}")
@@ -0,0 +1,148 @@
+import argparse
+import os, sys
+import random
+from pathlib import Path
+from time import perf_counter
+sys.path.append(os.path.join(Path(os.path.join(os.path.dirname(__file__))).parent))
+from mlb_showdown_bot.core.card.showdown_player_card import ShowdownPlayerCard, Set, StatsPeriod, StatsPeriodType, Position
+from mlb_showdown_bot.core.card.chart import Chart, ChartKernel
+from mlb_showdown_bot.core.card.chart_solver import ChartSolver, ChartCandidate, solve_charts
+from mlb_showdown_bot.core.data.replacement_season_averages import build_replacement_level_stats_for_card
+
+# PARSE ARGS
+parser = argparse.ArgumentParser(description="Benchmark per-card chart generation time. Uses synthetic stat lines, no database or network needed.")
+parser.add_argument('-n', '--num_cards', help='Number of cards per set', type=int, default=100)
+parser.add_argument('-s', '--sets', help='List of sets to include', type=str, default='2000,2001,2002,2003,2004,2005,CLASSIC,EXPANDED')
+parser.add_argument('-r', '--seed', help='Random seed for stat lines', type=int, default=7)
+parser.add_argument('-i', '--iterations', help='Runs per timing, fastest run is kept', type=int, default=3)
+args = parser.parse_args()
+
+
+def synthetic_stats(rng: random.Random) -> tuple[int, dict]:
+    """Replacement level stat line for a random season, with counting stats scaled up/down"""
+    kind = rng.choice(['Hitter', 'Hitter', 'SP', 'RP'])
+    player_type = 'Hitter' if kind == 'Hitter' else 'Pitcher'
+    positions = [Position.SS] if kind == 'Hitter' else ([Position.SP] if kind == 'SP' else [Position.RP])
+    year = rng.randint(1920, 2024)
+    stats = build_replacement_level_stats_for_card(year=year, player_type=player_type, runs_below_avg=rng.uniform(-80, 30), positions=positions)
+    for stat in ['1B', '2B', '3B', 'HR', 'BB', 'SO', 'SB', 'HBP', 'SF', 'SH', 'IBB']:
+        stats[stat] = (stats.get(stat) or 0) * rng.uniform(0.5, 1.8)
+    hits = stats['1B'] + stats['2B'] + stats['3B'] + stats['HR']
+    ab = stats['PA'] - stats['BB'] - stats['HBP'] - stats['SF'] - stats['SH']
+    stats['H'], stats['AB'] = hits, ab
+    stats['batting_avg'] = round(hits / ab, 3)
+    stats['onbase_perc'] = round((hits + stats['BB'] + stats['HBP']) / (ab + stats['BB'] + stats['HBP'] + stats['SF']), 3)
+    stats['slugging_perc'] = round((stats['1B'] + 2 * stats['2B'] + 3 * stats['3B'] + 4 * stats['HR']) / ab, 3)
+    stats['onbase_plus_slugging'] = round(stats['onbase_perc'] + stats['slugging_perc'], 3)
+    return year, stats
+
+
+def timed(func, *a, **kw) -> float:
+    """Fastest of `iterations` runs, single core timings are noisy"""
+    times = []
+    for _ in range(args.iterations):
+        start = perf_counter()
+        func(*a, **kw)
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def search_with_charts(card: ShowdownPlayerCard, command_options: list[int], chart_kwargs: dict) -> list[Chart]:
+    """Command/outs search building every combination as its own Chart (before ChartSolver)"""
+    charts: list[Chart] = []
+    for command in command_options:
+        command_accuracy_weight = card.set.command_accuracy_weighting(command=command, player_sub_type=card.player_sub_type)
+        for use_alternate_outs in [False, True]:
+            outs = 0
+            if use_alternate_outs:
+                outs = max( chart.outs + ( chart.sub_21_per_slot_worth * (-1 if chart.is_overestimating_obp else 1) ), 0 )
+                if outs == chart.outs or outs > 20:
+                    continue
+            chart = Chart(command=command, outs=outs, command_accuracy_weight=command_accuracy_weight, **chart_kwargs)
+            if chart.command_outs_concat in [c.command_outs_concat for c in charts]:
+                continue
+            charts.append(chart)
+    return charts
+
+
+if __name__ == "__main__":
+
+    rng = random.Random(args.seed)
+    sets_as_list = [Set(set) for set in args.sets.replace(' ','').split(',')]
+    totals = { 'search (Chart per combo)': 0.0, 'search (ChartSolver)': 0.0, 'search (solve_charts)': 0.0, 'chart stage': 0.0, 'Chart(...)': 0.0, 'ChartSolver.to_chart': 0.0, 'projections (model_copy)': 0.0, 'projections (kernel)': 0.0 }
+    num_cards = 0
+    for set in sets_as_list:
+        set_cards: list[tuple[ShowdownPlayerCard, dict]] = []
+        for _ in range(args.num_cards):
+            year, stats = synthetic_stats(rng)
+            try:
+                card = ShowdownPlayerCard(name='Benchmark', year=str(year), set=set, stats_period=StatsPeriod(year=str(year), type=StatsPeriodType.REPLACEMENT), stats=stats, print_to_cli=False)
+            except Exception as e:
+                print(set.value, year, e)
+                continue
+            num_cards += 1
+            chart = card.chart
+            stats_per_400_pa = card.stats_per_n_pa(plate_appearances=400, stats=card.stats_for_card)
+            opponent_for_pts = card.set.wotc_baseline_chart(card.player_type.opponent_type, my_type=card.player_sub_type, adjust_for_simulation_accuracy=True)
+            set_cards.append( (card, stats_per_400_pa) )
+
+            # COMMAND/OUTS SEARCH: A CHART PER COMBINATION VS ONE ARRAY BATCH
+            year_list = card._chart_year_list()
+            opponent = card.set.opponent_chart(player_sub_type=card.player_sub_type, era=card.era, year_list=year_list, adjust_for_simulation_accuracy=True)
+            command_options = list({ c for c in card.set.command_options(player_type=card.player_type) })
+            command_accuracy_weights = [card.set.command_accuracy_weighting(command=c, player_sub_type=card.player_sub_type) for c in command_options]
+            search_kwargs = dict(
+                opponent=opponent, set=card.set.value, era_year_list=year_list, year=card.stats_period.last_year, era=card.era.value,
+                is_expanded=card.set.has_expanded_chart, pa=card.stats_for_card.get('pa', 400), stats_per_400_pa=stats_per_400_pa,
+                is_pitcher=card.is_pitcher, player_subtype=card.player_sub_type.value,
+            )
+            totals['search (Chart per combo)'] += timed(lambda: search_with_charts(card=card, command_options=command_options, chart_kwargs=search_kwargs))
+            totals['search (ChartSolver)'] += timed(lambda: ChartSolver(set=card.set.value, is_pitcher=card.is_pitcher, is_expanded=card.set.has_expanded_chart).search(
+                commands=command_options, command_accuracy_weights=command_accuracy_weights, stats_per_400_pa=stats_per_400_pa, opponent=opponent,
+                era_year_list=year_list, player_subtype=card.player_sub_type.value, year=card.stats_period.last_year,
+            ))
+
+            # FULL CHART STAGE OF build_card (SEARCH + BOUNDARY + PROJECTIONS)
+            def chart_stage():
+                best_chart = card._most_accurate_chart(stats_per_400_pa=stats_per_400_pa, offset=0)
+                ChartKernel.from_chart(best_chart).projected_stats_per_400_pa()
+                ChartKernel.from_chart(best_chart, opponent=opponent_for_pts).projected_stats_per_400_pa()
+            totals['chart stage'] += timed(chart_stage)
+
+            # BOUNDARY: FULL PYDANTIC CONSTRUCTION VS BUILDING ONLY THE WINNING CANDIDATE
+            chart_kwargs = dict(
+                opponent=chart.opponent, set=chart.set, era_year_list=chart.era_year_list, year=chart.year, era=chart.era,
+                is_expanded=chart.is_expanded, pa=chart.pa, stats_per_400_pa=chart.stats_per_400_pa,
+                is_pitcher=chart.is_pitcher, player_subtype=chart.player_subtype,
+            )
+            candidate = ChartCandidate(
+                command=chart.command, outs=chart.outs, outs_input=chart.outs, sub_21_per_slot_worth=chart.sub_21_per_slot_worth,
+                command_accuracy_weight=chart.command_accuracy_weight, accuracy=chart.accuracy, accuracy_breakdown=chart.accuracy_breakdown,
+                command_out_accuracy_weight=chart.command_out_accuracy_weight, is_command_out_anomaly=chart.is_command_out_anomaly,
+                command_estimated=chart.command_estimated,
+            )
+            solver = ChartSolver(set=chart.set, is_pitcher=chart.is_pitcher, is_expanded=chart.is_expanded)
+            totals['Chart(...)'] += timed(lambda: Chart(command=chart.command, outs=chart.outs, command_accuracy_weight=chart.command_accuracy_weight, **chart_kwargs))
+            totals['ChartSolver.to_chart'] += timed(lambda: solver.to_chart(candidate, **chart_kwargs))
+
+            # PROJECTIONS FOR POINTS: COPY CHART AND SWAP OPPONENT VS KERNEL WITH OPPONENT OVERRIDE
+            def projections_model_copy():
+                chart_for_pts = chart.model_copy()
+                chart_for_pts.opponent = opponent_for_pts
+                return chart_for_pts.projected_stats_per_400_pa
+            totals['projections (model_copy)'] += timed(projections_model_copy)
+            totals['projections (kernel)'] += timed(lambda: ChartKernel.from_chart(chart, opponent=opponent_for_pts).projected_stats_per_400_pa())
+
+        # EVERY CARD OF THE SET SEARCHED IN ONE BATCH, REPORTED PER CARD
+        totals['search (solve_charts)'] += timed(lambda: solve_charts(
+            stats_matrix=[stats for _, stats in set_cards],
+            set=set,
+            era=[card.era for card, _ in set_cards],
+            sub_types=[card.player_sub_type for card, _ in set_cards],
+            year_lists=[card._chart_year_list() for card, _ in set_cards],
+            years=[card.stats_period.last_year for card, _ in set_cards],
+        ))
+
+    print(f"\n{num_cards} CARDS")
+    for name, total in totals.items():
+        print(f"  {name:<28} {total / max(num_cards, 1) * 1000:8.3f} ms/card")
@@ -0,0 +1,102 @@
+import argparse
+import os, sys
+import copy
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+sys.path.append(os.path.join(Path(os.path.join(os.path.dirname(__file__))).parent))
+from mlb_showdown_bot.core.card.showdown_player_card import ShowdownPlayerCard, Set, StatsPeriod, StatsPeriodType, Position, PlayerType
+from mlb_showdown_bot.core.card.stats.stats_period import StatsPeriodDateAggregation
+from mlb_showdown_bot.core.card.card_generation import generate_in_season_trends_for_player
+from mlb_showdown_bot.core.card.utils.shared_functions import convert_to_date
+from mlb_showdown_bot.core.data.replacement_season_averages import build_replacement_level_stats_for_card
+
+# PARSE ARGS
+parser = argparse.ArgumentParser(description="Benchmark in-season trends (one card per date range) on synthetic full seasons. No database or network needed.")
+parser.add_argument('-s', '--sets', help='List of sets to include', type=str, default='2000,2005,CLASSIC,EXPANDED')
+parser.add_argument('-a', '--aggregations', help='Date aggregations to include', type=str, default='WEEK,DAY')
+parser.add_argument('-y', '--year', help='Season year', type=int, default=2024)
+parser.add_argument('-r', '--seed', help='Random seed for game logs', type=int, default=7)
+args = parser.parse_args()
+
+# COUNTING STATS BREF LEAVES BLANK INSTEAD OF 0
+BLANK_WHEN_ZERO = ['R', 'RBI', 'SB', 'GIDP']
+
+
+def synthetic_game_logs(rng: random.Random, year: int, is_pitcher: bool) -> tuple[list[dict], dict]:
+    """Full season of bref style game logs for an everyday hitter or a starting pitcher, plus season totals"""
+    stats = build_replacement_level_stats_for_card(year=year, player_type=PlayerType.PITCHER if is_pitcher else PlayerType.HITTER, runs_below_avg=-25, positions=[Position.SP if is_pitcher else Position.CF])
+    rates = { stat: (stats.get(stat) or 0) / stats['PA'] for stat in ['1B', '2B', '3B', 'HR', 'BB', 'SO', 'HBP', 'SF'] }
+    game_logs: list[dict] = []
+    game_date = date(year, 3, 28)
+    while game_date <= date(year, 9, 29):
+        game_log = { 'date_game': game_date.strftime('%Y-%m-%d'), 'team_ID': 'NYY' if game_date.month < 8 else 'LAD' }
+        num_pa = rng.randint(22, 29) if is_pitcher else rng.randint(3, 5)
+        outcomes = { stat: sum(rng.random() < rate for _ in range(num_pa)) for stat, rate in rates.items() }
+        hits = outcomes['1B'] + outcomes['2B'] + outcomes['3B'] + outcomes['HR']
+        game_log.update({
+            'PA': num_pa, 'AB': max(num_pa - outcomes['BB'] - outcomes['HBP'] - outcomes['SF'], 0), 'H': hits,
+            '2B': outcomes['2B'], '3B': outcomes['3B'], 'HR': outcomes['HR'], 'BB': outcomes['BB'], 'SO': outcomes['SO'],
+            'HBP': outcomes['HBP'], 'SF': outcomes['SF'], 'IBB': 0, 'CS': 0,
+        })
+        if is_pitcher:
+            outs = rng.randint(12, 23)
+            game_log.update({ 'IP': outs // 3 + (outs % 3) / 10, 'batters_faced': num_pa, 'ER': rng.randint(0, 5),
+                              'player_game_span': f"GS-{outs // 3 + 1}", 'player_game_result': rng.choice(['W(5-2)', 'L(1-3)', '']) })
+        else:
+            game_log.update({ 'R': rng.randint(0, 2), 'RBI': rng.randint(0, 2), 'SB': int(rng.random() < 0.1), 'GIDP': int(rng.random() < 0.08),
+                              'player_game_result': rng.choice(['W 5-2', 'L 1-3']) })
+        for stat in BLANK_WHEN_ZERO:
+            if game_log.get(stat, None) == 0:
+                game_log[stat] = ''
+        game_logs.append(game_log)
+        game_date += timedelta(days=5 if is_pitcher else rng.choice([1, 1, 1, 1, 1, 2]))
+
+    # SEASON TOTALS FROM THE GAME LOGS
+    for stat in ['PA', 'AB', 'H', '2B', '3B', 'HR', 'BB', 'SO', 'HBP', 'SF']:
+        stats[stat] = sum(gl[stat] for gl in game_logs)
+    stats['1B'] = stats['H'] - stats['2B'] - stats['3B'] - stats['HR']
+    stats['G'] = len(game_logs)
+    if is_pitcher:
+        stats['GS'] = len(game_logs)
+    stats['game_logs'] = game_logs
+    return game_logs, stats
+
+
+def trends_one_card_per_range(actual_card: ShowdownPlayerCard, date_aggregation: str, **kwargs) -> dict:
+    """Trend points the way they were built before: a full card build for every date range"""
+    game_logs = actual_card.stats['game_logs']
+    year = actual_card.stats_period.year_list[0]
+    first_date, last_date = convert_to_date(game_logs[0]['date_game'], year), convert_to_date(game_logs[-1]['date_game'], year)
+    trends = {}
+    for start_date, end_date in StatsPeriodDateAggregation(date_aggregation).date_ranges(year=year, start_date=first_date, stop_date=last_date):
+        if end_date < date(int(year), 3, 28): continue
+        card = ShowdownPlayerCard(stats_period=StatsPeriod(type=StatsPeriodType.DATE_RANGE, year=str(year), start_date=start_date, end_date=end_date), stats=actual_card.stats, chart_version=1, **kwargs)
+        trends[end_date.strftime('%Y-%m-%d')] = card.trend_line_data()
+    return trends
+
+
+if __name__ == "__main__":
+
+    rng = random.Random(args.seed)
+    sets_as_list = [Set(set) for set in args.sets.replace(' ','').split(',')]
+    for label, is_pitcher in [('HITTER', False), ('STARTER', True)]:
+        _, season_stats = synthetic_game_logs(rng=rng, year=args.year, is_pitcher=is_pitcher)
+        for aggregation in args.aggregations.replace(' ','').split(','):
+            for set in sets_as_list:
+                # BUILDING CLEANS GAME LOGS IN PLACE, SO EACH RUN STARTS FROM ITS OWN COPY
+                kwargs = dict(name=f'Benchmark {label}', year=str(args.year), set=set, print_to_cli=False)
+                actual_card = ShowdownPlayerCard(stats_period=StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=str(args.year)), stats=copy.deepcopy(season_stats), **kwargs)
+                start = perf_counter()
+                baseline = trends_one_card_per_range(actual_card=actual_card, date_aggregation=aggregation, **kwargs)
+                baseline_time = perf_counter() - start
+
+                actual_card = ShowdownPlayerCard(stats_period=StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=str(args.year)), stats=copy.deepcopy(season_stats), **kwargs)
+                start = perf_counter()
+                in_season_trends = generate_in_season_trends_for_player(actual_card=actual_card, date_aggregation=aggregation, **kwargs)
+                incremental_time = perf_counter() - start
+
+                trends = in_season_trends.cumulative_trends if in_season_trends else {}
+                num_mismatches = len([d for d in baseline if baseline[d] != trends.get(d, None)])
+                print(f"{label:<8} {aggregation:<5} {set.value:<9} {len(baseline):>3} POINTS | ONE CARD PER RANGE: {baseline_time * 1000:8.1f} ms | INCREMENTAL: {incremental_time * 1000:8.1f} ms | {baseline_time / max(incremental_time, 1e-9):5.2f}x | MISMATCHES: {num_mismatches}")
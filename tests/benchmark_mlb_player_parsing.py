@@ -0,0 +1,191 @@
+import argparse
+import copy
+import gc
+import json
+import os, sys
+import random
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from time import perf_counter
+sys.path.append(os.path.join(Path(os.path.join(os.path.dirname(__file__))).parent))
+from mlb_showdown_bot.core.mlb_stats_api.models.person import Players
+from mlb_showdown_bot.core.mlb_stats_api.models.stats.stats import LAZY_STATS_CONTEXT_KEY, LAZY_STAT_TYPES
+from mlb_showdown_bot.core.card.stats.normalized_player_stats import PlayerStatsNormalizer
+from mlb_showdown_bot.core.card.stats.stats_period import StatsPeriod, StatsPeriodType
+
+# PARSE ARGS
+parser = argparse.ArgumentParser(description="Benchmark eager vs lazy validation of hydrated MLB Stats API player payloads (parse time, memory, normalization). No network needed.")
+parser.add_argument('-p', '--payload', help='Saved `people` endpoint response (JSON). Defaults to a synthetic 26 man roster with game logs, splits and rankings', type=str, default=None)
+parser.add_argument('-n', '--num_players', help='Players in the synthetic roster', type=int, default=26)
+parser.add_argument('-y', '--year', help='Season year', type=int, default=2024)
+parser.add_argument('-i', '--iterations', help='Timed iterations for each mode', type=int, default=5)
+parser.add_argument('-r', '--seed', help='Random seed for the synthetic roster', type=int, default=7)
+args = parser.parse_args()
+
+
+# ---------------------------------
+# PAYLOAD
+# ---------------------------------
+
+TEAM = { 'id': 147, 'name': 'New York Yankees', 'abbreviation': 'NYY', 'league': { 'id': 103, 'name': 'American League', 'abbreviation': 'AL' } }
+SPORT = { 'id': 1, 'abbreviation': 'MLB' }
+HITTING_STATS = ['gamesPlayed', 'plateAppearances', 'atBats', 'runs', 'hits', 'doubles', 'triples', 'homeRuns', 'rbi', 'baseOnBalls', 'intentionalWalks', 'strikeOuts', 'hitByPitch', 'sacFlies', 'sacBunts', 'stolenBases', 'caughtStealing', 'groundIntoDoublePlay', 'totalBases']
+PITCHING_STATS = ['gamesPlayed', 'gamesStarted', 'gamesPitched', 'battersFaced', 'hits', 'doubles', 'triples', 'homeRuns', 'baseOnBalls', 'intentionalWalks', 'strikeOuts', 'hitBatsmen', 'earnedRuns', 'wins', 'losses', 'saves', 'sacFlies', 'groundIntoDoublePlay', 'flyOuts', 'popOuts', 'lineOuts']
+SIT_CODES = [('vl', 'vs Left'), ('vr', 'vs Right'), ('h', 'Home'), ('a', 'Away'), ('sp', 'Starting Pitcher'), ('rp', 'Relief Pitcher'), ('risp', 'Scoring Position')]
+
+
+def game_stat(rng: random.Random, is_pitcher: bool) -> dict:
+    if is_pitcher:
+        stat = { key: rng.choice([0, 0, 1, 2]) for key in PITCHING_STATS }
+        stat.update({ 'gamesPlayed': 1, 'gamesPitched': 1, 'battersFaced': rng.randint(3, 28), 'inningsPitched': f"{rng.randint(0, 7)}.{rng.randint(0, 2)}", 'era': f"{rng.uniform(0, 9):.2f}" })
+    else:
+        stat = { key: rng.choice([0, 0, 0, 1, 1, 2]) for key in HITTING_STATS }
+        stat.update({ 'gamesPlayed': 1, 'plateAppearances': rng.randint(3, 5), 'atBats': rng.randint(2, 5), 'avg': f".{rng.randint(150, 350)}", 'obp': f".{rng.randint(250, 420)}", 'slg': f".{rng.randint(300, 600)}" })
+    return stat
+
+
+def season_stat(rng: random.Random, is_pitcher: bool, num_games: int) -> dict:
+    stat = game_stat(rng=rng, is_pitcher=is_pitcher)
+    stat = { key: value * num_games if isinstance(value, int) else value for key, value in stat.items() }
+    if is_pitcher:
+        stat['inningsPitched'] = f"{num_games * rng.randint(1, 6)}.{rng.randint(0, 2)}"
+    return stat
+
+
+def synthetic_player(rng: random.Random, player_id: int, year: int, is_pitcher: bool) -> dict:
+    """Player hydrated like `build_players_from_id_list` (season, advanced, sabermetrics, rankings, splits and game logs)"""
+    group = 'pitching' if is_pitcher else 'hitting'
+    num_games = rng.randint(30, 60) if is_pitcher else rng.randint(120, 162)
+    season_split = lambda stat: { 'season': str(year), 'stat': stat, 'team': TEAM, 'sport': SPORT, 'gameType': 'R' }
+
+    game_logs = []
+    game_date = date(year, 3, 28)
+    for _ in range(num_games):
+        game_logs.append({
+            'season': str(year), 'stat': game_stat(rng=rng, is_pitcher=is_pitcher), 'team': TEAM, 'sport': SPORT, 'gameType': 'R', 'date': game_date.isoformat(),
+            'game': { 'gamePk': rng.randint(700000, 800000), 'gameNumber': 1, 'dayNight': rng.choice(['day', 'night']) },
+            'opponent': { 'id': rng.randint(108, 158), 'name': 'Opponent' }, 'isHome': rng.random() < 0.5, 'isWin': rng.random() < 0.5,
+        })
+        game_date += timedelta(days=rng.choice([1, 1, 2]) if not is_pitcher else 5)
+
+    stats = [
+        { 'type': { 'displayName': 'statsSingleSeason' }, 'group': { 'displayName': group }, 'exemptions': [], 'splits': [season_split(season_stat(rng=rng, is_pitcher=is_pitcher, num_games=num_games))] },
+        { 'type': { 'displayName': 'statsSingleSeasonAdvanced' }, 'group': { 'displayName': group }, 'exemptions': [], 'splits': [season_split({ 'babip': '.300', 'iso': '.180', 'extraBaseHits': rng.randint(10, 80) })] },
+        { 'type': { 'displayName': 'sabermetrics' }, 'group': { 'displayName': group }, 'exemptions': [], 'splits': [season_split({ 'war': round(rng.uniform(-1, 8), 1), 'wRcPlus': rng.randint(60, 180), 'fip': round(rng.uniform(2, 6), 2) })] },
+        { 'type': { 'displayName': 'rankingsByYear' }, 'group': { 'displayName': group }, 'exemptions': [], 'splits': [season_split({ key: rng.randint(1, 300) for key in (PITCHING_STATS if is_pitcher else HITTING_STATS) })] },
+        { 'type': { 'displayName': 'statSplits' }, 'group': { 'displayName': group }, 'exemptions': [], 'splits': [
+            { **season_split(season_stat(rng=rng, is_pitcher=is_pitcher, num_games=num_games // 2)), 'split': { 'code': code, 'description': description, 'sortOrder': index } }
+            for index, (code, description) in enumerate(SIT_CODES)
+        ]},
+        { 'type': { 'displayName': 'gameLog' }, 'group': { 'displayName': group }, 'exemptions': [], 'splits': game_logs },
+        { 'type': { 'displayName': 'statsSingleSeason' }, 'group': { 'displayName': 'fielding' }, 'exemptions': [], 'splits': [
+            season_split({ 'gamesPlayed': num_games, 'gamesStarted': num_games, 'position': { 'code': '1' if is_pitcher else '8', 'name': 'Pitcher' if is_pitcher else 'Outfielder', 'type': 'Pitcher' if is_pitcher else 'Outfielder', 'abbreviation': 'P' if is_pitcher else 'CF' }, 'fielding': '.985' })
+        ]},
+        { 'type': { 'displayName': 'gameLog' }, 'group': { 'displayName': 'fielding' }, 'exemptions': [], 'splits': copy.deepcopy(game_logs) },
+    ]
+    return {
+        'id': player_id, 'fullName': f"Player {player_id}", 'firstName': 'Player', 'lastName': str(player_id), 'active': True,
+        'batSide': { 'code': 'R', 'description': 'Right' }, 'pitchHand': { 'code': 'R', 'description': 'Right' },
+        'primaryPosition': { 'code': '1' if is_pitcher else '8', 'name': 'Pitcher' if is_pitcher else 'Outfielder', 'type': 'Pitcher' if is_pitcher else 'Outfielder', 'abbreviation': 'P' if is_pitcher else 'CF' },
+        'rookieSeasons': [str(year - rng.randint(0, 8))],
+        'currentTeam': TEAM,
+        'xrefIds': [{ 'xrefId': str(rng.randint(10000, 30000)), 'xrefType': 'fangraphs' }, { 'xrefId': f"player{player_id}", 'xrefType': 'bbref' }],
+        'awards': [{ 'id': rng.choice(['ALAS', 'ALSS', 'MLBAFIRST', 'ALPOW']), 'name': 'Award', 'season': str(year - index), 'team': TEAM } for index in range(rng.randint(0, 12))],
+        'stats': stats,
+    }
+
+
+def synthetic_roster(rng: random.Random, num_players: int, year: int) -> dict:
+    """`people` response for a roster, half pitchers"""
+    return { 'people': [synthetic_player(rng=rng, player_id=600000 + index, year=year, is_pitcher=index % 2 == 1) for index in range(num_players)] }
+
+
+# ---------------------------------
+# BENCHMARK
+# ---------------------------------
+
+def parse(payload: dict, is_lazy: bool) -> Players:
+    return Players.model_validate(payload, context={ LAZY_STATS_CONTEXT_KEY: is_lazy })
+
+
+def normalize(players: Players, stats_period: StatsPeriod) -> list[dict]:
+    """Normalized stats for each player, or the error"""
+    results = []
+    for player in players.players:
+        try:
+            results.append(PlayerStatsNormalizer.from_mlb_api(player=player, stats_period=stats_period.model_copy(deep=True)).model_dump(mode='json'))
+        except Exception as e:
+            results.append({ 'error': f"{type(e).__name__}: {e}" })
+    return results
+
+
+def deferred_groups(players: Players) -> tuple[dict[str, int], dict[str, int]]:
+    """Counts of lazy stat groups by 'type/group', split into (loaded by normalization, still deferred)"""
+    loaded, deferred = {}, {}
+    for player in players.players:
+        for stats_group in player.stats or []:
+            if stats_group.type.display_name not in LAZY_STAT_TYPES:
+                continue
+            key = f"{stats_group.type.display_name}/{stats_group.group.display_name}"
+            counts = loaded if stats_group.is_loaded else deferred
+            counts[key] = counts.get(key, 0) + 1
+    return loaded, deferred
+
+
+def measure_memory(payload: dict, is_lazy: bool) -> tuple[float, float]:
+    """(Peak MB while parsing, MB retained by the parsed models). Raw JSON kept by lazy groups was allocated before tracing, so it isn't counted."""
+    gc.collect()
+    tracemalloc.start()
+    players = parse(payload=payload, is_lazy=is_lazy)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del players
+    return peak / 1024 ** 2, retained / 1024 ** 2
+
+
+if __name__ == "__main__":
+
+    if args.payload:
+        with open(args.payload, 'r') as file:
+            payload = json.load(file)
+    else:
+        payload = synthetic_roster(rng=random.Random(args.seed), num_players=args.num_players, year=args.year)
+    num_splits = sum(len(group.get('splits', [])) for player in payload['people'] for group in player.get('stats', []))
+    print(f"{len(payload['people'])} players, {num_splits} splits, {len(json.dumps(payload)) / 1024 ** 2:.1f} MB of JSON")
+
+    stats_period = StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=str(args.year))
+    results: dict[str, dict] = {}
+    for mode, is_lazy in [('eager', False), ('lazy', True)]:
+        parse_seconds, normalize_seconds = 0.0, 0.0
+        for _ in range(args.iterations):
+            start = perf_counter()
+            players = parse(payload=payload, is_lazy=is_lazy)
+            parse_seconds += perf_counter() - start
+
+            start = perf_counter()
+            normalized = normalize(players=players, stats_period=stats_period)
+            normalize_seconds += perf_counter() - start
+
+        peak_mb, retained_mb = measure_memory(payload=payload, is_lazy=is_lazy)
+        results[mode] = {
+            'parse_ms': parse_seconds / args.iterations * 1000, 'normalize_ms': normalize_seconds / args.iterations * 1000,
+            'peak_mb': peak_mb, 'retained_mb': retained_mb, 'normalized': normalized, 'players': players,
+        }
+
+    # END TO END (PARSE + NORMALIZE) IS THE NUMBER THAT MATTERS. LAZY GROUPS READ BY NORMALIZATION ARE VALIDATED
+    # DURING NORMALIZE, SO THE PARSE COLUMN ALONE OVERSTATES THE GAIN. PARSE MEMORY IS MEASURED BEFORE NORMALIZATION LOADS ANY GROUPS.
+    print(f"{'Mode':<8}{'Total (ms)':>12}{'Parse (ms)':>12}{'Normalize (ms)':>16}{'Parse peak (MB)':>17}{'Parse retained (MB)':>21}")
+    for mode, result in results.items():
+        print(f"{mode:<8}{result['parse_ms'] + result['normalize_ms']:>12.1f}{result['parse_ms']:>12.1f}{result['normalize_ms']:>16.1f}{result['peak_mb']:>17.1f}{result['retained_mb']:>21.1f}")
+
+    eager, lazy = results['eager'], results['lazy']
+    print(f"End to end speedup: {(eager['parse_ms'] + eager['normalize_ms']) / max(lazy['parse_ms'] + lazy['normalize_ms'], 1e-9):.2f}x (parse only: {eager['parse_ms'] / max(lazy['parse_ms'], 1e-9):.1f}x)")
+    loaded, deferred = deferred_groups(players=lazy['players'])
+    print(f"Lazy groups loaded by normalization: {', '.join(f'{key} ({count})' for key, count in sorted(loaded.items())) or 'none'}")
+    print(f"Lazy groups never loaded: {', '.join(f'{key} ({count})' for key, count in sorted(deferred.items())) or 'none'}")
+    num_errors = sum(1 for normalized in eager['normalized'] if 'error' in normalized)
+    mismatches = [index for index, (eager_normalized, lazy_normalized) in enumerate(zip(eager['normalized'], lazy['normalized'])) if eager_normalized != lazy_normalized]
+    print(f"Normalized mismatches: {len(mismatches)} (normalization errors in both modes: {num_errors})")
+    for index in mismatches[:10]:
+        print(f"  {payload['people'][index]['id']}")
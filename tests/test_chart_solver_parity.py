@@ -0,0 +1,155 @@
+import argparse
+import os, sys
+import random
+from pathlib import Path
+from time import perf_counter
+from pprint import pprint
+sys.path.append(os.path.join(Path(os.path.join(os.path.dirname(__file__))).parent))
+from mlb_showdown_bot.core.card.showdown_player_card import ShowdownPlayerCard, Set, StatsPeriod, StatsPeriodType, Position
+from mlb_showdown_bot.core.card.chart import Chart
+from mlb_showdown_bot.core.card.chart_solver import ChartSolver, ChartCandidate, solve_charts
+from mlb_showdown_bot.core.data.replacement_season_averages import build_replacement_level_stats_for_card
+
+# PARSE ARGS
+parser = argparse.ArgumentParser(description="Check that ChartSolver and solve_charts score every command/outs combination exactly like building each Chart. Uses synthetic stat lines, no database or network needed.")
+parser.add_argument('-n', '--num_cards', help='Number of synthetic cards per set', type=int, default=40)
+parser.add_argument('-s', '--sets', help='List of sets to include', type=str, default='2000,2001,2002,2003,2004,2005,CLASSIC,EXPANDED')
+parser.add_argument('-r', '--seed', help='Random seed for synthetic stat lines', type=int, default=7)
+parser.add_argument('-b', '--batch_size', help='Max players per solve_charts batch', type=int, default=250)
+parser.add_argument('-sd','--show_detail', action='store_true', help='Show candidate detail for mismatches')
+args = parser.parse_args()
+
+
+def synthetic_stats(rng: random.Random) -> tuple[int, dict]:
+    """Replacement level stat line for a random season, with counting stats scaled up/down"""
+    kind = rng.choice(['Hitter', 'Hitter', 'SP', 'RP'])
+    player_type = 'Hitter' if kind == 'Hitter' else 'Pitcher'
+    positions = [Position.SS] if kind == 'Hitter' else ([Position.SP] if kind == 'SP' else [Position.RP])
+    year = rng.randint(1920, 2024)
+    stats = build_replacement_level_stats_for_card(year=year, player_type=player_type, runs_below_avg=rng.uniform(-80, 30), positions=positions)
+    for stat in ['1B', '2B', '3B', 'HR', 'BB', 'SO', 'SB', 'HBP', 'SF', 'SH', 'IBB']:
+        stats[stat] = (stats.get(stat) or 0) * rng.uniform(0.5, 1.8)
+    return year, stats
+
+
+def scalar_charts(card: ShowdownPlayerCard, command_options: list[int], chart_kwargs: dict) -> list[Chart]:
+    """Every command/outs combination built as its own Chart, the way `_most_accurate_chart` used to"""
+    charts: list[Chart] = []
+    for command in command_options:
+        command_accuracy_weight = card.set.command_accuracy_weighting(command=command, player_sub_type=card.player_sub_type)
+        for use_alternate_outs in [False, True]:
+            outs = 0
+            if use_alternate_outs:
+                outs = max( chart.outs + ( chart.sub_21_per_slot_worth * (-1 if chart.is_overestimating_obp else 1) ), 0 )
+                if outs == chart.outs or outs > 20:
+                    continue
+            chart = Chart(command=command, outs=outs, command_accuracy_weight=command_accuracy_weight, **chart_kwargs)
+            if chart.command_outs_concat in [c.command_outs_concat for c in charts]:
+                continue
+            charts.append(chart)
+    return charts
+
+
+def scored(chart: Chart | ChartCandidate) -> dict:
+    """Everything the card keeps from a scored combination"""
+    return {
+        'command_outs': chart.command_outs_concat,
+        'outs': chart.outs,
+        'accuracy': chart.accuracy,
+        'command_out_accuracy_weight': chart.command_out_accuracy_weight,
+        'is_command_out_anomaly': chart.is_command_out_anomaly,
+        'command_estimated': chart.command_estimated,
+        'accuracy_breakdown': { stat.value: breakdown.model_dump() for stat, breakdown in chart.accuracy_breakdown.items() },
+    }
+
+
+if __name__ == "__main__":
+
+    rng = random.Random(args.seed)
+    sets_as_list = [Set(set) for set in args.sets.replace(' ','').split(',')]
+    has_failures = False
+    for set in sets_as_list:
+
+        all_failures = {}
+        num_compared = 0
+        scalar_time, solver_time, batch_time = 0.0, 0.0, 0.0
+        set_cards: list[tuple[ShowdownPlayerCard, dict, list[dict]]] = []
+        for _ in range(args.num_cards):
+            year, stats = synthetic_stats(rng)
+            try:
+                card = ShowdownPlayerCard(name='Parity', year=str(year), set=set, stats_period=StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=str(year)), stats=stats, print_to_cli=False)
+            except Exception as e:
+                print(set.value, year, e)
+                continue
+
+            # SAME INPUTS AS `_most_accurate_chart`
+            year_list = card._chart_year_list()
+            stats_per_400_pa = card.stats_per_n_pa(plate_appearances=400, stats=card.stats_for_card)
+            opponent = card.set.opponent_chart(player_sub_type=card.player_sub_type, era=card.era, year_list=year_list, adjust_for_simulation_accuracy=True)
+            chart_kwargs = dict(
+                opponent=opponent, set=card.set.value, era_year_list=year_list, year=card.stats_period.last_year, era=card.era.value,
+                is_expanded=card.set.has_expanded_chart, pa=card.stats_for_card.get('pa', 400), stats_per_400_pa=stats_per_400_pa,
+                is_pitcher=card.is_pitcher, player_subtype=card.player_sub_type.value,
+            )
+            command_options = list({ c for c in card.set.command_options(player_type=card.player_type) })
+
+            start = perf_counter()
+            charts = scalar_charts(card=card, command_options=command_options, chart_kwargs=chart_kwargs)
+            scalar_time += perf_counter() - start
+
+            start = perf_counter()
+            solver = ChartSolver(set=card.set.value, is_pitcher=card.is_pitcher, is_expanded=card.set.has_expanded_chart)
+            candidates = solver.search(
+                commands=command_options,
+                command_accuracy_weights=[card.set.command_accuracy_weighting(command=c, player_sub_type=card.player_sub_type) for c in command_options],
+                stats_per_400_pa=stats_per_400_pa, opponent=opponent, era_year_list=year_list,
+                player_subtype=card.player_sub_type.value, year=card.stats_period.last_year,
+            )
+            solver_time += perf_counter() - start
+            num_compared += 1
+
+            # EVERY COMBINATION, THEN THE FULL CHART FOR THE BEST ONE
+            failures = {}
+            scalar_scores, solver_scores = [scored(c) for c in charts], [scored(c) for c in candidates]
+            if scalar_scores != solver_scores:
+                failures['candidates'] = [ {'chart': a, 'solver': b} for a, b in zip(scalar_scores, solver_scores) if a != b ] or {'chart': len(scalar_scores), 'solver': len(solver_scores)}
+            else:
+                best_index = max(range(len(charts)), key=lambda i: charts[i].accuracy)
+                best_chart, best_candidate = charts[best_index], solver.to_chart(candidates[best_index], **chart_kwargs)
+                if best_chart.model_dump() != best_candidate.model_dump():
+                    failures['best_chart'] = {'chart': best_chart.model_dump(exclude={'opponent'}), 'solver': best_candidate.model_dump(exclude={'opponent'})}
+            if len(failures) > 0:
+                all_failures[f"{card.name} ({year}, {card.player_sub_type.value})"] = failures
+            set_cards.append( (card, stats_per_400_pa, scalar_scores) )
+
+        # EVERY PLAYER OF THE SET SCORED TOGETHER
+        start = perf_counter()
+        solutions = solve_charts(
+            stats_matrix=[stats for _, stats, _ in set_cards],
+            set=set,
+            era=[card.era for card, _, _ in set_cards],
+            sub_types=[card.player_sub_type for card, _, _ in set_cards],
+            year_lists=[card._chart_year_list() for card, _, _ in set_cards],
+            years=[card.stats_period.last_year for card, _, _ in set_cards],
+            batch_size=args.batch_size,
+        )
+        batch_time += perf_counter() - start
+        for (card, _, scalar_scores), solution in zip(set_cards, solutions):
+            batch_scores = [scored(c) for c in solution.candidates]
+            if batch_scores != scalar_scores:
+                all_failures.setdefault(f"{card.name} ({card.year}, {card.player_sub_type.value})", {})['batch'] = [ {'chart': a, 'solve_charts': b} for a, b in zip(scalar_scores, batch_scores) if a != b ] or {'chart': len(scalar_scores), 'solve_charts': len(batch_scores)}
+
+        # PRINT RESULTS
+        print(f"----- {set} ------")
+        num_success = num_compared - len(all_failures)
+        print(f"{num_success}/{num_compared} IDENTICAL | CHART PER COMBO: {scalar_time / max(num_compared, 1) * 1000:.2f} ms/card | SOLVER: {solver_time / max(num_compared, 1) * 1000:.2f} ms/card | SOLVE_CHARTS: {batch_time / max(num_compared, 1) * 1000:.2f} ms/card")
+
+        if args.show_detail:
+            for name, failures in all_failures.items():
+                print(f"{name} FAILED")
+                pprint(failures)
+
+        has_failures = has_failures or len(all_failures) > 0
+
+    if has_failures:
+        sys.exit(1)
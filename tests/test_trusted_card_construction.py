@@ -0,0 +1,112 @@
+import argparse
+import os, sys
+import random
+from pathlib import Path
+from time import perf_counter
+from pprint import pprint
+sys.path.append(os.path.join(Path(os.path.join(os.path.dirname(__file__))).parent))
+from mlb_showdown_bot.core.card.showdown_player_card import ShowdownPlayerCard, Set, StatsPeriod, StatsPeriodType, Position, PlayerType, ShowdownImage, StatHighlightsType
+from mlb_showdown_bot.core.data.replacement_season_averages import build_replacement_level_stats_for_card
+
+# PARSE ARGS
+parser = argparse.ArgumentParser(description="Check that ShowdownPlayerCard.from_trusted_inputs builds the same cards as the validated constructor.")
+parser.add_argument('-n', '--num_cards', help='Number of synthetic cards per set', type=int, default=50)
+parser.add_argument('-s', '--sets', help='List of sets to include', type=str, default='2000,2001,2002,2003,2004,2005,CLASSIC,EXPANDED')
+parser.add_argument('-y', '--years', help='Use archived stats for these year(s) instead of synthetic stats (requires DB)', type=str, required=False)
+parser.add_argument('-r', '--seed', help='Random seed for synthetic stat lines', type=int, default=7)
+parser.add_argument('-sd','--show_detail', action='store_true', help='Show field detail for mismatches')
+args = parser.parse_args()
+
+# FIELDS THAT DIFFER RUN TO RUN
+IGNORED_FIELDS = ['load_time']
+
+
+def synthetic_players(rng: random.Random, num_players: int) -> list[tuple[str, int, dict, str]]:
+    """Replacement level stat lines for random seasons as (name, year, stats, player type override)"""
+    players = []
+    for i in range(num_players):
+        kind = rng.choice(['Hitter', 'Hitter', 'SP', 'RP'])
+        player_type = 'Hitter' if kind == 'Hitter' else 'Pitcher'
+        positions = [Position.SS] if kind == 'Hitter' else ([Position.SP] if kind == 'SP' else [Position.RP])
+        year = rng.randint(1920, 2024)
+        stats = build_replacement_level_stats_for_card(year=year, player_type=player_type, runs_below_avg=rng.uniform(-80, 30), positions=positions)
+        for stat in ['1B', '2B', '3B', 'HR', 'BB', 'SO', 'SB', 'HBP', 'SF', 'SH', 'IBB']:
+            stats[stat] = (stats.get(stat) or 0) * rng.uniform(0.5, 1.8)
+        stats['bref_id'] = f"player{i:02d}"
+        if rng.random() < 0.5:
+            stats['mlb_id'] = rng.randint(100000, 700000)
+        type_override = '(pitcher)' if player_type == 'Pitcher' and rng.random() < 0.2 else None
+        players.append( (f"Player {i}", year, stats, type_override) )
+    return players
+
+
+def card_kwargs(name: str, year: int, stats: dict, type_override: str, set: Set, era: str = None) -> dict:
+    """Same inputs the archive uses when generating cards"""
+    return dict(
+        name=name, year=str(year), stats=stats, set=set, era=era,
+        stats_period=StatsPeriod(type=StatsPeriodType.REGULAR_SEASON, year=str(year)),
+        player_type_override=PlayerType.PITCHER if type_override else None, print_to_cli=False,
+        image=ShowdownImage(stat_highlights_type=StatHighlightsType.ALL),
+    )
+
+
+def card_diff(validated: ShowdownPlayerCard, trusted: ShowdownPlayerCard) -> dict:
+    validated_json, trusted_json = validated.as_json(), trusted.as_json()
+    return {
+        field: {'validated': validated_json.get(field), 'trusted': trusted_json.get(field)}
+            for field in dict.fromkeys(list(validated_json.keys()) + list(trusted_json.keys()))
+            if field not in IGNORED_FIELDS and validated_json.get(field) != trusted_json.get(field)
+    }
+
+
+if __name__ == "__main__":
+
+    sets_as_list = [Set(set) for set in args.sets.replace(' ','').split(',')]
+    if args.years:
+        from mlb_showdown_bot.core.database.postgres_db import PostgresDB
+        postgres_db = PostgresDB(is_archive=True)
+        player_list = postgres_db.fetch_all_stats_from_archive(year_list=[int(yr) for yr in args.years.split(',')], exclude_records_with_stats=False)
+        postgres_db.close_connection()
+        players = [(p.name, p.year, p.stats, p.player_type_override) for p in player_list if p.stats and p.stats.get('PA', 0) > 0]
+    else:
+        rng = random.Random(args.seed)
+        players = synthetic_players(rng=rng, num_players=args.num_cards)
+        eras = [None, None, None, 'DYNAMIC', 'STEROID ERA', 'DEAD BALL ERA']
+
+    for set in sets_as_list:
+
+        all_failures = {}
+        num_compared = 0
+        validated_time, trusted_time = 0.0, 0.0
+        for i, (name, year, stats, type_override) in enumerate(players):
+            era = None if args.years else eras[i % len(eras)]
+
+            try:
+                start = perf_counter()
+                validated = ShowdownPlayerCard(**card_kwargs(name, year, stats, type_override, set, era))
+                validated_time += perf_counter() - start
+            except Exception as e:
+                print(name, year, '(validated)', e)
+                continue
+
+            start = perf_counter()
+            trusted = ShowdownPlayerCard.from_trusted_inputs(**card_kwargs(name, year, stats, type_override, set, era))
+            trusted_time += perf_counter() - start
+            num_compared += 1
+
+            diff = card_diff(validated, trusted)
+            if len(diff) > 0:
+                all_failures[f"{name} ({year})"] = diff
+
+        # PRINT RESULTS
+        print(f"----- {set} ------")
+        num_success = num_compared - len(all_failures)
+        print(f"{num_success}/{num_compared} IDENTICAL | VALIDATED: {validated_time / max(num_compared, 1) * 1000:.2f} ms/card | TRUSTED: {trusted_time / max(num_compared, 1) * 1000:.2f} ms/card")
+
+        if args.show_detail:
+            for name, failures in all_failures.items():
+                print(f"{name} FAILED")
+                pprint(failures)
+
+        if len(all_failures) > 0:
+            sys.exit(1)